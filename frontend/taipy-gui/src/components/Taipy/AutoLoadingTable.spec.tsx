@@ -156,6 +156,7 @@ describe("AutoLoadingTable Component", () => {
                 infinite: true,
                 orderby: "Entity",
                 pagekey: "Infinite-Entity-Entity-asc",
+                acceptformats: ["ARROW"],
                 handlenan: false,
                 sort: "asc",
                 start: 0,
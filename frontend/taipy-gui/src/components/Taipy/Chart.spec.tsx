@@ -178,6 +178,7 @@ describe("Chart Component", () => {
             payload: {
                 alldata: true,
                 pagekey: "Day-Daily hospital occupancy",
+                acceptformats: ["ARROW"],
                 columns: ["Day", "Daily hospital occupancy"],
                 decimatorPayload: undefined,
                 id: "chart",
@@ -204,6 +205,7 @@ describe("Chart Component", () => {
                 columns: ["Day", "Daily hospital occupancy"],
                 decimatorPayload: undefined,
                 pagekey: "Day-Daily hospital occupancy",
+                acceptformats: ["ARROW"],
             },
             type: "REQUEST_DATA_UPDATE",
         });
@@ -244,6 +246,7 @@ describe("Chart Component", () => {
                 id: "table",
                 orderby: "",
                 pagekey: "100-200--asc",
+                acceptformats: ["ARROW"],
                 sort: "asc",
                 start: 100,
             },
@@ -243,6 +243,7 @@ describe("PaginatedTable Component", () => {
                 id: "table",
                 orderby: "",
                 pagekey: valueKey,
+                acceptformats: ["ARROW"],
                 handlenan: false,
                 sort: "asc",
                 start: 0,
@@ -269,6 +270,7 @@ describe("PaginatedTable Component", () => {
                 end: 99,
                 orderby: "Entity",
                 pagekey: "0-99-Entity,Daily hospital occupancy-Entity-asc",
+                acceptformats: ["ARROW"],
                 handlenan: false,
                 sort: "asc",
                 start: 0,
@@ -312,6 +314,7 @@ describe("PaginatedTable Component", () => {
                 id: "table",
                 orderby: "",
                 pagekey: "100-199-Entity,Daily hospital occupancy-asc",
+                acceptformats: ["ARROW"],
                 handlenan: false,
                 sort: "asc",
                 start: 100,
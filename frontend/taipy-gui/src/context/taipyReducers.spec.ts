@@ -301,6 +301,7 @@ describe("createRequestDataUpdateAction function", () => {
         expect(action.payload.id).toEqual(id);
         expect(action.payload.columns).toEqual(columns);
         expect(action.payload.pagekey).toEqual(pageKey);
+        expect(action.payload.acceptformats).toEqual(["ARROW"]);
         expect(action.payload.key).toEqual(payload.key);
         expect(action.payload.alldata).toEqual(allData);
         expect(action.payload.library).toEqual(library);
@@ -561,6 +562,23 @@ describe("taipyReducer function", () => {
         const newState = taipyReducer({ ...INITIAL_STATE }, action);
         expect(newState.data[action.name]).toEqual({ [action.payload.pagekey]: action.payload.value });
     });
+    it("should handle UPDATE action with a delta", () => {
+        const action = {
+            type: Types.Update,
+            payload: {
+                value: { rowcount: 120 },
+                delta: true,
+                pagekey: "somePageKey",
+            },
+            name: "someName",
+        };
+        const initialState = {
+            ...INITIAL_STATE,
+            data: { someName: { somePageKey: { data: [{ a: 1 }], rowcount: 100, start: 0 } } },
+        };
+        const newState = taipyReducer(initialState, action);
+        expect(newState.data[action.name]).toEqual({ somePageKey: { data: [{ a: 1 }], rowcount: 120, start: 0 } });
+    });
     it("should handle SET_LOCATIONS action", () => {
         const action = {
             type: Types.SetLocations,
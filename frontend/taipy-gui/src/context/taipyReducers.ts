@@ -21,7 +21,7 @@ import { nanoid } from 'nanoid';
 import { FilterDesc } from "../components/Taipy/tableUtils";
 import { stylekitModeThemes, stylekitTheme } from "../themes/stylekit";
 import { getBaseURL, TIMEZONE_CLIENT } from "../utils";
-import { parseData } from "../utils/dataFormat";
+import { DataFormat, parseData } from "../utils/dataFormat";
 import { MenuProps } from "../utils/lov";
 import { changeFavicon, getLocalStorageValue, IdMessage, storeClientId } from "./utils";
 import { lightenPayload, sendWsMessage, TAIPY_CLIENT_ID, WsMessage } from "./wsUtils";
@@ -368,7 +368,13 @@ export const taipyReducer = (state: TaipyState, baseAction: TaipyBaseAction): Ta
                 data: {
                     ...state.data,
                     [action.name]: action.payload.pagekey
-                        ? { ...oldValue, [action.payload.pagekey as string]: newValue }
+                        ? {
+                              ...oldValue,
+                              // A delta only holds the properties of the page that changed
+                              [action.payload.pagekey as string]: action.payload.delta
+                                  ? { ...(oldValue[action.payload.pagekey as string] as object), ...newValue }
+                                  : newValue,
+                          }
                         : newValue,
                 },
             };
@@ -741,6 +747,7 @@ export const createRequestDataUpdateAction = (
     }
     payload.columns = columns;
     payload.pagekey = pageKey;
+    payload.acceptformats = [DataFormat.APACHE_ARROW];
     if (library !== undefined) {
         payload.library = library;
     }
@@ -22,6 +22,11 @@ const ipcTable = tableToIPC(tableFromArrays({i32 : new Int32Array([1, 2, 3]), st
 
 const arrowRecordsData = { format: DataFormat.APACHE_ARROW, orient: "records", data: ipcTable };
 const arrowListData = { format: DataFormat.APACHE_ARROW, orient: "list", data: ipcTable };
+const arrowChunkedData = {
+    format: DataFormat.APACHE_ARROW,
+    orient: "list",
+    data: [ipcTable, tableToIPC(tableFromArrays({ i32: new Int32Array([4]), str: ["Four"] }))],
+};
 
 describe("does nothing", () => {
     it("returns straight", async () => {
@@ -36,4 +41,7 @@ describe("does nothing", () => {
     it("returns list from arrow", async () => {
         expect(await parseData(arrowListData)).toStrictEqual({ data: {i32: [1, 2, 3], str: ["One", "Two", "Three"]}, format: "ARROW", orient: "list" });
     });
+    it("returns list from chunked arrow", async () => {
+        expect(await parseData(arrowChunkedData)).toStrictEqual({ data: {i32: [1, 2, 3, 4], str: ["One", "Two", "Three", "Four"]}, format: "ARROW", orient: "list" });
+    });
 });
@@ -35,9 +35,12 @@ export const parseData = (data: Record<string, unknown>): Promise<Record<string,
         const orient = data.orient;
         const pData = multi ? (data.data as Array<unknown>) : [data.data];
         return new Promise((resolve, reject) => {
-            import("apache-arrow").then(({tableFromIPC}) => {
+            import("apache-arrow").then(({ tableFromIPC, Table }) => {
                 const res = pData.map((d) => {
-                    const arrowData = tableFromIPC(new Uint8Array(d as ArrayBuffer));
+                    // Large data is received as several IPC streams
+                    const arrowData = Array.isArray(d)
+                        ? new Table(d.flatMap((chunk) => tableFromIPC(new Uint8Array(chunk as ArrayBuffer)).batches))
+                        : tableFromIPC(new Uint8Array(d as ArrayBuffer));
                     const tableHeading = arrowData.schema.fields.map((f) => f.name);
                     if (orient === "records") {
                         const convertedData: Array<unknown> = [];
@@ -342,7 +342,7 @@ class Config:
         Arguments:
             storage_type (str): The default storage type for all data node configurations.
                 The possible values are *"pickle"* (the default value), *"csv"*, *"excel"*,
-                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"generic"*,
+                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"npy"*, *"generic"*,
                 or *"s3_object"*.
             scope (Optional[Scope^]): The default scope for all data node configurations.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -394,7 +394,7 @@ class Config:
                 are None (which is the default value of *"pickle"*, unless it has been overloaded by the
                 *storage_type* value set in the default data node configuration
                 (see `(Config.)set_default_data_node_configuration()^`)), *"pickle"*, *"csv"*, *"excel"*,
-                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"mongo_collection"*, *"in_memory"*, or
+                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"npy"*, *"mongo_collection"*, *"in_memory"*, or
                 *"generic"*.
             scope (Optional[Scope^]): The scope of the data node configuration.<br/>
                 The default value is `Scope.SCENARIO` (or the one specified in
@@ -431,7 +431,7 @@ class Config:
             encoding (Optional[str]): The encoding of the CSV file.
             has_header (Optional[bool]): If True, indicates that the CSV file has a header.
             exposed_type (Optional[str]): The exposed type of the data read from CSV file.<br/>
-                The default value is `pandas`.
+                The default value is `pandas`. The value "arrow" exposes the data as a *pyarrow.Table*.
             scope (Optional[Scope^]): The scope of the CSV data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -511,7 +511,7 @@ class Config:
                 The parameters in *read_kwargs* and *write_kwargs* have a **higher precedence** than the
                 top-level parameters which are also passed to Pandas.
             exposed_type (Optional[str]): The exposed type of the data read from Parquet file.<br/>
-                The default value is `pandas`.
+                The default value is `pandas`. The value "arrow" exposes the data as a *pyarrow.Table*.
             scope (Optional[Scope^]): The scope of the Parquet data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -663,6 +663,44 @@ class Config:
             The new pickle data node configuration.
         """  # noqa: E501
 
+    @classmethod
+    def configure_npy_data_node(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        default_data: Optional[Any] = None,
+        mmap_mode: Optional[Union[str, bool]] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new npy data node configuration.
+
+        Arguments:
+            id (str): The unique identifier of the new npy data node configuration.
+            default_path (Optional[str]): The path of the `.npy` file.
+            default_data (Optional[any]): The default data of the data nodes instantiated from
+                this npy data node configuration.
+                If provided, note that the default_data will be stored as a configuration attribute.
+                So it is designed to handle small data values like parameters, and it must be Json serializable.
+            mmap_mode (Optional[Union[str, bool]]): The mode used to memory-map the file when reading it, as
+                accepted by `numpy.load()`: *"r"*, *"r+"*, or *"c"*. If False, the whole array is loaded
+                in memory.<br/>
+                The default value is "r".
+            scope (Optional[Scope^]): The scope of the npy data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new npy data node configuration.
+        """  # noqa: E501
+
     @classmethod
     def configure_sql_table_data_node(
         cls,
@@ -678,6 +716,8 @@ class Config:
         sqlite_folder_path: Optional[str] = None,
         sqlite_file_extension: Optional[str] = None,
         db_extra_args: Optional[Dict[str, Any]] = None,
+        db_pool_size: Optional[int] = None,
+        db_pool_recycle: Optional[int] = None,
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
@@ -706,8 +746,12 @@ class Config:
                 The default value is ".db".
             db_extra_args (Optional[dict[str, any]]): A dictionary of additional arguments to be passed
                 into database connection string.
+            db_pool_size (Optional[int]): The number of connections to keep open in the connection pool.<br/>
+                The default value is the SQLAlchemy default, 5.
+            db_pool_recycle (Optional[int]): The number of seconds after which a pooled connection is
+                recycled. The default value is -1, meaning that connections are never recycled.
             exposed_type (Optional[str]): The exposed type of the data read from SQL table.<br/>
-                The default value is "pandas".
+                The default value is "pandas". The value "arrow" exposes the data as a *pyarrow.Table*.
             scope (Optional[Scope^]): The scope of the SQL data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -739,6 +783,8 @@ class Config:
         sqlite_folder_path: Optional[str] = None,
         sqlite_file_extension: Optional[str] = None,
         db_extra_args: Optional[Dict[str, Any]] = None,
+        db_pool_size: Optional[int] = None,
+        db_pool_recycle: Optional[int] = None,
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
@@ -771,8 +817,12 @@ class Config:
                 The default value is ".db".
             db_extra_args (Optional[dict[str, any]]): A dictionary of additional arguments to be passed
                 into database connection string.
+            db_pool_size (Optional[int]): The number of connections to keep open in the connection pool.<br/>
+                The default value is the SQLAlchemy default, 5.
+            db_pool_recycle (Optional[int]): The number of seconds after which a pooled connection is
+                recycled. The default value is -1, meaning that connections are never recycled.
             exposed_type (Optional[str]): The exposed type of the data read from SQL query.<br/>
-                The default value is "pandas".
+                The default value is "pandas". The value "arrow" exposes the data as a *pyarrow.Table*.
             scope (Optional[Scope^]): The scope of the SQL data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -902,6 +952,7 @@ class Config:
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: bool = False,
+        executor: Optional[str] = None,
         **properties,
     ) -> "TaskConfig":
         """Configure a new task configuration.
@@ -918,6 +969,13 @@ class Config:
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            executor (Optional[str]): The executor of the jobs of the task, overriding the one of
+                the job execution mode.<br/>
+                Possible values are *"process"*, *"thread"*, *"inline"* or *"asyncio"*. This is used
+                only in *"standalone"* and *"threaded"* job execution modes.<br/>
+                The *"asyncio"* executor runs the jobs concurrently on an event loop of the current
+                process. It is used by default for the tasks whose function is a coroutine function.<br/>
+                The default value is None.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -930,6 +988,7 @@ class Config:
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: bool = False,
+        executor: Optional[str] = None,
         **properties,
     ) -> "TaskConfig":
         """Set the default values for task configurations.
@@ -949,6 +1008,13 @@ class Config:
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            executor (Optional[str]): The executor of the jobs of the task, overriding the one of
+                the job execution mode.<br/>
+                Possible values are *"process"*, *"thread"*, *"inline"* or *"asyncio"*. This is used
+                only in *"standalone"* and *"threaded"* job execution modes.<br/>
+                The *"asyncio"* executor runs the jobs concurrently on an event loop of the current
+                process. It is used by default for the tasks whose function is a coroutine function.<br/>
+                The default value is None.
             **properties (dict[str, any]): A keyworded variable length list of additional
                 arguments.
 
@@ -964,8 +1030,10 @@ class Config:
 
         Arguments:
             mode (Optional[str]): The job execution mode.
-                Possible values are: *"standalone"* or *"development"*.
-            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* mode.
+                Possible values are: *"standalone"*, *"threaded"* or *"development"*.<br/>
+                In *"threaded"* mode, the jobs are executed in a pool of threads sharing the
+                entities of the current process. This suits I/O-bound tasks.
+            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* and *"threaded"* modes.
                 This indicates the maximum number of jobs able to run in parallel.<br/>
                 The default value is 2.<br/>
                 A string can be provided to dynamically set the value using an environment
@@ -1002,9 +1070,13 @@ class Config:
                 used in conjunction with the *root_folder* attribute. That means the storage path is
                 <root_folder><storage_folder> (The default path is "./taipy/.taipy/").
             repository_type (Optional[str]): The type of the repository to be used to store Taipy data.
-                The default value is "filesystem".
+                Possible values are *"filesystem"* and *"sql"* (a SQLite database). The default value is
+                "filesystem".
             repository_properties (Optional[Dict[str, Union[str, int]]]): A dictionary of additional properties
-                to be used by the repository.
+                to be used by the repository. Setting the *entity_cache_size* property to a positive integer
+                enables an in-process cache of at most that many entities per entity type. With the "sql"
+                repository type, the *db_location* property sets the path of the SQLite database file, which
+                defaults to *taipy.sqlite3* in the Taipy storage folder.
             read_entity_retry (Optional[int]): Number of retries to read an entity from the repository
                 before return failure. The default value is 3.
             mode (Optional[str]): Indicates the mode of the version management system.
@@ -1017,7 +1089,12 @@ class Config:
             force (Optional[bool]): If True, Taipy will override a version even if the configuration
                 has changed and run the application.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
-                behavior of the `Orchestrator^` service.
+                behavior of the `Orchestrator^` service. Setting the *data_read_cache_size* property to a positive
+                number of bytes enables an in-process cache of the data read by the file-based data nodes, with that
+                memory budget. The cached data is handed out as read-only views or copies unless the
+                *data_read_cache_read_only* property is set to False. Setting the *data_node_max_edits* property
+                bounds the number of edits stored with each data node entity; the older edits are moved to an
+                append-only edit log. It can be overridden by the *max_edits* property of a data node configuration.
 
         Returns:
             The Core configuration.
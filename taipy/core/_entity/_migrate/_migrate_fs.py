@@ -16,6 +16,7 @@ from typing import Dict
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
+from ..._repository._filesystem_repository import _FileSystemRepository
 from ._utils import _migrate
 
 __logger = _TaipyLogger._get_logger()
@@ -54,6 +55,11 @@ def __write_entities_to_fs(_entities: Dict, root: str):
     if os.path.exists(pipelines_path):
         shutil.rmtree(pipelines_path)
 
+    # Remove the secondary indexes, they are rebuilt from the migrated entities when needed
+    for file in os.listdir(root):
+        if file.endswith(_FileSystemRepository._INDEX_SUFFIX):
+            os.remove(os.path.join(root, file))
+
 
 def _restore_migrate_file_entities(path: str) -> bool:
     backup_path = f"{path}_backup"
@@ -0,0 +1,144 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from collections import defaultdict
+from typing import Dict, List
+
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from ..._repository._sql_connection import _SQLConnection
+from ..._version._version_sql_repository import _VersionSQLRepository
+from ...cycle._cycle_sql_repository import _CycleSQLRepository
+from ...data._data_sql_repository import _DataSQLRepository
+from ...job._job_sql_repository import _JobSQLRepository
+from ...scenario._scenario_sql_repository import _ScenarioSQLRepository
+from ...submission._submission_sql_repository import _SubmissionSQLRepository
+from ...task._task_sql_repository import _TaskSQLRepository
+from ._migrate_fs import _load_all_entities_from_fs
+from ._utils import _migrate
+
+__logger = _TaipyLogger._get_logger()
+
+VERSION_INFO_FILE = "version.json"
+
+
+def __get_backup_path(db_location: str) -> str:
+    return f"{db_location}_backup"
+
+
+def __write_entities_to_sql(_entities: Dict, path: str, db_location: str):
+    version_repository = _VersionSQLRepository()
+    # The repositories are mapped to the folders of the filesystem repositories
+    repositories = {
+        "cycles": _CycleSQLRepository(),
+        "data_nodes": _DataSQLRepository(),
+        "jobs": _JobSQLRepository(),
+        "scenarios": _ScenarioSQLRepository(),
+        "submission": _SubmissionSQLRepository(),
+        "tasks": _TaskSQLRepository(),
+        "version": version_repository,
+    }
+
+    version_info_path = os.path.abspath(os.path.join(path, VERSION_INFO_FILE))
+    documents: Dict[str, List[Dict]] = defaultdict(list)
+    version_info = None
+    for _id, entity in _entities.items():
+        # Do not write pipeline entities
+        if "PIPELINE" in _id:
+            continue
+        if os.path.abspath(entity["path"]) == version_info_path:
+            version_info = entity["data"]
+            continue
+        folder = os.path.basename(os.path.dirname(entity["path"]))
+        if folder in repositories:
+            documents[folder].append(entity["data"])
+
+    connection = _SQLConnection._connect(db_location)
+    try:
+        for folder, folder_documents in documents.items():
+            repositories[folder]._import_documents(folder_documents, connection)
+        if version_info:
+            version_repository._import_version_info(version_info, connection)
+    finally:
+        connection.close()
+
+
+def _restore_migrate_sql_entities(db_location: str) -> bool:
+    backup_path = __get_backup_path(db_location)
+
+    if not os.path.exists(backup_path):
+        __logger.error(f"The backup database '{backup_path}' does not exist.")
+        return False
+
+    if not os.path.exists(db_location):
+        __logger.warning(f"The original database '{db_location}' does not exist.")
+    # The write-ahead log of the migrated database must not be applied to the restored one.
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(f"{db_location}{suffix}"):
+            os.remove(f"{db_location}{suffix}")
+
+    os.replace(backup_path, db_location)
+    __logger.info(f"Restored entities from the backup database '{backup_path}' to '{db_location}'.")
+    return True
+
+
+def _remove_backup_sql_entities(db_location: str) -> bool:
+    backup_path = __get_backup_path(db_location)
+    if not os.path.exists(backup_path):
+        __logger.error(f"The backup database '{backup_path}' does not exist.")
+        return False
+
+    os.remove(backup_path)
+    __logger.info(f"Removed backup entities from the backup database '{backup_path}'.")
+    return True
+
+
+def _migrate_sql_entities(path: str, db_location: str, backup: bool = True) -> bool:
+    """Migrate entities from filesystem to a SQLite database, in the current version.
+
+    The entities stored in the filesystem folder are left unchanged.
+
+    Args:
+        path (str): The path to the folder containing the entities.
+        db_location (str): The path to the SQLite database file. The file is created if it does not exist.
+        backup (bool, optional): Whether to backup the database before migrating. Defaults to True.
+
+    Returns:
+        bool: True if the migration was successful, False otherwise.
+    """
+    if not os.path.isdir(path):
+        __logger.error(f"Folder '{path}' does not exist.")
+        return False
+
+    if backup and os.path.exists(db_location):
+        backup_path = __get_backup_path(db_location)
+        if os.path.exists(backup_path):
+            __logger.warning(f"The backup database '{backup_path}' already exists. Migration canceled.")
+            return False
+        # The backup API copies a consistent snapshot, including the content of the write-ahead log.
+        source = _SQLConnection._connect(db_location)
+        destination = _SQLConnection._connect(backup_path)
+        try:
+            source.backup(destination)
+        finally:
+            source.close()
+            destination.close()
+        __logger.info(f"Backed up entities from '{db_location}' to '{backup_path}' database before migration.")
+
+    __logger.info(f"Starting entity migration from '{path}' folder to '{db_location}' database.")
+
+    entities = _load_all_entities_from_fs(path)
+    entities, _ = _migrate(entities)
+    __write_entities_to_sql(entities, path, db_location)
+
+    __logger.info("Migration finished")
+    return True
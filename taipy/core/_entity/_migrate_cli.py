@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
 import sys
 from typing import List
 
@@ -16,13 +17,17 @@ from taipy.common._cli._base_cli._abstract_cli import _AbstractCLI
 from taipy.common._cli._base_cli._taipy_parser import _TaipyParser
 from taipy.common.config import Config
 
+from .._repository._sql_connection import _SQLConnection
 from ._migrate import (
     _migrate_fs_entities,
     _migrate_mongo_entities,
+    _migrate_sql_entities,
     _remove_backup_file_entities,
     _remove_backup_mongo_entities,
+    _remove_backup_sql_entities,
     _restore_migrate_file_entities,
     _restore_migrate_mongo_entities,
+    _restore_migrate_sql_entities,
 )
 
 
@@ -42,7 +47,8 @@ class _MigrateCLI(_AbstractCLI):
             nargs="+",
             help="The type of repository to migrate. If filesystem, a path to the database folder should be informed. "
             "In case of mongo host, port, user and password must be informed, if left empty it "
-            "is assumed default values",
+            "is assumed default values. In case of sql, the filesystem entities are migrated into a SQLite "
+            "database: a path to the database folder and a path to the database file can be informed.",
         )
         migrate_parser.add_argument(
             "--skip-backup",
@@ -92,6 +98,9 @@ class _MigrateCLI(_AbstractCLI):
         elif repository_type == "mongo":
             if not _remove_backup_mongo_entities():
                 sys.exit(1)
+        elif repository_type == "sql":
+            if not _remove_backup_sql_entities(cls.__get_db_location(repository_args)):
+                sys.exit(1)
         else:
             cls._logger.error(f"Unknown repository type {repository_type}")
             sys.exit(1)
@@ -108,6 +117,9 @@ class _MigrateCLI(_AbstractCLI):
             mongo_args = repository_args[1:5] if repository_args[0] else []
             if not _restore_migrate_mongo_entities(*mongo_args):
                 sys.exit(1)
+        elif repository_type == "sql":
+            if not _restore_migrate_sql_entities(cls.__get_db_location(repository_args)):
+                sys.exit(1)
         else:
             cls._logger.error(f"Unknown repository type {repository_type}")
             sys.exit(1)
@@ -124,6 +136,20 @@ class _MigrateCLI(_AbstractCLI):
             mongo_args = repository_args[1:5] if repository_args[0] else []
             _migrate_mongo_entities(*mongo_args, backup=do_backup)  # type: ignore
 
+        elif repository_type == "sql":
+            path = repository_args[0] or Config.core.taipy_storage_folder
+            if not _migrate_sql_entities(path, cls.__get_db_location(repository_args), do_backup):
+                sys.exit(1)
+
         else:
             cls._logger.error(f"Unknown repository type {repository_type}")
             sys.exit(1)
+
+    @classmethod
+    def __get_db_location(cls, repository_args: List) -> str:
+        if len(repository_args) > 1:
+            return repository_args[1]
+        if db_location := Config.core.repository_properties.get(_SQLConnection._DB_LOCATION_PROPERTY):
+            return str(db_location)
+        path = repository_args[0] or Config.core.taipy_storage_folder
+        return os.path.join(path, _SQLConnection._DEFAULT_DB_NAME)
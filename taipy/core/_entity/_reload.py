@@ -38,6 +38,9 @@ class _Reloader:
             if obj._properties._pending_deletions:
                 entity._properties._pending_deletions = obj._properties._pending_deletions
             entity._properties._entity_owner = obj
+        if manager == "job" and obj._read_durations and not entity._read_durations:
+            # The read durations are set on the job object by the dispatcher, and saved with its status change.
+            entity._read_durations = obj._read_durations
         return entity
 
     def __enter__(self):
@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
@@ -18,6 +18,7 @@ from .._repository._abstract_repository import _AbstractRepository
 from ..exceptions.exceptions import ModelNotFound
 from ..notification import Event, EventOperation, Notifier
 from ..reason import EntityDoesNotExist, ReasonCollection
+from ._save_batch import _SaveBatch
 
 EntityType = TypeVar("EntityType")
 
@@ -94,7 +95,10 @@ class _Manager(Generic[EntityType]):
         """
         Save or update an entity.
         """
-        cls._repository._save(entity)
+        if batch := _SaveBatch._get_current():
+            batch._add(cls._repository, entity)
+        else:
+            cls._repository._save(entity)
 
     @classmethod
     def _get_all(cls, version_number: Optional[str] = "all") -> List[EntityType]:
@@ -102,7 +106,7 @@ class _Manager(Generic[EntityType]):
         Returns all entities.
         """
         filters: List[Dict] = []
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
 
     @classmethod
     def _get_all_by(cls, filters: Optional[List[Dict]] = None) -> List[EntityType]:
@@ -111,7 +115,47 @@ class _Manager(Generic[EntityType]):
         """
         if not filters:
             filters = []
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
+
+    @classmethod
+    def _load_all(cls, filters: Optional[List[Dict]] = None) -> List[EntityType]:
+        """
+        Returns the entities of the repository matching the filters, and the ones pending in the current save batch.
+        """
+        entities = cls._repository._load_all(filters)
+        if not (batch := _SaveBatch._get_current()) or not (pending := batch._get_all(cls._repository)):
+            return entities
+        entities = [pending.pop(entity.id, entity) for entity in entities]  # type: ignore[attr-defined]
+        entities.extend(entity for entity in pending.values() if cls.__matches(entity, filters))
+        return entities
+
+    @classmethod
+    def _get_by_configs_and_owner_ids(
+        cls, configs_and_owner_ids: Iterable[Tuple[Any, Optional[str]]], filters: Optional[List[Dict]] = None
+    ) -> Dict[Tuple[Any, Optional[str]], EntityType]:
+        """
+        Returns the first entity of each config and owner id, looking into the current save batch as well.
+        """
+        configs_and_owner_ids = list(configs_and_owner_ids)
+        entities = cls._repository._get_by_configs_and_owner_ids(configs_and_owner_ids, filters)
+        if not (batch := _SaveBatch._get_current()) or not (pending := batch._get_all(cls._repository)):
+            return entities
+        missing = {(config.id, owner_id): (config, owner_id) for config, owner_id in configs_and_owner_ids}
+        for key in entities:
+            missing.pop((key[0].id, key[1]), None)
+        for entity in pending.values():
+            key = missing.get((getattr(entity, "config_id", None), getattr(entity, "owner_id", None)))
+            if key and key not in entities and cls.__matches(entity, filters):
+                entities[key] = entity
+        return entities
+
+    @staticmethod
+    def __matches(entity: Any, filters: Optional[List[Dict]]) -> bool:
+        def value_of(attribute: str):
+            value = getattr(entity, attribute, None)
+            return getattr(value, "id", value)
+
+        return not filters or any(all(value_of(k) == v for k, v in fil.items()) for fil in filters)
 
     @classmethod
     def _get(cls, entity: Union[str, EntityType], default=None) -> EntityType:
@@ -119,6 +163,8 @@ class _Manager(Generic[EntityType]):
         Returns an entity by id or reference.
         """
         entity_id = entity if isinstance(entity, str) else entity.id  # type: ignore
+        if (batch := _SaveBatch._get_current()) and (pending := batch._get(cls._repository, entity_id)) is not None:
+            return pending
         try:
             return cls._repository._load(entity_id)
         except ModelNotFound:
@@ -133,7 +179,9 @@ class _Manager(Generic[EntityType]):
         """
         reason_collector = ReasonCollection()
 
-        if not cls._repository._exists(entity_id):
+        batch = _SaveBatch._get_current()
+        is_pending = batch is not None and batch._get(cls._repository, entity_id) is not None
+        if not is_pending and not cls._repository._exists(entity_id):
             reason_collector._add_reason(entity_id, EntityDoesNotExist(entity_id))
 
         return reason_collector
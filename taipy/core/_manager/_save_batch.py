@@ -0,0 +1,66 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from typing import Any, Dict, Optional
+
+from .._repository._abstract_repository import _AbstractRepository
+from ..notification import Notifier
+
+
+class _SaveBatch:
+    """
+    Context manager deferring the entity saves of the current thread to the end of the batch.
+
+    Within a batch, the entities set through the managers are kept in memory, and the managers read them from
+    there. The events published meanwhile are held. When the outermost batch exits, each repository saves its
+    entities with a single `_save_many()` call, then the held events are published. If an exception is raised
+    within the batch, nothing is saved and the events are dropped.
+
+    Nested batches are merged into the outermost one.
+    """
+
+    __local = threading.local()
+
+    def __init__(self):
+        self._entities: Dict[_AbstractRepository, Dict[str, Any]] = {}
+
+    @classmethod
+    def _get_current(cls) -> Optional["_SaveBatch"]:
+        return getattr(cls.__local, "batch", None)
+
+    def __enter__(self):
+        if self._get_current() is None:
+            self.__local.batch = self
+            Notifier._hold_events()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if self._get_current() is not self:
+            return
+        del self.__local.batch
+        try:
+            if exc_type is None:
+                for repository, entities in self._entities.items():
+                    repository._save_many(entities.values())
+        except Exception:
+            Notifier._release_events(publish=False)
+            raise
+        Notifier._release_events(publish=exc_type is None)
+
+    def _add(self, repository: _AbstractRepository, entity: Any):
+        self._entities.setdefault(repository, {})[entity.id] = entity
+
+    def _get(self, repository: _AbstractRepository, entity_id: str) -> Optional[Any]:
+        return self._entities.get(repository, {}).get(entity_id)
+
+    def _get_all(self, repository: _AbstractRepository) -> Dict[str, Any]:
+        return dict(self._entities.get(repository, {}))
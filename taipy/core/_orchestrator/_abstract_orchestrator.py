@@ -66,3 +66,8 @@ class _AbstractOrchestrator:
     @abstractmethod
     def cancel_job(cls, job: Job):
         raise NotImplementedError
+
+    @classmethod
+    def _on_data_node_written(cls, data_node_id: str) -> None:
+        """Called when a data node is written, so the jobs waiting for it can be unblocked."""
+        pass
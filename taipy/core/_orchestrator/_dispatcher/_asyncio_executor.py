@@ -0,0 +1,62 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import asyncio
+import threading
+from concurrent import futures
+from concurrent.futures import Executor, Future
+from typing import Set
+
+
+class _AsyncioExecutor(Executor):
+    """Executes coroutines concurrently on an event loop running in a dedicated thread.
+
+    The callable submitted must return a coroutine. Cancelling the returned future cancels the coroutine.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.__run_loop, name="Thread-Taipy-EventLoop", daemon=True)
+        self._futures: Set[Future] = set()
+        self._futures_lock = threading.Lock()
+        self._shutdown = False
+        self._thread.start()
+
+    def __run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._futures_lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot schedule new coroutines after shutdown.")
+            future = asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self._loop)
+            self._futures.add(future)
+        future.add_done_callback(self.__discard)
+        return future
+
+    def __discard(self, future: Future):
+        with self._futures_lock:
+            self._futures.discard(future)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._futures_lock:
+            self._shutdown = True
+            pending_futures = list(self._futures)
+        if cancel_futures:
+            for future in pending_futures:
+                future.cancel()
+        if wait:
+            futures.wait(pending_futures)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait:
+            self._thread.join()
+            self._loop.close()
@@ -44,5 +44,6 @@ class _DevelopmentJobDispatcher(_JobDispatcher):
         Arguments:
             job (Job^): The job to submit on an executor with an available worker.
         """
-        rs = _TaskFunctionWrapper(job.id, job.task).execute()
-        self._update_job_status(job, rs)
+        wrapper = _TaskFunctionWrapper(job.id, job.task)
+        exceptions = wrapper.execute()
+        self._update_job_status(job, exceptions, wrapper.read_durations)
@@ -10,11 +10,10 @@
 # specific language governing permissions and limitations under the License.
 
 import threading
-import time
 import traceback
 from abc import abstractmethod
 from queue import Empty
-from typing import Optional
+from typing import Dict, Optional
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
@@ -32,6 +31,8 @@ class _JobDispatcher(threading.Thread):
     _STOP_FLAG = False
     stop_wait = True
     stop_timeout = None
+    # Upper bound of the time waiting for a notification, in case a job is queued without notifying the dispatcher.
+    _MAX_WAITING_TIME = 1.0
     _logger = _TaipyLogger._get_logger()
 
     def __init__(self, orchestrator: _AbstractOrchestrator):
@@ -39,6 +40,7 @@ class _JobDispatcher(threading.Thread):
         self.daemon = True
         self.orchestrator = orchestrator
         self.lock = self.orchestrator.lock  # type: ignore
+        self.condition = self.orchestrator.jobs_to_run_condition  # type: ignore
         Config.block_update()
 
     def start(self):
@@ -57,6 +59,7 @@ class _JobDispatcher(threading.Thread):
             timeout (Optional[float]): The maximum time to wait. If None, the method will wait indefinitely.
         """
         self._STOP_FLAG = True
+        self._notify()
         if wait and self.is_running():
             self._logger.debug("Waiting for the dispatcher thread to stop...")
             self.join(timeout=timeout)
@@ -64,8 +67,7 @@ class _JobDispatcher(threading.Thread):
     def run(self):
         self._logger.debug("Job dispatcher started.")
         while not self._STOP_FLAG:
-            if not self._can_execute():
-                time.sleep(0.2)  # We need to sleep to avoid busy waiting.
+            if not self.__wait_for_job_to_dispatch():
                 continue
 
             with self.lock:
@@ -73,7 +75,7 @@ class _JobDispatcher(threading.Thread):
                 job = None
                 try:
                     if not self._STOP_FLAG:
-                        job = self.orchestrator.jobs_to_run.get(block=True, timeout=0.1)
+                        job = self.orchestrator.jobs_to_run.get(block=False)
                 except Empty:  # In case the last job of the queue has been removed.
                     pass
             if job:
@@ -87,6 +89,28 @@ class _JobDispatcher(threading.Thread):
                     self._logger.exception(e)
         self._logger.debug("Job dispatcher stopped.")
 
+    def __wait_for_job_to_dispatch(self) -> bool:
+        """Wait until a job is queued and the dispatcher has resources to dispatch it.
+
+        The dispatcher is notified when a job is queued, when resources are released and when it is stopped.
+
+        Returns:
+            True if a job can be dispatched. False if the waiting time is over or if the dispatcher is stopped.
+        """
+        with self.condition:
+            return (
+                self.condition.wait_for(
+                    lambda: self._STOP_FLAG or (self._can_execute() and not self.orchestrator.jobs_to_run.empty()),
+                    timeout=self._MAX_WAITING_TIME,
+                )
+                and not self._STOP_FLAG
+            )
+
+    def _notify(self):
+        """Wake up the dispatcher if it is waiting for a job to dispatch."""
+        with self.condition:
+            self.condition.notify_all()
+
     @abstractmethod
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to dispatch a new job."""
@@ -147,9 +171,23 @@ class _JobDispatcher(threading.Thread):
         """
         raise NotImplementedError
 
+    def _cancel_running_job(self, job: Job) -> bool:
+        """Cancel the execution of a running job.
+
+        Arguments:
+            job (Job^): The running job to cancel.
+
+        Returns:
+            True if the execution of the job has been canceled. False otherwise.
+        """
+        return False
+
     @staticmethod
-    def _update_job_status(job: Job, exceptions):
+    def _update_job_status(job: Job, exceptions, read_durations: Optional[Dict[str, float]] = None):
         """Update the job status based on the success or the failure of its execution."""
+        if read_durations:
+            # Saved with the status change of the job.
+            job._read_durations = read_durations
         if exceptions:
             job.failed()
             _TaipyLogger._get_logger().error(f" {len(exceptions)} errors occurred during execution of job {job.id}")
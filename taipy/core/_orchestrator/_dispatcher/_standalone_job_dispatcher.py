@@ -9,33 +9,45 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import inspect
 import multiprocessing as mp
-from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 from threading import Lock
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 
+from ...config.task_config import TaskConfig
 from ...job.job import Job
+from ...job.job_id import JobId
+from ...task.task import Task
 from .._abstract_orchestrator import _AbstractOrchestrator
+from ._asyncio_executor import _AsyncioExecutor
 from ._job_dispatcher import _JobDispatcher
 from ._task_function_wrapper import _TaskFunctionWrapper
 
 
 class _StandaloneJobDispatcher(_JobDispatcher):
-    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor."""
+    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor.
+
+    A task can override the executor of its jobs with its *executor* property. The executors share the same
+    number of available workers, except the asyncio executor that runs the jobs of the tasks with a coroutine
+    function concurrently on an event loop.
+    """
 
     _nb_available_workers_lock = Lock()
     _DEFAULT_MAX_NB_OF_WORKERS = 2
+    _DEFAULT_EXECUTOR = TaskConfig._PROCESS_EXECUTOR
 
     def __init__(self, orchestrator: _AbstractOrchestrator, subproc_initializer: Optional[Callable] = None):
         super().__init__(orchestrator)
-        max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
-        self._executor: Executor = ProcessPoolExecutor(
-            max_workers=max_workers, initializer=subproc_initializer, mp_context=mp.get_context("spawn")
-        )
+        self._max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
+        self._subproc_initializer = subproc_initializer
+        self._executors: Dict[str, Executor] = {}
+        self._coroutine_futures: Dict[JobId, Future] = {}
+        self._executor: Executor = self._get_executor(self._DEFAULT_EXECUTOR)
         self._nb_available_workers = self._executor._max_workers  # type: ignore
 
     def _can_execute(self) -> bool:
@@ -45,9 +57,12 @@ class _StandaloneJobDispatcher(_JobDispatcher):
             return self._nb_available_workers > 0
 
     def run(self):
-        with self._executor:
+        try:
             super().run()
-        self._logger.debug("Standalone job dispatcher: Pool executor shut down.")
+        finally:
+            for executor in self._executors.values():
+                executor.shutdown(wait=True)
+        self._logger.debug("Standalone job dispatcher: Pool executors shut down.")
 
     def _dispatch(self, job: Job):
         """Dispatches the given `Job^` on an available worker for execution.
@@ -55,16 +70,71 @@ class _StandaloneJobDispatcher(_JobDispatcher):
         Arguments:
             job (Job^): The job to submit on an executor with an available worker.
         """
+        executor_type = self._get_executor_type(job.task)
+        wrapper = _TaskFunctionWrapper(job.id, job.task)
+        if executor_type == TaskConfig._INLINE_EXECUTOR:
+            exceptions = wrapper.execute()
+            self._update_job_status(job, exceptions, wrapper.read_durations)
+            return
+        if executor_type == TaskConfig._ASYNCIO_EXECUTOR:
+            future = self._get_executor(executor_type).submit(wrapper.execute_async)
+            self._coroutine_futures[job.id] = future
+            future.add_done_callback(partial(self._update_job_status_from_coroutine_future, job, wrapper))
+            return
+
         with self._nb_available_workers_lock:
             self._nb_available_workers -= 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the dispatch method.")
-        config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
-
-        future = self._executor.submit(_TaskFunctionWrapper(job.id, job.task), config_as_string=config_as_string)
+        future = self._get_executor(executor_type).submit(wrapper)
         future.add_done_callback(partial(self._update_job_status_from_future, job))
 
     def _update_job_status_from_future(self, job: Job, ft):
         with self._nb_available_workers_lock:
             self._nb_available_workers += 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the callback method.")
-        self._update_job_status(job, ft.result())
+        self._notify()
+        self._update_job_status(job, *ft.result())
+
+    def _update_job_status_from_coroutine_future(self, job: Job, wrapper: _TaskFunctionWrapper, ft: Future):
+        self._coroutine_futures.pop(job.id, None)
+        if ft.cancelled():
+            return  # The job has been canceled by the orchestrator.
+        self._update_job_status(job, ft.result(), wrapper.read_durations)
+
+    def _cancel_running_job(self, job: Job) -> bool:
+        """Cancel the coroutine of a job running on the asyncio executor.
+
+        The jobs running on the other executors cannot be canceled.
+        """
+        if future := self._coroutine_futures.get(job.id):
+            return future.cancel()
+        return False
+
+    def _get_executor_type(self, task: Task) -> str:
+        if executor_type := task.properties.get(TaskConfig._EXECUTOR_KEY):
+            return executor_type
+        if inspect.iscoroutinefunction(task.function):
+            return TaskConfig._ASYNCIO_EXECUTOR
+        return self._DEFAULT_EXECUTOR
+
+    def _get_executor(self, executor_type: str) -> Executor:
+        """Get the executor of the given type, creating it on first use."""
+        if executor_type not in self._executors:
+            self._executors[executor_type] = self._create_executor(executor_type)
+        return self._executors[executor_type]
+
+    def _create_executor(self, executor_type: str) -> Executor:
+        if executor_type == TaskConfig._ASYNCIO_EXECUTOR:
+            return _AsyncioExecutor()
+        if executor_type == TaskConfig._THREAD_EXECUTOR:
+            # The threads share the managers and the configuration of the current process.
+            return ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="taipy-job")
+        # The configuration update is blocked while the dispatcher runs, so the configuration is sent once to each
+        # worker when it starts rather than with every job.
+        config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_TaskFunctionWrapper._initialize_worker,
+            initargs=(config_as_string, self._subproc_initializer),
+            mp_context=mp.get_context("spawn"),
+        )
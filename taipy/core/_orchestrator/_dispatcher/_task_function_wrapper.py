@@ -9,12 +9,19 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, List
+import asyncio
+import hashlib
+import inspect
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
+from ...config.task_config import TaskConfig
 from ...data._data_manager_factory import _DataManagerFactory
 from ...data.data_node import DataNode
 from ...exceptions import DataNodeWritingError
@@ -27,54 +34,150 @@ logger = _TaipyLogger._get_logger()
 class _TaskFunctionWrapper:
     """Wrapper around task function."""
 
+    # Hash of the configuration last applied in the current process.
+    __applied_config_hash: Optional[str] = None
+
     def __init__(self, job_id: JobId, task: Task):
         self.job_id = job_id
         self.task = task
+        # The durations in seconds of the reads of the input data nodes, by data node id.
+        self.read_durations: Dict[str, float] = {}
+
+    def __call__(self, **kwargs) -> Tuple[Optional[List[Exception]], Dict[str, float]]:
+        """Make this object callable as a function. Actually calls `execute`.
 
-    def __call__(self, **kwargs):
-        """Make this object callable as a function. Actually calls `execute`."""
-        return self.execute(**kwargs)
+        The wrapper is called in a worker process that does not send it back, so the read durations are returned
+        along with the exceptions.
+        """
+        return self.execute(**kwargs), self.read_durations
 
     def execute(self, **kwargs):
         """Execute the wrapped function. If `config_as_string` is given, then it will be reapplied to the config."""
+        self.read_durations = {}
         try:
             if config_as_string := kwargs.pop("config_as_string", None):
-                Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
-                Config.block_update()
+                self._apply_config(config_as_string)
+
+            inputs = list(self.task.input.values())
+            outputs = list(self.task.output.values())
+
+            with self._io_executor(inputs, outputs) as io_executor:
+                arguments = self._read_inputs(inputs, self.read_durations, io_executor)
+                results = self._execute_fct(arguments)
+                return self._write_data(outputs, results, self.job_id, io_executor)
+        except Exception as e:
+            logger.error("Error during task function execution!", exc_info=1)
+            return [e]
+
+    async def execute_async(self):
+        """Execute the wrapped function on the running event loop.
 
+        The data nodes are read and written in separate threads so that they do not block the event loop. A
+        function that is not a coroutine function is also called in a separate thread.
+        """
+        self.read_durations = {}
+        try:
             inputs = list(self.task.input.values())
             outputs = list(self.task.output.values())
 
-            arguments = self._read_inputs(inputs)
-            results = self._execute_fct(arguments)
-            return self._write_data(outputs, results, self.job_id)
+            with self._io_executor(inputs, outputs) as io_executor:
+                arguments = await asyncio.to_thread(self._read_inputs, inputs, self.read_durations, io_executor)
+                if inspect.iscoroutinefunction(self.task.function):
+                    results = await self.task.function(*arguments)
+                else:
+                    results = await asyncio.to_thread(self._execute_fct, arguments)
+                return await asyncio.to_thread(self._write_data, outputs, results, self.job_id, io_executor)
         except Exception as e:
             logger.error("Error during task function execution!", exc_info=1)
             return [e]
 
-    def _read_inputs(self, inputs: List[DataNode]) -> List[Any]:
+    @classmethod
+    def _initialize_worker(cls, config_as_string: str, initializer: Optional[Callable] = None):
+        """Initialize a worker process: apply the configuration once for all the jobs it executes.
+
+        Arguments:
+            config_as_string (str): The serialized configuration.
+            initializer (Optional[Callable]): An additional initializer to call once the configuration is applied.
+        """
+        cls._apply_config(config_as_string)
+        if initializer:
+            initializer()
+
+    @classmethod
+    def _apply_config(cls, config_as_string: str):
+        """Apply the serialized configuration, unless it is the configuration already applied in this process."""
+        config_hash = hashlib.sha256(config_as_string.encode("UTF-8")).hexdigest()
+        if config_hash != cls.__applied_config_hash:
+            Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))  # type: ignore[attr-defined]
+            cls.__applied_config_hash = config_hash
+        Config.block_update()
+
+    def _io_executor(self, inputs: List[DataNode], outputs: List[DataNode]):
+        """Create the thread pool reading the inputs and writing the outputs concurrently, if the task opts in.
+
+        Returns:
+            A context manager providing the executor, or None if the data nodes are read and written sequentially.
+        """
+        max_nb_of_io_workers = self.task.properties.get(TaskConfig._MAX_NB_OF_IO_WORKERS_KEY)
+        nb_of_data_nodes = max(len(inputs), len(outputs))
+        if not max_nb_of_io_workers or int(max_nb_of_io_workers) < 2 or nb_of_data_nodes < 2:
+            return nullcontext()
+        return ThreadPoolExecutor(max_workers=min(int(max_nb_of_io_workers), nb_of_data_nodes))
+
+    def _read_inputs(
+        self,
+        inputs: List[DataNode],
+        read_durations: Optional[Dict[str, float]] = None,
+        io_executor: Optional[Executor] = None,
+    ) -> List[Any]:
         data_manager = _DataManagerFactory._build_manager()
-        return [data_manager._get(dn.id).read_or_raise() for dn in inputs]
+        read_durations = {} if read_durations is None else read_durations
+
+        def read(dn: DataNode) -> Any:
+            start = perf_counter()
+            try:
+                return data_manager._get(dn.id).read_or_raise()
+            finally:
+                read_durations[dn.id] = perf_counter() - start
+
+        if io_executor is None:
+            return [read(dn) for dn in inputs]
+        futures = [io_executor.submit(read, dn) for dn in inputs]
+        # Wait for all the reads, so that the durations are recorded, before raising the first error if any.
+        errors = [future.exception() for future in futures]
+        if error := next((e for e in errors if e is not None), None):
+            raise error
+        return [future.result() for future in futures]
 
-    def _write_data(self, outputs: List[DataNode], results, job_id: JobId):
+    def _write_data(self, outputs: List[DataNode], results, job_id: JobId, io_executor: Optional[Executor] = None):
         data_manager = _DataManagerFactory._build_manager()
+
+        def write(res: Any, dn: DataNode) -> Optional[Exception]:
+            try:
+                data_node = data_manager._get(dn.id)
+                data_node.write(res, job_id=job_id)
+                return None
+            except Exception as e:
+                logger.error("Error during write", exc_info=1)
+                return DataNodeWritingError(f"Error writing in datanode id {dn.id}: {e}")
+
         try:
             if outputs:
                 _results = self._extract_results(outputs, results)
-                exceptions = []
-                for res, dn in zip(_results, outputs):
-                    try:
-                        data_node = data_manager._get(dn.id)
-                        data_node.write(res, job_id=job_id)
-                    except Exception as e:
-                        logger.error("Error during write", exc_info=1)
-                        exceptions.append(DataNodeWritingError(f"Error writing in datanode id {dn.id}: {e}"))
-                return exceptions
+                if io_executor is None:
+                    errors = [write(res, dn) for res, dn in zip(_results, outputs)]
+                else:
+                    errors = list(io_executor.map(write, _results, outputs))
+                return [e for e in errors if e is not None]
         except Exception as e:
             return [e]
 
     def _execute_fct(self, arguments: List[Any]) -> Any:
-        return self.task.function(*arguments)
+        results = self.task.function(*arguments)
+        if inspect.iscoroutine(results):
+            # A coroutine function executed out of the asyncio executor runs on its own event loop.
+            return asyncio.run(results)
+        return results
 
     def _extract_results(self, outputs: List[DataNode], results: Any) -> List[Any]:
         _results: List[Any] = [results] if len(outputs) == 1 else results
@@ -0,0 +1,23 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from ...config.task_config import TaskConfig
+from ._standalone_job_dispatcher import _StandaloneJobDispatcher
+
+
+class _ThreadedJobDispatcher(_StandaloneJobDispatcher):
+    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ThreadPoolExecutor.
+
+    The jobs are executed in threads of the current process, sharing its managers. This avoids the cost of
+    spawning processes for I/O-bound tasks.
+    """
+
+    _DEFAULT_EXECUTOR = TaskConfig._THREAD_EXECUTOR
@@ -12,9 +12,8 @@
 import itertools
 from datetime import datetime
 from queue import Queue
-from threading import Lock
-from time import sleep
-from typing import Callable, Iterable, List, Optional, Set, Union
+from threading import Condition, Lock
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
@@ -37,8 +36,19 @@ class _Orchestrator(_AbstractOrchestrator):
 
     jobs_to_run: Queue = Queue()
     blocked_jobs: List[Job] = []
+    # Dependency graph of the blocked jobs: the ids of the input data nodes each blocked job is still waiting for,
+    # and the reverse edges from these data nodes to the blocked jobs waiting for them.
+    _blocking_data_node_ids: Dict[JobId, Set[str]] = {}
+    _waiting_jobs: Dict[str, Dict[JobId, Job]] = {}
+    # The ids of the unfinished jobs writing each data node. These data nodes are not checked when unblocking jobs,
+    # even if the cancellation of another job writing them has unlocked them.
+    _writing_jobs: Dict[str, Set[JobId]] = {}
 
     lock = Lock()
+    # Notified when jobs are queued, so the dispatcher does not need to poll the queue.
+    jobs_to_run_condition = Condition()
+    # Notified when the status of a job changes, so waiting for jobs does not need to poll their status.
+    __job_status_condition = Condition()
     __logger = _TaipyLogger._get_logger()
 
     @classmethod
@@ -163,9 +173,13 @@ class _Orchestrator(_AbstractOrchestrator):
     ) -> Job:
         for dn in task.output.values():
             dn.lock_edit()
-        return _JobManagerFactory._build_manager()._create(
+        job = _JobManagerFactory._build_manager()._create(
             task, itertools.chain([cls._on_status_change], callbacks or []), submit_id, submit_entity_id, force=force
         )
+        if not job._is_finished():
+            for dn in task.output.values():
+                cls._writing_jobs.setdefault(dn.id, set()).add(job.id)
+        return job
 
     @classmethod
     def _update_submission_status(cls, job: Job) -> None:
@@ -191,9 +205,10 @@ class _Orchestrator(_AbstractOrchestrator):
         pending_jobs = []
 
         for job in jobs:
-            if cls._is_blocked(job):
+            if blocking_data_node_ids := cls.__get_blocking_data_node_ids(job.task):
                 job.blocked()
                 blocked_jobs.append(job)
+                cls.__add_blocked_job(job, blocking_data_node_ids)
             else:
                 job.pending()
                 pending_jobs.append(job)
@@ -201,6 +216,14 @@ class _Orchestrator(_AbstractOrchestrator):
         cls.blocked_jobs.extend(blocked_jobs)
         for job in pending_jobs:
             cls.jobs_to_run.put(job)
+        if pending_jobs:
+            cls._notify_jobs_to_run()
+
+    @classmethod
+    def _notify_jobs_to_run(cls) -> None:
+        """Wake up the dispatcher waiting for a job to run."""
+        with cls.jobs_to_run_condition:
+            cls.jobs_to_run_condition.notify_all()
 
     @classmethod
     def _wait_until_job_finished(cls, jobs: Union[List[Job], Job], timeout: Optional[Union[float, int]] = None) -> None:
@@ -215,10 +238,12 @@ class _Orchestrator(_AbstractOrchestrator):
         index = 0
         while __check_if_timeout(start, timeout) and index < len(jobs):
             try:
-                if jobs[index]._is_finished():
-                    index += 1
-                else:
-                    sleep(0.5)  # Limit CPU usage
+                with cls.__job_status_condition:
+                    if jobs[index]._is_finished():
+                        index += 1
+                    else:
+                        # The timeout bounds the wait if the job status is changed by another process.
+                        cls.__job_status_condition.wait(timeout=0.5)
             except Exception:
                 pass
 
@@ -232,9 +257,18 @@ class _Orchestrator(_AbstractOrchestrator):
         Returns:
              True if one of its input data nodes is blocked.
         """
-        input_data_nodes = obj.task.input.values() if isinstance(obj, Job) else obj.input.values()
+        return bool(cls.__get_blocking_data_node_ids(obj.task if isinstance(obj, Job) else obj))
+
+    @staticmethod
+    def __get_blocking_data_node_ids(task: Task) -> Set[str]:
         data_manager = _DataManagerFactory._build_manager()
-        return any(not data_manager._get(dn.id).is_ready_for_reading for dn in input_data_nodes)
+        return {dn.id for dn in task.input.values() if not data_manager._get(dn.id).is_ready_for_reading}
+
+    @classmethod
+    def __add_blocked_job(cls, job: Job, blocking_data_node_ids: Set[str]) -> None:
+        cls._blocking_data_node_ids[job.id] = blocking_data_node_ids
+        for dn_id in blocking_data_node_ids:
+            cls._waiting_jobs.setdefault(dn_id, {})[job.id] = job
 
     @staticmethod
     def _unlock_edit_on_jobs_outputs(jobs: Union[Job, List[Job], Set[Job]]) -> None:
@@ -244,27 +278,77 @@ class _Orchestrator(_AbstractOrchestrator):
 
     @classmethod
     def _on_status_change(cls, job: Job) -> None:
+        if job._is_finished():
+            cls.__remove_writing_job(job)
         if job.is_completed() or job.is_skipped():
             cls.__logger.debug(f"{job.id} has been completed or skipped. Unblocking jobs.")
-            cls.__unblock_jobs()
+            cls.__unblock_jobs(dn.id for dn in job.task.output.values())
         elif job.is_failed():
             cls._fail_subsequent_jobs(job)
+        with cls.__job_status_condition:
+            cls.__job_status_condition.notify_all()
+
+    @classmethod
+    def __remove_writing_job(cls, job: Job) -> None:
+        for dn in job.task.output.values():
+            if writing_jobs := cls._writing_jobs.get(dn.id):
+                writing_jobs.discard(job.id)
+                if not writing_jobs:
+                    cls._writing_jobs.pop(dn.id, None)
 
     @classmethod
-    def __unblock_jobs(cls) -> None:
+    def _on_data_node_written(cls, data_node_id: str) -> None:
+        cls.__unblock_jobs([data_node_id])
+
+    @classmethod
+    def __unblock_jobs(cls, data_node_ids: Iterable[str]) -> None:
+        """Unblock the jobs waiting for the given data nodes, if all their blocking data nodes are ready for reading.
+
+        Only the given data nodes are checked: the outputs of a finished or canceled job, or a data node written
+        outside of a job. The data nodes no job is waiting for, or still written by an unfinished job, are skipped
+        without being read from the repository.
+        """
+        data_node_ids = [
+            dn_id for dn_id in data_node_ids if dn_id in cls._waiting_jobs and dn_id not in cls._writing_jobs
+        ]
+        if not data_node_ids:
+            return
+        data_manager = _DataManagerFactory._build_manager()
         with cls.lock:
             cls.__logger.debug("Acquiring lock to unblock jobs.")
-            for job in cls.blocked_jobs:
-                if not cls._is_blocked(job):
-                    cls.__logger.debug(f"Unblocking job: {job.id}.")
-                    job.pending()
-                    cls.__logger.debug(f"Removing job {job.id} from the blocked_job list.")
-                    cls.__remove_blocked_job(job)
-                    cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
-                    cls.jobs_to_run.put(job)
+            waiting_jobs: Dict[JobId, Job] = {}
+            for dn_id in data_node_ids:
+                # The jobs waiting for the data node may have been unblocked or canceled meanwhile.
+                if dn_id in cls._waiting_jobs and data_manager._get(dn_id).is_ready_for_reading:
+                    for job in cls._waiting_jobs.pop(dn_id).values():
+                        cls._blocking_data_node_ids[job.id].discard(dn_id)
+                        waiting_jobs[job.id] = job
+
+            unblocked = False
+            for job in waiting_jobs.values():
+                if cls._blocking_data_node_ids[job.id]:
+                    continue
+                # The inputs are checked again, in case one of them has been locked by another job meanwhile.
+                if blocking_data_node_ids := cls.__get_blocking_data_node_ids(job.task):
+                    cls.__add_blocked_job(job, blocking_data_node_ids)
+                    continue
+                cls.__logger.debug(f"Unblocking job: {job.id}.")
+                job.pending()
+                cls.__logger.debug(f"Removing job {job.id} from the blocked_job list.")
+                cls.__remove_blocked_job(job)
+                cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
+                cls.jobs_to_run.put(job)
+                unblocked = True
+            if unblocked:
+                cls._notify_jobs_to_run()
 
     @classmethod
     def __remove_blocked_job(cls, job: Job) -> None:
+        for dn_id in cls._blocking_data_node_ids.pop(job.id, set()):
+            if waiting_jobs := cls._waiting_jobs.get(dn_id):
+                waiting_jobs.pop(job.id, None)
+                if not waiting_jobs:
+                    del cls._waiting_jobs[dn_id]
         try:  # In case the job has been removed from the list of blocked_jobs.
             cls.blocked_jobs.remove(job)
         except Exception:
@@ -282,26 +366,26 @@ class _Orchestrator(_AbstractOrchestrator):
             with cls.lock:
                 cls.__logger.debug(f"Acquiring lock to cancel job {job.id}.")
                 to_cancel_or_abandon_jobs = {job}
-                to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job.submit_id, set(job.task.output.keys())))
+                to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job))
                 cls.__remove_blocked_jobs(to_cancel_or_abandon_jobs)
                 cls.__remove_jobs_to_run(to_cancel_or_abandon_jobs)
                 cls._cancel_jobs(job.id, to_cancel_or_abandon_jobs)
                 cls._unlock_edit_on_jobs_outputs(to_cancel_or_abandon_jobs)
+            # The outputs of the canceled jobs may be awaited by the jobs of other submissions.
+            cls.__unblock_jobs(dn.id for job in to_cancel_or_abandon_jobs for dn in job.task.output.values())
 
     @classmethod
-    def __find_subsequent_jobs(cls, submit_id, output_dn_config_ids: Set) -> Set[Job]:
-        next_output_dn_config_ids = set()
-        subsequent_jobs = set()
-        for job in cls.blocked_jobs:
-            job_input_dn_config_ids = job.task.input.keys()
-            if job.submit_id == submit_id and len(output_dn_config_ids.intersection(job_input_dn_config_ids)) > 0:
-                next_output_dn_config_ids.update(job.task.output.keys())
-                subsequent_jobs.update([job])
-        if next_output_dn_config_ids:
-            subsequent_jobs.update(
-                cls.__find_subsequent_jobs(submit_id, output_dn_config_ids=next_output_dn_config_ids)
-            )
-        return subsequent_jobs
+    def __find_subsequent_jobs(cls, job: Job) -> Set[Job]:
+        """Find the blocked jobs of the same submission depending on the outputs of the job, directly or not."""
+        subsequent_jobs: Dict[JobId, Job] = {}
+        output_dn_ids = [dn.id for dn in job.task.output.values()]
+        while output_dn_ids:
+            dn_id = output_dn_ids.pop()
+            for waiting_job in cls._waiting_jobs.get(dn_id, {}).values():
+                if waiting_job.submit_id == job.submit_id and waiting_job.id not in subsequent_jobs:
+                    subsequent_jobs[waiting_job.id] = waiting_job
+                    output_dn_ids.extend(dn.id for dn in waiting_job.task.output.values())
+        return set(subsequent_jobs.values())
 
     @classmethod
     def __remove_blocked_jobs(cls, jobs: Set[Job]) -> None:
@@ -322,9 +406,7 @@ class _Orchestrator(_AbstractOrchestrator):
         with cls.lock:
             cls.__logger.debug("Acquiring lock to fail subsequent jobs.")
             to_fail_or_abandon_jobs = set()
-            to_fail_or_abandon_jobs.update(
-                cls.__find_subsequent_jobs(failed_job.submit_id, set(failed_job.task.output.keys()))
-            )
+            to_fail_or_abandon_jobs.update(cls.__find_subsequent_jobs(failed_job))
             for job in to_fail_or_abandon_jobs:
                 job.abandoned()
             to_fail_or_abandon_jobs.update([failed_job])
@@ -336,7 +418,10 @@ class _Orchestrator(_AbstractOrchestrator):
     def _cancel_jobs(cls, job_id_to_cancel: JobId, jobs: Set[Job]) -> None:
         for job in jobs:
             if job.is_running():
-                cls.__logger.info(f"{job.id} is running and cannot be canceled.")
+                if job_id_to_cancel == job.id and cls.__cancel_running_job(job):
+                    job.canceled()
+                else:
+                    cls.__logger.info(f"{job.id} is running and cannot be canceled.")
             elif job.is_completed():
                 cls.__logger.info(f"{job.id} has already been completed and cannot be canceled.")
             elif job.is_skipped():
@@ -346,6 +431,14 @@ class _Orchestrator(_AbstractOrchestrator):
             else:
                 job.abandoned()
 
+    @staticmethod
+    def __cancel_running_job(job: Job) -> bool:
+        from ._orchestrator_factory import _OrchestratorFactory
+
+        if dispatcher := _OrchestratorFactory._dispatcher:
+            return dispatcher._cancel_running_job(job)
+        return False
+
     @staticmethod
     def _check_and_execute_jobs_if_development_mode() -> None:
         from ._orchestrator_factory import _OrchestratorFactory
@@ -17,7 +17,7 @@ from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ..exceptions.exceptions import ModeNotAvailable, OrchestratorNotBuilt
 from ._abstract_orchestrator import _AbstractOrchestrator
-from ._dispatcher import _DevelopmentJobDispatcher, _JobDispatcher, _StandaloneJobDispatcher
+from ._dispatcher import _DevelopmentJobDispatcher, _JobDispatcher, _StandaloneJobDispatcher, _ThreadedJobDispatcher
 from ._orchestrator import _Orchestrator
 
 
@@ -58,6 +58,8 @@ class _OrchestratorFactory:
             cls.__build_enterprise_job_dispatcher(force_restart=force_restart)
         elif Config.job_config.is_standalone:
             cls.__build_standalone_job_dispatcher(force_restart=force_restart)
+        elif Config.job_config.is_threaded:
+            cls.__build_threaded_job_dispatcher(force_restart=force_restart)
         elif Config.job_config.is_development:
             cls.__build_development_job_dispatcher()
         else:
@@ -74,11 +76,15 @@ class _OrchestratorFactory:
 
     @classmethod
     def __build_standalone_job_dispatcher(cls, force_restart=False):
-        if isinstance(cls._dispatcher, _StandaloneJobDispatcher):
+        if isinstance(cls._dispatcher, _StandaloneJobDispatcher) and not isinstance(
+            cls._dispatcher, _ThreadedJobDispatcher
+        ):
             if force_restart:
                 cls._dispatcher.stop()
             else:
                 return
+        if isinstance(cls._dispatcher, _ThreadedJobDispatcher):
+            cls._dispatcher.stop()
 
         if EnterpriseEditionUtils._using_enterprise():
             cls._dispatcher = _load_fct(
@@ -88,6 +94,19 @@ class _OrchestratorFactory:
             cls._dispatcher = _StandaloneJobDispatcher(typing.cast(_AbstractOrchestrator, cls._orchestrator))
         cls._dispatcher.start()  # type: ignore
 
+    @classmethod
+    def __build_threaded_job_dispatcher(cls, force_restart=False):
+        if isinstance(cls._dispatcher, _ThreadedJobDispatcher):
+            if force_restart:
+                cls._dispatcher.stop()
+            else:
+                return
+        if isinstance(cls._dispatcher, _StandaloneJobDispatcher):
+            cls._dispatcher.stop()
+
+        cls._dispatcher = _ThreadedJobDispatcher(typing.cast(_AbstractOrchestrator, cls._orchestrator))
+        cls._dispatcher.start()  # type: ignore
+
     @classmethod
     def __build_development_job_dispatcher(cls):
         if isinstance(cls._dispatcher, _StandaloneJobDispatcher):
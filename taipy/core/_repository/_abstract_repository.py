@@ -32,6 +32,19 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _save_many(self, entities: Iterable[Entity]):
+        """
+        Save several entities in the repository.
+
+        Repositories should override this method when saving entities together is cheaper than saving them
+        one by one.
+
+        Arguments:
+            entities: The entities to save.
+        """
+        for entity in entities:
+            self._save(entity)
+
     @abstractmethod
     def _exists(self, entity_id: str) -> bool:
         """
@@ -116,6 +129,20 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: Optional[List[Dict]] = None):
+        """
+        Get the first entity of each pair of config and owner id.
+
+        Arguments:
+            configs_and_owner_ids: The pairs of config and owner id to look up.
+            filters: The additional filters the entities must match.
+
+        Returns:
+            A dictionary of the entities found, by pair of config and owner id.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]):
         """
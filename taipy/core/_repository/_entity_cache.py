@@ -0,0 +1,112 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections import OrderedDict
+from copy import copy
+from threading import Lock
+from typing import Any, Hashable, Optional, Tuple
+
+from .._entity._properties import _Properties
+
+
+class _EntityCache:
+    """
+    Bounded identity map of the entities loaded from or saved to a repository.
+
+    Each entry is stored with a version token provided by the repository (e.g. the file modification time and
+    size for a file system repository). An entry is only returned if the token given on lookup matches the one
+    it was stored with, so that an entity modified by another process is never served from the cache.
+
+    An entry holds either an entity or the serialized document it was saved as, which is only converted to an
+    entity the next time it is loaded. The cached entities are never handed out: a structural copy is returned
+    instead, so that the changes made to an entity (in particular within an entity context) are not visible to
+    the other holders.
+
+    The cache is enabled by setting the *entity_cache_size* repository property to a positive integer.
+    """
+
+    _SIZE_PROPERTY = "entity_cache_size"
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, Tuple[Any, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def _get(self, key: Hashable, token: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != token:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return self.__clone(entry[1])
+
+    def _put(self, key: Hashable, token: Any, entity: Any):
+        entity = self.__clone(entity)
+        with self._lock:
+            self._entries[key] = (token, entity)
+            self._entries.move_to_end(key)
+            self.__evict()
+
+    def _invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _resize(self, max_size: int):
+        with self._lock:
+            self._max_size = max_size
+            self.__evict()
+
+    @classmethod
+    def __clone(cls, entity: Any) -> Any:
+        if isinstance(entity, str):
+            return entity
+        clone = object.__new__(type(entity))
+        state = {}
+        for name, value in vars(entity).items():
+            if name in ("_is_in_context", "_in_context_attributes_changed_collector"):
+                continue
+            if isinstance(value, _Properties):
+                properties = copy(value)
+                properties._entity_owner = clone
+                properties._pending_changes = {}
+                properties._pending_deletions = set()
+                value = properties
+            else:
+                value = cls.__copy_container(value)
+            state[name] = value
+        # Bypass the entities' __setattr__ which may trigger a save.
+        clone.__dict__.update(state)
+        return clone
+
+    @classmethod
+    def __copy_container(cls, value: Any) -> Any:
+        from .._entity._entity import _Entity
+        from .._entity._reload import _get_manager
+
+        if isinstance(value, _Entity):
+            # Nested entities are reloaded, as they would be when converting the entity from its model.
+            return _get_manager(value._MANAGER_NAME)._get(value, value)
+        if isinstance(value, dict):
+            return type(value)((k, cls.__copy_container(v)) for k, v in value.items())
+        if isinstance(value, (list, set)):
+            return type(value)(cls.__copy_container(v) for v in value)
+        return value
+
+    def __evict(self):
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
@@ -0,0 +1,250 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+import pathlib
+import uuid
+from collections import defaultdict
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ._decoder import _Decoder
+from ._encoder import _Encoder
+
+
+class _FileSystemIndex:
+    """
+    Persistent secondary index of the entities stored by a `_FileSystemRepository`.
+
+    The index is an append-only journal stored next to the entity directory. After a header line identifying
+    the journal, each line records either the indexed attributes of a saved entity or the deletion of an
+    entity, the last line of an entity being the one that applies. Appending a line is the only write
+    operation, which keeps the index consistent when several processes (e.g. standalone workers) save
+    entities concurrently.
+
+    Each process keeps an in-memory view of the journal that is refreshed with the lines appended since the
+    last lookup. If the journal does not exist, it is rebuilt by reading all the entity files once.
+
+    Once the journal holds many more lines than live entities, it is compacted: it is replaced by a journal
+    holding only the live entities. A process that appended lines to the replaced journal appends them again
+    to the new one.
+
+    The index only provides candidates: the repository still checks the content of the candidate files
+    against the filters.
+    """
+
+    _ATTRIBUTES = ("config_id", "owner_id", "version", "cycle", "parent_ids")
+    _ID_KEY = "id"
+    _DELETED_KEY = "deleted"
+    _JOURNAL_KEY = "journal"
+    _COMPACTION_FACTOR = 4
+    _MIN_NB_OF_LINES_TO_COMPACT = 1000
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        attributes: Iterable[str],
+        loader: Callable[[], Iterable[Tuple[str, Dict[str, Any]]]],
+    ):
+        """
+        Arguments:
+            path (pathlib.Path): The path of the journal.
+            attributes (Iterable[str]): The indexed attributes.
+            loader (Callable): Returns the (entity id, entity content) pairs of all the stored entities. It is
+                only called to rebuild a missing journal.
+        """
+        self._path = path
+        self._attributes = tuple(attributes)
+        self._loader = loader
+        self._lock = Lock()
+        self.__reset()
+
+    def _add(self, models: Iterable[Dict[str, Any]]):
+        self.__append([self.__to_record(model) for model in models])
+
+    def _remove(self, entity_ids: Iterable[str]):
+        self.__append([{self._ID_KEY: entity_id, self._DELETED_KEY: True} for entity_id in entity_ids])
+
+    def _clear(self):
+        with self._lock:
+            self._path.unlink(missing_ok=True)
+            self.__reset()
+
+    def _can_answer(self, filters: Optional[List[Dict]]) -> bool:
+        if not filters:
+            return False
+        for fil in filters:
+            indexed_values = [value for key, value in fil.items() if key in self._attributes]
+            # A list is compared as a whole to the attribute value, which the postings cannot answer.
+            if not indexed_values or any(isinstance(value, (list, tuple, set)) for value in indexed_values):
+                return False
+        return True
+
+    def _get_ids(self, filters: List[Dict]) -> Set[str]:
+        """Return the ids of the entities that may match at least one of the filters.
+
+        Each filter must contain at least one indexed attribute.
+        """
+        with self._lock:
+            self.__refresh()
+            ids: Set[str] = set()
+            for fil in filters:
+                id_sets = [
+                    self._postings[key].get(self.__hashable(value), set())
+                    for key, value in fil.items()
+                    if key in self._attributes
+                ]
+                ids.update(set.intersection(*id_sets))
+            return ids
+
+    def __append(self, records: List[Dict]):
+        if not records:
+            return
+        with self._lock:
+            self.__create_if_not_exists()
+            lines = self.__to_lines(records)
+            while True:
+                # A single write in append mode, so that lines appended by concurrent processes are not
+                # interleaved.
+                with self._path.open("a", encoding="UTF-8") as f:
+                    f.write(lines)
+                    f.flush()
+                    if not self.__is_replaced(f):
+                        return
+
+    def __create_if_not_exists(self):
+        if self._path.exists():
+            return
+        records = [self.__to_record({**content, self._ID_KEY: entity_id}) for entity_id, content in self._loader()]
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            header = {self._JOURNAL_KEY: uuid.uuid4().hex}
+            tmp_path.write_text(self.__to_lines([header, *records]), encoding="UTF-8")
+            # Linking fails if another process created the journal meanwhile: its journal is kept, and the
+            # entities saved after its rebuild are appended to it.
+            os.link(tmp_path, self._path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def __is_replaced(self, f) -> bool:
+        """Check if the journal open as *f* has been replaced by its compaction in another process."""
+        try:
+            return os.fstat(f.fileno()).st_ino != os.stat(self._path).st_ino
+        except FileNotFoundError:
+            return False
+
+    def __refresh(self):
+        self.__create_if_not_exists()
+        self.__read()
+        if self._nb_of_lines > max(self._MIN_NB_OF_LINES_TO_COMPACT, self._COMPACTION_FACTOR * len(self._records)):
+            self.__compact()
+
+    def __read(self):
+        with self._path.open("rb") as f:
+            # The header identifies the journal, which may have been deleted and rebuilt by another process.
+            header = f.readline()
+            if header != self._header:
+                self.__reset()
+                self._header = header
+                self._offset = len(header)
+            f.seek(self._offset)
+            content = f.read()
+
+        # A line being appended by another process is only read once complete.
+        end = content.rfind(b"\n") + 1
+        self._offset += end
+        for line in content[:end].decode("UTF-8").splitlines():
+            if line:
+                self.__apply(json.loads(line, cls=_Decoder))
+                self._nb_of_lines += 1
+
+    def __compact(self):
+        """Replace the journal by a journal holding only the live entities."""
+        lock_path = self._path.with_name(f"{self._path.name}.lock")
+        try:
+            # Only one process compacts the journal at a time.
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return
+        tmp_path = self._path.with_name(f"{self._path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with self._path.open("rb") as f:
+                # The journal may have been replaced since it was read.
+                if f.readline() != self._header:
+                    return
+                records = [{**values, self._ID_KEY: entity_id} for entity_id, values in self._records.items()]
+                tmp_path.write_text(
+                    self.__to_lines([{self._JOURNAL_KEY: uuid.uuid4().hex}, *records]), encoding="UTF-8"
+                )
+                os.replace(tmp_path, self._path)
+                # The lines appended by other processes meanwhile are moved to the new journal.
+                f.seek(self._offset)
+                content = f.read()
+            if content := content[: content.rfind(b"\n") + 1]:
+                with self._path.open("ab") as new_journal:
+                    new_journal.write(content)
+        except OSError:
+            # The journal cannot be replaced while it is open by another process on some platforms.
+            return
+        finally:
+            tmp_path.unlink(missing_ok=True)
+            lock_path.unlink(missing_ok=True)
+        self.__reset()
+        self.__read()
+
+    def __apply(self, record: Dict[str, Any]):
+        entity_id = record[self._ID_KEY]
+        if previous := self._records.pop(entity_id, None):
+            for key, value in previous.items():
+                for v in self.__values(value):
+                    self._postings[key][v].discard(entity_id)
+        if record.get(self._DELETED_KEY):
+            return
+
+        values = {key: record.get(key) for key in self._attributes}
+        self._records[entity_id] = values
+        for key, value in values.items():
+            for v in self.__values(value):
+                self._postings[key][v].add(entity_id)
+
+    def __reset(self):
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[Any, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._header: Optional[bytes] = None
+        self._offset = 0
+        self._nb_of_lines = 0
+
+    def __to_record(self, model: Dict[str, Any]) -> Dict[str, Any]:
+        record = {key: model[key] for key in self._attributes if key in model}
+        record[self._ID_KEY] = model[self._ID_KEY]
+        return record
+
+    @staticmethod
+    def __to_lines(records: List[Dict]) -> str:
+        return "".join(json.dumps(r, ensure_ascii=False, cls=_Encoder) + "\n" for r in records)
+
+    @classmethod
+    def __values(cls, value) -> List:
+        if isinstance(value, (list, tuple, set)):
+            return [cls.__hashable(v) for v in value]
+        return [cls.__hashable(value)]
+
+    @staticmethod
+    def __hashable(value):
+        try:
+            hash(value)
+            return value
+        except TypeError:
+            return json.dumps(value, cls=_Encoder)
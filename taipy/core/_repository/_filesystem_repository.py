@@ -11,9 +11,11 @@
 
 import copy
 import json
+import os
 import pathlib
 import shutil
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from taipy.common.config import Config
 
@@ -23,6 +25,8 @@ from ..exceptions import FileCannotBeRead, FileEmpty, ModelNotFound
 from ._abstract_repository import _AbstractRepository
 from ._decoder import _Decoder
 from ._encoder import _Encoder
+from ._entity_cache import _EntityCache
+from ._filesystem_index import _FileSystemIndex
 
 
 class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
@@ -40,11 +44,19 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     """
 
     __EXCEPTIONS_TO_RETRY = (FileCannotBeRead, FileEmpty)
+    __EXCEPTIONS_TO_RETRY_ON_WRITE = (PermissionError,)
+    _ENTITY_SUFFIX = ".json"
+    _TMP_SUFFIX = ".tmp"
+    _INDEX_SUFFIX = ".index.jsonl"
 
     def __init__(self, model_type: Type[ModelType], converter: Type[Converter], dir_name: str):
         self.model_type = model_type
         self.converter = converter
         self._dir_name = dir_name
+        self._cache: Optional[_EntityCache] = None
+        self._fs_index: Optional[_FileSystemIndex] = None
+        model_fields = getattr(model_type, "__dataclass_fields__", {})
+        self._indexed_attributes = [a for a in _FileSystemIndex._ATTRIBUTES if a in model_fields]
 
     @property
     def dir_path(self):
@@ -54,17 +66,49 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     def _storage_folder(self) -> pathlib.Path:
         return pathlib.Path(Config.core.taipy_storage_folder)
 
+    @property
+    def _entity_cache(self) -> Optional[_EntityCache]:
+        size = int(Config.core.repository_properties.get(_EntityCache._SIZE_PROPERTY, 0) or 0)
+        if size <= 0:
+            self._cache = None
+        elif self._cache is None:
+            self._cache = _EntityCache(size)
+        else:
+            self._cache._resize(size)
+        return self._cache
+
+    @property
+    def _index(self) -> Optional[_FileSystemIndex]:
+        if not self._indexed_attributes:
+            return None
+        path = self._storage_folder / f"{self._dir_name}{self._INDEX_SUFFIX}"
+        if self._fs_index is None or self._fs_index._path != path:
+            self._fs_index = _FileSystemIndex(path, self._indexed_attributes, self.__load_index_contents)
+        return self._fs_index
+
     ###############################
     # ##   Inherited methods   ## #
     ###############################
 
     def _save(self, entity: Entity):
+        self._save_many([entity])
+
+    def _save_many(self, entities: Iterable[Entity]):
+        model_dicts = [self.converter._entity_to_model(entity).to_dict() for entity in entities]  # type: ignore
+        if not model_dicts:
+            return
+
         self.__create_directory_if_not_exists()
-        model = self.converter._entity_to_model(entity)  # type: ignore
-        self.__get_path(model.id).write_text(
-            json.dumps(model.to_dict(), ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
-            encoding="UTF-8",
-        )
+        cache = self._entity_cache
+        for model_dict in model_dicts:
+            path = self.__get_path(model_dict["id"])
+            file_content = json.dumps(model_dict, ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False)
+            self.__write_file(path, file_content)
+            if cache:
+                # The entity is rebuilt from the saved content on the next load so that it matches what is persisted.
+                cache._put(path, self.__get_version_token(path), file_content)
+        if index := self._index:
+            index._add(model_dicts)
 
     def _exists(self, entity_id: str) -> bool:
         return self.__get_path(entity_id).exists()
@@ -72,17 +116,33 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     def _load(self, entity_id: str) -> Entity:
         path = pathlib.Path(self.__get_path(entity_id))
 
-        try:
-            file_content = self.__read_file(path)
-        except (FileNotFoundError, FileCannotBeRead, FileEmpty):
-            raise ModelNotFound(str(self.dir_path), entity_id) from None
+        token, file_content = None, None
+        if cache := self._entity_cache:
+            try:
+                token = self.__get_version_token(path)
+            except FileNotFoundError:
+                cache._invalidate(path)
+                raise ModelNotFound(str(self.dir_path), entity_id) from None
+            cached = cache._get(path, token)
+            if cached is not None and not isinstance(cached, str):
+                return cached
+            file_content = cached
+
+        if not file_content:
+            try:
+                file_content = self.__read_file(path)
+            except (FileNotFoundError, FileCannotBeRead, FileEmpty):
+                raise ModelNotFound(str(self.dir_path), entity_id) from None
 
-        return self.__file_content_to_entity(file_content)
+        entity = self.__file_content_to_entity(file_content)
+        if cache:
+            cache._put(path, token, entity)
+        return entity
 
     def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
         entities = []
         try:
-            for f in self.dir_path.iterdir():
+            for f in self.__get_paths(filters):
                 if data := self.__filter_by(f, filters):
                     entities.append(self.__file_content_to_entity(data))
         except FileNotFoundError:
@@ -90,13 +150,22 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         return entities
 
     def _delete(self, entity_id: str):
+        path = self.__get_path(entity_id)
+        if cache := self._entity_cache:
+            cache._invalidate(path)
         try:
-            self.__get_path(entity_id).unlink()
+            path.unlink()
         except FileNotFoundError:
             raise ModelNotFound(str(self.dir_path), entity_id) from None
+        if index := self._index:
+            index._remove([entity_id])
 
     def _delete_all(self):
+        if cache := self._entity_cache:
+            cache._clear()
         shutil.rmtree(self.dir_path, ignore_errors=True)
+        if index := self._index:
+            index._clear()
 
     def _delete_many(self, ids: Iterable[str]):
         for model_id in ids:
@@ -107,12 +176,19 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         for fil in filters:
             fil.update({attribute: value})
 
+        cache = self._entity_cache
+        deleted_ids = []
         try:
-            for f in self.dir_path.iterdir():
+            for f in self.__get_paths(filters):
                 if self.__filter_by(f, filters):
+                    if cache:
+                        cache._invalidate(f)
                     f.unlink()
+                    deleted_ids.append(f.stem)
         except FileNotFoundError:
             pass
+        if index := self._index:
+            index._remove(deleted_ids)
 
     def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
         return list(self.__search(attribute, value, filters))
@@ -142,8 +218,15 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         res = {}
         configs_and_owner_ids = set(configs_and_owner_ids)
 
+        if self.__can_use_index(["config_id", "owner_id"]):
+            for config, owner_id in configs_and_owner_ids:
+                _filters = [{**fil, "config_id": config.id, "owner_id": owner_id} for fil in filters]
+                if entity := self.__get_first_entity(_filters):
+                    res[config, owner_id] = entity
+            return res
+
         try:
-            for f in self.dir_path.iterdir():
+            for f in self.__iter_entity_files():
                 config_id, owner_id, entity = self.__match_file_and_get_entity(
                     f, configs_and_owner_ids, copy.deepcopy(filters)
                 )
@@ -166,6 +249,9 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     ) -> Optional[Entity]:
         filters = [{}] if not filters else copy.deepcopy(filters)
 
+        if self.__can_use_index(["config_id", "owner_id"]):
+            return self.__get_first_entity([{**fil, "config_id": config_id, "owner_id": owner_id} for fil in filters])
+
         if owner_id is not None:
             for fil in filters:
                 fil.update({"owner_id": owner_id})
@@ -179,7 +265,7 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
     ):
         try:
-            files = filter(lambda f: config_id in f.name, self.dir_path.iterdir())
+            files = filter(lambda f: config_id in f.name, self.__iter_entity_files())
             entities = (self.__file_content_to_entity(self.__filter_by(f, filters)) for f in files)
             corresponding_entities = filter(
                 lambda e: e is not None and e.config_id == config_id and e.owner_id == owner_id,  # type: ignore
@@ -205,10 +291,46 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         self.dir_path.mkdir(parents=True, exist_ok=True)
 
     def __search(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Iterator[Entity]:
+        if (value is None or isinstance(value, str)) and self.__can_use_index([attribute]):
+            filters = [{**fil, attribute: value} for fil in (filters or [{}])]
         return filter(lambda e: getattr(e, attribute, None) == value, self._load_all(filters))
 
+    def __can_use_index(self, attributes: List[str]) -> bool:
+        return all(attribute in self._indexed_attributes for attribute in attributes)
+
+    def __get_paths(self, filters: Optional[List[Dict]]) -> Iterable[pathlib.Path]:
+        if (index := self._index) and index._can_answer(filters):
+            return [self.__get_path(entity_id) for entity_id in index._get_ids(filters)]  # type: ignore
+        return self.__iter_entity_files()
+
+    def __iter_entity_files(self) -> Iterator[pathlib.Path]:
+        # The temporary files of the entities being saved are skipped.
+        return (f for f in self.dir_path.iterdir() if f.suffix == self._ENTITY_SUFFIX)
+
+    def __get_first_entity(self, filters: List[Dict]) -> Optional[Entity]:
+        for f in self.__get_paths(filters):
+            if data := self.__filter_by(f, filters):
+                return self.__file_content_to_entity(data)
+        return None
+
+    def __load_index_contents(self) -> Iterator[Tuple[str, Dict]]:
+        try:
+            for f in self.__iter_entity_files():
+                try:
+                    yield f.stem, json.loads(self.__read_file(f), cls=_Decoder)
+                except (FileNotFoundError, FileCannotBeRead, FileEmpty):
+                    continue
+        except FileNotFoundError:
+            return
+
     def __get_path(self, model_id) -> pathlib.Path:
-        return self.dir_path / f"{model_id}.json"
+        return self.dir_path / f"{model_id}{self._ENTITY_SUFFIX}"
+
+    @staticmethod
+    def __get_version_token(path: pathlib.Path):
+        # The modification time and size of the file are used to detect changes made by other processes.
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
 
     def __file_content_to_entity(self, file_content):
         if not file_content:
@@ -235,6 +357,14 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
                 return json.loads(file_content, cls=_Decoder)
         return None
 
+    @_retry_repository_operation(__EXCEPTIONS_TO_RETRY_ON_WRITE)
+    def __write_file(self, filepath: pathlib.Path, file_content: str):
+        # The content is written in a temporary file that then replaces the entity file, so that the threads and
+        # processes reading the entity concurrently never read a partially written file.
+        tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.{threading.get_ident()}{self._TMP_SUFFIX}")
+        tmp_path.write_text(file_content, encoding="UTF-8")
+        os.replace(tmp_path, filepath)
+
     @_retry_repository_operation(__EXCEPTIONS_TO_RETRY)
     def __read_file(self, filepath: pathlib.Path) -> str:
         if not filepath.is_file():
@@ -0,0 +1,73 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+import sqlite3
+import threading
+from typing import Dict, Set, Tuple
+
+from taipy.common.config import Config
+
+
+class _SQLConnection:
+    """
+    Holds the SQLite connections used by the SQL repositories.
+
+    SQLite connections cannot be shared between threads, so each thread opens its own connection to the
+    database file. The database is opened in WAL mode so that readers are not blocked by a writer, e.g. a
+    standalone worker saving a data node.
+
+    The database file is set by the *db_location* repository property. It defaults to a *taipy.sqlite3* file
+    in the Taipy storage folder.
+    """
+
+    _DB_LOCATION_PROPERTY = "db_location"
+    _DEFAULT_DB_NAME = "taipy.sqlite3"
+    _BUSY_TIMEOUT = 30
+
+    __local = threading.local()
+
+    @classmethod
+    def _get_db_location(cls) -> str:
+        if db_location := Config.core.repository_properties.get(cls._DB_LOCATION_PROPERTY):
+            return str(db_location)
+        return str(pathlib.Path(Config.core.taipy_storage_folder) / cls._DEFAULT_DB_NAME)
+
+    @classmethod
+    def _get_connection(cls) -> Tuple[sqlite3.Connection, Set[str]]:
+        """Return the connection of the current thread and the set of tables created through it."""
+        db_location = cls._get_db_location()
+        connections: Dict[str, Tuple[sqlite3.Connection, Set[str]]] = cls.__local.__dict__.setdefault("connections", {})
+        if db_location in connections and os.path.exists(db_location):
+            return connections[db_location]
+        if db_location in connections:
+            # The database file has been removed: a new one is created.
+            connections.pop(db_location)[0].close()
+
+        connections[db_location] = cls._connect(db_location), set()
+        return connections[db_location]
+
+    @classmethod
+    def _connect(cls, db_location: str) -> sqlite3.Connection:
+        """Open a new connection to the database file, creating it if needed."""
+        pathlib.Path(db_location).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(db_location, timeout=cls._BUSY_TIMEOUT)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @classmethod
+    def _close(cls):
+        """Close the connections of the current thread."""
+        connections = cls.__local.__dict__.pop("connections", {})
+        for connection, _ in connections.values():
+            connection.close()
@@ -0,0 +1,231 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import pathlib
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ..common.typing import Converter, Entity, ModelType
+from ..exceptions import ModelNotFound
+from ._abstract_repository import _AbstractRepository
+from ._decoder import _Decoder
+from ._encoder import _Encoder
+from ._sql_connection import _SQLConnection
+
+
+class _SQLRepository(_AbstractRepository[ModelType, Entity]):
+    """
+    Holds common methods to be used and extended when the need for saving
+    dataclasses in a SQLite database emerges.
+
+    Each model is stored as a JSON document in a table. The attributes used to look entities up
+    (config id, owner id, version, ...) are also stored in indexed columns, so that filtered queries
+    do not need to read all the entities.
+
+    Attributes:
+        model_type (ModelType): Generic dataclass.
+        converter: A class that handles conversion to and from a database backend.
+        table_name (str): Name of the table that holds the models.
+    """
+
+    _INDEXED_COLUMNS = (
+        "config_id",
+        "owner_id",
+        "version",
+        "cycle",
+        "task_id",
+        "submit_id",
+        "submit_entity_id",
+        "entity_id",
+        "status",
+    )
+    _DATA_COLUMN = "data"
+    __MAX_PARAMETERS = 900
+
+    def __init__(self, model_type: Type[ModelType], converter: Type[Converter], table_name: str):
+        self.model_type = model_type
+        self.converter = converter
+        self._table_name = table_name
+        model_fields = getattr(model_type, "__dataclass_fields__", {})
+        self._columns = [c for c in self._INDEXED_COLUMNS if c in model_fields]
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection, tables = _SQLConnection._get_connection()
+        if self._table_name not in tables:
+            self.__create_table_if_not_exists(connection)
+            tables.add(self._table_name)
+        return connection
+
+    ###############################
+    # ##   Inherited methods   ## #
+    ###############################
+
+    def _save(self, entity: Entity):
+        self._save_many([entity])
+
+    def _save_many(self, entities: Iterable[Entity]):
+        rows = [self.__to_row(self.converter._entity_to_model(entity).to_dict()) for entity in entities]  # type: ignore
+        with self._connection as connection:
+            connection.executemany(self.__upsert_query, rows)
+
+    def _exists(self, entity_id: str) -> bool:
+        query = f"SELECT 1 FROM {self._table_name} WHERE id = ?"
+        return self._connection.execute(query, (entity_id,)).fetchone() is not None
+
+    def _load(self, entity_id: str) -> Entity:
+        query = f"SELECT {self._DATA_COLUMN} FROM {self._table_name} WHERE id = ?"
+        if row := self._connection.execute(query, (entity_id,)).fetchone():
+            return self.__to_entity(row[0])
+        raise ModelNotFound(self._table_name, entity_id)
+
+    def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        where, parameters = self.__build_where_clause(filters)
+        query = f"SELECT {self._DATA_COLUMN} FROM {self._table_name}{where} ORDER BY rowid"
+        return [self.__to_entity(row[0]) for row in self._connection.execute(query, parameters)]
+
+    def _delete(self, entity_id: str):
+        with self._connection as connection:
+            if connection.execute(f"DELETE FROM {self._table_name} WHERE id = ?", (entity_id,)).rowcount == 0:
+                raise ModelNotFound(self._table_name, entity_id)
+
+    def _delete_all(self):
+        with self._connection as connection:
+            connection.execute(f"DELETE FROM {self._table_name}")
+
+    def _delete_many(self, ids: Iterable[str]):
+        with self._connection as connection:
+            for entity_id in ids:
+                if connection.execute(f"DELETE FROM {self._table_name} WHERE id = ?", (entity_id,)).rowcount == 0:
+                    raise ModelNotFound(self._table_name, entity_id)
+
+    def _delete_by(self, attribute: str, value: str):
+        where, parameters = self.__build_where_clause([{attribute: value}])
+        with self._connection as connection:
+            connection.execute(f"DELETE FROM {self._table_name}{where}", parameters)
+
+    def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        if value is None or isinstance(value, str):
+            filters = [{**fil, attribute: value} for fil in (filters or [{}])]
+        return [e for e in self._load_all(filters) if getattr(e, attribute, None) == value]
+
+    def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]):
+        query = f"SELECT {self._DATA_COLUMN} FROM {self._table_name} WHERE id = ?"
+        if not (row := self._connection.execute(query, (entity_id,)).fetchone()):
+            raise ModelNotFound(self._table_name, entity_id)
+
+        export_dir = pathlib.Path(folder_path) / self._table_name
+        export_dir.mkdir(parents=True, exist_ok=True)
+        (export_dir / f"{entity_id}.json").write_text(row[0], encoding="UTF-8")
+
+    ###########################################
+    # ##   Specific or optimized methods   ## #
+    ###########################################
+    def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: Optional[List[Dict]] = None):
+        keys = {(config.id, owner_id): (config, owner_id) for config, owner_id in set(configs_and_owner_ids)}
+        filters_where, filters_parameters = self.__build_where_clause(filters)
+        res = {}
+        pairs = list(keys.keys())
+        chunk_size = max(1, (self.__MAX_PARAMETERS - len(filters_parameters)) // 2)
+        for i in range(0, len(pairs), chunk_size):
+            chunk = pairs[i : i + chunk_size]
+            condition = " OR ".join(["(config_id = ? AND owner_id IS ?)"] * len(chunk))
+            where = f"{filters_where} AND ({condition})" if filters_where else f" WHERE {condition}"
+            query = f"SELECT config_id, owner_id, {self._DATA_COLUMN} FROM {self._table_name}{where} ORDER BY rowid"
+            parameters = [*filters_parameters, *(p for pair in chunk for p in pair)]
+            for config_id, owner_id, data in self._connection.execute(query, parameters):
+                if (key := keys[(config_id, owner_id)]) not in res:
+                    res[key] = self.__to_entity(data)
+        return res
+
+    def _get_by_config_and_owner_id(
+        self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
+    ) -> Optional[Entity]:
+        filters = [{**fil, "config_id": config_id, "owner_id": owner_id} for fil in (filters or [{}])]
+        where, parameters = self.__build_where_clause(filters)
+        query = f"SELECT {self._DATA_COLUMN} FROM {self._table_name}{where} ORDER BY rowid LIMIT 1"
+        if row := self._connection.execute(query, parameters).fetchone():
+            return self.__to_entity(row[0])
+        return None
+
+    def _import_documents(self, documents: Iterable[Dict], connection: sqlite3.Connection):
+        """Insert serialized models in a single transaction.
+
+        Used to migrate the entities of another repository into a database.
+        """
+        self.__create_table_if_not_exists(connection)
+        with connection:
+            connection.executemany(self.__upsert_query, (self.__to_row(document) for document in documents))
+
+    #############################
+    # ##   Private methods   ## #
+    #############################
+
+    def __create_table_if_not_exists(self, connection: sqlite3.Connection):
+        columns = "".join(f", {c} TEXT" for c in self._columns)
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table_name} "
+                f"(id TEXT PRIMARY KEY{columns}, {self._DATA_COLUMN} TEXT NOT NULL)"
+            )
+            for column in self._columns:
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS ix_{self._table_name}_{column} ON {self._table_name} ({column})"
+                )
+            if "config_id" in self._columns and "owner_id" in self._columns:
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS ix_{self._table_name}_config_id_owner_id "
+                    f"ON {self._table_name} (config_id, owner_id)"
+                )
+
+    @property
+    def __upsert_query(self) -> str:
+        columns = ["id", *self._columns, self._DATA_COLUMN]
+        return (
+            f"INSERT OR REPLACE INTO {self._table_name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+
+    def __to_row(self, model_dict: Dict[str, Any]) -> Tuple:
+        data = json.dumps(model_dict, ensure_ascii=False, cls=_Encoder, check_circular=False)
+        return (model_dict["id"], *(self.__to_column_value(model_dict.get(c)) for c in self._columns), data)
+
+    @staticmethod
+    def __to_column_value(value: Any) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        return json.dumps(value, ensure_ascii=False, cls=_Encoder)
+
+    def __build_where_clause(self, filters: Optional[List[Dict]]) -> Tuple[str, List]:
+        """Build a WHERE clause matching any of the filters, each filter matching all its attributes."""
+        if not filters or not any(filters):
+            return "", []
+
+        conditions, parameters = [], []
+        for fil in filters:
+            fil_conditions = []
+            for key, value in fil.items():
+                if key == "id" or key in self._columns:
+                    column = key
+                else:
+                    column = f"json_extract({self._DATA_COLUMN}, '$.{key}')"
+                if value is None:
+                    fil_conditions.append(f"{column} IS NULL")
+                else:
+                    fil_conditions.append(f"{column} = ?")
+                    parameters.append(value if key not in self._columns else self.__to_column_value(value))
+            conditions.append(f"({' AND '.join(fil_conditions) or '1'})")
+        return f" WHERE ({' OR '.join(conditions)})", parameters
+
+    def __to_entity(self, data: str) -> Entity:
+        model = self.model_type.from_dict(json.loads(data, cls=_Decoder))  # type: ignore[attr-defined]
+        return self.converter._model_to_entity(model)  # type: ignore[attr-defined]
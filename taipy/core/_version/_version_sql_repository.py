@@ -0,0 +1,83 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sqlite3
+from typing import Dict
+
+from .._repository._sql_repository import _SQLRepository
+from ..exceptions import ModelNotFound
+from ._version_converter import _VersionConverter
+from ._version_model import _VersionModel
+
+
+class _VersionSQLRepository(_SQLRepository):
+    _LATEST_VERSION_KEY = "latest_version"
+    _DEVELOPMENT_VERSION_KEY = "development_version"
+    _VERSION_INFO_TABLE = "version_info"
+
+    def __init__(self) -> None:
+        super().__init__(model_type=_VersionModel, converter=_VersionConverter, table_name="version")
+
+    def _delete_all(self):
+        super()._delete_all()
+
+        with self.__connection as connection:
+            connection.execute(f"DELETE FROM {self._VERSION_INFO_TABLE}")
+
+    def _set_latest_version(self, version_number):
+        with self.__connection as connection:
+            connection.execute(
+                f"INSERT OR IGNORE INTO {self._VERSION_INFO_TABLE} (key, value) VALUES (?, ?)",
+                (self._DEVELOPMENT_VERSION_KEY, ""),
+            )
+            self.__set_version_info(connection, {self._LATEST_VERSION_KEY: version_number})
+
+    def _get_latest_version(self) -> str:
+        return self.__get_version_info(self._LATEST_VERSION_KEY)
+
+    def _set_development_version(self, version_number):
+        with self.__connection as connection:
+            self.__set_version_info(
+                connection, {self._DEVELOPMENT_VERSION_KEY: version_number, self._LATEST_VERSION_KEY: version_number}
+            )
+
+    def _get_development_version(self) -> str:
+        return self.__get_version_info(self._DEVELOPMENT_VERSION_KEY)
+
+    def _import_version_info(self, version_info: Dict[str, str], connection: sqlite3.Connection):
+        """Set the latest and development versions. Used to migrate the versions of another repository."""
+        keys = (self._LATEST_VERSION_KEY, self._DEVELOPMENT_VERSION_KEY)
+        self.__create_version_info_table_if_not_exists(connection)
+        with connection:
+            self.__set_version_info(connection, {k: v for k, v in version_info.items() if k in keys})
+
+    @property
+    def __connection(self) -> sqlite3.Connection:
+        connection = self._connection
+        self.__create_version_info_table_if_not_exists(connection)
+        return connection
+
+    def __create_version_info_table_if_not_exists(self, connection: sqlite3.Connection):
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._VERSION_INFO_TABLE} (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def __set_version_info(self, connection: sqlite3.Connection, values: Dict[str, str]):
+        connection.executemany(
+            f"INSERT OR REPLACE INTO {self._VERSION_INFO_TABLE} (key, value) VALUES (?, ?)", values.items()
+        )
+
+    def __get_version_info(self, key: str) -> str:
+        query = f"SELECT value FROM {self._VERSION_INFO_TABLE} WHERE key = ?"
+        if row := self.__connection.execute(query, (key,)).fetchone():
+            return row[0]
+        raise ModelNotFound(self._VERSION_INFO_TABLE, key)
@@ -54,6 +54,7 @@ _inject_section(
         ("configure_mongo_collection_data_node", DataNodeConfig._configure_mongo_collection),
         ("configure_in_memory_data_node", DataNodeConfig._configure_in_memory),
         ("configure_pickle_data_node", DataNodeConfig._configure_pickle),
+        ("configure_npy_data_node", DataNodeConfig._configure_npy),
         ("configure_excel_data_node", DataNodeConfig._configure_excel),
         ("configure_generic_data_node", DataNodeConfig._configure_generic),
         ("configure_s3_object_data_node", DataNodeConfig._configure_s3_object),
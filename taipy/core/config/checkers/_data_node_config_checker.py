@@ -79,7 +79,7 @@ class _DataNodeConfigChecker(_ConfigChecker):
                 data_node_config._STORAGE_TYPE_KEY,
                 data_node_config.storage_type,
                 f"`{data_node_config._STORAGE_TYPE_KEY}` field of DataNodeConfig `{data_node_config_id}` must be"
-                f" either csv, sql_table, sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object,"
+                f" either csv, sql_table, sql, mongo_collection, pickle, excel, generic, json, parquet, npy, s3_object,"
                 f" or in_memory.",
             )
 
@@ -227,5 +227,5 @@ class _DataNodeConfigChecker(_ConfigChecker):
                 data_node_config._EXPOSED_TYPE_KEY,
                 data_node_config.exposed_type,
                 f"The `{data_node_config._EXPOSED_TYPE_KEY}` of DataNodeConfig `{data_node_config_id}` "
-                f'must be either "pandas", "numpy", or a custom type.',
+                f'must be either "pandas", "numpy", "arrow", or a custom type.',
             )
@@ -17,6 +17,7 @@ from taipy.common.config.checker.issue_collector import IssueCollector
 
 from ..data_node_config import DataNodeConfig
 from ..job_config import JobConfig
+from ..task_config import TaskConfig
 
 
 class _JobConfigChecker(_ConfigChecker):
@@ -30,6 +31,10 @@ class _JobConfigChecker(_ConfigChecker):
                 cast(JobConfig, job_config),
                 cast(Dict[str, DataNodeConfig], data_node_configs),
             )
+            self._check_threaded_mode(
+                cast(JobConfig, job_config),
+                cast(Dict[str, TaskConfig], self._config._sections.get(TaskConfig.name, {})),
+            )
             self._check_job_execution_mode(cast(JobConfig, job_config))
         return self._collector
 
@@ -44,6 +49,20 @@ class _JobConfigChecker(_ConfigChecker):
                         f"{JobConfig._DEVELOPMENT_MODE} mode.",
                     )
 
+    def _check_threaded_mode(self, job_config: JobConfig, task_configs: Dict[str, TaskConfig]):
+        if job_config.is_threaded:
+            for task_config_id, task_config in task_configs.items():
+                if task_config.executor != TaskConfig._PROCESS_EXECUTOR:
+                    continue
+                for data_node_config in task_config.input_configs + task_config.output_configs:
+                    if data_node_config.storage_type == DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
+                        self._error(
+                            DataNodeConfig._STORAGE_TYPE_KEY,
+                            data_node_config.storage_type,
+                            f"DataNode `{data_node_config.id}`: In-memory storage type cannot be used by TaskConfig "
+                            f"`{task_config_id}` executed by the `{TaskConfig._PROCESS_EXECUTOR}` executor.",
+                        )
+
     def _check_job_execution_mode(self, job_config: JobConfig):
         if job_config.mode not in JobConfig._MODES:
             self._error(
@@ -40,6 +40,8 @@ class _TaskConfigChecker(_ConfigChecker):
                 self._check_existing_function(task_config_id, task_config)
                 self._check_inputs(task_config_id, task_config)
                 self._check_outputs(task_config_id, task_config)
+                self._check_executor(task_config_id, task_config)
+                self._check_max_nb_of_io_workers(task_config_id, task_config)
                 self._check_if_children_config_id_is_overlapping_with_properties(task_config_id, task_config)
         return self._collector
 
@@ -74,6 +76,38 @@ class _TaskConfigChecker(_ConfigChecker):
             TaskConfig, task_config_id, task_config._OUTPUT_KEY, task_config.output_configs, DataNodeConfig
         )
 
+    def _check_executor(self, task_config_id: str, task_config: TaskConfig):
+        executor = task_config.executor
+        if executor is not None and executor not in TaskConfig._EXECUTORS:
+            self._error(
+                task_config._EXECUTOR_KEY,
+                executor,
+                f"{task_config._EXECUTOR_KEY} field of TaskConfig `{task_config_id}` must be either "
+                f"{', '.join(TaskConfig._EXECUTORS)}.",
+            )
+
+    def _check_max_nb_of_io_workers(self, task_config_id: str, task_config: TaskConfig):
+        max_nb_of_io_workers = task_config.max_nb_of_io_workers
+        if max_nb_of_io_workers is None:
+            return
+        if isinstance(max_nb_of_io_workers, str):
+            # The value of an environment variable is a string
+            try:
+                max_nb_of_io_workers = int(max_nb_of_io_workers)
+            except ValueError:
+                pass
+        if (
+            isinstance(max_nb_of_io_workers, bool)
+            or not isinstance(max_nb_of_io_workers, int)
+            or max_nb_of_io_workers < 1
+        ):
+            self._error(
+                task_config._MAX_NB_OF_IO_WORKERS_KEY,
+                max_nb_of_io_workers,
+                f"{task_config._MAX_NB_OF_IO_WORKERS_KEY} field of TaskConfig `{task_config_id}` must be"
+                f" populated with a positive integer value.",
+            )
+
     def _check_existing_function(self, task_config_id: str, task_config: TaskConfig):
         if not task_config.function:
             self._error(
@@ -400,9 +400,13 @@ class CoreSection(UniqueSection):
                 used in conjunction with the *root_folder* attribute. That means the storage path is
                 <root_folder><storage_folder> (The default path is "./taipy/.taipy/").
             repository_type (Optional[str]): The type of the repository to be used to store Taipy data.
-                The default value is "filesystem".
+                Possible values are *"filesystem"* and *"sql"* (a SQLite database). The default value is
+                "filesystem".
             repository_properties (Optional[Dict[str, Union[str, int]]]): A dictionary of additional properties
-                to be used by the repository.
+                to be used by the repository. Setting the *entity_cache_size* property to a positive integer
+                enables an in-process cache of at most that many entities per entity type. With the "sql"
+                repository type, the *db_location* property sets the path of the SQLite database file, which
+                defaults to *taipy.sqlite3* in the Taipy storage folder.
             read_entity_retry (Optional[int]): Number of retries to read an entity from the repository
                 before return failure. The default value is 3.
             mode (Optional[str]): Indicates the mode of the version management system.
@@ -415,7 +419,12 @@ class CoreSection(UniqueSection):
             force (Optional[bool]): If True, Taipy will override a version even if the configuration
                 has changed and run the application.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
-                behavior of the `Orchestrator^` service.
+                behavior of the `Orchestrator^` service. Setting the *data_read_cache_size* property to a positive
+                number of bytes enables an in-process cache of the data read by the file-based data nodes, with that
+                memory budget. The cached data is handed out as read-only views or copies unless the
+                *data_read_cache_read_only* property is set to False. Setting the *data_node_max_edits* property
+                bounds the number of edits stored with each data node entity; the older edits are moved to an
+                append-only edit log. It can be overridden by the *max_edits* property of a data node configuration.
 
         Returns:
             The Core configuration.
@@ -442,6 +451,13 @@ class CoreSection(UniqueSection):
 
     @staticmethod
     def __reload_repositories():
+        _CycleManagerFactory._build_repository.cache_clear()
+        _ScenarioManagerFactory._build_repository.cache_clear()
+        _TaskManagerFactory._build_repository.cache_clear()
+        _JobManagerFactory._build_repository.cache_clear()
+        _DataManagerFactory._build_repository.cache_clear()
+        _SubmissionManagerFactory._build_repository.cache_clear()
+        _VersionManagerFactory._build_repository.cache_clear()
         _CycleManagerFactory._build_manager.cache_clear()
         _SequenceManagerFactory._build_manager.cache_clear()
         _ScenarioManagerFactory._build_manager.cache_clear()
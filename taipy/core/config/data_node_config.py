@@ -33,7 +33,9 @@ class DataNodeConfig(Section):
     needed to create an actual data node.
 
     Attributes:
-        **properties (dict[str, any]): A dictionary of additional properties.
+        **properties (dict[str, any]): A dictionary of additional properties. The *max_edits* property bounds
+            the number of edits stored with the data node entities; the older edits are moved to an append-only
+            edit log.
     """
 
     name = "DATA_NODE"
@@ -49,6 +51,7 @@ class DataNodeConfig(Section):
     _STORAGE_TYPE_VALUE_GENERIC = "generic"
     _STORAGE_TYPE_VALUE_JSON = "json"
     _STORAGE_TYPE_VALUE_PARQUET = "parquet"
+    _STORAGE_TYPE_VALUE_NPY = "npy"
     _STORAGE_TYPE_VALUE_S3_OBJECT = "s3_object"
 
     _DEFAULT_STORAGE_TYPE = _STORAGE_TYPE_VALUE_PICKLE
@@ -63,6 +66,7 @@ class DataNodeConfig(Section):
         _STORAGE_TYPE_VALUE_GENERIC,
         _STORAGE_TYPE_VALUE_JSON,
         _STORAGE_TYPE_VALUE_PARQUET,
+        _STORAGE_TYPE_VALUE_NPY,
         _STORAGE_TYPE_VALUE_S3_OBJECT,
     ]
 
@@ -70,11 +74,13 @@ class DataNodeConfig(Section):
     _EXPOSED_TYPE_PANDAS = "pandas"
     _EXPOSED_TYPE_MODIN = "modin"  # Deprecated in favor of pandas since 3.1.0
     _EXPOSED_TYPE_NUMPY = "numpy"
+    _EXPOSED_TYPE_ARROW = "arrow"
     _DEFAULT_EXPOSED_TYPE = _EXPOSED_TYPE_PANDAS
 
     _ALL_EXPOSED_TYPES = [
         _EXPOSED_TYPE_PANDAS,
         _EXPOSED_TYPE_NUMPY,
+        _EXPOSED_TYPE_ARROW,
     ]
 
     _OPTIONAL_ENCODING_PROPERTY = "encoding"
@@ -108,6 +114,8 @@ class DataNodeConfig(Section):
     _OPTIONAL_HOST_SQL_PROPERTY = "db_host"
     _OPTIONAL_DRIVER_SQL_PROPERTY = "db_driver"
     _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY = "db_extra_args"
+    _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY = "db_pool_size"
+    _OPTIONAL_DB_POOL_RECYCLE_SQL_PROPERTY = "db_pool_recycle"
     _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY = "exposed_type"
     # SQL_TABLE
     _REQUIRED_TABLE_NAME_SQL_TABLE_PROPERTY = "table_name"
@@ -139,6 +147,10 @@ class DataNodeConfig(Section):
     _OPTIONAL_COMPRESSION_PARQUET_PROPERTY = "compression"
     _OPTIONAL_READ_KWARGS_PARQUET_PROPERTY = "read_kwargs"
     _OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY = "write_kwargs"
+    # Npy
+    _OPTIONAL_DEFAULT_PATH_NPY_PROPERTY = "default_path"
+    _OPTIONAL_DEFAULT_DATA_NPY_PROPERTY = "default_data"
+    _OPTIONAL_MMAP_MODE_NPY_PROPERTY = "mmap_mode"
     # S3object
     _REQUIRED_AWS_ACCESS_KEY_ID_PROPERTY = "aws_access_key"
     _REQUIRED_AWS_SECRET_ACCESS_KEY_PROPERTY = "aws_secret_access_key"
@@ -172,6 +184,7 @@ class DataNodeConfig(Section):
         _STORAGE_TYPE_VALUE_GENERIC: [],
         _STORAGE_TYPE_VALUE_JSON: [],
         _STORAGE_TYPE_VALUE_PARQUET: [],
+        _STORAGE_TYPE_VALUE_NPY: [],
         _STORAGE_TYPE_VALUE_S3_OBJECT: [
             _REQUIRED_AWS_ACCESS_KEY_ID_PROPERTY,
             _REQUIRED_AWS_SECRET_ACCESS_KEY_PROPERTY,
@@ -209,6 +222,8 @@ class DataNodeConfig(Section):
             _OPTIONAL_FOLDER_PATH_SQLITE_PROPERTY: None,
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: ".db",
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: None,
+            _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY: None,
+            _OPTIONAL_DB_POOL_RECYCLE_SQL_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: _DEFAULT_EXPOSED_TYPE,
         },
         _STORAGE_TYPE_VALUE_SQL: {
@@ -221,6 +236,8 @@ class DataNodeConfig(Section):
             _OPTIONAL_FOLDER_PATH_SQLITE_PROPERTY: None,
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: ".db",
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: None,
+            _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY: None,
+            _OPTIONAL_DB_POOL_RECYCLE_SQL_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: _DEFAULT_EXPOSED_TYPE,
         },
         _STORAGE_TYPE_VALUE_MONGO_COLLECTION: {
@@ -250,6 +267,11 @@ class DataNodeConfig(Section):
             _OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_PARQUET_PROPERTY: _DEFAULT_EXPOSED_TYPE,
         },
+        _STORAGE_TYPE_VALUE_NPY: {
+            _OPTIONAL_DEFAULT_PATH_NPY_PROPERTY: None,
+            _OPTIONAL_DEFAULT_DATA_NPY_PROPERTY: None,
+            _OPTIONAL_MMAP_MODE_NPY_PROPERTY: "r",
+        },
         _STORAGE_TYPE_VALUE_S3_OBJECT: {
             _OPTIONAL_AWS_REGION_PROPERTY: None,
             _OPTIONAL_AWS_S3_CLIENT_PARAMETERS_PROPERTY: None,
@@ -297,7 +319,7 @@ class DataNodeConfig(Section):
         """Storage type of the data nodes created from the data node config.
 
         The possible values are : "csv", "excel", "pickle", "sql_table", "sql",
-        "mongo_collection", "generic", "json", "parquet", "in_memory and "s3_object".
+        "mongo_collection", "generic", "json", "parquet", "npy", "in_memory and "s3_object".
 
         The default value is "pickle".
 
@@ -414,7 +436,7 @@ class DataNodeConfig(Section):
         Arguments:
             storage_type (str): The default storage type for all data node configurations.
                 The possible values are *"pickle"* (the default value), *"csv"*, *"excel"*,
-                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"generic"*,
+                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"npy"*, *"generic"*,
                 or *"s3_object"*.
             scope (Optional[Scope^]): The default scope for all data node configurations.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -474,7 +496,7 @@ class DataNodeConfig(Section):
                 are None (which is the default value of *"pickle"*, unless it has been overloaded by the
                 *storage_type* value set in the default data node configuration
                 (see `(Config.)set_default_data_node_configuration()^`)), *"pickle"*, *"csv"*, *"excel"*,
-                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"mongo_collection"*, *"in_memory"*, or
+                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"npy"*, *"mongo_collection"*, *"in_memory"*, or
                 *"generic"*.
             scope (Optional[Scope^]): The scope of the data node configuration.<br/>
                 The default value is `Scope.SCENARIO` (or the one specified in
@@ -501,6 +523,7 @@ class DataNodeConfig(Section):
             cls._STORAGE_TYPE_VALUE_GENERIC: cls._configure_generic,
             cls._STORAGE_TYPE_VALUE_JSON: cls._configure_json,
             cls._STORAGE_TYPE_VALUE_PARQUET: cls._configure_parquet,
+            cls._STORAGE_TYPE_VALUE_NPY: cls._configure_npy,
             cls._STORAGE_TYPE_VALUE_S3_OBJECT: cls._configure_s3_object,
         }
 
@@ -529,7 +552,7 @@ class DataNodeConfig(Section):
             encoding (Optional[str]): The encoding of the CSV file.
             has_header (Optional[bool]): If True, indicates that the CSV file has a header.
             exposed_type (Optional[str]): The exposed type of the data read from CSV file.<br/>
-                The default value is `pandas`.
+                The default value is `pandas`. The value "arrow" exposes the data as a *pyarrow.Table*.
             scope (Optional[Scope^]): The scope of the CSV data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -629,7 +652,7 @@ class DataNodeConfig(Section):
                 The parameters in *read_kwargs* and *write_kwargs* have a **higher precedence** than the
                 top-level parameters which are also passed to Pandas.
             exposed_type (Optional[str]): The exposed type of the data read from Parquet file.<br/>
-                The default value is `pandas`.
+                The default value is `pandas`. The value "arrow" exposes the data as a *pyarrow.Table*.
             scope (Optional[Scope^]): The scope of the Parquet data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -825,6 +848,52 @@ class DataNodeConfig(Section):
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_PICKLE, scope, validity_period, **properties)
 
+    @classmethod
+    def _configure_npy(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        default_data: Optional[Any] = None,
+        mmap_mode: Optional[Union[str, bool]] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new npy data node configuration.
+
+        Arguments:
+            id (str): The unique identifier of the new npy data node configuration.
+            default_path (Optional[str]): The path of the `.npy` file.
+            default_data (Optional[any]): The default data of the data nodes instantiated from
+                this npy data node configuration.
+                If provided, note that the default_data will be stored as a configuration attribute.
+                So it is designed to handle small data values like parameters, and it must be Json serializable.
+            mmap_mode (Optional[Union[str, bool]]): The mode used to memory-map the file when reading it, as
+                accepted by `numpy.load()`: *"r"*, *"r+"*, or *"c"*. If False, the whole array is loaded
+                in memory.<br/>
+                The default value is "r".
+            scope (Optional[Scope^]): The scope of the npy data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new npy data node configuration.
+        """  # noqa: E501
+        if default_path is not None:
+            properties[cls._OPTIONAL_DEFAULT_PATH_NPY_PROPERTY] = default_path
+        if default_data is not None:
+            properties[cls._OPTIONAL_DEFAULT_DATA_NPY_PROPERTY] = default_data
+        if mmap_mode is not None:
+            properties[cls._OPTIONAL_MMAP_MODE_NPY_PROPERTY] = mmap_mode
+
+        return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_NPY, scope, validity_period, **properties)
+
     @classmethod
     def _configure_sql_table(
         cls,
@@ -840,6 +909,8 @@ class DataNodeConfig(Section):
         sqlite_folder_path: Optional[str] = None,
         sqlite_file_extension: Optional[str] = None,
         db_extra_args: Optional[Dict[str, Any]] = None,
+        db_pool_size: Optional[int] = None,
+        db_pool_recycle: Optional[int] = None,
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
@@ -868,8 +939,12 @@ class DataNodeConfig(Section):
                 The default value is ".db".
             db_extra_args (Optional[dict[str, any]]): A dictionary of additional arguments to be passed
                 into database connection string.
+            db_pool_size (Optional[int]): The number of connections to keep open in the connection pool.<br/>
+                The default value is the SQLAlchemy default, 5.
+            db_pool_recycle (Optional[int]): The number of seconds after which a pooled connection is
+                recycled. The default value is -1, meaning that connections are never recycled.
             exposed_type (Optional[str]): The exposed type of the data read from SQL table.<br/>
-                The default value is "pandas".
+                The default value is "pandas". The value "arrow" exposes the data as a *pyarrow.Table*.
             scope (Optional[Scope^]): The scope of the SQL data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -907,6 +982,10 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY] = sqlite_file_extension
         if db_extra_args is not None:
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY] = db_extra_args
+        if db_pool_size is not None:
+            properties[cls._OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY] = db_pool_size
+        if db_pool_recycle is not None:
+            properties[cls._OPTIONAL_DB_POOL_RECYCLE_SQL_PROPERTY] = db_pool_recycle
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY] = exposed_type
 
@@ -929,6 +1008,8 @@ class DataNodeConfig(Section):
         sqlite_folder_path: Optional[str] = None,
         sqlite_file_extension: Optional[str] = None,
         db_extra_args: Optional[Dict[str, Any]] = None,
+        db_pool_size: Optional[int] = None,
+        db_pool_recycle: Optional[int] = None,
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
@@ -961,8 +1042,12 @@ class DataNodeConfig(Section):
                 The default value is ".db".
             db_extra_args (Optional[dict[str, any]]): A dictionary of additional arguments to be passed
                 into database connection string.
+            db_pool_size (Optional[int]): The number of connections to keep open in the connection pool.<br/>
+                The default value is the SQLAlchemy default, 5.
+            db_pool_recycle (Optional[int]): The number of seconds after which a pooled connection is
+                recycled. The default value is -1, meaning that connections are never recycled.
             exposed_type (Optional[str]): The exposed type of the data read from SQL query.<br/>
-                The default value is "pandas".
+                The default value is "pandas". The value "arrow" exposes the data as a *pyarrow.Table*.
             scope (Optional[Scope^]): The scope of the SQL data node configuration.<br/>
                 The default value is `Scope.SCENARIO`.
             validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
@@ -1003,6 +1088,10 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY] = sqlite_file_extension
         if db_extra_args is not None:
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY] = db_extra_args
+        if db_pool_size is not None:
+            properties[cls._OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY] = db_pool_size
+        if db_pool_recycle is not None:
+            properties[cls._OPTIONAL_DB_POOL_RECYCLE_SQL_PROPERTY] = db_pool_recycle
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY] = exposed_type
 
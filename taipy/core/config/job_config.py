@@ -25,16 +25,18 @@ class JobConfig(UniqueSection):
 
     _MODE_KEY = "mode"
     _STANDALONE_MODE = "standalone"
+    _THREADED_MODE = "threaded"
     _DEVELOPMENT_MODE = "development"
     _DEFAULT_MODE = _DEVELOPMENT_MODE
     _DEFAULT_MAX_NB_OF_WORKERS = 2
-    _MODES = [_DEVELOPMENT_MODE, _STANDALONE_MODE]
+    _MODES = [_DEVELOPMENT_MODE, _STANDALONE_MODE, _THREADED_MODE]
 
     mode: Optional[str]
     """The task orchestration mode.
 
     By default, the "development" mode is set for testing and debugging the
-    executions of jobs. A "standalone" mode is also available.
+    executions of jobs. A "standalone" mode, executing jobs in separate processes, and
+    a "threaded" mode, executing jobs in threads of the current process, are also available.
 
     In the Taipy Enterprise Edition, the "cluster" mode is available.
     """
@@ -56,6 +58,11 @@ class JobConfig(UniqueSection):
         """True if the config is set to standalone mode"""
         return self.mode == self._STANDALONE_MODE
 
+    @property
+    def is_threaded(self) -> bool:
+        """True if the config is set to threaded mode"""
+        return self.mode == self._THREADED_MODE
+
     @property
     def is_development(self) -> bool:
         """True if the config is set to development mode"""
@@ -103,8 +110,10 @@ class JobConfig(UniqueSection):
 
         Arguments:
             mode (Optional[str]): The job execution mode.
-                Possible values are: *"standalone"* or *"development"*.
-            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* mode.
+                Possible values are: *"standalone"*, *"threaded"* or *"development"*.<br/>
+                In *"threaded"* mode, the jobs are executed in a pool of threads sharing the
+                entities of the current process. This suits I/O-bound tasks.
+            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* and *"threaded"* modes.
                 This indicates the maximum number of jobs able to run in parallel.<br/>
                 The default value is 2.<br/>
                 A string can be provided to dynamically set the value using an environment
@@ -122,6 +131,6 @@ class JobConfig(UniqueSection):
         return Config.unique_sections[JobConfig.name]
 
     def _update_default_max_nb_of_workers_properties(self):
-        """If the job execution mode is standalone, set the default value for the max_nb_of_workers property"""
-        if self.is_standalone and "max_nb_of_workers" not in self._properties:
+        """If the job execution mode uses workers, set the default value for the max_nb_of_workers property"""
+        if (self.is_standalone or self.is_threaded) and "max_nb_of_workers" not in self._properties:
             self.properties.update({"max_nb_of_workers": self._DEFAULT_MAX_NB_OF_WORKERS})
@@ -35,8 +35,16 @@ class TaskConfig(Section):
     #         The default value is False.
     #     function (Callable): User function taking as inputs some parameters compatible with the
     #         exposed types (*exposed_type* field) of the input data nodes and returning results
-    #         compatible with the exposed types (*exposed_type* field) of the outputs list.<br/>
+    #         compatible with the exposed types (*exposed_type* field) of the outputs list. It can be
+    #         a coroutine function.<br/>
     #         The default value is None.
+    #     executor (Optional[str]): The executor of the jobs of the task, overriding the one of
+    #         the job execution mode. Possible values are "process", "thread", "inline" or "asyncio".<br/>
+    #         The default value is None: the jobs of a task whose function is a coroutine function are
+    #         executed by the "asyncio" executor.
+    #     max_nb_of_io_workers (Optional[int]): If greater than 1, the input data nodes are read and
+    #         the output data nodes are written concurrently, by at most this number of threads.<br/>
+    #         The default value is None: the data nodes are read and written one after another.
 
     name = "TASK"
 
@@ -44,11 +52,20 @@ class TaskConfig(Section):
     _FUNCTION = "function"
     _OUTPUT_KEY = "outputs"
     _IS_SKIPPABLE_KEY = "skippable"
+    _EXECUTOR_KEY = "executor"
+    _PROCESS_EXECUTOR = "process"
+    _THREAD_EXECUTOR = "thread"
+    _INLINE_EXECUTOR = "inline"
+    _ASYNCIO_EXECUTOR = "asyncio"
+    _EXECUTORS = [_PROCESS_EXECUTOR, _THREAD_EXECUTOR, _INLINE_EXECUTOR, _ASYNCIO_EXECUTOR]
+    _MAX_NB_OF_IO_WORKERS_KEY = "max_nb_of_io_workers"
 
     function: Optional[Callable]
     """User function taking as inputs some parameters compatible with the data type
     (*exposed_type* field) of the input data nodes and returning results compatible with the
-    data type (*exposed_type* field) of the outputs list."""
+    data type (*exposed_type* field) of the outputs list.
+
+    The function can be a coroutine function (defined with `async def`)."""
 
     def __init__(
         self,
@@ -168,6 +185,7 @@ class TaskConfig(Section):
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: bool = False,
+        executor: Optional[str] = None,
         **properties,
     ) -> "TaskConfig":
         """Configure a new task configuration.
@@ -184,11 +202,20 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            executor (Optional[str]): The executor of the jobs of the task, overriding the one of
+                the job execution mode.<br/>
+                Possible values are *"process"*, *"thread"*, *"inline"* or *"asyncio"*. This is used
+                only in *"standalone"* and *"threaded"* job execution modes.<br/>
+                The *"asyncio"* executor runs the jobs concurrently on an event loop of the current
+                process. It is used by default for the tasks whose function is a coroutine function.<br/>
+                The default value is None.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
             The new task configuration.
         """
+        if executor:
+            properties[TaskConfig._EXECUTOR_KEY] = executor
         section = TaskConfig(id, function, input, output, skippable, **properties)
         Config._register(section)
         return Config.sections[TaskConfig.name][id]
@@ -199,6 +226,7 @@ class TaskConfig(Section):
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: bool = False,
+        executor: Optional[str] = None,
         **properties,
     ) -> "TaskConfig":
         """Set the default values for task configurations.
@@ -218,12 +246,21 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            executor (Optional[str]): The executor of the jobs of the task, overriding the one of
+                the job execution mode.<br/>
+                Possible values are *"process"*, *"thread"*, *"inline"* or *"asyncio"*. This is used
+                only in *"standalone"* and *"threaded"* job execution modes.<br/>
+                The *"asyncio"* executor runs the jobs concurrently on an event loop of the current
+                process. It is used by default for the tasks whose function is a coroutine function.<br/>
+                The default value is None.
             **properties (dict[str, any]): A keyworded variable length list of additional
                 arguments.
 
         Returns:
             The default task configuration.
         """
+        if executor:
+            properties[TaskConfig._EXECUTOR_KEY] = executor
         section = TaskConfig(_Config.DEFAULT_KEY, function, input, output, skippable, **properties)
         Config._register(section)
         return Config.sections[TaskConfig.name][_Config.DEFAULT_KEY]
@@ -18,6 +18,7 @@ from .generic import GenericDataNode
 from .in_memory import InMemoryDataNode
 from .json import JSONDataNode
 from .mongo import MongoCollectionDataNode
+from .npy import NpyDataNode
 from .operator import JoinOperator, Operator
 from .parquet import ParquetDataNode
 from .pickle import PickleDataNode
@@ -14,26 +14,41 @@ import re
 import urllib.parse
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple, Union
+from importlib import util
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import and_, column, literal_column, or_, select, text
+from sqlalchemy.sql import Executable, FromClause
 
 from taipy.common.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..data.operator import JoinOperator, Operator
 from ..exceptions.exceptions import MissingRequiredProperty, UnknownDatabaseEngine
+from ._sql_engine_registry import _SQLEngineRegistry
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
 
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+
 
 class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
     """Abstract base class for data node implementations (SQLDataNode and SQLTableDataNode) that use SQL."""
 
     __STORAGE_TYPE = "NOT_IMPLEMENTED"
+    __OPERATORS = {
+        Operator.EQUAL: eq,
+        Operator.NOT_EQUAL: ne,
+        Operator.GREATER_THAN: gt,
+        Operator.GREATER_OR_EQUAL: ge,
+        Operator.LESS_THAN: lt,
+        Operator.LESS_OR_EQUAL: le,
+    }
     __DB_NAME_KEY = "db_name"
     __DB_USERNAME_KEY = "db_username"
     __DB_PASSWORD_KEY = "db_password"
@@ -42,6 +57,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
     __DB_ENGINE_KEY = "db_engine"
     __DB_DRIVER_KEY = "db_driver"
     __DB_EXTRA_ARGS_KEY = "db_extra_args"
+    __DB_POOL_SIZE_KEY = "db_pool_size"
+    __DB_POOL_RECYCLE_KEY = "db_pool_recycle"
     __SQLITE_FOLDER_PATH = "sqlite_folder_path"
     __SQLITE_FILE_EXTENSION = "sqlite_file_extension"
 
@@ -53,6 +70,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
         __DB_PORT_KEY,
         __DB_DRIVER_KEY,
         __DB_EXTRA_ARGS_KEY,
+        __DB_POOL_SIZE_KEY,
+        __DB_POOL_RECYCLE_KEY,
         __SQLITE_FOLDER_PATH,
         __SQLITE_FILE_EXTENSION,
     ]
@@ -129,6 +148,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
                 self.__DB_ENGINE_KEY,
                 self.__DB_DRIVER_KEY,
                 self.__DB_EXTRA_ARGS_KEY,
+                self.__DB_POOL_SIZE_KEY,
+                self.__DB_POOL_RECYCLE_KEY,
                 self.__SQLITE_FOLDER_PATH,
                 self.__SQLITE_FILE_EXTENSION,
                 self._EXPOSED_TYPE_PROPERTY,
@@ -140,13 +161,46 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
             self._engine = None
         return super().__setattr__(key, value)
 
-    def filter(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
+    def filter(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ):
+        """Read and filter the data referenced by this data node.
+
+        The operators, the column selection, and the paging are compiled into the SQL query, with
+        bound parameters, so that only the selected rows and columns are fetched from the database.
+
+        Arguments:
+            operators (Optional[Union[List[Tuple], Tuple]]): A 3-element tuple or a list of 3-element
+                tuples, each is in the form of (key, value, `Operator^`).
+            join_operator (JoinOperator^): The operator used to join the multiple filter 3-tuples.
+            columns (Optional[List[str]]): The names of the columns to select. All the columns are
+                selected by default.
+            limit (Optional[int]): The maximum number of rows to return.
+            offset (Optional[int]): The number of rows to skip before returning rows.
+
+        Returns:
+            The filtered data.
+        """
+        kwargs = {
+            "operators": operators,
+            "join_operator": join_operator,
+            "columns": columns,
+            "limit": limit,
+            "offset": offset,
+        }
         properties = self.properties
         if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_PANDAS:
-            return self._read_as_pandas_dataframe(operators=operators, join_operator=join_operator)
+            return self._read_as_pandas_dataframe(**kwargs)
         if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_NUMPY:
-            return self._read_as_numpy(operators=operators, join_operator=join_operator)
-        return self._read_as(operators=operators, join_operator=join_operator)
+            return self._read_as_numpy(**kwargs)
+        if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_ARROW:
+            return self._read_as_arrow_table(**kwargs)
+        return self._read_as(**kwargs)
 
     def _check_required_properties(self, properties: Dict):
         db_engine = properties.get(self.__DB_ENGINE_KEY)
@@ -163,9 +217,18 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
 
     def _get_engine(self):
         if self._engine is None:
-            self._engine = create_engine(self._conn_string())
+            self._engine = _SQLEngineRegistry._get_engine(self._conn_string(), **self._engine_options())
         return self._engine
 
+    def _engine_options(self) -> Dict[str, Any]:
+        properties = self.properties
+        options = {}
+        if (pool_size := properties.get(self.__DB_POOL_SIZE_KEY)) is not None:
+            options["pool_size"] = int(pool_size)
+        if (pool_recycle := properties.get(self.__DB_POOL_RECYCLE_KEY)) is not None:
+            options["pool_recycle"] = int(pool_recycle)
+        return options
+
     def _conn_string(self) -> str:
         properties = self.properties
         engine = properties.get(self.__DB_ENGINE_KEY)
@@ -211,69 +274,125 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
             return self._read_as_pandas_dataframe()
         if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_NUMPY:
             return self._read_as_numpy()
+        if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_ARROW:
+            return self._read_as_arrow_table()
         return self._read_as()
 
-    def _read_as(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
+    def _read_as(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ):
         custom_class = self.properties[self._EXPOSED_TYPE_PROPERTY]
         with self._get_engine().connect() as connection:
-            query_result = connection.execute(text(self._get_read_query(operators, join_operator)))
+            query_result = connection.execute(self._get_read_query(operators, join_operator, columns, limit, offset))
         return [custom_class(**row) for row in query_result]
 
     def _read_as_numpy(
-        self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> np.ndarray:
-        return self._read_as_pandas_dataframe(operators=operators, join_operator=join_operator).to_numpy()
+        return self._read_as_pandas_dataframe(
+            columns=columns, operators=operators, join_operator=join_operator, limit=limit, offset=offset
+        ).to_numpy()
 
     def _read_as_pandas_dataframe(
         self,
         columns: Optional[List[str]] = None,
         operators: Optional[Union[List, Tuple]] = None,
         join_operator=JoinOperator.AND,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ):
         with self._get_engine().connect() as conn:
-            result = conn.execute(text(self._get_read_query(operators, join_operator)))
+            result = conn.execute(self._get_read_query(operators, join_operator, columns, limit, offset))
 
             # On pandas 1.3.5 there's a bug that makes that the dataframe from sqlalchemy query is
             # created without headers
             keys = list(result.keys())
-            if columns:
-                return pd.DataFrame(result, columns=keys)[columns]
             return pd.DataFrame(result, columns=keys)
 
-    @abstractmethod
-    def _get_read_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
-        query = self._get_base_read_query()
-
-        if not operators:
-            return query
-
-        if not isinstance(operators, List):
-            operators = [operators]
-
-        conditions = []
-        for key, value, operator in operators:
-            if operator == Operator.EQUAL:
-                conditions.append(f"{key} = '{value}'")
-            elif operator == Operator.NOT_EQUAL:
-                conditions.append(f"{key} <> '{value}'")
-            elif operator == Operator.GREATER_THAN:
-                conditions.append(f"{key} > '{value}'")
-            elif operator == Operator.GREATER_OR_EQUAL:
-                conditions.append(f"{key} >= '{value}'")
-            elif operator == Operator.LESS_THAN:
-                conditions.append(f"{key} < '{value}'")
-            elif operator == Operator.LESS_OR_EQUAL:
-                conditions.append(f"{key} <= '{value}'")
-
-        if join_operator == JoinOperator.AND:
-            query += f" WHERE {' AND '.join(conditions)}"
-        elif join_operator == JoinOperator.OR:
-            query += f" WHERE {' OR '.join(conditions)}"
-        else:
-            raise NotImplementedError(f"Join operator {join_operator} not implemented.")
+    def _read_as_arrow_table(
+        self,
+        columns: Optional[List[str]] = None,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ):
+        with self._get_engine().connect() as conn:
+            result = conn.execute(self._get_read_query(operators, join_operator, columns, limit, offset))
+
+            # Some drivers (e.g. ADBC or DuckDB) fetch the result set directly in the Arrow format.
+            fetch_arrow_table = getattr(getattr(result, "cursor", None), "fetch_arrow_table", None)
+            if callable(fetch_arrow_table):
+                return fetch_arrow_table()
+            return self.__rows_to_arrow_table(result.all(), list(result.keys()))
+
+    @staticmethod
+    def __rows_to_arrow_table(rows: List, keys: List[str]):
+        columns: List[Sequence[Any]] = list(zip(*rows)) if rows else [[] for _ in keys]
+        return pa.Table.from_arrays([pa.array(list(values)) for values in columns], names=keys)
+
+    def _read_chunks(self, chunk_size: int) -> Iterator[Any]:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        with self._get_engine().connect() as connection:
+            # The rows are fetched from a server-side cursor, chunk_size rows at a time.
+            result = connection.execution_options(yield_per=chunk_size).execute(self._get_read_query())
+            keys = list(result.keys())
+            for rows in result.partitions():
+                if exposed_type == self._EXPOSED_TYPE_ARROW:
+                    yield self.__rows_to_arrow_table(rows, keys)
+                else:
+                    yield self._convert_dataframe_to_exposed_type(exposed_type, pd.DataFrame(rows, columns=keys))
 
+    def _get_read_query(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Executable:
+        if not operators and not columns and limit is None and offset is None:
+            return text(self._get_base_read_query())
+
+        selected_columns = [column(c) for c in columns] if columns else [literal_column("*")]
+        query = select(*selected_columns)
+        query = query.select_from(self._get_read_selectable())
+
+        if operators:
+            if not isinstance(operators, List):
+                operators = [operators]
+            conditions = [
+                self.__OPERATORS[operator](column(key), value)
+                for key, value, operator in operators
+                if operator in self.__OPERATORS
+            ]
+            if join_operator == JoinOperator.AND:
+                query = query.where(and_(*conditions))
+            elif join_operator == JoinOperator.OR:
+                query = query.where(or_(*conditions))
+            else:
+                raise NotImplementedError(f"Join operator {join_operator} not implemented.")
+
+        if limit is not None:
+            query = query.limit(limit)
+        if offset is not None:
+            query = query.offset(offset)
         return query
 
+    def _get_read_selectable(self) -> FromClause:
+        """The rows to read from, as a subquery of the base read query."""
+        return text(self._get_base_read_query().strip().rstrip(";")).columns().subquery("taipy_query")
+
     @abstractmethod
     def _get_base_read_query(self) -> str:
         raise NotImplementedError
@@ -294,6 +413,27 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
     def _do_append(self, data, engine, connection) -> None:
         raise NotImplementedError
 
+    def _write_chunks(self, chunks: Iterable[Any]) -> bool:
+        """Write all the chunks in a single transaction."""
+        engine = self._get_engine()
+        with engine.connect() as connection:
+            with connection.begin() as transaction:
+                try:
+                    chunks = iter(chunks)
+                    for chunk in chunks:
+                        self._do_write(chunk, engine, connection)
+                        break
+                    else:
+                        return False
+                    for chunk in chunks:
+                        self._do_append(chunk, engine, connection)
+                except Exception as e:
+                    transaction.rollback()
+                    raise e
+                else:
+                    transaction.commit()
+        return True
+
     def _write(self, data) -> None:
         """Check data against a collection of types to handle insertion on the database."""
         engine = self._get_engine()
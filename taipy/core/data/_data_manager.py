@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+import shutil
 from typing import Dict, Iterable, List, Optional, Set, Union
 
 from taipy.common.config import Config
@@ -17,6 +18,7 @@ from taipy.common.config._config import _Config
 from taipy.common.config.common.scope import Scope
 
 from .._manager._manager import _Manager
+from .._manager._save_batch import _SaveBatch
 from .._version._version_mixin import _VersionMixin
 from ..config.data_node_config import DataNodeConfig
 from ..cycle.cycle_id import CycleId
@@ -26,6 +28,7 @@ from ..reason import NotGlobalScope, ReasonCollection, WrongConfigType
 from ..scenario.scenario_id import ScenarioId
 from ..sequence.sequence_id import SequenceId
 from ._data_fs_repository import _DataFSRepository
+from ._edit_log import _EditLog
 from ._file_datanode_mixin import _FileDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId
@@ -57,14 +60,13 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
                 owner_id = None
             dn_configs_and_owner_id.append((dn_config, owner_id))
 
-        data_nodes = cls._repository._get_by_configs_and_owner_ids(
-            dn_configs_and_owner_id, cls._build_filters_with_version(None)
-        )
+        data_nodes = cls._get_by_configs_and_owner_ids(dn_configs_and_owner_id, cls._build_filters_with_version(None))
 
-        return {
-            dn_config: data_nodes.get((dn_config, owner_id)) or cls._create_and_set(dn_config, owner_id, None)
-            for dn_config, owner_id in dn_configs_and_owner_id
-        }
+        with _SaveBatch():
+            return {
+                dn_config: data_nodes.get((dn_config, owner_id)) or cls._create_and_set(dn_config, owner_id, None)
+                for dn_config, owner_id in dn_configs_and_owner_id
+            }
 
     @classmethod
     def _can_create(cls, config: Optional[DataNodeConfig] = None) -> ReasonCollection:
@@ -119,13 +121,18 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
         Returns all entities.
         """
         filters = cls._build_filters_with_version(version_number)
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
 
     @classmethod
     def _clean_generated_file(cls, data_node: DataNode) -> None:
         if not isinstance(data_node, _FileDataNodeMixin):
             return
-        if data_node.is_generated and os.path.exists(data_node.path):
+        if not data_node.is_generated or not os.path.exists(data_node.path):
+            return
+        if os.path.isdir(data_node.path):
+            # Appending data to a Parquet data node turns its file into a dataset directory.
+            shutil.rmtree(data_node.path)
+        else:
             os.remove(data_node.path)
 
     @classmethod
@@ -133,10 +140,16 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
         for data_node in data_nodes:
             cls._clean_generated_file(data_node)
 
+    @classmethod
+    def _clean_edit_logs(cls, data_nodes: Iterable[DataNode]) -> None:
+        for data_node in data_nodes:
+            _EditLog._delete(data_node.id)
+
     @classmethod
     def _delete(cls, data_node_id: DataNodeId) -> None:
         if data_node := cls._get(data_node_id, None):
             cls._clean_generated_file(data_node)
+            cls._clean_edit_logs([data_node])
         super()._delete(data_node_id)
 
     @classmethod
@@ -146,18 +159,21 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
             if data_node := cls._get(data_node_id):
                 data_nodes.append(data_node)
         cls._clean_generated_files(data_nodes)
+        cls._clean_edit_logs(data_nodes)
         super()._delete_many(data_node_ids)
 
     @classmethod
     def _delete_all(cls) -> None:
         data_nodes = cls._get_all()
         cls._clean_generated_files(data_nodes)
+        cls._clean_edit_logs(data_nodes)
         super()._delete_all()
 
     @classmethod
     def _delete_by_version(cls, version_number: str) -> None:
         data_nodes = cls._get_all(version_number)
         cls._clean_generated_files(data_nodes)
+        cls._clean_edit_logs(data_nodes)
         cls._repository._delete_by(attribute="version", value=version_number)
         Notifier.publish(
             Event(EventEntityType.DATA_NODE, EventOperation.DELETION, metadata={"delete_by_version": version_number})
@@ -173,4 +189,4 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
             filters = [{}]
         for fil in filters:
             fil.update({"config_id": config_id})
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
@@ -0,0 +1,155 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import sys
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from typing import Any, Callable, Hashable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from taipy.common.config import Config
+
+from ._tabular_datanode_mixin import _TabularDataNodeMixin
+
+
+class _DataReadCache:
+    """
+    Process-local cache of the data read from the files of the file-based data nodes.
+
+    An entry is stored per data node with the key (path, file modification time, file size, read properties) it was
+    read with, the read properties being the data node properties that change how the file is read, like the exposed
+    type or the encoding. An entry is only returned if the key computed on lookup matches, so that a file modified by
+    another process or an edited data node configuration is never served from the cache. The entries are also
+    invalidated when the data node is edited from this process.
+
+    The cache is enabled by setting the *data_read_cache_size* property of the core section to a positive memory
+    budget, in bytes. The least recently used entries are evicted when the budget is exceeded.
+
+    By default, the cache is read-only: NumPy arrays are handed out as read-only views, Arrow tables, which are
+    immutable, as they are, and any other data as a copy, so that the cached data cannot be mutated. Setting the
+    *data_read_cache_read_only* property of the core section to False hands out the cached data itself, which must
+    then not be modified.
+    """
+
+    _SIZE_PROPERTY = "data_read_cache_size"
+    _READ_ONLY_PROPERTY = "data_read_cache_read_only"
+    _READ_PROPERTIES = (
+        "exposed_type",
+        "has_header",
+        "sheet_name",
+        "encoding",
+        "decoder",
+        "engine",
+        "read_kwargs",
+        "mmap_mode",
+    )
+
+    __entries: "OrderedDict[str, Tuple[Hashable, Any, int]]" = OrderedDict()
+    __total_size = 0
+    __lock = Lock()
+
+    @classmethod
+    def _read(cls, data_node, read_fct: Callable[[], Any]) -> Any:
+        max_size = cls.__max_size()
+        if max_size <= 0:
+            if cls.__entries:
+                cls._clear()
+            return read_fct()
+
+        try:
+            stat = os.stat(data_node._path)
+        except OSError:
+            return read_fct()
+        key = (data_node._path, stat.st_mtime_ns, stat.st_size, cls.__read_properties(data_node))
+
+        with cls.__lock:
+            entry = cls.__entries.get(data_node.id)
+            if entry is not None and entry[0] == key:
+                cls.__entries.move_to_end(data_node.id)
+                return cls.__hand_out(entry[1])
+
+        data = read_fct()
+        if data is not None:
+            cls.__put(data_node.id, key, data, max_size)
+        return cls.__hand_out(data)
+
+    @classmethod
+    def _invalidate(cls, data_node_id: str):
+        with cls.__lock:
+            if entry := cls.__entries.pop(data_node_id, None):
+                cls.__total_size -= entry[2]
+
+    @classmethod
+    def _clear(cls):
+        with cls.__lock:
+            cls.__entries.clear()
+            cls.__total_size = 0
+
+    @classmethod
+    def __put(cls, data_node_id: str, key: Hashable, data: Any, max_size: int):
+        size = cls.__size_of(data)
+        with cls.__lock:
+            if entry := cls.__entries.pop(data_node_id, None):
+                cls.__total_size -= entry[2]
+            if size > max_size:
+                return
+            cls.__entries[data_node_id] = (key, data, size)
+            cls.__total_size += size
+            while cls.__total_size > max_size:
+                _, (_, _, evicted_size) = cls.__entries.popitem(last=False)
+                cls.__total_size -= evicted_size
+
+    @classmethod
+    def __hand_out(cls, data: Any) -> Any:
+        if not cls.__is_read_only():
+            return data
+        if isinstance(data, np.ndarray) and data.dtype != object:
+            view = data.view()
+            view.flags.writeable = False
+            return view
+        if _TabularDataNodeMixin._is_arrow_table(data):
+            return data
+        return deepcopy(data)
+
+    @classmethod
+    def __size_of(cls, data: Any) -> int:
+        if isinstance(data, pd.DataFrame):
+            return int(data.memory_usage(deep=True).sum())
+        if isinstance(data, pd.Series):
+            return int(data.memory_usage(deep=True))
+        if isinstance(data, np.ndarray) or _TabularDataNodeMixin._is_arrow_table(data):
+            return int(data.nbytes)
+        if isinstance(data, dict):
+            return sys.getsizeof(data) + sum(cls.__size_of(k) + cls.__size_of(v) for k, v in data.items())
+        if isinstance(data, (list, tuple, set)):
+            return sys.getsizeof(data) + sum(cls.__size_of(v) for v in data)
+        return sys.getsizeof(data)
+
+    @classmethod
+    def __read_properties(cls, data_node) -> Tuple[str, ...]:
+        # The values are compared by their representation, since some of them (like the read kwargs) are not hashable.
+        properties = data_node._properties
+        return tuple(repr(properties.get(name)) for name in cls._READ_PROPERTIES)
+
+    @classmethod
+    def __max_size(cls) -> int:
+        return int(Config.core.properties.get(cls._SIZE_PROPERTY, 0) or 0)
+
+    @classmethod
+    def __is_read_only(cls) -> bool:
+        read_only = Config.core.properties.get(cls._READ_ONLY_PROPERTY, True)
+        if isinstance(read_only, str):
+            return read_only.lower() != "false"
+        return bool(read_only)
@@ -0,0 +1,85 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+import pathlib
+from threading import Lock
+from typing import List, Optional
+
+from taipy.common.config import Config
+
+from .._repository._decoder import _Decoder
+from .._repository._encoder import _Encoder
+from .data_node_id import Edit
+
+
+class _EditLog:
+    """
+    Append-only log of the edits that no longer fit in the edit history stored with a data node entity.
+
+    The number of edits kept with the entity is bounded by the *max_edits* property of the data node, or by the
+    *data_node_max_edits* property of the core section if the data node does not define it. When a new edit
+    exceeds that number, the oldest edits are appended to a JSON Lines file in the Taipy storage folder, one per
+    data node, so that the entity stays small. The edits are read back from the log only when the full edit
+    history of the data node is requested.
+    """
+
+    _MAX_EDITS_PROPERTY = "max_edits"
+    _CORE_MAX_EDITS_PROPERTY = "data_node_max_edits"
+
+    __FOLDER = "edit_logs"
+    __SUFFIX = ".jsonl"
+    __lock = Lock()
+
+    @classmethod
+    def _max_edits(cls, data_node) -> Optional[int]:
+        max_edits = data_node._properties.get(cls._MAX_EDITS_PROPERTY)
+        if max_edits is None:
+            max_edits = Config.core.properties.get(cls._CORE_MAX_EDITS_PROPERTY)
+        return int(max_edits) if max_edits is not None else None
+
+    @classmethod
+    def _archive(cls, data_node, edits: List[Edit]) -> List[Edit]:
+        """Move the oldest edits to the log of the data node and return the edits to keep."""
+        max_edits = cls._max_edits(data_node)
+        if max_edits is None or len(edits) <= max_edits:
+            return edits
+        cls._append(data_node.id, edits[: len(edits) - max_edits])
+        return edits[len(edits) - max_edits :]
+
+    @classmethod
+    def _append(cls, data_node_id: str, edits: List[Edit]):
+        path = cls.__path(data_node_id)
+        lines = "".join(json.dumps(edit, ensure_ascii=False, cls=_Encoder) + "\n" for edit in edits)
+        with cls.__lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as log:
+                log.write(lines)
+
+    @classmethod
+    def _read(cls, data_node_id: str) -> List[Edit]:
+        path = cls.__path(data_node_id)
+        if not path.exists():
+            return []
+        with open(path, encoding="utf-8") as log:
+            return [json.loads(line, cls=_Decoder) for line in log if line.strip()]
+
+    @classmethod
+    def _delete(cls, data_node_id: str):
+        path = cls.__path(data_node_id)
+        with cls.__lock:
+            if path.exists():
+                os.remove(path)
+
+    @classmethod
+    def __path(cls, data_node_id: str) -> pathlib.Path:
+        return pathlib.Path(Config.core.taipy_storage_folder) / cls.__FOLDER / f"{data_node_id}{cls.__SUFFIX}"
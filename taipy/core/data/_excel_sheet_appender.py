@@ -0,0 +1,228 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import copy
+import math
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+import zipfile
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+
+class _ExcelSheetAppender:
+    """
+    Append rows at the end of the sheets of an existing Excel (.xlsx) file.
+
+    An .xlsx file is a zip archive of XML documents. Instead of loading the whole workbook, the archive is copied
+    entry by entry to a new file and the XML documents of the sheets the rows are appended to are streamed: the new
+    rows are inserted right before the end of their sheet data. The memory used does not depend on the size of the
+    workbook.
+
+    Only rows made of numbers, booleans, strings and missing values are supported, since these values are stored
+    without any cell style. `_append()` returns False, without modifying the file, if any other value is found.
+    """
+
+    __MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    __REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    __PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+    __CHUNK_SIZE = 1 << 20
+    __ROW_RE = re.compile(rb"<(?:\w+:)?row\b[^>]*?\br=\"(\d+)\"")
+    __SHEET_DATA_END_RE = re.compile(rb"</(?:\w+:)?sheetData>|<(?:\w+:)?sheetData\s*/>")
+    __DIMENSION_RE = re.compile(rb"(<(?:\w+:)?dimension\b[^>]*?\bref=\")([A-Z]+)(\d+)(?::([A-Z]+)\d+)?\"")
+    # Bytes kept between two chunks, so that no tag is split by the end of a chunk
+    __OVERLAP = 512
+    # The end of the cell element of a value that is not supported: the end of a cell element is never empty
+    __UNSUPPORTED = b""
+
+    @classmethod
+    def _append(cls, path: str, data: Dict[Optional[str], pd.DataFrame]) -> bool:
+        """Append the data frames to the sheets they are keyed by, or to the first sheet for the None key."""
+        rows_by_sheet = {}
+        for sheet_name, df in data.items():
+            rows = cls.__build_rows(df)
+            if rows is None:
+                return False
+            rows_by_sheet[sheet_name] = rows
+
+        try:
+            source = zipfile.ZipFile(path)
+        except zipfile.BadZipFile:
+            # Not an .xlsx file
+            return False
+        with source:
+            sheet_paths = cls.__get_sheet_paths(source)
+            if not sheet_paths:
+                return False
+            rows_by_path: Dict[str, List[List[Optional[bytes]]]] = {}
+            for sheet_name, rows in rows_by_sheet.items():
+                sheet_path = sheet_paths[0][1] if sheet_name is None else dict(sheet_paths).get(sheet_name)
+                if sheet_path is None or sheet_path not in source.namelist():
+                    return False
+                rows_by_path.setdefault(sheet_path, []).extend(rows)
+
+            fd, tmp_path = tempfile.mkstemp(suffix=".xlsx.tmp", dir=os.path.dirname(os.path.abspath(path)))
+            os.close(fd)
+            try:
+                with zipfile.ZipFile(tmp_path, "w") as target:
+                    for item in source.infolist():
+                        # Writing an entry updates its info, which must then not be shared with the source archive
+                        target_item = copy.copy(item)
+                        if item.filename in rows_by_path:
+                            cls.__append_to_sheet(source, target, item, target_item, rows_by_path[item.filename])
+                        else:
+                            with source.open(item) as src, target.open(target_item, "w") as dst:
+                                while chunk := src.read(cls.__CHUNK_SIZE):
+                                    dst.write(chunk)
+                # The temporary file is only readable by its owner
+                shutil.copymode(path, tmp_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+        return True
+
+    @classmethod
+    def __get_sheet_paths(cls, source: zipfile.ZipFile) -> List[Tuple[str, str]]:
+        """Return the sheet names and the paths of their XML documents in the archive, in the workbook order."""
+        try:
+            workbook = ElementTree.fromstring(source.read("xl/workbook.xml"))
+            rels = ElementTree.fromstring(source.read("xl/_rels/workbook.xml.rels"))
+        except KeyError:
+            return []
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{{{cls.__PACKAGE_REL_NS}}}Relationship")}
+        sheet_paths = []
+        for sheet in workbook.iter(f"{{{cls.__MAIN_NS}}}sheet"):
+            name = sheet.get("name")
+            target = targets.get(sheet.get(f"{{{cls.__REL_NS}}}id"))
+            if name is None or target is None:
+                continue
+            if target.startswith("/"):
+                sheet_path = target.lstrip("/")
+            else:
+                sheet_path = posixpath.normpath(posixpath.join("xl", target))
+            sheet_paths.append((name, sheet_path))
+        return sheet_paths
+
+    @classmethod
+    def __append_to_sheet(
+        cls,
+        source: zipfile.ZipFile,
+        target: zipfile.ZipFile,
+        item: zipfile.ZipInfo,
+        target_item: zipfile.ZipInfo,
+        rows: List[List[Optional[bytes]]],
+    ):
+        # The sheet is read a first time to find its last row, then copied with the new rows.
+        last_row = 0
+        for chunk in cls.__chunks(source, item):
+            last_row = max([last_row, *(int(r) for r in cls.__ROW_RE.findall(chunk))])
+        last_col = max((len(row) for row in rows), default=0)
+        new_rows = b"".join(
+            b'<row r="%d">' % (last_row + i + 1)
+            + b"".join(
+                b'<c r="%s%d"%s' % (get_column_letter(j + 1).encode(), last_row + i + 1, cell)
+                for j, cell in enumerate(row)
+                if cell is not None
+            )
+            + b"</row>"
+            for i, row in enumerate(rows)
+        )
+
+        with target.open(target_item, "w") as dst:
+            buffer = b""
+            has_dimension = inserted = False
+            for chunk in cls.__chunks(source, item, raw=True):
+                if inserted:
+                    dst.write(chunk)
+                    continue
+                buffer += chunk
+                if not has_dimension and (match := cls.__DIMENSION_RE.search(buffer)):
+                    buffer = cls.__update_dimension(buffer, match, last_row + len(rows), last_col)
+                    has_dimension = True
+                if match := cls.__SHEET_DATA_END_RE.search(buffer):
+                    if match.group().endswith(b"/>"):
+                        # Empty sheet data
+                        tag = match.group()[1:].rstrip(b"/ \t\r\n")
+                        insertion = b"<" + tag + b">" + new_rows + b"</" + tag + b">"
+                    else:
+                        insertion = new_rows + match.group()
+                    dst.write(buffer[: match.start()] + insertion + buffer[match.end() :])
+                    buffer = b""
+                    inserted = True
+                elif len(buffer) > cls.__OVERLAP:
+                    dst.write(buffer[: -cls.__OVERLAP])
+                    buffer = buffer[-cls.__OVERLAP :]
+            dst.write(buffer)
+
+    @classmethod
+    def __update_dimension(cls, buffer: bytes, match: re.Match, last_row: int, last_col: int) -> bytes:
+        end_col = match.group(4) or match.group(2)
+        if last_col and column_index_from_string(end_col.decode()) < last_col:
+            end_col = get_column_letter(last_col).encode()
+        ref = match.group(1) + match.group(2) + match.group(3) + b":" + end_col + b"%d" % max(last_row, 1) + b'"'
+        return buffer[: match.start()] + ref + buffer[match.end() :]
+
+    @classmethod
+    def __chunks(cls, source: zipfile.ZipFile, item: zipfile.ZipInfo, raw: bool = False) -> Iterable[bytes]:
+        with source.open(item) as src:
+            previous = b""
+            while chunk := src.read(cls.__CHUNK_SIZE):
+                if raw:
+                    yield chunk
+                else:
+                    # Overlapping chunks, so that no row tag is missed at the end of a chunk
+                    yield previous + chunk
+                    previous = chunk[-cls.__OVERLAP :]
+
+    @classmethod
+    def __build_rows(cls, df: pd.DataFrame) -> Optional[List[List[Optional[bytes]]]]:
+        rows = []
+        for values in df.itertuples(index=False, name=None):
+            row = []
+            for value in values:
+                cell = cls.__build_cell(value)
+                if cell == cls.__UNSUPPORTED:
+                    return None
+                row.append(cell)
+            rows.append(row)
+        return rows
+
+    @classmethod
+    def __build_cell(cls, value) -> Optional[bytes]:
+        """Return the end of the cell element of the value, None for a missing value or `__UNSUPPORTED`."""
+        if value is None or value is pd.NA or value is pd.NaT:
+            return None
+        if isinstance(value, (bool, np.bool_)):
+            return b' t="b"><v>%d</v></c>' % bool(value)
+        if isinstance(value, (int, float, np.integer, np.floating)):
+            if isinstance(value, (float, np.floating)):
+                if math.isnan(value):
+                    return None
+                if math.isinf(value):
+                    return cls.__UNSUPPORTED
+            return b"><v>%s</v></c>" % repr(value.item() if isinstance(value, np.generic) else value).encode()
+        if isinstance(value, str):
+            if ILLEGAL_CHARACTERS_RE.search(value):
+                return cls.__UNSUPPORTED
+            text = escape(value).encode("utf-8")
+            return b' t="inlineStr"><is><t xml:space="preserve">%s</t></is></c>' % text
+        return cls.__UNSUPPORTED
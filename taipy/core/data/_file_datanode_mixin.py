@@ -13,7 +13,7 @@ import os
 import pathlib
 import shutil
 from datetime import datetime
-from os.path import isfile
+from os.path import isdir, isfile
 from typing import Any, Callable, Dict, Optional
 
 from taipy.common.config import Config
@@ -21,6 +21,7 @@ from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from .._entity._reload import _self_reload
 from ..reason import InvalidUploadFile, NoFileToDownload, NotAFile, ReasonCollection, UploadFileCanNotBeRead
+from ._data_read_cache import _DataReadCache
 from .data_node import DataNode
 from .data_node_id import Edit
 
@@ -28,7 +29,7 @@ from .data_node_id import Edit
 class _FileDataNodeMixin(object):
     """Mixin class designed to handle file-based data nodes."""
 
-    __EXTENSION_MAP = {"csv": "csv", "excel": "xlsx", "parquet": "parquet", "pickle": "p", "json": "json"}
+    __EXTENSION_MAP = {"csv": "csv", "excel": "xlsx", "parquet": "parquet", "pickle": "p", "json": "json", "npy": "npy"}
 
     _DEFAULT_DATA_KEY = "default_data"
     _PATH_KEY = "path"
@@ -140,17 +141,24 @@ class _FileDataNodeMixin(object):
                 reason_collection._add_reason(self.id, InvalidUploadFile(upload_path.name, self.id))  # type: ignore[attr-defined]
                 return reason_collection
 
+        if isdir(self.path):
+            # The uploaded file replaces the dataset directory, instead of being added to it.
+            shutil.rmtree(self.path)
         shutil.copy(upload_path, self.path)
 
         self.track_edit(timestamp=datetime.now())  # type: ignore[attr-defined]
         self.unlock_edit()  # type: ignore[attr-defined]
         _DataManagerFactory._build_manager()._set(self)  # type: ignore[arg-type]
+        self._unblock_waiting_jobs()  # type: ignore[attr-defined]
 
         return reason_collection
 
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         raise NotImplementedError
 
+    def _read_from_cache(self) -> Any:
+        return _DataReadCache._read(self, self._read_from_path)
+
     def _write_default_data(self, default_value: Any):
         if default_value is not None and not os.path.exists(self._path):
             self._write(default_value)  # type: ignore[attr-defined]
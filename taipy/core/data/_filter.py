@@ -11,16 +11,22 @@
 
 from collections.abc import Hashable
 from functools import reduce
+from importlib import util
 from itertools import chain
 from operator import and_, or_
-from typing import Dict, Iterable, List, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from pandas.core.common import is_bool_indexer
 
+from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .operator import JoinOperator, Operator
 
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
 
 class _FilterDataNode:
     @staticmethod
@@ -68,6 +74,8 @@ class _FilterDataNode:
 
     @staticmethod
     def __getitem_hashable(data, key):
+        if _TabularDataNodeMixin._is_arrow_table(data):
+            return data.column(key)
         if _FilterDataNode.__is_pandas_object(data) or _FilterDataNode.__is_multi_sheet_excel(data):
             return data.get(key)
         return [getattr(entry, key, None) for entry in data]
@@ -94,12 +102,16 @@ class _FilterDataNode:
     def __getitem_bool_indexer(data, key):
         if _FilterDataNode.__is_pandas_object(data):
             return data[key]
+        if _TabularDataNodeMixin._is_arrow_table(data):
+            return data.filter(pa.array(key, type=pa.bool_()))
         return [e for i, e in enumerate(data) if key[i]]
 
     @staticmethod
     def __getitem_iterable(data, keys):
         if _FilterDataNode.__is_pandas_object(data):
             return data[keys]
+        if _TabularDataNodeMixin._is_arrow_table(data):
+            return data.select(list(keys))
 
         return [{k: getattr(entry, k) for k in keys if hasattr(entry, k)} for entry in data]
 
@@ -111,6 +123,9 @@ class _FilterDataNode:
         if isinstance(data, Dict):
             return {k: _FilterDataNode._filter(v, operators, join_operator) for k, v in data.items()}
 
+        if _TabularDataNodeMixin._is_arrow_table(data):
+            return _FilterDataNode.__filter_arrow_table(data, operators, join_operator)
+
         if not isinstance(operators[0], (list, tuple)):
             if isinstance(data, pd.DataFrame):
                 return _FilterDataNode.__filter_dataframe_per_key_value(data, operators[0], operators[1], operators[2])
@@ -146,6 +161,27 @@ class _FilterDataNode:
 
     @staticmethod
     def __filter_dataframe_per_key_value(df_data: pd.DataFrame, key: str, value, operator: Operator):
+        return df_data[_FilterDataNode.__get_dataframe_condition_per_key_value(df_data, key, value, operator)]
+
+    @staticmethod
+    def _get_dataframe_condition(df_data: pd.DataFrame, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
+        if not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+
+        conditions = [
+            _FilterDataNode.__get_dataframe_condition_per_key_value(df_data, key, value, operator)
+            for key, value, operator in operators
+        ]
+
+        if join_operator == JoinOperator.AND:
+            return reduce(and_, conditions)
+        elif join_operator == JoinOperator.OR:
+            return reduce(or_, conditions)
+        else:
+            raise NotImplementedError
+
+    @staticmethod
+    def __get_dataframe_condition_per_key_value(df_data: pd.DataFrame, key: str, value, operator: Operator):
         df_by_col = df_data[key]
         if operator == Operator.EQUAL:
             df_by_col = df_by_col == value
@@ -159,7 +195,64 @@ class _FilterDataNode:
             df_by_col = df_by_col > value
         if operator == Operator.GREATER_OR_EQUAL:
             df_by_col = df_by_col >= value
-        return df_data[df_by_col]
+        return df_by_col
+
+    @staticmethod
+    def __filter_arrow_table(table, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
+        try:
+            if (expression := _FilterDataNode._get_arrow_expression(operators, join_operator)) is not None:
+                return table.filter(expression)
+        except (pa.ArrowException, TypeError):
+            pass
+        # The operators that cannot be expressed with pyarrow.compute are applied on a pandas copy of the table.
+        filtered_df = _FilterDataNode._filter(table.to_pandas(), operators, join_operator)
+        return pa.Table.from_pandas(filtered_df, schema=table.schema, preserve_index=False)
+
+    @staticmethod
+    def _get_arrow_expression(operators: Union[List, Tuple], join_operator=JoinOperator.AND):
+        """Return the pyarrow.compute expression of the operators, or None if they cannot be expressed."""
+        if not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        if join_operator not in (JoinOperator.AND, JoinOperator.OR):
+            return None
+
+        expression = None
+        for key, value, operator in operators:
+            if value is None or not isinstance(key, str):
+                return None
+            field = pc.field(key)
+            if operator == Operator.EQUAL:
+                condition = field == value
+            elif operator == Operator.NOT_EQUAL:
+                # Pandas considers that missing values are not equal to any value.
+                condition = (field != value) | field.is_null()
+            elif operator == Operator.LESS_THAN:
+                condition = field < value
+            elif operator == Operator.LESS_OR_EQUAL:
+                condition = field <= value
+            elif operator == Operator.GREATER_THAN:
+                condition = field > value
+            elif operator == Operator.GREATER_OR_EQUAL:
+                condition = field >= value
+            else:
+                return None
+            if expression is None:
+                expression = condition
+            elif join_operator == JoinOperator.AND:
+                expression = expression & condition
+            else:
+                expression = expression | condition
+        return expression
+
+    @staticmethod
+    def _get_columns_to_read(operators: Union[List, Tuple], columns: Optional[List]) -> Optional[List]:
+        """Return the columns to read to select the columns and apply the operators, or None to read all of them."""
+        if columns is None:
+            return None
+        if operators and not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        keys = [key for key, _, _ in operators]
+        return list(columns) + [key for key in dict.fromkeys(keys) if key not in columns]
 
     @staticmethod
     def __dataframe_merge(df_list: List, how="inner"):
@@ -0,0 +1,63 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from threading import Lock
+from typing import Any, Dict, Hashable, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+
+class _SQLEngineRegistry:
+    """
+    Process-wide registry of the SQLAlchemy engines used by the SQL data nodes.
+
+    The data node entities are instantiated again each time they are loaded from the repository. Engines, and their
+    connection pools, are shared by all the data nodes with the same connection string and engine options instead
+    of being created again for each instance.
+
+    In a forked process (e.g. a standalone worker), the inherited engines are discarded without closing the
+    connections of the parent process, and new engines are created on demand.
+    """
+
+    __engines: Dict[Tuple[str, Hashable], Engine] = {}
+    __lock = Lock()
+
+    @classmethod
+    def _get_engine(cls, conn_string: str, **engine_options: Any) -> Engine:
+        key = (conn_string, tuple(sorted(engine_options.items())))
+        with cls.__lock:
+            engine = cls.__engines.get(key)
+            if engine is None:
+                engine = create_engine(conn_string, **engine_options)
+                cls.__engines[key] = engine
+            return engine
+
+    @classmethod
+    def _dispose(cls):
+        """Dispose all the registered engines, closing the connections checked in their pools."""
+        with cls.__lock:
+            engines = list(cls.__engines.values())
+            cls.__engines.clear()
+        for engine in engines:
+            engine.dispose()
+
+    @classmethod
+    def _reset_after_fork(cls):
+        cls.__lock = Lock()
+        for engine in cls.__engines.values():
+            engine.dispose(close=False)
+        cls.__engines.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SQLEngineRegistry._reset_after_fork)
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from importlib import util
 from typing import Any, Callable, Dict, List, Union
 
 import numpy as np
@@ -16,6 +17,9 @@ import pandas as pd
 
 from ..exceptions.exceptions import InvalidExposedType
 
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+
 
 class _TabularDataNodeMixin(object):
     """Mixin class designed to handle tabular representable data nodes."""
@@ -24,8 +28,9 @@ class _TabularDataNodeMixin(object):
     _EXPOSED_TYPE_PROPERTY = "exposed_type"
     _EXPOSED_TYPE_NUMPY = "numpy"
     _EXPOSED_TYPE_PANDAS = "pandas"
+    _EXPOSED_TYPE_ARROW = "arrow"
     _EXPOSED_TYPE_MODIN = "modin"  # Deprecated in favor of pandas since 3.1.0
-    _VALID_STRING_EXPOSED_TYPES = [_EXPOSED_TYPE_PANDAS, _EXPOSED_TYPE_NUMPY]
+    _VALID_STRING_EXPOSED_TYPES = [_EXPOSED_TYPE_PANDAS, _EXPOSED_TYPE_NUMPY, _EXPOSED_TYPE_ARROW]
 
     def __init__(self, **kwargs) -> None:
         self._decoder: Union[Callable, Any]
@@ -48,12 +53,23 @@ class _TabularDataNodeMixin(object):
     def _convert_data_to_dataframe(self, exposed_type: Any, data: Any) -> Union[pd.DataFrame, pd.Series]:
         if exposed_type == self._EXPOSED_TYPE_PANDAS and isinstance(data, (pd.DataFrame, pd.Series)):
             return data
+        elif self._is_arrow_table(data):
+            return data.to_pandas()
         elif exposed_type == self._EXPOSED_TYPE_NUMPY and isinstance(data, np.ndarray):
             return pd.DataFrame(data)
         elif isinstance(data, list) and not isinstance(exposed_type, str):
             return pd.DataFrame.from_records([self._encoder(row) for row in data])
         return pd.DataFrame(data)
 
+    def _convert_dataframe_to_exposed_type(self, exposed_type: Any, df: pd.DataFrame) -> Any:
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return df
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return df.to_numpy()
+        if exposed_type == self._EXPOSED_TYPE_ARROW:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        return [exposed_type(**row) for row in df.to_dict(orient="records")]
+
     @classmethod
     def _get_valid_exposed_type(cls, properties: Dict):
         if (
@@ -73,6 +89,15 @@ class _TabularDataNodeMixin(object):
                 f"Invalid string exposed type {exposed_type}. Supported values are "
                 f"{', '.join(valid_string_exposed_types)}"
             )
+        if exposed_type == cls._EXPOSED_TYPE_ARROW and not util.find_spec("pyarrow"):
+            raise InvalidExposedType(
+                f"The exposed type {exposed_type} requires the pyarrow package. You can install it with "
+                "'pip install taipy[arrow]'."
+            )
+
+    @staticmethod
+    def _is_arrow_table(data: Any) -> bool:
+        return util.find_spec("pyarrow") is not None and isinstance(data, pa.Table)
 
     def _default_decoder_with_header(self, document: Dict) -> Any:
         if self.custom_document:
@@ -10,8 +10,11 @@
 # specific language governing permissions and limitations under the License.
 
 import csv
+import os
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from importlib import util
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -22,9 +25,15 @@ from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..job.job_id import JobId
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator
+
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
 
 
 class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -39,10 +48,13 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         to write the data to the CSV file.
     - *has_header* (`bool`): If True, indicates that the CSV file has a header.
     - *exposed_type*: The exposed type of the data read from CSV file. The default value is `pandas`.
+        If set to *"arrow"*, the file is parsed by the multithreaded *pyarrow.csv* reader into a
+        *pyarrow.Table*.
     """
 
     __STORAGE_TYPE = "csv"
     __ENCODING_KEY = "encoding"
+    __FILTER_CHUNK_SIZE = 100_000
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -128,7 +140,7 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         self.track_edit(timestamp=datetime.now(), job_id=job_id)
 
     def _read(self):
-        return self._read_from_path()
+        return self._read_from_cache()
 
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
@@ -139,8 +151,66 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             return self._read_as_pandas_dataframe(path=path)
         if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_NUMPY:
             return self._read_as_numpy(path=path)
+        if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_ARROW:
+            return self._read_as_arrow_table(path=path)
         return self._read_as(path=path)
 
+    def _read_for_filter(
+        self, operators: Union[List, Tuple], join_operator=JoinOperator.AND, columns: Optional[List] = None
+    ):
+        properties = self.properties
+        if not operators or properties[self._EXPOSED_TYPE_PROPERTY] != self._EXPOSED_TYPE_PANDAS:
+            return super()._read_for_filter(operators, join_operator, columns)
+
+        # The file is streamed by chunks and only the rows matching the operators are kept, so that
+        # the whole file is never loaded in memory. Only the selected columns and the columns of the
+        # operators are parsed.
+        read_kwargs = {
+            "encoding": properties[self.__ENCODING_KEY],
+            "header": 0 if properties[self._HAS_HEADER_PROPERTY] else None,
+            "usecols": _FilterDataNode._get_columns_to_read(operators, columns),
+        }
+        try:
+            # The dtypes inferred from the first rows are used for all the chunks, so that a column
+            # does not get a different dtype from one chunk to another.
+            dtypes = pd.read_csv(self._path, nrows=self.__FILTER_CHUNK_SIZE, **read_kwargs).dtypes.to_dict()
+            with pd.read_csv(self._path, dtype=dtypes, chunksize=self.__FILTER_CHUNK_SIZE, **read_kwargs) as reader:
+                filtered_chunks = [
+                    chunk[_FilterDataNode._get_dataframe_condition(chunk, operators, join_operator)] for chunk in reader
+                ]
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+        except ValueError:
+            # The next rows do not fit the dtypes of the first ones: the whole file is read instead.
+            return super()._read_for_filter(operators, join_operator, columns)
+        return pd.concat(filtered_chunks) if filtered_chunks else pd.DataFrame()
+
+    def _read_chunks(self, chunk_size: int) -> Iterator[Any]:
+        properties = self.properties
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type not in (self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_NUMPY, self._EXPOSED_TYPE_ARROW):
+            with open(self._path, encoding=properties[self.__ENCODING_KEY]) as csvFile:
+                if properties[self._HAS_HEADER_PROPERTY]:
+                    rows = (self._decoder(line) for line in csv.DictReader(csvFile))
+                else:
+                    rows = (self._decoder(line) for line in csv.reader(csvFile))
+                while chunk := list(islice(rows, chunk_size)):
+                    yield chunk
+            return
+
+        try:
+            reader = pd.read_csv(
+                self._path,
+                encoding=properties[self.__ENCODING_KEY],
+                header=0 if properties[self._HAS_HEADER_PROPERTY] else None,
+                chunksize=chunk_size,
+            )
+        except pd.errors.EmptyDataError:
+            return
+        with reader:
+            for chunk in reader:
+                yield self._convert_dataframe_to_exposed_type(exposed_type, chunk)
+
     def _read_as(self, path: str):
         properties = self.properties
         with open(path, encoding=properties[self.__ENCODING_KEY]) as csvFile:
@@ -154,6 +224,19 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _read_as_numpy(self, path: str) -> np.ndarray:
         return self._read_as_pandas_dataframe(path=path).to_numpy()
 
+    def _read_as_arrow_table(self, path: str):
+        properties = self.properties
+        read_options = pa_csv.ReadOptions(
+            encoding=properties[self.__ENCODING_KEY],
+            autogenerate_column_names=not properties[self._HAS_HEADER_PROPERTY],
+        )
+        try:
+            return pa_csv.read_csv(path, read_options=read_options)
+        except pa.ArrowInvalid:
+            if os.path.getsize(path) == 0:
+                return pa.table({})
+            raise
+
     def _read_as_pandas_dataframe(
         self,
         path: str,
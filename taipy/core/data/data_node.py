@@ -14,9 +14,11 @@ import os
 import uuid
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import networkx as nx
+import numpy as np
+import pandas as pd
 
 from taipy.common.config.common._validate_id import _validate_id
 from taipy.common.config.common.scope import Scope
@@ -32,7 +34,10 @@ from ..exceptions.exceptions import DataNodeIsBeingEdited, NoData
 from ..job.job_id import JobId
 from ..notification.event import Event, EventEntityType, EventOperation, _make_event
 from ..reason import DataNodeEditInProgress, DataNodeIsNotWritten
+from ._data_read_cache import _DataReadCache
+from ._edit_log import _EditLog
 from ._filter import _FilterDataNode
+from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node_id import DataNodeId, Edit
 from .operator import JoinOperator
 
@@ -107,9 +112,10 @@ class DataNode(_Entity, _Labeled):
     _REQUIRED_PROPERTIES: List[str] = []
     _MANAGER_NAME: str = "data"
     _PATH_KEY = "path"
+    _DEFAULT_CHUNK_SIZE = 10_000
     __EDIT_TIMEOUT = 30
 
-    _TAIPY_PROPERTIES: Set[str] = set()
+    _TAIPY_PROPERTIES: Set[str] = {_EditLog._MAX_EDITS_PROPERTY}
 
     id: DataNodeId
     """The unique identifier of the data node."""
@@ -197,7 +203,12 @@ class DataNode(_Entity, _Labeled):
             <li>job_id: Only populated when the data node is written by a task execution and
                 corresponds to the job's id.</li></ul>
         Additional metadata related to the edition made to the data node can also be provided in Edits.
+
+        If the number of edits kept with the data node is bounded by the *max_edits* property, the oldest
+        edits are read from the data node's edit log.
         """
+        if archived_edits := _EditLog._read(self.id):
+            return archived_edits + self._edits
         return self._edits
 
     @property  # type: ignore
@@ -430,6 +441,7 @@ class DataNode(_Entity, _Labeled):
         self.track_edit(job_id=job_id, **kwargs)
         self.unlock_edit()
         _DataManagerFactory._build_manager()._set(self)
+        self._unblock_waiting_jobs()
 
     def write(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
         """Write some data to this data node.
@@ -446,6 +458,53 @@ class DataNode(_Entity, _Labeled):
         self.track_edit(job_id=job_id, **kwargs)
         self.unlock_edit()
         _DataManagerFactory._build_manager()._set(self)
+        self._unblock_waiting_jobs()
+
+    def read_chunks(self, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """Read the data referenced by this data node by chunks.
+
+        CSV, Parquet, SQL and Mongo collection data nodes read the chunks lazily from their storage,
+        so that the whole data never has to fit in memory. The other data node types read all the
+        data and split it.
+
+        Arguments:
+            chunk_size (int): The maximum number of rows (or elements) of each chunk.
+
+        Returns:
+            An iterator over the chunks of data, each having the exposed type of the data node.
+            Nothing is iterated if the data has not been written yet.
+        """
+        if not self.last_edit_date:
+            self._logger.warning(
+                f"Data node {self.id} from config {self.config_id} is being read but has never been written."
+            )
+            return iter(())
+        return self._read_chunks(chunk_size)
+
+    def write_chunks(self, chunks: Iterable[Any], job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
+        """Write some data to this data node by chunks.
+
+        The first chunk overwrites the data of the data node and the next ones are appended to it. The
+        chunks can be produced lazily (by a generator for instance), so that the whole data never has
+        to fit in memory. If no chunk is provided, the data node is left untouched.
+
+        Arguments:
+            chunks (Iterable[Any]): The chunks of data to write to this data node.
+            job_id (JobId): An optional identifier of the writer.
+            **kwargs (dict[str, any]): Extra information to attach to the edit document
+                corresponding to this write.
+
+        Raises:
+            NotImplementedError: If the data node type does not support appending data.
+        """
+        from ._data_manager_factory import _DataManagerFactory
+
+        if not self._write_chunks(chunks):
+            return
+        self.track_edit(job_id=job_id, **kwargs)
+        self.unlock_edit()
+        _DataManagerFactory._build_manager()._set(self)
+        self._unblock_waiting_jobs()
 
     def track_edit(self, **options):
         """Creates and adds a new entry in the edits attribute without writing the data.
@@ -461,6 +520,15 @@ class DataNode(_Entity, _Labeled):
             )
         self.last_edit_date = edit.get("timestamp")
         self._edits.append(edit)
+        self._edits = _EditLog._archive(self, self._edits)
+        _DataReadCache._invalidate(self.id)
+
+    def _unblock_waiting_jobs(self):
+        """Let the orchestrator unblock the jobs waiting for this data node, now it is written."""
+        from .._orchestrator._orchestrator_factory import _OrchestratorFactory
+
+        if orchestrator := _OrchestratorFactory._orchestrator:
+            orchestrator._on_data_node_written(self.id)
 
     def lock_edit(self, editor_id: Optional[str] = None):
         """Lock the data node modification.
@@ -507,7 +575,9 @@ class DataNode(_Entity, _Labeled):
         self.editor_expiration_date = None
         self.edit_in_progress = False
 
-    def filter(self, operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Any:
+    def filter(
+        self, operators: Union[List, Tuple], join_operator=JoinOperator.AND, columns: Optional[List] = None
+    ) -> Any:
         """Read and filter the data referenced by this data node.
 
         The data is filtered by the provided list of 3-tuples (key, value, `Operator^`).
@@ -520,6 +590,9 @@ class DataNode(_Entity, _Labeled):
                 each is in the form of (key, value, `Operator^`).
             join_operator (JoinOperator^): The operator used to join the multiple filter
                 3-tuples.
+            columns (Optional[List]): The columns to keep in the filtered data. All the columns are
+                kept by default. CSV and Parquet data nodes only read these columns and the columns
+                of the operators from their file.
 
         Returns:
             The filtered data.
@@ -527,8 +600,9 @@ class DataNode(_Entity, _Labeled):
         Raises:
             NotImplementedError: If the data type is not supported.
         """
-        data = self._read()
-        return _FilterDataNode._filter(data, operators, join_operator)
+        data = self._read_for_filter(operators, join_operator, columns)
+        data = _FilterDataNode._filter(data, operators, join_operator)
+        return data if columns is None else _FilterDataNode._filter_by_key(data, list(columns))
 
     def get_label(self) -> str:
         """Returns the data node simple label prefixed by its owner label.
@@ -571,9 +645,48 @@ class DataNode(_Entity, _Labeled):
     def _read(self):
         raise NotImplementedError
 
+    def _read_for_filter(
+        self, operators: Union[List, Tuple], join_operator=JoinOperator.AND, columns: Optional[List] = None
+    ):
+        """Read the data to be filtered by the given operators.
+
+        Data node types that can push the filter down to their storage read only the data that
+        may match the operators, and only the selected columns and the columns of the operators.
+        By default, all the data is read.
+        """
+        return self._read()
+
     def _append(self, data):
         raise NotImplementedError
 
+    def _read_chunks(self, chunk_size: int) -> Iterator[Any]:
+        data = self._read()
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            for start in range(0, len(data), chunk_size):
+                yield data.iloc[start : start + chunk_size]
+        elif isinstance(data, (np.ndarray, list, tuple)):
+            for start in range(0, len(data), chunk_size):
+                yield data[start : start + chunk_size]
+        elif _TabularDataNodeMixin._is_arrow_table(data):
+            for start in range(0, data.num_rows, chunk_size):
+                yield data.slice(start, chunk_size)
+        else:
+            yield data
+
+    def _write_chunks(self, chunks: Iterable[Any]) -> bool:
+        """Write the chunks and return False if there was no chunk to write."""
+        if type(self)._append is DataNode._append:
+            raise NotImplementedError(f"Data node {self.id} does not support appending data.")
+        chunks = iter(chunks)
+        for chunk in chunks:
+            self._write(chunk)
+            break
+        else:
+            return False
+        for chunk in chunks:
+            self._append(chunk)
+        return True
+
     @abstractmethod
     def _write(self, data):
         raise NotImplementedError
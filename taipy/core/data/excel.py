@@ -20,8 +20,14 @@ from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
-from ..exceptions.exceptions import ExposedTypeLengthMismatch, NonExistingExcelSheet, SheetNameLengthMismatch
+from ..exceptions.exceptions import (
+    ExposedTypeLengthMismatch,
+    InvalidExposedType,
+    NonExistingExcelSheet,
+    SheetNameLengthMismatch,
+)
 from ..job.job_id import JobId
+from ._excel_sheet_appender import _ExcelSheetAppender
 from ._file_datanode_mixin import _FileDataNodeMixin
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
@@ -43,6 +49,9 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     - *has_header* (`bool`): If True, indicates that the Excel file has a header.
     - *exposed_type* (`str`): The exposed type of the data read from Excel file. The default value
         is `pandas`.
+
+    Appending numbers, booleans and strings streams the new rows at the end of the existing sheets,
+    without loading the whole workbook in memory.
     """
 
     __STORAGE_TYPE = "excel"
@@ -139,16 +148,20 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     @staticmethod
     def _check_exposed_type(exposed_type):
         if isinstance(exposed_type, str):
-            _TabularDataNodeMixin._check_exposed_type(exposed_type)
+            exposed_types = [exposed_type]
         elif isinstance(exposed_type, list):
-            for t in exposed_type:
-                _TabularDataNodeMixin._check_exposed_type(t)
+            exposed_types = exposed_type
         elif isinstance(exposed_type, dict):
-            for t in exposed_type.values():
-                _TabularDataNodeMixin._check_exposed_type(t)
+            exposed_types = list(exposed_type.values())
+        else:
+            return
+        for t in exposed_types:
+            _TabularDataNodeMixin._check_exposed_type(t)
+            if t == _TabularDataNodeMixin._EXPOSED_TYPE_ARROW:
+                raise InvalidExposedType(f"The exposed type {t} is not supported by Excel data nodes.")
 
     def _read(self):
-        return self._read_from_path()
+        return self._read_from_cache()
 
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
@@ -298,11 +311,17 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             raise ImportError("The append method is only available for pandas version 1.4 or higher.")
 
         if isinstance(data, Dict) and all(isinstance(x, (pd.DataFrame, np.ndarray)) for x in data.values()):
-            self._append_excel_with_multiple_sheets(data)
-        elif isinstance(data, pd.DataFrame):
-            self._append_excel_with_single_sheet(data.to_excel, index=False, header=False)
-        else:
-            self._append_excel_with_single_sheet(pd.DataFrame(data).to_excel, index=False, header=False)
+            dfs = {sheet_name: pd.DataFrame(df) for sheet_name, df in data.items()}
+            if not _ExcelSheetAppender._append(self._path, dfs):
+                self._append_excel_with_multiple_sheets(data)
+            return
+
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        sheet_name = self.properties.get(self.__SHEET_NAME_PROPERTY)
+        if sheet_name and not isinstance(sheet_name, str):
+            sheet_name = sheet_name[0]
+        if not _ExcelSheetAppender._append(self._path, {sheet_name or None: df}):
+            self._append_excel_with_single_sheet(df.to_excel, index=False, header=False)
 
     def _write_excel_with_single_sheet(self, write_excel_fct, *args, **kwargs):
         if sheet_name := self.properties.get(self.__SHEET_NAME_PROPERTY):
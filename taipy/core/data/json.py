@@ -131,7 +131,7 @@ class JSONDataNode(DataNode, _FileDataNodeMixin):
         self.properties[self._DECODER_KEY] = decoder
 
     def _read(self):
-        return self._read_from_path()
+        return self._read_from_cache()
 
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
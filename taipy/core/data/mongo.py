@@ -12,7 +12,8 @@
 from datetime import datetime, timedelta
 from importlib import util
 from inspect import isclass
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from taipy.common.config.common.scope import Scope
 
@@ -158,18 +159,35 @@ class MongoCollectionDataNode(DataNode):
         """Return the storage type of the data node: "mongo_collection"."""
         return cls.__STORAGE_TYPE
 
-    def filter(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND) -> List:
-        cursor = self._read_by_query(operators, join_operator)
+    def filter(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List] = None,
+    ) -> List:
+        cursor = self._read_by_query(operators, join_operator, columns)
         return [self._decoder(row) for row in cursor]
 
     def _read(self):
         cursor = self._read_by_query()
         return [self._decoder(row) for row in cursor]
 
-    def _read_by_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
+    def _read_chunks(self, chunk_size: int) -> Iterator[Any]:
+        documents = (self._decoder(row) for row in self._read_by_query().batch_size(chunk_size))
+        while chunk := list(islice(documents, chunk_size)):
+            yield chunk
+
+    def _read_by_query(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List] = None,
+    ):
         """Query from a Mongo collection, exclude the _id field"""
+        # Only the selected fields of the documents are returned by Mongo.
+        projection = {column: 1 for column in columns} if columns is not None else None
         if not operators:
-            return self.collection.find()
+            return self.collection.find({}, projection)
 
         if not isinstance(operators, List):
             operators = [operators]
@@ -197,7 +215,7 @@ class MongoCollectionDataNode(DataNode):
         else:
             raise NotImplementedError(f"Join operator {join_operator} is not supported.")
 
-        return self.collection.find(query)
+        return self.collection.find(query, projection)
 
     def _append(self, data) -> None:
         """Append data to a Mongo collection."""
@@ -0,0 +1,148 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Set
+
+import numpy as np
+
+from taipy.common.config.common.scope import Scope
+
+from .._entity._reload import _Reloader
+from .._version._version_manager_factory import _VersionManagerFactory
+from ._file_datanode_mixin import _FileDataNodeMixin
+from .data_node import DataNode
+from .data_node_id import DataNodeId, Edit
+
+
+class NpyDataNode(DataNode, _FileDataNodeMixin):
+    """Data Node stored as a NumPy binary array file (`.npy`).
+
+    The array is memory-mapped when read: only the pages that are accessed are loaded in memory, and
+    they are shared by all the processes reading the same file. Reading a large array is then
+    cheap, including from the standalone workers, which only receive the path of the file.
+
+    The *properties* attribute can contain the following optional entries:
+
+    - *default_path* (`str`): The default path of the `.npy` file used at the instantiation of the
+        data node.
+    - *default_data*: The default data of the data node. It is used at the data node instantiation
+        to write the data to the `.npy` file.
+    - *mmap_mode* (`str`): The mode used to memory-map the file, as accepted by `numpy.load()`:
+        *"r"*, *"r+"*, or *"c"*. The default value is *"r"*, which exposes read-only arrays.
+        If set to False, the whole array is loaded in memory.
+
+    Writing the data node replaces its file. On Windows, a file cannot be replaced while it is
+    memory-mapped: writing raises a `PermissionError` as long as arrays read from the file are
+    referenced. Set *mmap_mode* to False for the data nodes written while their data is in use.
+    """
+
+    __STORAGE_TYPE = "npy"
+    __MMAP_MODE_KEY = "mmap_mode"
+    __MMAP_MODE_DEFAULT = "r"
+
+    _REQUIRED_PROPERTIES: List[str] = []
+
+    def __init__(
+        self,
+        config_id: str,
+        scope: Scope,
+        id: Optional[DataNodeId] = None,
+        owner_id: Optional[str] = None,
+        parent_ids: Optional[Set[str]] = None,
+        last_edit_date: Optional[datetime] = None,
+        edits: Optional[List[Edit]] = None,
+        version: str = None,
+        validity_period: Optional[timedelta] = None,
+        edit_in_progress: bool = False,
+        editor_id: Optional[str] = None,
+        editor_expiration_date: Optional[datetime] = None,
+        properties=None,
+    ) -> None:
+        self.id = id or self._new_id(config_id)
+
+        if properties is None:
+            properties = {}
+
+        default_value = properties.pop(self._DEFAULT_DATA_KEY, None)
+        _FileDataNodeMixin.__init__(self, properties)
+        if properties.get(self.__MMAP_MODE_KEY) is None:
+            properties[self.__MMAP_MODE_KEY] = self.__MMAP_MODE_DEFAULT
+
+        DataNode.__init__(
+            self,
+            config_id,
+            scope,
+            self.id,
+            owner_id,
+            parent_ids,
+            last_edit_date,
+            edits,
+            version or _VersionManagerFactory._build_manager()._get_latest_version(),
+            validity_period,
+            edit_in_progress,
+            editor_id,
+            editor_expiration_date,
+            **properties,
+        )
+
+        with _Reloader():
+            self._write_default_data(default_value)
+
+        self._TAIPY_PROPERTIES.update(
+            {
+                self._PATH_KEY,
+                self._DEFAULT_PATH_KEY,
+                self._DEFAULT_DATA_KEY,
+                self._IS_GENERATED_KEY,
+                self.__MMAP_MODE_KEY,
+            }
+        )
+
+    @classmethod
+    def storage_type(cls) -> str:
+        """Return the storage type of the data node: "npy"."""
+        return cls.__STORAGE_TYPE
+
+    def _read(self):
+        if self.__mmap_mode():
+            return self._read_from_path()
+        return self._read_from_cache()
+
+    def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
+        if path is None:
+            path = self._path
+        return np.load(path, mmap_mode=self.__mmap_mode() or None, allow_pickle=False)
+
+    def _write(self, data: Any):
+        # The array is written to a temporary file first so that the arrays memory-mapped on the
+        # previous file, possibly by other processes, remain valid.
+        folder = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(folder, exist_ok=True)
+        tmp_path = os.path.join(folder, f".{os.path.basename(self._path)}.{uuid.uuid4().hex}.tmp")
+        # The file is created with the default mode, or gets the mode of the file it replaces.
+        fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(data), allow_pickle=False)
+            if os.path.exists(self._path):
+                shutil.copymode(self._path, tmp_path)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def __mmap_mode(self):
+        return self.properties.get(self.__MMAP_MODE_KEY, self.__MMAP_MODE_DEFAULT)
@@ -9,9 +9,15 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
+import re
+import shutil
+import time
+import uuid
 from datetime import datetime, timedelta
+from importlib import util
 from os.path import isdir, isfile
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -22,10 +28,18 @@ from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..exceptions.exceptions import UnknownCompressionAlgorithm, UnknownParquetEngine
 from ..job.job_id import JobId
+from ..reason import ReasonCollection
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator
+
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
 
 
 class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -39,7 +53,8 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         instantiation to write the data to the Parquet file.
     - *has_header* (`bool`): If True, indicates that the Parquet file has a header.
     - *exposed_type* (`str`): The exposed type of the data read from Parquet
-        file.<br/> The default value is `pandas`.
+        file.<br/> The default value is `pandas`. If set to *"arrow"*, the data is read
+        as a *pyarrow.Table* with the *pyarrow.parquet* module, without any pandas conversion.
     - *engine* (`Optional[str]`): Parquet library to use. Possible values are
         *"fastparquet"* or *"pyarrow"*.<br/> The default value is *"pyarrow"*.
     - *compression* (`Optional[str]`): Name of the compression to use. Possible values
@@ -53,6 +68,11 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         *pandas.DataFrame.write_parquet()* function when writing the data. <br/>
         The parameters in *"write_kwargs"* have a **higher precedence** than the
         top-level parameters which are also passed to Pandas.
+
+    With the *"pyarrow"* engine, appending data does not rewrite the Parquet file: the file is
+    turned into a dataset directory, at the same path, and each append adds a new Parquet file
+    to it. Reading the data node reads all the files of the directory. The `compact()` method
+    merges them back into a single Parquet file.
     """
 
     __STORAGE_TYPE = "parquet"
@@ -63,6 +83,7 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     __READ_KWARGS_PROPERTY = "read_kwargs"
     __WRITE_KWARGS_PROPERTY = "write_kwargs"
     _REQUIRED_PROPERTIES: List[str] = []
+    __PART_NAME_PATTERN = re.compile(r"part-\d+-[0-9a-f]{8}\.parquet")
 
     def __init__(
         self,
@@ -182,6 +203,14 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         kwargs.update(properties[self.__WRITE_KWARGS_PROPERTY])
         kwargs.update(write_kwargs)
 
+        if not kwargs.get("append") and not kwargs.get("partition_cols"):
+            self.__remove_dataset_directory()
+
+        if self._is_arrow_table(data) and kwargs[self.__ENGINE_PROPERTY] == "pyarrow" and not kwargs.get("append"):
+            self.__write_arrow_table(data, kwargs)
+            self.track_edit(timestamp=datetime.now(), job_id=job_id)
+            return
+
         df = self._convert_data_to_dataframe(properties[self._EXPOSED_TYPE_PROPERTY], data)
         if isinstance(df, pd.Series):
             df = pd.DataFrame(df)
@@ -191,6 +220,13 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         df.to_parquet(self._path, **kwargs)
         self.track_edit(timestamp=datetime.now(), job_id=job_id)
 
+    def __write_arrow_table(self, table, kwargs: Dict):
+        write_kwargs = {k: v for k, v in kwargs.items() if k not in (self.__ENGINE_PROPERTY, "index", "partition_cols")}
+        if partition_cols := kwargs.get("partition_cols"):
+            pq.write_to_dataset(table, self._path, partition_cols=partition_cols, **write_kwargs)
+        else:
+            pq.write_table(table, self._path, **write_kwargs)
+
     def read_with_kwargs(self, **read_kwargs):
         """Read data from this data node.
 
@@ -203,7 +239,7 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         return self._read_from_path(**read_kwargs)
 
     def _read(self):
-        return self._read_from_path()
+        return self._read_from_cache()
 
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
@@ -227,11 +263,92 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         kwargs.update(read_kwargs)
         return self._do_read_from_path(path, properties[self._EXPOSED_TYPE_PROPERTY], kwargs)
 
+    def _read_chunks(self, chunk_size: int) -> Iterator[Any]:
+        properties = self.properties
+        if properties[self.__ENGINE_PROPERTY] != "pyarrow" or not util.find_spec("pyarrow"):
+            yield from super()._read_chunks(chunk_size)
+            return
+
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        columns = properties[self.__READ_KWARGS_PROPERTY].get("columns")
+        for batch in self.__iter_batches(chunk_size, columns):
+            if exposed_type == self._EXPOSED_TYPE_ARROW:
+                yield pa.Table.from_batches([batch])
+            else:
+                yield self._convert_dataframe_to_exposed_type(exposed_type, batch.to_pandas())
+
+    def __iter_batches(self, batch_size: int, columns: Optional[List[str]]) -> Iterator[Any]:
+        if isdir(self._path):
+            # The files of a dataset directory are streamed one after the other, as pandas reads them.
+            dataset = ds.dataset(self._path, format="parquet", partitioning="hive")
+            yield from dataset.to_batches(batch_size=batch_size, columns=columns)
+            return
+        with pq.ParquetFile(self._path) as parquet_file:
+            yield from parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+
+    def _write_chunks(self, chunks: Iterable[Any]) -> bool:
+        properties = self.properties
+        if (
+            properties[self.__ENGINE_PROPERTY] != "pyarrow"
+            or properties[self.__WRITE_KWARGS_PROPERTY]
+            or not util.find_spec("pyarrow")
+        ):
+            return super()._write_chunks(chunks)
+
+        # The chunks are written as the row groups of a single Parquet file.
+        writer = None
+        try:
+            for chunk in chunks:
+                table = self.__to_arrow_table(chunk)
+                if writer is None:
+                    self.__remove_dataset_directory()
+                    writer = pq.ParquetWriter(
+                        self._path, table.schema, compression=properties[self.__COMPRESSION_PROPERTY]
+                    )
+                else:
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return writer is not None
+
+    def _read_for_filter(
+        self, operators: Union[List, Tuple], join_operator=JoinOperator.AND, columns: Optional[List] = None
+    ):
+        properties = self.properties
+        if (
+            not self.last_edit_date
+            or properties[self._EXPOSED_TYPE_PROPERTY] not in (self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_ARROW)
+            or properties[self.__ENGINE_PROPERTY] != "pyarrow"
+            or "filters" in properties[self.__READ_KWARGS_PROPERTY]
+            or "columns" in properties[self.__READ_KWARGS_PROPERTY]
+            or not util.find_spec("pyarrow")
+        ):
+            return super()._read_for_filter(operators, join_operator, columns)
+        try:
+            # Only the row groups and the rows that may match the operators are read, and only the selected columns
+            # and the columns of the operators. The operators are then applied again on the read data, so the result
+            # is the same as filtering all the data.
+            read_kwargs: Dict[str, Any] = {}
+            if operators:
+                if (expression := _FilterDataNode._get_arrow_expression(operators, join_operator)) is not None:
+                    read_kwargs["filters"] = expression
+            if columns is not None:
+                read_kwargs["columns"] = _FilterDataNode._get_columns_to_read(operators, columns)
+            if not read_kwargs:
+                return super()._read_for_filter(operators, join_operator, columns)
+            return self._read_from_path(**read_kwargs)
+        except (pa.ArrowException, TypeError):
+            return super()._read_for_filter(operators, join_operator, columns)
+
     def _do_read_from_path(self, path: str, exposed_type: str, kwargs: Dict) -> Any:
         if exposed_type == self._EXPOSED_TYPE_PANDAS:
             return self._read_as_pandas_dataframe(path, kwargs)
         if exposed_type == self._EXPOSED_TYPE_NUMPY:
             return self._read_as_numpy(path, kwargs)
+        if exposed_type == self._EXPOSED_TYPE_ARROW:
+            return self._read_as_arrow_table(path, kwargs)
         return self._read_as(path, kwargs)
 
     def _read_as(self, path: str, read_kwargs: Dict):
@@ -245,8 +362,118 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _read_as_pandas_dataframe(self, path: str, read_kwargs: Dict) -> pd.DataFrame:
         return pd.read_parquet(path, **read_kwargs)
 
+    def _read_as_arrow_table(self, path: str, read_kwargs: Dict):
+        read_kwargs = {k: v for k, v in read_kwargs.items() if k not in (self.__ENGINE_PROPERTY, "dtype_backend")}
+        return pq.read_table(path, **read_kwargs)
+
+    def is_downloadable(self) -> ReasonCollection:
+        """Check if the data node is downloadable.
+
+        The dataset directory made by appending data to the data node is downloadable, as it is compacted
+        into a single Parquet file before being downloaded.
+
+        Returns:
+            A `ReasonCollection^` object containing the reasons why the data node is not downloadable.
+        """
+        if self.__is_appended_dataset():
+            return ReasonCollection()
+        return super().is_downloadable()
+
+    def _get_downloadable_path(self) -> str:
+        if self.__is_appended_dataset():
+            self.compact()
+        return super()._get_downloadable_path()
+
+    def compact(self):
+        """Merge the files appended to the Parquet dataset directory into a single Parquet file.
+
+        The data is streamed by record batches from the dataset directory to the new file, which then
+        replaces the directory. Nothing is done if the data is already stored in a single file, or if
+        the data node is written with partition columns.
+        """
+        properties = self.properties
+        if not isdir(self._path) or properties[self.__WRITE_KWARGS_PROPERTY].get("partition_cols"):
+            return
+        dataset = ds.dataset(self._path, format="parquet")
+        tmp_path = self.__tmp_path(os.path.dirname(os.path.abspath(self._path)))
+        try:
+            with pq.ParquetWriter(
+                tmp_path, dataset.schema, compression=properties[self.__COMPRESSION_PROPERTY]
+            ) as writer:
+                for batch in dataset.to_batches():
+                    writer.write_batch(batch)
+            shutil.rmtree(self._path)
+            os.replace(tmp_path, self._path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def _append(self, data: Any):
-        self._write_with_kwargs(data, engine="fastparquet", append=True)
+        properties = self.properties
+        if properties[self.__ENGINE_PROPERTY] != "pyarrow" or not util.find_spec("pyarrow"):
+            self._write_with_kwargs(data, engine="fastparquet", append=True)
+            return
+        if not os.path.exists(self._path):
+            self._write_with_kwargs(data)
+            return
+
+        table = self.__to_arrow_table(data)
+        if isfile(self._path):
+            self.__to_dataset_directory()
+        if parts := self.__dataset_parts():
+            schema = pq.read_schema(parts[0])
+            if not table.schema.equals(schema):
+                table = table.select(schema.names).cast(schema)
+        # The new file is written under a hidden name, ignored by the readers, until it is complete.
+        tmp_path = self.__tmp_path(self._path)
+        try:
+            pq.write_table(table, tmp_path, compression=properties[self.__COMPRESSION_PROPERTY])
+            os.replace(tmp_path, os.path.join(self._path, self.__new_part_name()))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def __to_arrow_table(self, data: Any):
+        if self._is_arrow_table(data):
+            return data
+        df = self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data)
+        if isinstance(df, pd.Series):
+            df = pd.DataFrame(df)
+        df.columns = df.columns.astype(str)
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    def __to_dataset_directory(self):
+        tmp_path = self.__tmp_path(os.path.dirname(os.path.abspath(self._path)))
+        os.replace(self._path, tmp_path)
+        os.makedirs(self._path)
+        os.replace(tmp_path, os.path.join(self._path, self.__new_part_name()))
+
+    def __dataset_parts(self) -> List[str]:
+        return sorted(
+            os.path.join(self._path, name)
+            for name in os.listdir(self._path)
+            if name.endswith(".parquet") and not name.startswith((".", "_"))
+        )
+
+    def __is_appended_dataset(self) -> bool:
+        """Return True if the path is a dataset directory only made of the files appended to the data node."""
+        if not isdir(self._path) or self.properties[self.__WRITE_KWARGS_PROPERTY].get("partition_cols"):
+            return False
+        names = [name for name in os.listdir(self._path) if not name.startswith((".", "_"))]
+        return bool(names) and all(self.__PART_NAME_PATTERN.fullmatch(name) for name in names)
+
+    def __remove_dataset_directory(self):
+        if isdir(self._path):
+            shutil.rmtree(self._path)
+
+    @staticmethod
+    def __new_part_name() -> str:
+        # The parts are named after their creation time so that they are read in the order they were appended.
+        return f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+
+    @staticmethod
+    def __tmp_path(folder: str) -> str:
+        return os.path.join(folder, f".{uuid.uuid4().hex}.parquet.tmp")
 
     def _write(self, data: Any):
         self._write_with_kwargs(data)
@@ -96,7 +96,7 @@ class PickleDataNode(DataNode, _FileDataNodeMixin):
         return cls.__STORAGE_TYPE
 
     def _read(self):
-        return self._read_from_path()
+        return self._read_from_cache()
 
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
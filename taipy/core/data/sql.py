@@ -29,6 +29,7 @@ class SQLDataNode(_AbstractSQLDataNode):
 
     - *has_header* (`bool`): If True, indicates that the SQL query has a header.
     - *exposed_type* (`str`): The exposed type of the data read from SQL query. The default value is `pandas`.
+        If set to *"arrow"*, the rows are fetched as a *pyarrow.Table*, natively with the drivers that support it.
     - *db_name* (`str`): The database name, or the name of the SQLite database file.
     - *db_engine* (`str`): The database engine. Possible values are *sqlite*, *mssql*,
         *mysql*, or *postgresql*.
@@ -52,6 +53,9 @@ class SQLDataNode(_AbstractSQLDataNode):
     - *sqlite_file_extension* (str): The filename extension of the SQLite file. The default value is ".db".
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into database
         connection string.
+    - *db_pool_size* (`int`): The number of connections to keep open in the connection pool. The engine and its
+        pool are shared by all the SQL data nodes with the same connection string and pool settings.
+    - *db_pool_recycle* (`int`): The number of seconds after which a pooled connection is recycled.
     """
 
     __STORAGE_TYPE = "sql"
@@ -9,11 +9,15 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import io
 from datetime import datetime, timedelta
+from threading import Lock
 from typing import Any, Dict, List, Optional, Set, Union
+from weakref import WeakKeyDictionary
 
 import pandas as pd
-from sqlalchemy import MetaData, Table
+from sqlalchemy import Boolean, Float, Integer, MetaData, String, Table, table
+from sqlalchemy.sql import FromClause
 
 from taipy.common.config.common.scope import Scope
 
@@ -29,6 +33,7 @@ class SQLTableDataNode(_AbstractSQLDataNode):
 
     - *has_header* (`bool`): If True, indicates that the SQL query has a header.
     - *exposed_type* (`str`): The exposed type of the data read from SQL query. The default value is `pandas`.
+        If set to *"arrow"*, the rows are fetched as a *pyarrow.Table*, natively with the drivers that support it.
     - *db_name* (`str`): The database name, or the name of the SQLite database file.
     - *db_engine* (`str`): The database engine. Possible values are *sqlite*, *mssql*,
         *mysql*, or *postgresql*.
@@ -46,10 +51,26 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     - *sqlite_file_extension* (str): The filename extension of the SQLite file. The default value is ".db".
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into database
         connection string.
+    - *db_pool_size* (`int`): The number of connections to keep open in the connection pool. The engine and its
+        pool are shared by all the SQL data nodes with the same connection string and pool settings.
+    - *db_pool_recycle* (`int`): The number of seconds after which a pooled connection is recycled.
+    - *insert_batch_size* (`int`): The maximum number of rows inserted at once when writing data. The default
+        value is 10000.
+    - *insert_method* (`str`): The method used to insert the rows. If set to *"multi"*, each batch of rows is
+        inserted with a single multi-row INSERT statement. By default, the rows are bulk loaded with `COPY` on
+        PostgreSQL, inserted with prepared statements on SQLite, and with an executemany INSERT otherwise.
     """
 
     __STORAGE_TYPE = "sql_table"
     __TABLE_KEY = "table_name"
+    __INSERT_BATCH_SIZE_KEY = "insert_batch_size"
+    __INSERT_METHOD_KEY = "insert_method"
+    __DEFAULT_INSERT_BATCH_SIZE = 10_000
+    __MULTI_VALUES_INSERT_METHOD = "multi"
+
+    # The tables reflected from the database, per engine and table name.
+    __tables: "WeakKeyDictionary[Any, Dict[str, Table]]" = WeakKeyDictionary()
+    __tables_lock = Lock()
 
     def __init__(
         self,
@@ -86,7 +107,7 @@ class SQLTableDataNode(_AbstractSQLDataNode):
             editor_expiration_date=editor_expiration_date,
             properties=properties,
         )
-        self._TAIPY_PROPERTIES.update({self.__TABLE_KEY})
+        self._TAIPY_PROPERTIES.update({self.__TABLE_KEY, self.__INSERT_BATCH_SIZE_KEY, self.__INSERT_METHOD_KEY})
 
     @classmethod
     def storage_type(cls) -> str:
@@ -96,6 +117,9 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     def _get_base_read_query(self) -> str:
         return f"SELECT * FROM {self.properties[self.__TABLE_KEY]}"
 
+    def _get_read_selectable(self) -> FromClause:
+        return table(self.properties[self.__TABLE_KEY])
+
     def _do_append(self, data, engine, connection) -> None:
         self.__insert_data(data, engine, connection)
 
@@ -103,20 +127,40 @@ class SQLTableDataNode(_AbstractSQLDataNode):
         self.__insert_data(data, engine, connection, delete_table=True)
 
     def __insert_data(self, data, engine, connection, delete_table: bool = False) -> None:
+        properties = self.properties
+        df = self._convert_data_to_dataframe(properties[self._EXPOSED_TYPE_PROPERTY], data)
         table = self._create_table(engine)
-        self._insert_dataframe(
-            self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data),
-            table,
-            connection,
-            delete_table,
-        )
+        if isinstance(df, pd.DataFrame) and not all(str(column) in table.c for column in df.columns):
+            # The table may have been altered since it was reflected.
+            self.__forget_table(engine)
+            table = self._create_table(engine)
+        try:
+            self._insert_dataframe(
+                df,
+                table,
+                connection,
+                delete_table,
+                batch_size=properties.get(self.__INSERT_BATCH_SIZE_KEY),
+                method=properties.get(self.__INSERT_METHOD_KEY),
+            )
+        except Exception:
+            # The table is reflected again on the next insert.
+            self.__forget_table(engine)
+            raise
 
     def _create_table(self, engine) -> Table:
-        return Table(
-            self.properties[self.__TABLE_KEY],
-            MetaData(),
-            autoload_with=engine,
-        )
+        table_name = self.properties[self.__TABLE_KEY]
+        with self.__tables_lock:
+            tables = self.__tables.setdefault(engine, {})
+            if (table := tables.get(table_name)) is not None:
+                return table
+        table = Table(table_name, MetaData(), autoload_with=engine)
+        with self.__tables_lock:
+            return self.__tables.setdefault(engine, {}).setdefault(table_name, table)
+
+    def __forget_table(self, engine) -> None:
+        with self.__tables_lock:
+            self.__tables.get(engine, {}).pop(self.properties[self.__TABLE_KEY], None)
 
     @classmethod
     def _insert_dicts(cls, data: List[Dict], table: Any, connection: Any, delete_table: bool) -> None:
@@ -129,13 +173,67 @@ class SQLTableDataNode(_AbstractSQLDataNode):
 
     @classmethod
     def _insert_dataframe(
-        cls, df: Union[pd.DataFrame, pd.Series], table: Any, connection: Any, delete_table: bool
+        cls,
+        df: Union[pd.DataFrame, pd.Series],
+        table: Any,
+        connection: Any,
+        delete_table: bool,
+        batch_size: Optional[int] = None,
+        method: Optional[str] = None,
     ) -> None:
         if isinstance(df, pd.Series):
-            data = [df.to_dict()]
-        elif isinstance(df, pd.DataFrame):
-            data = df.to_dict(orient="records")
-        cls._insert_dicts(data, table, connection, delete_table)
+            cls._insert_dicts([df.to_dict()], table, connection, delete_table)
+            return
+
+        cls.__delete_all_rows(table, connection, delete_table)
+        batch_size = int(batch_size or cls.__DEFAULT_INSERT_BATCH_SIZE)
+        for start in range(0, len(df), batch_size):
+            cls.__insert_batch(df.iloc[start : start + batch_size], table, connection, method)
+
+    @classmethod
+    def __insert_batch(cls, df: pd.DataFrame, table: Any, connection: Any, method: Optional[str]) -> None:
+        if method == cls.__MULTI_VALUES_INSERT_METHOD:
+            connection.execute(table.insert().values(df.to_dict(orient="records")))
+            return
+
+        dialect = connection.dialect
+        columns = [str(column) for column in df.columns]
+        if all(column in table.c for column in columns):
+            if dialect.name == "postgresql" and cls.__copy_batch(df, table, connection, columns):
+                return
+            if dialect.name == "sqlite" and all(cls.__is_natively_bound(table.c[c], dialect) for c in columns):
+                # The values need no conversion by SQLAlchemy, so the rows are passed as tuples to a prepared
+                # statement. The numpy and pandas scalars (including the missing values) are made native first.
+                preparer = dialect.identifier_preparer
+                statement = (
+                    f"INSERT INTO {preparer.format_table(table)} ({', '.join(preparer.quote(c) for c in columns)})"
+                    f" VALUES ({', '.join('?' for _ in columns)})"
+                )
+                rows = df.astype(object).where(df.notna(), None)
+                connection.exec_driver_sql(statement, list(rows.itertuples(index=False, name=None)))
+                return
+        connection.execute(table.insert(), df.to_dict(orient="records"))
+
+    @staticmethod
+    def __is_natively_bound(column: Any, dialect: Any) -> bool:
+        # The values of these types are bound as is by the database driver.
+        return isinstance(column.type, (Integer, Float, String, Boolean)) or column.type.bind_processor(dialect) is None
+
+    @classmethod
+    def __copy_batch(cls, df: pd.DataFrame, table: Any, connection: Any, columns: List[str]) -> bool:
+        cursor = connection.connection.cursor()
+        if not hasattr(cursor, "copy_expert"):
+            return False
+        buffer = io.StringIO()
+        df.to_csv(buffer, index=False, header=False, na_rep="\\N")
+        buffer.seek(0)
+        preparer = connection.dialect.identifier_preparer
+        cursor.copy_expert(
+            f"COPY {preparer.format_table(table)} ({', '.join(preparer.quote(c) for c in columns)})"
+            " FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+        return True
 
     @classmethod
     def __delete_all_rows(cls, table: Any, connection: Any, delete_table: bool) -> None:
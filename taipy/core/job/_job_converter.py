@@ -35,6 +35,7 @@ class _JobConverter(_AbstractConverter):
             cls.__serialize_subscribers(job._subscribers),
             job._stacktrace,
             version=job._version,
+            read_durations=job._read_durations,
         )
 
     @classmethod
@@ -63,6 +64,7 @@ class _JobConverter(_AbstractConverter):
             except AttributeError:
                 raise InvalidSubscriber(f"The subscriber function {it.get('fct_name')} cannot be loaded.") from None
         job._stacktrace = model.stacktrace
+        job._read_durations = model.read_durations
 
         return job
 
@@ -36,7 +36,7 @@ class _JobManager(_Manager[Job], _VersionMixin):
         Returns all entities.
         """
         filters = cls._build_filters_with_version(version_number)
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
 
     @classmethod
     def _create(
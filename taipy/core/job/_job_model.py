@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 from .._repository._base_taipy_model import _BaseModel
@@ -30,6 +30,7 @@ class _JobModel(_BaseModel):
     subscribers: List[Dict]
     stacktrace: List[str]
     version: str
+    read_durations: Dict[str, float] = field(default_factory=dict)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]):
@@ -45,6 +46,7 @@ class _JobModel(_BaseModel):
             subscribers=_BaseModel._deserialize_attribute(data["subscribers"]),
             stacktrace=_BaseModel._deserialize_attribute(data["stacktrace"]),
             version=data["version"],
+            read_durations=_BaseModel._deserialize_attribute(data.get("read_durations", {})),
         )
 
     def to_list(self):
@@ -60,4 +62,5 @@ class _JobModel(_BaseModel):
             _BaseModel._serialize_attribute(self.subscribers),
             _BaseModel._serialize_attribute(self.stacktrace),
             self.version,
+            _BaseModel._serialize_attribute(self.read_durations),
         ]
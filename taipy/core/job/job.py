@@ -50,7 +50,8 @@ class Job(_Entity, _Labeled):
     Every time a task is submitted for execution, a new *Job* is created. A job represents a
     single execution of a task. It holds all the information related to the task execution,
     including the **creation date**, the execution `Status^`, the timestamp of status changes,
-    and the **stacktrace** of any exception that may be raised by the user function.
+    the **duration of the reads** of the input data nodes, and the **stacktrace** of any exception
+    that may be raised by the user function.
 
     In addition, a job notifies scenario or sequence subscribers on its status change.
     """
@@ -72,6 +73,7 @@ class Job(_Entity, _Labeled):
         self._status_change_records: Dict[str, datetime] = {"SUBMITTED": self._creation_date}
         self._subscribers: List[Callable] = []
         self._stacktrace: List[str] = []
+        self._read_durations: Dict[str, float] = {}
         self.__logger = _TaipyLogger._get_logger()
         self._version = version or _VersionManagerFactory._build_manager()._get_latest_version()
 
@@ -252,6 +254,12 @@ class Job(_Entity, _Labeled):
     def stacktrace(self, val):
         self._stacktrace = val
 
+    @property  # type: ignore
+    @_self_reload(_MANAGER_NAME)
+    def read_durations(self) -> Dict[str, float]:
+        """The durations in seconds of the reads of the input data nodes, by data node id."""
+        return self._read_durations
+
     @property
     def version(self) -> str:
         """The application version of the job.
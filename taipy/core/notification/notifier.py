@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import threading
 from queue import SimpleQueue
 from typing import Any, Dict, Optional, Set, Tuple
 
@@ -54,6 +55,7 @@ class Notifier:
     """A class for managing event registrations and publishing a Taipy application events."""
 
     _topics_registrations_list: Dict[_Topic, Set[_Registration]] = {}
+    __local = threading.local()
 
     @classmethod
     def register(
@@ -171,11 +173,27 @@ class Notifier:
         Arguments:
             event (`Event^`): The event to publish.
         """
+        if (held_events := getattr(cls.__local, "held_events", None)) is not None:
+            held_events.append(event)
+            return
         for topic, registrations in cls._topics_registrations_list.items():
             if Notifier._is_matching(event, topic):
                 for registration in registrations:
                     registration.queue.put(event)
 
+    @classmethod
+    def _hold_events(cls) -> None:
+        """Hold the events published by the current thread until `_release_events` is called."""
+        cls.__local.held_events = []
+
+    @classmethod
+    def _release_events(cls, publish: bool = True) -> None:
+        """Stop holding the events of the current thread, and publish the held ones unless *publish* is False."""
+        held_events = cls.__local.__dict__.pop("held_events", [])
+        if publish:
+            for event in held_events:
+                cls.publish(event)
+
     @staticmethod
     def _is_matching(event: Event, topic: _Topic) -> bool:
         """Check if an event matches a topic."""
@@ -21,6 +21,7 @@ from ._orchestrator._orchestrator import _Orchestrator
 from ._orchestrator._orchestrator_factory import _OrchestratorFactory
 from ._version._version_manager_factory import _VersionManagerFactory
 from .config import CoreSection
+from .data._sql_engine_registry import _SQLEngineRegistry
 from .exceptions.exceptions import OrchestratorServiceIsAlreadyRunning
 
 
@@ -68,7 +69,8 @@ class Orchestrator:
 
     def stop(self, wait: bool = True, timeout: Optional[float] = None) -> None:
         """Stop the Orchestrator service.
-        This function stops the dispatcher and unblock the Config for update.
+        This function stops the dispatcher, disposes the connection pools of the SQL data nodes,
+        and unblock the Config for update.
 
         Arguments:
             wait (bool): If True, the method will wait for the dispatcher to stop.
@@ -80,6 +82,10 @@ class Orchestrator:
         self.__logger.info("Stopping job dispatcher...")
         if self._dispatcher:
             self._dispatcher = _OrchestratorFactory._remove_dispatcher(wait, timeout)
+
+        self.__logger.info("Disposing SQL engines...")
+        _SQLEngineRegistry._dispose()
+
         with self.__class__.__lock_is_running:
             self.__class__._is_running = False
         with self.__class__.__lock_version_is_initialized:
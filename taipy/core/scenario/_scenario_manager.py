@@ -17,6 +17,7 @@ from taipy.common.config import Config
 
 from .._entity._entity_ids import _EntityIds
 from .._manager._manager import _Manager
+from .._manager._save_batch import _SaveBatch
 from .._repository._abstract_repository import _AbstractRepository
 from .._version._version_mixin import _VersionMixin
 from ..common.warn_if_inputs_not_ready import _warn_if_inputs_not_ready
@@ -68,7 +69,7 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         Returns all entities.
         """
         filters = cls._build_filters_with_version(version_number)
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
 
     @classmethod
     def _subscribe(
@@ -130,6 +131,17 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         config: ScenarioConfig,
         creation_date: Optional[datetime] = None,
         name: Optional[str] = None,
+    ) -> Scenario:
+        # The new entities are saved together once the scenario is complete.
+        with _SaveBatch():
+            return cls.__create(config, creation_date, name)
+
+    @classmethod
+    def __create(
+        cls,
+        config: ScenarioConfig,
+        creation_date: Optional[datetime] = None,
+        name: Optional[str] = None,
     ) -> Scenario:
         _task_manager = _TaskManagerFactory._build_manager()
         _data_manager = _DataManagerFactory._build_manager()
@@ -520,4 +532,4 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
             filters = [{}]
         for fil in filters:
             fil.update({"config_id": config_id})
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
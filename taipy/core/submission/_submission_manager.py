@@ -41,7 +41,7 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
         Returns all entities.
         """
         filters = cls._build_filters_with_version(version_number)
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
 
     @classmethod
     def _create(cls, entity_id: str, entity_type: str, entity_config: Optional[str], **properties) -> Submission:
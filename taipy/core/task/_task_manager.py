@@ -16,6 +16,7 @@ from taipy.common.config.common.scope import Scope
 
 from .._entity._entity_ids import _EntityIds
 from .._manager._manager import _Manager
+from .._manager._save_batch import _SaveBatch
 from .._orchestrator._abstract_orchestrator import _AbstractOrchestrator
 from .._repository._abstract_repository import _AbstractRepository
 from .._version._version_manager_factory import _VersionManagerFactory
@@ -63,6 +64,17 @@ class _TaskManager(_Manager[Task], _VersionMixin):
         task_configs: List[TaskConfig],
         cycle_id: Optional[CycleId] = None,
         scenario_id: Optional[ScenarioId] = None,
+    ) -> List[Task]:
+        # The new tasks and data nodes are saved together once they are all created.
+        with _SaveBatch():
+            return cls.__bulk_get_or_create(task_configs, cycle_id, scenario_id)
+
+    @classmethod
+    def __bulk_get_or_create(
+        cls,
+        task_configs: List[TaskConfig],
+        cycle_id: Optional[CycleId] = None,
+        scenario_id: Optional[ScenarioId] = None,
     ) -> List[Task]:
         data_node_configs = set()
         for task_config in task_configs:
@@ -89,7 +101,7 @@ class _TaskManager(_Manager[Task], _VersionMixin):
 
             tasks_configs_and_owner_id.append((task_config, owner_id))
 
-        tasks_by_config = cls._repository._get_by_configs_and_owner_ids(  # type: ignore
+        tasks_by_config = cls._get_by_configs_and_owner_ids(  # type: ignore
             tasks_configs_and_owner_id, cls._build_filters_with_version(None)
         )
 
@@ -133,7 +145,7 @@ class _TaskManager(_Manager[Task], _VersionMixin):
         Returns all entities.
         """
         filters = cls._build_filters_with_version(version_number)
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
 
     @classmethod
     def __save_data_nodes(cls, data_nodes) -> None:
@@ -225,4 +237,4 @@ class _TaskManager(_Manager[Task], _VersionMixin):
             filters = [{}]
         for fil in filters:
             fil.update({"config_id": config_id})
-        return cls._repository._load_all(filters)
+        return cls._load_all(filters)
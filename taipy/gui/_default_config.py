@@ -74,7 +74,7 @@ default_config: Config = {
     "title": None,
     "stylekit": _default_stylekit.copy(),
     "upload_folder": None,
-    "use_arrow": False,
+    "use_arrow": True,
     "use_reloader": False,
     "watermark": "Taipy inside",
     "webapp_path": None,
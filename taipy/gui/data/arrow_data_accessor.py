@@ -0,0 +1,123 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+
+import pandas as pd
+import pyarrow as pa
+
+from .._warnings import _warn
+from .data_format import _DataFormat
+from .pandas_data_accessor import _PandasDataAccessor
+
+
+class _ArrowDataAccessor(_PandasDataAccessor):
+    __types = (pa.Table,)
+
+    __INDEX_COL = "_tp_index"
+
+    # Payload entries that require the pandas processing of the data
+    __PANDAS_PAYLOAD_KEYS = ("filters", "aggregates", "orderby", "styles", "tooltips", "formats", "compare")
+
+    @staticmethod
+    def get_supported_classes() -> t.List[t.Type]:
+        return list(_ArrowDataAccessor.__types)
+
+    def to_pandas(self, value: t.Any) -> t.Union[t.List[pd.DataFrame], pd.DataFrame]:
+        if isinstance(value, pa.Table):
+            return value.to_pandas()
+        return super().to_pandas(value)
+
+    def _from_pandas(self, value: pd.DataFrame, data_type: t.Type):
+        if data_type is pa.Table:
+            return pa.Table.from_pandas(value, preserve_index=False)
+        return super()._from_pandas(value, data_type)
+
+    def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
+        if isinstance(value, pa.Table):
+            # The column types are computed on an empty table, so that no data is converted.
+            value = value.schema.empty_table().to_pandas()
+        return super().get_col_types(var_name, value)
+
+    def get_data(
+        self, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        if isinstance(value, pa.Table) and (ret_payload := self.__get_page(value, payload, data_format)) is not None:
+            return ret_payload
+        return super().get_data(var_name, value, payload, data_format)
+
+    def __get_page(
+        self, table: pa.Table, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Optional[t.Dict[str, t.Any]]:
+        # A plain page of the table is sliced and streamed as is to the front-end, without any conversion
+        # to pandas. Any other request falls back to the pandas data accessor.
+        if data_format is not _DataFormat.APACHE_ARROW or payload.get("alldata", False):
+            return None
+        if any(payload.get(key) for key in _ArrowDataAccessor.__PANDAS_PAYLOAD_KEYS):
+            return None
+        columns = [c for c in payload.get("columns", []) if c != _ArrowDataAccessor.__INDEX_COL]
+        if any(c not in table.column_names for c in columns):
+            return None
+        if columns:
+            table = table.select([c for c in table.column_names if c in columns])
+        elif _ArrowDataAccessor.__INDEX_COL in table.column_names:
+            table = table.drop_columns([_ArrowDataAccessor.__INDEX_COL])
+        if any(pa.types.is_timestamp(field.type) for field in table.schema):
+            # Dates are sent as strings, which is handled by the pandas data accessor
+            return None
+
+        rowcount = table.num_rows
+        start, end = self.__get_bounds(payload, rowcount)
+        page = table.slice(start, end + 1 - start)
+        page = page.append_column(
+            _ArrowDataAccessor.__INDEX_COL, pa.array(range(start, start + page.num_rows), type=pa.int64())
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, page.schema) as writer:
+            writer.write_table(page)
+
+        ret_payload: t.Dict[str, t.Any] = {"pagekey": payload.get("pagekey", "unknown page")}
+        inf = payload.get("infinite")
+        if inf is not None:
+            ret_payload["infinite"] = inf
+        ret_payload["value"] = {
+            "format": str(data_format.value),
+            "rowcount": rowcount,
+            "start": start,
+            "data": sink.getvalue().to_pybytes(),
+            "orient": "records",
+        }
+        return ret_payload
+
+    @staticmethod
+    def __get_bounds(payload: t.Dict[str, t.Any], rowcount: int) -> t.Tuple[int, int]:
+        try:
+            start = int(str(payload.get("start", 0)), base=10)
+        except Exception:
+            _warn(f'start should be an int value {payload["start"]}.')
+            start = 0
+        try:
+            end = int(str(payload.get("end", -1)), base=10)
+        except Exception:
+            end = -1
+        if start < 0 or start >= rowcount:
+            start = 0
+        if end < 0 or end >= rowcount:
+            end = rowcount - 1
+        if payload.get("reverse", False):
+            diff = end - start
+            end = rowcount - 1 - start
+            if end < 0:
+                end = rowcount - 1
+            start = end - diff
+            if start < 0:
+                start = 0
+        return start, end
@@ -12,10 +12,12 @@
 import inspect
 import typing as t
 from abc import ABC, abstractmethod
+from importlib import util
 
 from .._warnings import _warn
 from ..utils import _TaipyData
 from .data_format import _DataFormat
+from .data_windows import _DataWindows
 
 if t.TYPE_CHECKING:
     from ..gui import Gui
@@ -64,6 +66,26 @@ class _DataAccessor(ABC):
     def to_csv(self, var_name: str, value: t.Any) -> t.Optional[str]:
         pass
 
+    # Not abstract: accessors that cache nothing have nothing to drop
+    def invalidate_cache(self, var_name: t.Optional[str] = None, client_id: t.Optional[str] = None) -> None:  # noqa: B027
+        """Drop what was cached for a variable and/or a client, or everything if neither is set."""
+        pass
+
+    def append_rows(self, value: t.Any, rows: t.Any) -> t.Optional[t.Any]:
+        """Return a new value made of the rows of *value* followed by *rows*, or None if not supported."""
+        return None
+
+    def get_appended_rows_updates(
+        self, var_name: str, value: t.Any, windows: t.Optional[t.List[t.Tuple[t.Dict[str, t.Any], _DataFormat]]]
+    ) -> t.Optional[t.List[t.Dict[str, t.Any]]]:
+        """Return the data updates that bring the windows of a client up to date with *value*.
+
+        This is only possible if *value* was built by `append_rows()` and if the rows of the windows
+        are not filtered, aggregated or sorted. None is returned otherwise, and the client must
+        request its data again.
+        """
+        return None
+
 
 class _InvalidDataAccessor(_DataAccessor):
     @staticmethod
@@ -99,6 +121,8 @@ class _DataAccessors(object):
         self.__access_4_type: t.Dict[t.Type, _DataAccessor] = {}
         self.__invalid_data_accessor = _InvalidDataAccessor(gui)
         self.__data_format = _DataFormat.JSON
+        self.__has_arrow_module = False
+        self.__windows = _DataWindows()
         self.__gui = gui
 
         from .array_dict_data_accessor import _ArrayDictDataAccessor
@@ -108,6 +132,11 @@ class _DataAccessors(object):
         self._register(_PandasDataAccessor)
         self._register(_ArrayDictDataAccessor)
         self._register(_NumpyDataAccessor)
+        if util.find_spec("pyarrow"):
+            from .arrow_data_accessor import _ArrowDataAccessor
+
+            self._register(_ArrowDataAccessor)
+            self.__has_arrow_module = True
 
     def _register(self, cls: t.Type[_DataAccessor]) -> None:
         if not inspect.isclass(cls):
@@ -142,7 +171,18 @@ class _DataAccessors(object):
         return access
 
     def get_data(self, var_name: str, value: _TaipyData, payload: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
-        return self.__get_instance(value).get_data(var_name, value.get(), payload, self.__data_format)
+        return self.__get_instance(value).get_data(var_name, value.get(), payload, self.__get_data_format(payload))
+
+    def __get_data_format(self, payload: t.Dict[str, t.Any]) -> _DataFormat:
+        # Arrow is only used with the clients that can decode it
+        if (
+            self.__data_format is _DataFormat.APACHE_ARROW
+            and self.__has_arrow_module
+            and isinstance(payload, dict)
+            and _DataFormat.APACHE_ARROW.value in (payload.get("acceptformats") or ())
+        ):
+            return _DataFormat.APACHE_ARROW
+        return _DataFormat.JSON
 
     def get_col_types(self, var_name: str, value: _TaipyData) -> t.Dict[str, str]:
         return self.__get_instance(value).get_col_types(var_name, value.get())
@@ -167,3 +207,24 @@ class _DataAccessors(object):
 
     def to_pandas(self, value: t.Any):
         return self.__get_instance(value).to_pandas(value.get())
+
+    def invalidate_cache(self, var_name: t.Optional[str] = None, client_id: t.Optional[str] = None):
+        for accessor in set(self.__access_4_type.values()):
+            accessor.invalidate_cache(var_name, client_id)
+        if var_name is None:
+            self.__windows.remove(client_id)
+
+    def set_data_window(self, var_name: str, payload: t.Dict[str, t.Any]) -> None:
+        self.__windows.set(self.__gui._get_client_id(), var_name, payload)
+
+    def append_rows(self, value: t.Any, rows: t.Any) -> t.Optional[t.Any]:
+        return self.__get_instance(value).append_rows(value, rows)
+
+    def get_appended_rows_updates(self, var_name: str, value: _TaipyData) -> t.Optional[t.List[t.Dict[str, t.Any]]]:
+        # The windows of the other clients are not known when broadcasting
+        windows = (
+            None
+            if self.__gui._is_broadcasting()
+            else [(pl, self.__get_data_format(pl)) for pl in self.__windows.get(self.__gui._get_client_id(), var_name)]
+        )
+        return self.__get_instance(value).get_appended_rows_updates(var_name, value.get(), windows)
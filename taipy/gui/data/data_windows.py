@@ -0,0 +1,53 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+from collections import OrderedDict
+from threading import Lock
+
+
+class _DataWindows:
+    """Last data requests of the clients, by variable.
+
+    A data request holds the rows an element displays (the page of a table, for example). These are
+    the rows that must be sent again to the client when the variable is updated.
+    """
+
+    _MAX_WINDOWS_PER_VARIABLE = 4
+
+    def __init__(self, max_windows_per_variable: int = _MAX_WINDOWS_PER_VARIABLE) -> None:
+        self.__max_windows = max_windows_per_variable
+        # { (client_id, var_name): { element_key: payload } }
+        self.__windows: t.Dict[t.Tuple[str, str], "OrderedDict[str, t.Dict[str, t.Any]]"] = {}
+        self.__lock = Lock()
+
+    def set(self, client_id: str, var_name: str, payload: t.Dict[str, t.Any]) -> None:
+        # Elements with no id are told apart by the key of the data they requested
+        key = str(payload.get("id") or payload.get("pagekey", ""))
+        with self.__lock:
+            windows = self.__windows.setdefault((client_id, var_name), OrderedDict())
+            windows[key] = payload
+            windows.move_to_end(key)
+            while len(windows) > self.__max_windows:
+                windows.popitem(last=False)
+
+    def get(self, client_id: str, var_name: str) -> t.List[t.Dict[str, t.Any]]:
+        with self.__lock:
+            return list(self.__windows.get((client_id, var_name), {}).values())
+
+    def remove(self, client_id: t.Optional[str] = None) -> None:
+        """Remove the requests of a client, or of all the clients."""
+        with self.__lock:
+            if client_id is None:
+                self.__windows.clear()
+            else:
+                for key in [k for k in self.__windows if k[0] == client_id]:
+                    del self.__windows[key]
@@ -0,0 +1,106 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+
+class _DecimationPyramid:
+    """Decimation levels of a series, computed once.
+
+    The first level holds all the points of the series. Each of the following levels holds about a
+    fourth of the points of the previous level: the previous level is split in bins of equal size,
+    and the points with the minimum and the maximum y values of each bin are kept. The levels stop
+    at a few thousand points. The points of a level are stored as their positions in the series.
+
+    The series must be sorted by x so that the points in a range of x values are found by binary
+    search, at every level.
+    """
+
+    _LEVEL_FACTOR = 4
+    _MIN_LEVEL_SIZE = 2048
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, is_datetime: bool) -> None:
+        self.__x = x
+        self.__y = y
+        self.__is_datetime = is_datetime
+        # Positions of the points of each level in the series, from the finest to the coarsest.
+        # The first level, which holds all the points, is not stored.
+        self.__levels: t.List[np.ndarray] = []
+        positions: t.Optional[np.ndarray] = None
+        level_y = y
+        while len(level_y) > _DecimationPyramid._LEVEL_FACTOR * _DecimationPyramid._MIN_LEVEL_SIZE:
+            mask = _DecimationPyramid.__min_max_mask(level_y)
+            level_positions: np.ndarray = np.flatnonzero(mask) if positions is None else positions[mask]
+            self.__levels.append(level_positions)
+            positions = level_positions
+            level_y = y[level_positions]
+
+    @staticmethod
+    def _create(x: np.ndarray, y: np.ndarray) -> t.Optional["_DecimationPyramid"]:
+        """Return the pyramid of the series, or None if the series cannot be searched by x value."""
+        is_datetime = np.issubdtype(x.dtype, np.datetime64)
+        if is_datetime:
+            x = x.astype("datetime64[ns]").view(np.int64)
+        elif not np.issubdtype(x.dtype, np.number):
+            return None
+        if not np.issubdtype(y.dtype, np.number):
+            return None
+        x = x.astype(np.float64, copy=False)
+        # NaN values fail the comparison too
+        if len(x) > 1 and not np.all(x[1:] >= x[:-1]):
+            return None
+        return _DecimationPyramid(x, y.astype(np.float64, copy=False), is_datetime)
+
+    @staticmethod
+    def __min_max_mask(y: np.ndarray) -> np.ndarray:
+        # Bins of twice the level factor points, since two points are kept in each bin
+        pts_per_bin = 2 * _DecimationPyramid._LEVEL_FACTOR
+        num_bins = len(y) // pts_per_bin
+        bins = y[: num_bins * pts_per_bin].reshape((num_bins, pts_per_bin))
+        bin_starts = np.arange(0, num_bins * pts_per_bin, pts_per_bin)
+        mask = np.full(len(y), False)
+        mask[bin_starts + np.argmin(bins, axis=1)] = True
+        mask[bin_starts + np.argmax(bins, axis=1)] = True
+        # The first and last points, and the points that do not fill a bin, are kept
+        mask[0] = True
+        mask[num_bins * pts_per_bin :] = True
+        mask[-1] = True
+        return mask
+
+    def get_range(self, x0: t.Optional[t.Any], x1: t.Optional[t.Any]) -> t.Tuple[int, int]:
+        """Return the bounds of the positions of the points where x0 < x < x1."""
+        start = 0 if x0 is None else int(np.searchsorted(self.__x, self.__to_x(x0), side="right"))
+        end = len(self.__x) if x1 is None else int(np.searchsorted(self.__x, self.__to_x(x1), side="left"))
+        return start, max(start, end)
+
+    def select(self, start: int, end: int, max_size: int) -> np.ndarray:
+        """Return the positions of the points of the finest level that has at most *max_size* points in the range.
+
+        The points of the coarsest level are returned if all the levels have more points in the range.
+        """
+        if end - start <= max_size or not self.__levels:
+            return np.arange(start, end)
+        for level in self.__levels:
+            positions = level[np.searchsorted(level, start) : np.searchsorted(level, end)]
+            if len(positions) <= max_size:
+                break
+        return positions
+
+    def get_points(self, positions: np.ndarray) -> np.ndarray:
+        return np.column_stack((self.__x[positions], self.__y[positions]))
+
+    def __to_x(self, value: t.Any) -> float:
+        if self.__is_datetime:
+            return float(pd.Timestamp(value).value)
+        return float(value)
@@ -12,12 +12,16 @@
 from __future__ import annotations
 
 import typing as t
+import weakref
 from abc import ABC, abstractmethod
+from functools import partial
+from threading import Lock
 
 import numpy as np
 import pandas as pd
 
 from ..._warnings import _warn
+from ._pyramid import _DecimationPyramid
 
 
 class Decimator(ABC):
@@ -33,10 +37,14 @@ class Decimator(ABC):
 
     _CHART_MODES: t.List[str] = []
 
+    # Maximum number of series a decimator keeps the pyramid of
+    __MAX_PYRAMIDS = 4
+
     def __init__(
         self,
         threshold: t.Optional[int],
         zoom: t.Optional[bool],
+        pyramid: t.Optional[bool] = False,
         # apply_decimator: t.Optional[t.Callable] = None,
         # on_decimate: t.Optional[t.Callable] = None,
     ) -> None:  # noqa: E501
@@ -47,6 +55,9 @@ class Decimator(ABC):
                 decimator class is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid (Optional[bool]): set to True to precompute decimation levels of the
+                data, so that zooming only decimates the points of the most appropriate level
+                in the displayed range. This only applies to line charts.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
@@ -57,6 +68,10 @@ class Decimator(ABC):
         self._zoom = zoom if zoom is not None else True
         self.__user_defined_on_decimate = None
         self.__user_defined_apply_decimator = None
+        self._pyramid = bool(pyramid)
+        # { (id(df), x_column, y_column): (weakref(df), pyramid) }
+        self.__pyramids: t.Dict[t.Tuple[int, str, str], t.Tuple[weakref.ref, t.Optional[_DecimationPyramid]]] = {}
+        self.__pyramids_lock = Lock()
 
     def _is_applicable(self, data: t.Any, nb_rows_max: int, chart_mode: str):
         if chart_mode not in self._CHART_MODES:
@@ -141,6 +156,72 @@ class Decimator(ABC):
         mask = self._decimate(points, payload)
         return df[mask], is_copied
 
+    def _invalidate_pyramids(self) -> None:
+        """NOT DOCUMENTED
+        Drop the decimation pyramids built so far, so that they are built again on the current data.
+        """
+        with self.__pyramids_lock:
+            self.__pyramids.clear()
+
+    def __remove_pyramid(self, key: t.Tuple[int, str, str], ref: weakref.ref) -> None:
+        with self.__pyramids_lock:
+            if (entry := self.__pyramids.get(key)) is not None and entry[0] is ref:
+                del self.__pyramids[key]
+
+    def __get_pyramid(
+        self, df: pd.DataFrame, x_column: t.Optional[str], y_column: str
+    ) -> t.Optional[_DecimationPyramid]:
+        key = (id(df), x_column or "", y_column)
+        with self.__pyramids_lock:
+            if (entry := self.__pyramids.get(key)) is not None and entry[0]() is df:
+                return entry[1]
+        x = df[x_column].to_numpy() if x_column else df.index.to_numpy()
+        pyramid = _DecimationPyramid._create(x, df[y_column].to_numpy())
+        # The pyramid is dropped when the data it was built from is released
+        ref = weakref.ref(df, partial(self.__remove_pyramid, key))
+        with self.__pyramids_lock:
+            self.__pyramids[key] = (ref, pyramid)
+            while len(self.__pyramids) > Decimator.__MAX_PYRAMIDS:
+                del self.__pyramids[next(iter(self.__pyramids))]
+        return pyramid
+
+    def __decimate_from_pyramid(
+        self,
+        decimator_var_name: t.Optional[str],
+        dataframe: pd.DataFrame,
+        x_column: t.Optional[str],
+        y_column: str,
+        chart_mode: str,
+        decimator_payload: t.Dict[str, t.Any],
+        is_copied: bool,
+    ) -> t.Optional[t.Tuple[pd.DataFrame, bool, bool]]:
+        # The y range is not used to filter the points of line charts
+        if chart_mode not in ["lines+markers", "lines"]:
+            return None
+        pyramid = self.__get_pyramid(dataframe, x_column, y_column)
+        if pyramid is None:
+            return None
+        x0 = x1 = None
+        if self._zoom and "relayoutData" in decimator_payload:
+            relayout_data = decimator_payload.get("relayoutData", {})
+            x0 = relayout_data.get("xaxis.range[0]")
+            x1 = relayout_data.get("xaxis.range[1]")
+        try:
+            start, end = pyramid.get_range(x0, x1)
+        except (TypeError, ValueError):
+            return None
+        df = dataframe.iloc[start:end]
+        nb_rows_max = decimator_payload.get("width")
+        if not nb_rows_max or not self._is_applicable(df, nb_rows_max, chart_mode):
+            return df, False, is_copied
+        try:
+            positions = pyramid.select(start, end, _DecimationPyramid._LEVEL_FACTOR * int(nb_rows_max))
+            mask = self._decimate(pyramid.get_points(positions), decimator_payload)
+            return dataframe.iloc[positions[mask]], True, True
+        except Exception as e:
+            _warn(f"Limit rows error with {decimator_var_name} for Dataframe", e)
+        return df, False, is_copied
+
     def _on_decimate_df(
         self,
         df: pd.DataFrame,
@@ -148,6 +229,7 @@ class Decimator(ABC):
         decimator_payload: t.Dict[str, t.Any],
         is_copied: bool = False,
         filter_unused_columns: bool = True,
+        use_pyramid: bool = True,
     ):
         decimator_var_name = decimator_instance_payload.get("decimator")
         x_column, y_column, z_column = (
@@ -156,32 +238,42 @@ class Decimator(ABC):
             decimator_instance_payload.get("zAxis", ""),
         )
         chart_mode = decimator_instance_payload.get("chartMode", "")
-        if self._zoom and "relayoutData" in decimator_payload is not None and not z_column:
-            relayout_data = decimator_payload.get("relayoutData", {})
-            x0 = relayout_data.get("xaxis.range[0]")
-            x1 = relayout_data.get("xaxis.range[1]")
-            y0 = relayout_data.get("yaxis.range[0]")
-            y1 = relayout_data.get("yaxis.range[1]")
-
-            df, is_copied = self._df_relayout(
-                t.cast(pd.DataFrame, df), x_column, y_column, chart_mode, x0, x1, y0, y1, is_copied
+        pyramid_ret = (
+            self.__decimate_from_pyramid(
+                decimator_var_name, df, x_column, y_column, chart_mode, decimator_payload, is_copied
             )
-
-        nb_rows_max = decimator_payload.get("width")
-        is_decimator_applied = False
-        if nb_rows_max and self._is_applicable(df, nb_rows_max, chart_mode):
-            try:
-                df, is_copied = self._apply_decimator(
-                    t.cast(pd.DataFrame, df),
-                    x_column,
-                    y_column,
-                    z_column,
-                    payload=decimator_payload,
-                    is_copied=is_copied,
+            if self._pyramid and use_pyramid and not z_column
+            else None
+        )
+        if pyramid_ret is not None:
+            df, is_decimator_applied, is_copied = pyramid_ret
+        else:
+            if self._zoom and "relayoutData" in decimator_payload is not None and not z_column:
+                relayout_data = decimator_payload.get("relayoutData", {})
+                x0 = relayout_data.get("xaxis.range[0]")
+                x1 = relayout_data.get("xaxis.range[1]")
+                y0 = relayout_data.get("yaxis.range[0]")
+                y1 = relayout_data.get("yaxis.range[1]")
+
+                df, is_copied = self._df_relayout(
+                    t.cast(pd.DataFrame, df), x_column, y_column, chart_mode, x0, x1, y0, y1, is_copied
                 )
-                is_decimator_applied = True
-            except Exception as e:
-                _warn(f"Limit rows error with {decimator_var_name} for Dataframe", e)
+
+            nb_rows_max = decimator_payload.get("width")
+            is_decimator_applied = False
+            if nb_rows_max and self._is_applicable(df, nb_rows_max, chart_mode):
+                try:
+                    df, is_copied = self._apply_decimator(
+                        t.cast(pd.DataFrame, df),
+                        x_column,
+                        y_column,
+                        z_column,
+                        payload=decimator_payload,
+                        is_copied=is_copied,
+                    )
+                    is_decimator_applied = True
+                except Exception as e:
+                    _warn(f"Limit rows error with {decimator_var_name} for Dataframe", e)
         # only include columns involving the decimator
         if filter_unused_columns:
             filterd_columns = [x_column, y_column, z_column] if z_column else [x_column, y_column]
@@ -195,6 +287,7 @@ class Decimator(ABC):
         decimator_payload: t.Dict[str, t.Any],
         is_copied: bool = False,
         filter_unused_columns: bool = True,
+        use_pyramid: bool = True,
     ) -> t.Tuple:
         """NOT DOCUMENTED
         This function is executed whenever a decimator is found during runtime.
@@ -210,6 +303,8 @@ class Decimator(ABC):
             is_copied (bool): A flag to indicate if the DataFrame is copied.
             filter_unused_columns (bool): A flag to indicate if the DataFrame columns should be filtered to only
                 include the columns that are involved with the decimator.
+            use_pyramid (bool): A flag to indicate if the pre-computed pyramid can be used. It must be False
+                when *df* is built for this request only (filtered data, for example).
 
         Returns:
             A tuple containing the decimated DataFrame, a flag indicating if the decimator is applied,
@@ -222,7 +317,9 @@ class Decimator(ABC):
                 )
             except Exception as e:
                 _warn("Error executing user defined on_decimate function: ", e)
-        return self._on_decimate_df(df, decimator_instance_payload, decimator_payload, filter_unused_columns)
+        return self._on_decimate_df(
+            df, decimator_instance_payload, decimator_payload, filter_unused_columns, use_pyramid=use_pyramid
+        )
 
     def _apply_decimator(
         self,
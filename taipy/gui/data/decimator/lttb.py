@@ -33,6 +33,7 @@ class LTTB(Decimator):
         n_out: int,
         threshold: t.Optional[int] = None,
         zoom: t.Optional[bool] = True,
+        pyramid: t.Optional[bool] = False,
         # on_decimate: t.Optional[t.Callable] = None,
         # apply_decimator: t.Optional[t.Callable] = None,
     ) -> None:
@@ -44,20 +45,20 @@ class LTTB(Decimator):
                 decimation is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid (Optional[bool]): set to True to precompute decimation levels of the
+                data, keeping the minimum and maximum values of small bins. Zooming then only
+                decimates the points of the most appropriate level in the displayed range,
+                instead of all the points in that range. The levels are computed again when
+                the data changes.<br/>
+                The data must be sorted on the x values.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
         # apply_decimator (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is applied to modify the data.
-        super().__init__(threshold, zoom)
+        super().__init__(threshold, zoom, pyramid)
         self._n_out = n_out
 
-    @staticmethod
-    def _areas_of_triangles(a, bs, c):
-        bs_minus_a = bs - a
-        a_minus_bs = a - bs
-        return 0.5 * abs((a[0] - c[0]) * (bs_minus_a[:, 1]) - (a_minus_bs[:, 0]) * (c[1] - a[1]))
-
     def _decimate(self, data: np.ndarray, payload: t.Dict[str, t.Any]) -> np.ndarray:
         n_out = self._n_out
         if n_out >= data.shape[0]:
@@ -66,34 +67,46 @@ class LTTB(Decimator):
         if n_out < 3:
             raise ValueError("Can only down-sample to a minimum of 3 points")
 
-        # Split data into bins
+        # Split data into bins, the same way np.array_split() does:
+        # the first bins hold one more point than the others.
         n_bins = n_out - 2
-        data_bins = np.array_split(data[1:-1], n_bins)
+        inner = data[1:-1]
+        bin_size, n_larger_bins = divmod(inner.shape[0], n_bins)
+        bin_lengths = np.full(n_bins, bin_size, dtype=np.intp)
+        bin_lengths[:n_larger_bins] += 1
+        bin_starts = np.zeros(n_bins, dtype=np.intp)
+        np.cumsum(bin_lengths[:-1], out=bin_starts[1:])
+
+        # The centroids of all the bins are computed at once.
+        # The third point of the triangles of a bin is the centroid of the next bin,
+        # or the last point for the last bin.
+        centroids = np.add.reduceat(inner, bin_starts, axis=0) / bin_lengths[:, np.newaxis]
+        next_centroids = np.vstack((centroids[1:], data[-1:])).tolist()
 
-        prev_a = data[0]
-        start_pos = 0
+        # Largest Triangle Three Buckets (LTTB):
+        # In each bin, find the point that makes the largest triangle
+        # with the point saved in the previous bin
+        # and the centroid of the points in the next bin.
+        # Half the area is not computed since it does not change the largest triangle.
+        # The point saved in a bin depends on the point saved in the previous bin, so the bins
+        # are processed in sequence, each one with a single vectorized computation.
+        xs = inner[:, 0]
+        ys = inner[:, 1]
+        a_x, a_y = data[0]
+        selected = np.empty(n_bins, dtype=np.intp)
+        for i, (start, end) in enumerate(zip(bin_starts.tolist(), (bin_starts + bin_lengths).tolist())):
+            c_x, c_y = next_centroids[i]
+            b_xs = xs[start:end]
+            b_ys = ys[start:end]
+            b_pos = np.argmax(np.abs((a_x - c_x) * (b_ys - a_y) - (a_x - b_xs) * (c_y - a_y)))
+            a_x = b_xs[b_pos]
+            a_y = b_ys[b_pos]
+            selected[i] = start + b_pos
 
         # Prepare output mask array
         # First and last points are the same as in the input.
         out_mask = np.full(len(data), False)
         out_mask[0] = True
         out_mask[len(data) - 1] = True
-
-        # Largest Triangle Three Buckets (LTTB):
-        # In each bin, find the point that makes the largest triangle
-        # with the point saved in the previous bin
-        # and the centroid of the points in the next bin.
-        for i in range(len(data_bins)):
-            this_bin = data_bins[i]
-            next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
-            a = prev_a
-            bs = this_bin
-            c = next_bin.mean(axis=0)
-
-            areas = LTTB._areas_of_triangles(a, bs, c)
-            bs_pos = np.argmax(areas)
-            prev_a = bs[bs_pos]
-            out_mask[start_pos + bs_pos] = True
-            start_pos += len(this_bin)
-
+        out_mask[selected] = True
         return out_mask
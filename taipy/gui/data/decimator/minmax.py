@@ -32,6 +32,7 @@ class MinMaxDecimator(Decimator):
         n_out: int,
         threshold: t.Optional[int] = None,
         zoom: t.Optional[bool] = True,
+        pyramid: t.Optional[bool] = False,
         # on_decimate: t.Optional[t.Callable] = None,
         # apply_decimator: t.Optional[t.Callable] = None,
     ):
@@ -43,17 +44,23 @@ class MinMaxDecimator(Decimator):
                 decimation is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid (Optional[bool]): set to True to precompute decimation levels of the
+                data, keeping the minimum and maximum values of small bins. Zooming then only
+                decimates the points of the most appropriate level in the displayed range,
+                instead of all the points in that range. The levels are computed again when
+                the data changes.<br/>
+                The data must be sorted on the x values.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
         # apply_decimator (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is applied to modify the data.
-        super().__init__(threshold, zoom)
+        super().__init__(threshold, zoom, pyramid)
         self._n_out = n_out // 2
 
     def _decimate(self, data: np.ndarray, payload: t.Dict[str, t.Any]) -> np.ndarray:
         if self._n_out >= data.shape[0]:
-            return np.full(len(data), False)
+            return np.full(len(data), True)
         # Create a boolean mask
         x = data[:, 0]
         y = data[:, 1]
@@ -9,11 +9,14 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
 import os
 import typing as t
+import weakref
 from datetime import datetime
 from importlib import util
 from tempfile import mkstemp
+from threading import Lock
 
 import numpy as np
 import pandas as pd
@@ -26,6 +29,7 @@ from ..utils import _RE_PD_TYPE, _get_date_col_str_name
 from .comparison import _compare_function
 from .data_accessor import _DataAccessor
 from .data_format import _DataFormat
+from .query_cache import _QueryCache
 
 _has_arrow_module = False
 if util.find_spec("pyarrow"):
@@ -40,6 +44,22 @@ class _PandasDataAccessor(_DataAccessor):
 
     __AGGREGATE_FUNCTIONS: t.List[str] = ["count", "sum", "mean", "median", "min", "max", "std", "first", "last"]
 
+    # Payload entries that define the rows of a table page, besides its bounds
+    __QUERY_PAYLOAD_KEYS = ("filters", "aggregates", "applies", "orderby", "sort")
+
+    # Maximum number of rows of the Arrow record batches that the data is sent in
+    __ARROW_BATCH_ROWS = 100_000
+
+    def __init__(self, gui: Gui) -> None:
+        super().__init__(gui)
+        # Filtered, aggregated and sorted rows of the tables, so that paging through them only slices these rows
+        self.__query_cache = _QueryCache()
+        # The decimators that precompute the decimation of the variables, by variable name
+        self.__pyramid_decimators: t.Dict[str, weakref.WeakSet] = {}
+        # Number of rows of the values that rows were appended to, by id of the resulting value
+        self.__appended_rows: t.Dict[int, t.Tuple[weakref.ref, int]] = {}
+        self.__appended_rows_lock = Lock()
+
     def to_pandas(self, value: t.Union[pd.DataFrame, pd.Series]) -> t.Union[t.List[pd.DataFrame], pd.DataFrame]:
         return self.__to_dataframe(value)
 
@@ -204,25 +224,31 @@ class _PandasDataAccessor(_DataAccessor):
         if data_format is _DataFormat.APACHE_ARROW:
             if not _has_arrow_module:
                 raise RuntimeError("Cannot use Arrow as pyarrow package is not installed")
-            # Convert from pandas to Arrow
-            table = pa.Table.from_pandas(data)  # type: ignore[reportPossiblyUnboundVariable]
-            # Create sink buffer stream
-            sink = pa.BufferOutputStream()  # type: ignore[reportPossiblyUnboundVariable]
-            # Create Stream writer
-            writer = pa.ipc.new_stream(sink, table.schema)  # type: ignore[reportPossiblyUnboundVariable]
-            # Write data to table
-            writer.write_table(table)
-            writer.close()
-            # End buffer stream
-            buf = sink.getvalue()
-            # Convert buffer to Python bytes and return
-            ret["data"] = buf.to_pybytes()
-            ret["orient"] = orient
-        else:
-            # Workaround for Python built in JSON encoder that does not yet support ignore_nan
-            ret["data"] = data.replace([np.nan, pd.NA], [None, None]).to_dict(orient=orient)  # type: ignore
+            try:
+                ret["data"] = _PandasDataAccessor.__to_arrow_streams(data)
+                ret["orient"] = orient
+                return ret
+            except (ValueError, TypeError, NotImplementedError):
+                # Arrow cannot convert some columns (mixed types...): send the data as JSON
+                ret["format"] = str(_DataFormat.JSON.value)
+        # Workaround for Python built in JSON encoder that does not yet support ignore_nan
+        ret["data"] = data.replace([np.nan, pd.NA], [None, None]).to_dict(orient=orient)  # type: ignore
         return ret
 
+    @staticmethod
+    def __to_arrow_streams(data: pd.DataFrame) -> t.Union[bytes, t.List[bytes]]:
+        # Convert from pandas to Arrow: NaN and NA values become nulls
+        table = pa.Table.from_pandas(data, preserve_index=False)  # type: ignore[reportPossiblyUnboundVariable]
+        # Large tables are split in several IPC streams, sent as separate binary attachments
+        streams: t.List[bytes] = []
+        for batch in table.to_batches(max_chunksize=_PandasDataAccessor.__ARROW_BATCH_ROWS) or [None]:
+            sink = pa.BufferOutputStream()  # type: ignore[reportPossiblyUnboundVariable]
+            with pa.ipc.new_stream(sink, table.schema) as writer:  # type: ignore[reportPossiblyUnboundVariable]
+                if batch is not None:
+                    writer.write_batch(batch)
+            streams.append(sink.getvalue().to_pybytes())
+        return streams[0] if len(streams) == 1 else streams
+
     def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
         if isinstance(value, list):
             ret_dict: t.Dict[str, str] = {}
@@ -233,32 +259,7 @@ class _PandasDataAccessor(_DataAccessor):
             return ret_dict
         return {str(k): v for k, v in self.__to_dataframe(value).dtypes.apply(lambda x: x.name.lower()).items()}
 
-    def __get_data(  # noqa: C901
-        self,
-        var_name: str,
-        df: pd.DataFrame,
-        payload: t.Dict[str, t.Any],
-        data_format: _DataFormat,
-        col_prefix: t.Optional[str] = "",
-    ) -> t.Dict[str, t.Any]:
-        columns = payload.get("columns", [])
-        if col_prefix:
-            columns = [c[len(col_prefix) :] if c.startswith(col_prefix) else c for c in columns]
-        ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
-        paged = not payload.get("alldata", False)
-        is_copied = False
-
-        orig_df = df
-        # add index if not chart
-        if paged:
-            if _PandasDataAccessor.__INDEX_COL not in df.columns:
-                is_copied = True
-                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
-            if columns and _PandasDataAccessor.__INDEX_COL not in columns:
-                columns.append(_PandasDataAccessor.__INDEX_COL)
-
-        fullrowcount = len(df)
-        # filtering
+    def __get_filter_mask(self, df: pd.DataFrame, payload: t.Dict[str, t.Any]) -> t.Optional[np.ndarray]:
         filters = payload.get("filters")
         if isinstance(filters, list) and len(filters) > 0:
             query = ""
@@ -293,36 +294,130 @@ class _PandasDataAccessor(_DataAccessor):
                     query += " and "
                 query += f"{col_expr}{right}"
 
-            # Apply filters using df.query()
+            # Evaluate the filters as df.query() does, to get the mask of the filtered rows
             try:
                 if query:
-                    df = df.query(query)
-                    is_copied = True
+                    return t.cast(pd.Series, df.eval(query)).to_numpy(dtype=bool, na_value=False)
             except Exception as e:
                 _warn(f"Dataframe filtering: invalid query '{query}' on {df.head()}", e)
 
+        return None
+
+    def __apply_filters(self, df: pd.DataFrame, payload: t.Dict[str, t.Any]) -> t.Tuple[pd.DataFrame, bool]:
+        mask = self.__get_filter_mask(df, payload)
+        return (df, False) if mask is None else (df[mask], True)
+
+    def __run_query(
+        self, var_name: str, df: pd.DataFrame, payload: t.Dict[str, t.Any], columns: t.List[str]
+    ) -> t.Tuple[t.Optional[t.Union[np.ndarray, pd.DataFrame]], t.Optional[np.ndarray]]:
+        """Filter, aggregate and sort the rows of a table.
+
+        Returns:
+            The rows of the query: None if all the rows of *df* are kept, the positions of the filtered
+            rows in *df*, or the aggregated frame. And the permutation that sorts these rows, if any.
+        """
+        mask = self.__get_filter_mask(df, payload)
+        rows: t.Optional[t.Union[np.ndarray, pd.DataFrame]] = None if mask is None else np.flatnonzero(mask)
+        aggregates = payload.get("aggregates")
+        applies = payload.get("applies")
+        if isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict):
+            applies_with_fn = {
+                k: v if v in _PandasDataAccessor.__AGGREGATE_FUNCTIONS else self._gui._get_user_function(v)
+                for k, v in applies.items()
+            }
+
+            for col in columns:
+                if col not in applies_with_fn.keys():
+                    applies_with_fn[col] = "first"
+            filtered_df = df if rows is None else df.iloc[rows]
+            if _PandasDataAccessor.__INDEX_COL not in filtered_df.columns:
+                filtered_df = filtered_df.assign(**{_PandasDataAccessor.__INDEX_COL: filtered_df.index})
+            try:
+                rows = t.cast(pd.DataFrame, filtered_df).groupby(aggregates).agg(applies_with_fn)
+            except Exception:
+                _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+        # deal with sort
+        sorted_indexes = None
+        order_by = payload.get("orderby")
+        if isinstance(order_by, str) and len(order_by):
+            try:
+                query_df = rows if isinstance(rows, pd.DataFrame) else df
+                if query_df.columns.dtype.name == "int64":
+                    order_by = int(order_by)
+                values = t.cast(pd.DataFrame, query_df)[order_by].values
+                if isinstance(rows, np.ndarray):
+                    values = values[rows]
+                sorted_indexes = values.argsort(axis=0)
+                if payload.get("sort") == "desc":
+                    # reverse order
+                    sorted_indexes = sorted_indexes[::-1]
+            except Exception:
+                _warn(f"Cannot sort {var_name} on columns {order_by}.")
+        return rows, sorted_indexes
+
+    @staticmethod
+    def __get_query_size(query: t.Tuple[t.Optional[t.Union[np.ndarray, pd.DataFrame]], t.Optional[np.ndarray]]) -> int:
+        rows, sorted_indexes = query
+        size = 0 if sorted_indexes is None else sorted_indexes.nbytes
+        if isinstance(rows, pd.DataFrame):
+            return size + int(rows.memory_usage(index=True, deep=False).sum())
+        return size + (0 if rows is None else rows.nbytes)
+
+    @staticmethod
+    def __get_query_key(payload: t.Dict[str, t.Any], columns: t.List[str]) -> str:
+        query = {k: payload.get(k) for k in _PandasDataAccessor.__QUERY_PAYLOAD_KEYS}
+        query["columns"] = columns
+        return json.dumps(query, sort_keys=True, default=str)
+
+    def __get_data(  # noqa: C901
+        self,
+        var_name: str,
+        df: pd.DataFrame,
+        payload: t.Dict[str, t.Any],
+        data_format: _DataFormat,
+        col_prefix: t.Optional[str] = "",
+        source: t.Optional[t.Any] = None,
+        cache_query: t.Optional[bool] = True,
+    ) -> t.Dict[str, t.Any]:
+        if source is None:
+            source = df
+        columns = payload.get("columns", [])
+        if col_prefix:
+            columns = [c[len(col_prefix) :] if c.startswith(col_prefix) else c for c in columns]
+        ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
+        paged = not payload.get("alldata", False)
+        is_copied = False
+
+        orig_df = df
+        # add index if not chart
+        if paged and columns and _PandasDataAccessor.__INDEX_COL not in columns:
+            columns.append(_PandasDataAccessor.__INDEX_COL)
+
         dict_ret: t.Optional[t.Dict[str, t.Any]]
         if paged:
-            aggregates = payload.get("aggregates")
-            applies = payload.get("applies")
-            if isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict):
-                applies_with_fn = {
-                    k: v if v in _PandasDataAccessor.__AGGREGATE_FUNCTIONS else self._gui._get_user_function(v)
-                    for k, v in applies.items()
-                }
-
-                for col in columns:
-                    if col not in applies_with_fn.keys():
-                        applies_with_fn[col] = "first"
-                try:
-                    df = t.cast(pd.DataFrame, df).groupby(aggregates).agg(applies_with_fn)
-                except Exception:
-                    _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+            # The rows are filtered, aggregated and sorted once for all the pages of the same query
+            query_key = self.__get_query_key(payload, columns)
+            client_id = self._gui._get_client_id()
+            query = self.__query_cache.get(client_id, var_name, query_key, source) if cache_query else None
+            if query is None:
+                query = self.__run_query(var_name, df, payload, columns)
+                # A query that keeps the rows as they are has nothing worth caching
+                if cache_query and (query[0] is not None or query[1] is not None):
+                    self.__query_cache.set(client_id, var_name, query_key, source, query, self.__get_query_size(query))
+            rows, sorted_indexes = query
+            fullrowcount = len(df)
+            # The positions of the query rows in df, if not all of them
+            positions: t.Optional[np.ndarray] = None
+            is_aggregated = isinstance(rows, pd.DataFrame)
+            if isinstance(rows, pd.DataFrame):
+                df = rows
+            else:
+                positions = rows
             inf = payload.get("infinite")
             if inf is not None:
                 ret_payload["infinite"] = inf
             # real number of rows is needed to calculate the number of pages
-            rowcount = len(df)
+            rowcount = len(df) if positions is None else len(positions)
             # here we'll deal with start and end values from payload if present
             if isinstance(payload.get("start", 0), int):
                 start = int(payload.get("start", 0))
@@ -351,29 +446,18 @@ class _PandasDataAccessor(_DataAccessor):
                 start = end - diff
                 if start < 0:
                     start = 0
-            # deal with sort
-            order_by = payload.get("orderby")
-            if isinstance(order_by, str) and len(order_by):
-                try:
-                    if df.columns.dtype.name == "int64":
-                        order_by = int(order_by)
-                    new_indexes = t.cast(pd.DataFrame, df)[order_by].values.argsort(axis=0)
-                    if payload.get("sort") == "desc":
-                        # reverse order
-                        new_indexes = new_indexes[::-1]
-                    new_indexes = new_indexes[slice(start, end + 1)]
-                except Exception:
-                    _warn(f"Cannot sort {var_name} on columns {order_by}.")
-                    new_indexes = slice(start, end + 1)  # type: ignore
-            else:
-                new_indexes = slice(start, end + 1)  # type: ignore
+            new_indexes = sorted_indexes[slice(start, end + 1)] if sorted_indexes is not None else slice(start, end + 1)
+            # Only the rows of the page are copied, to add the index column
+            df = t.cast(pd.DataFrame, df).iloc[new_indexes if positions is None else positions[new_indexes]]
+            if not is_aggregated and _PandasDataAccessor.__INDEX_COL not in df.columns:
+                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
+                is_copied = True
             df = self.__build_transferred_cols(
                 columns,
                 t.cast(pd.DataFrame, df),
                 styles=payload.get("styles"),
                 tooltips=payload.get("tooltips"),
                 is_copied=is_copied,
-                new_indexes=t.cast(np.ndarray, new_indexes),
                 handle_nan=payload.get("handlenan", False),
                 formats=payload.get("formats"),
             )
@@ -401,11 +485,14 @@ class _PandasDataAccessor(_DataAccessor):
                         comp_df = self.__build_transferred_cols(
                             columns, comp_df, new_indexes=t.cast(np.ndarray, new_indexes)
                         )
-                        dict_ret["comp"] = self.__format_data(comp_df, data_format, "records").get("data")
+                        # The front-end only decodes the Arrow streams of the main data
+                        dict_ret["comp"] = self.__format_data(comp_df, _DataFormat.JSON, "records").get("data")
                     except Exception as e:
                         _warn("Pandas accessor compare raised an exception", e)
 
         else:
+            df, is_filtered = self.__apply_filters(df, payload)
+            is_copied = is_filtered
             ret_payload["alldata"] = True
             decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
             decimators = decimator_payload.get("decimators", [])
@@ -428,10 +515,13 @@ class _PandasDataAccessor(_DataAccessor):
                     else None
                 )
                 if isinstance(decimator_instance, PropertyType.decimator.value):
+                    if decimator_instance._pyramid:
+                        self.__pyramid_decimators.setdefault(var_name, weakref.WeakSet()).add(decimator_instance)
                     # Run the on_decimate method -> check if the decimator should be applied
                     # -> apply the decimator
+                    # Filtered data is a new frame for every request: a pyramid built on it would never be reused
                     decimated_df, is_decimator_applied, is_copied = decimator_instance._on_decimate(
-                        df, decimator_pl, decimator_payload, is_copied
+                        df, decimator_pl, decimator_payload, is_copied, use_pyramid=not is_filtered
                     )
                     # add decimated dataframe to the list of decimated
                     decimated_dfs.append(decimated_df)
@@ -500,19 +590,35 @@ class _PandasDataAccessor(_DataAccessor):
                         else {}
                     )
                     ret_val = ret.get("value", {})
+                    if data_format is not _DataFormat.JSON and ret_val.get("format") == _DataFormat.JSON.value:
+                        # Some of the data could not be sent as Arrow: send all of it as JSON
+                        return self.get_data(var_name, value, payload, _DataFormat.JSON)
                     data.append(ret_val.pop("data", None))
                     ret_payload.get("value", {}).update(ret_val)
                 ret_payload["value"]["data"] = data
                 return ret_payload
             else:
                 value = value[0]
-        return self.__get_data(var_name, self.__to_dataframe(value), payload, data_format)
+        return self.__get_data(
+            var_name, t.cast(pd.DataFrame, self.to_pandas(value)), payload, data_format, source=value
+        )
+
+    def invalidate_cache(self, var_name: t.Optional[str] = None, client_id: t.Optional[str] = None) -> None:
+        self.__query_cache.invalidate(var_name, client_id)
+        # The decimation pyramids are shared by all the clients.
+        # The pyramids of the data of a removed client are dropped when that data is released.
+        if var_name is not None or client_id is None:
+            for name in [var_name] if var_name is not None else list(self.__pyramid_decimators):
+                for decimator in self.__pyramid_decimators.pop(name, ()):
+                    decimator._invalidate_pyramids()
 
     def on_edit(self, value: t.Any, payload: t.Dict[str, t.Any]):
         df = self.to_pandas(value)
         if not isinstance(df, pd.DataFrame):
             raise ValueError(f"Cannot edit {type(value)}.")
         df.at[payload["index"], payload["col"]] = payload["value"]
+        # The value is modified in place
+        self.__query_cache.invalidate(source=value)
         return self._from_pandas(df, type(value))
 
     def on_delete(self, value: t.Any, payload: t.Dict[str, t.Any]):
@@ -546,6 +652,107 @@ class _PandasDataAccessor(_DataAccessor):
                 return self._from_pandas(df.sort_index(), type(value))
         return value
 
+    def append_rows(self, value: t.Any, rows: t.Any):
+        df = self.to_pandas(value)
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError(f"Cannot append rows to {type(value)}.")
+        new_rows = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows, columns=df.columns)
+        # Keep a range index so that the indexes of the rows match their positions
+        new_df = pd.concat([df, new_rows], ignore_index=isinstance(df.index, pd.RangeIndex))
+        new_value = self._from_pandas(new_df, type(value))
+        with self.__appended_rows_lock:
+            # Rows may be appended several times before the clients are updated
+            appended = self.__appended_rows.pop(id(value), None)
+            rowcount = appended[1] if appended is not None and appended[0]() is value else len(df)
+            try:
+                ref = weakref.ref(new_value)
+            except TypeError:
+                # The rows cannot be tracked: the clients will request the whole data again
+                return new_value
+            self.__appended_rows[id(new_value)] = (ref, rowcount)
+        weakref.finalize(new_value, self.__forget_appended_rows, id(new_value), ref)
+        return new_value
+
+    def __forget_appended_rows(self, value_id: int, ref: weakref.ref) -> None:
+        with self.__appended_rows_lock:
+            if (appended := self.__appended_rows.get(value_id)) is not None and appended[0] is ref:
+                del self.__appended_rows[value_id]
+
+    def get_appended_rows_updates(  # noqa: C901
+        self, var_name: str, value: t.Any, windows: t.Optional[t.List[t.Tuple[t.Dict[str, t.Any], _DataFormat]]]
+    ):
+        with self.__appended_rows_lock:
+            appended = self.__appended_rows.pop(id(value), None)
+        if appended is None or appended[0]() is not value or windows is None:
+            return None
+        df = self.to_pandas(value)
+        if not isinstance(df, pd.DataFrame):
+            return None
+        prev_rowcount = appended[1]
+        rowcount = len(df)
+        updates: t.List[t.Dict[str, t.Any]] = []
+        if rowcount == prev_rowcount:
+            return updates
+        for payload, data_format in windows:
+            if (
+                payload.get("alldata", False)
+                or payload.get("library")
+                or payload.get("reverse", False)
+                or payload.get("compare")
+                or any(payload.get(k) for k in ("filters", "aggregates", "orderby"))
+            ):
+                # The rows of the window cannot be found without processing the whole data again
+                return None
+            try:
+                start = int(payload.get("start", 0))
+                end = int(payload.get("end", -1))
+            except (TypeError, ValueError):
+                return None
+            if start < 0 or start >= prev_rowcount:
+                return None
+            if payload.get("infinite"):
+                # The front-end adds the rows to the ones it has loaded
+                if 0 <= end < prev_rowcount - 1:
+                    # The client has not loaded the last rows: only the number of rows changes
+                    updates.append(
+                        {
+                            "pagekey": payload.get("pagekey", "unknown page"),
+                            "infinite": True,
+                            "value": {"rowcount": rowcount, "start": prev_rowcount, "data": []},
+                        }
+                    )
+                else:
+                    updates.append(self.__get_rows_update(var_name, df, payload, prev_rowcount, -1, data_format))
+            elif 0 <= end < prev_rowcount:
+                # The rows of the page are unchanged: only the number of rows changes
+                updates.append(
+                    {"pagekey": payload.get("pagekey", "unknown page"), "delta": True, "value": {"rowcount": rowcount}}
+                )
+            else:
+                updates.append(self.__get_rows_update(var_name, df, payload, start, end, data_format))
+        return updates
+
+    def __get_rows_update(
+        self,
+        var_name: str,
+        df: pd.DataFrame,
+        payload: t.Dict[str, t.Any],
+        start: int,
+        end: int,
+        data_format: _DataFormat,
+    ) -> t.Dict[str, t.Any]:
+        # Only the requested rows are processed, so that the whole data is not copied
+        ret_payload = self.__get_data(
+            var_name,
+            df.iloc[start : end + 1 if end >= 0 else None],
+            {**payload, "start": 0, "end": -1},
+            data_format,
+            cache_query=False,
+        )
+        ret_payload["value"]["start"] = start
+        ret_payload["value"]["rowcount"] = len(df)
+        return ret_payload
+
     def to_csv(self, var_name: str, value: t.Any):
         df = self.to_pandas(value)
         if not isinstance(df, pd.DataFrame):
@@ -0,0 +1,90 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+import weakref
+from collections import OrderedDict
+from threading import Lock
+
+
+class _QueryCache:
+    """Least recently used cache of the results of the queries run on the variables, per client.
+
+    A result is stored along with the value it was computed from: it is only returned for that very
+    same value, so that a variable that is assigned a new value never gets a stale result. That value
+    is referenced weakly when possible, so that the cache does not keep a replaced value alive.
+
+    The size of the results, in bytes, is bounded per client.
+    """
+
+    _MAX_BYTES_PER_CLIENT = 64 * 1024 * 1024
+
+    def __init__(self, max_bytes_per_client: int = _MAX_BYTES_PER_CLIENT) -> None:
+        self.__max_bytes = max_bytes_per_client
+        # { client_id: { (var_name, query_key): (source reference, result, size) } }
+        self.__entries: t.Dict[str, "OrderedDict[t.Tuple[str, str], t.Tuple[t.Callable[[], t.Any], t.Any, int]]"] = {}
+        self.__sizes: t.Dict[str, int] = {}
+        self.__lock = Lock()
+
+    @staticmethod
+    def __reference(source: t.Any) -> t.Callable[[], t.Any]:
+        try:
+            return weakref.ref(source)
+        except TypeError:
+            return lambda: source
+
+    def get(self, client_id: str, var_name: str, query_key: str, source: t.Any) -> t.Optional[t.Any]:
+        with self.__lock:
+            entries = self.__entries.get(client_id)
+            if entries is None or (entry := entries.get((var_name, query_key))) is None:
+                return None
+            if entry[0]() is not source:
+                self.__remove(client_id, (var_name, query_key))
+                return None
+            entries.move_to_end((var_name, query_key))
+            return entry[1]
+
+    def set(self, client_id: str, var_name: str, query_key: str, source: t.Any, result: t.Any, size: int) -> None:
+        """Store the result of a query, unless it is larger than the size of the results of a client."""
+        if size > self.__max_bytes:
+            return
+        with self.__lock:
+            entries = self.__entries.setdefault(client_id, OrderedDict())
+            if (var_name, query_key) in entries:
+                self.__remove(client_id, (var_name, query_key))
+                entries = self.__entries.setdefault(client_id, OrderedDict())
+            entries[(var_name, query_key)] = (self.__reference(source), result, size)
+            self.__sizes[client_id] = self.__sizes.get(client_id, 0) + size
+            while self.__sizes[client_id] > self.__max_bytes:
+                self.__remove(client_id, next(iter(entries)))
+
+    def __remove(self, client_id: str, key: t.Tuple[str, str]) -> None:
+        entries = self.__entries[client_id]
+        self.__sizes[client_id] -= entries.pop(key)[2]
+        if not entries:
+            del self.__entries[client_id]
+            del self.__sizes[client_id]
+
+    def invalidate(
+        self, var_name: t.Optional[str] = None, client_id: t.Optional[str] = None, source: t.Optional[t.Any] = None
+    ) -> None:
+        """Remove the results computed on a variable, for a client or from a value, or all the results."""
+        with self.__lock:
+            client_ids = list(self.__entries) if client_id is None else [client_id]
+            for cl_id in client_ids:
+                if (entries := self.__entries.get(cl_id)) is None:
+                    continue
+                for key in [
+                    k
+                    for k, entry in entries.items()
+                    if (var_name is None or k[0] == var_name) and (source is None or entry[0]() is source)
+                ]:
+                    self.__remove(cl_id, key)
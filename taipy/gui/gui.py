@@ -654,6 +654,7 @@ class Gui:
             try:
                 del self.__client_id_2_sid[client_id]
                 self._bindings()._delete_scope(client_id)
+                self._get_accessor().invalidate_cache(client_id=client_id)
             except Exception as e:
                 _warn(f"Unexpected error removing state {client_id}", e)
 
@@ -1072,6 +1073,17 @@ class Gui:
             resource_handler = get_current_resource_handler()
             custom_page_filtered_types = resource_handler.data_layer_supported_types if resource_handler else ()
             if isinstance(newvalue, (_TaipyData)) or isinstance(newvalue, custom_page_filtered_types):
+                # Drop the query results computed on the previous value of the variable
+                self._get_accessor().invalidate_cache(
+                    _var, None if self._is_broadcasting() else self._get_client_id()
+                )
+                # Only send the appended rows, if any, to the elements that display them
+                if isinstance(newvalue, _TaipyData) and (
+                    updates := self._get_accessor().get_appended_rows_updates(_var, newvalue)
+                ) is not None:
+                    for update in updates:
+                        self.__send_ws_update_with_dict({_var: update})
+                    continue
                 newvalue = {"__taipy_refresh": True}
             else:
                 if isinstance(newvalue, (_TaipyContent, _TaipyContentImage)):
@@ -1137,6 +1149,7 @@ class Gui:
         if isinstance(newvalue, _TaipyData):
             ret_payload = None
             if isinstance(payload, dict):
+                self._get_accessor().set_data_window(var_name, payload)
                 self.__update_state_context(payload)
                 lib_name = payload.get("library")
                 if isinstance(lib_name, str):
@@ -2214,6 +2227,14 @@ class Gui:
         """
         self.__send_ws_broadcast(name, value, client_id, message_type)
 
+    def _append_rows(self, name: str, rows: t.Any):
+        value = getattr(self._bindings(), name)
+        new_value = self._get_accessor().append_rows(value, rows)
+        if new_value is None:
+            _warn(f"Cannot append rows to a value of type {type(value).__name__}.")
+            return
+        setattr(self._bindings(), name, new_value)
+
     def _broadcast_all_clients(self, name: str, value: t.Any):
         try:
             self._set_broadcast()
@@ -80,6 +80,7 @@ class State:
         "_context_list",
     )
     __methods = (
+        "append_rows",
         "assign",
         "broadcast",
         "get_gui",
@@ -226,6 +227,27 @@ class State:
         val = attrgetter(name)(self)
         _attrsetter(self, name, val)
 
+    def append_rows(self, name: str, rows: t.Any):
+        """Append rows to a tabular state variable.
+
+        The variable is set to a new value made of its rows followed by *rows*.<br/>
+        Unlike when the variable is assigned a new value, the elements that display the variable
+        only receive the rows they need, as long as their rows are not filtered, aggregated or
+        sorted: tables that do not show the last rows only update their number of rows.
+
+        Arguments:
+            name (str): The name of the variable to append rows to.
+            rows (Any): The rows to append. This can be a Pandas DataFrame with the same columns
+                as the variable, or any value that can create such a DataFrame (a list of rows,
+                a dictionary of columns...).
+        """
+        gui: "Gui" = super().__getattribute__(State.__gui_attr)
+        if not name.startswith("__") and name not in super().__getattribute__(State.__attrs[1]):
+            raise AttributeError(f"Variable '{name}' is not accessible.")
+        with self._notebook_context(gui), self._set_context(gui):
+            encoded_name = gui._bind_var(name)
+            gui._append_rows(encoded_name, rows)
+
     def broadcast(self, name: str, value: t.Any):
         """Update a variable on all clients.
 
@@ -187,8 +187,10 @@ class _GuiCoreScenarioNoUpdate(_TaipyBase, _DoNotUpdate):
 class _GuiCoreDatanodeAdapter(_TaipyBase):
     @staticmethod
     def _is_tabular_data(datanode: DataNode, value: t.Any):
-        return isinstance(datanode, _TabularDataNodeMixin) or isinstance(
-            value, (pd.DataFrame, pd.Series, list, tuple, dict)
+        return (
+            isinstance(datanode, _TabularDataNodeMixin)
+            or isinstance(value, (pd.DataFrame, pd.Series, list, tuple, dict))
+            or _TabularDataNodeMixin._is_arrow_table(value)
         )
 
     def __get_data(self, dn: DataNode):
@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import filecmp
+import json
 import os
 import shutil
 from unittest.mock import patch
@@ -18,7 +19,11 @@ import mongomock
 import pytest
 
 from taipy._entrypoint import _entrypoint
+from taipy.common.config import Config
 from taipy.core._entity._migrate_cli import _MigrateCLI
+from taipy.core._repository._sql_connection import _SQLConnection
+from taipy.core._version._version_sql_repository import _VersionSQLRepository
+from taipy.core.cycle._cycle_sql_repository import _CycleSQLRepository
 
 
 def test_migrate_cli_with_wrong_repository_type_arguments(caplog):
@@ -234,6 +239,91 @@ def test_migrate_mongo_backup_and_restore(caplog):
     assert not os.path.exists(mongo_backup_path)
 
 
+def test_migrate_sql_specified_folder(caplog, mocker, tmp_sqlite):
+    mocker.patch("taipy.core._entity._migrate._utils.version", return_value="3.1.0")
+    _MigrateCLI.create_parser()
+
+    data_sample_path = "tests/core/_entity/data_sample"
+    data_path = "tests/core/_entity/.data"
+    shutil.copytree(data_sample_path, data_path)
+
+    with pytest.raises(SystemExit):
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "sql", data_path, tmp_sqlite, "--skip-backup"]):
+            _MigrateCLI.handle_command()
+    assert f"Starting entity migration from '{data_path}' folder to '{tmp_sqlite}' database." in caplog.text
+
+    # The filesystem entities are left unchanged
+    dircmp_result = filecmp.dircmp(data_path, data_sample_path)
+    assert not dircmp_result.diff_files and not dircmp_result.left_only and not dircmp_result.right_only
+
+    # The migrated entities are the ones of the filesystem migration
+    migrated_path = "tests/core/_entity/data_sample_migrated"
+    Config.configure_core(repository_properties={"db_location": tmp_sqlite})
+    connection, _ = _SQLConnection._get_connection()
+    for folder, table in [
+        ("cycles", "cycle"),
+        ("data_nodes", "data_node"),
+        ("jobs", "job"),
+        ("scenarios", "scenario"),
+        ("tasks", "task"),
+        ("version", "version"),
+    ]:
+        files = os.listdir(os.path.join(migrated_path, folder))
+        assert connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == len(files)
+        for file in files:
+            with open(os.path.join(migrated_path, folder, file)) as f:
+                (data,) = connection.execute(f"SELECT data FROM {table} WHERE id = ?", (file[:-5],)).fetchone()
+                assert json.loads(data) == json.load(f)
+    with open(os.path.join(migrated_path, "version.json")) as f:
+        version_info = json.load(f)
+    assert _VersionSQLRepository()._get_latest_version() == version_info["latest_version"]
+    assert _VersionSQLRepository()._get_development_version() == version_info["development_version"]
+
+
+def test_migrate_sql_backup_and_restore(caplog, mocker, tmp_sqlite):
+    mocker.patch("taipy.core._entity._migrate._utils.version", return_value="3.1.0")
+    _MigrateCLI.create_parser()
+
+    data_path = "tests/core/_entity/.data"
+    backup_path = f"{tmp_sqlite}_backup"
+    shutil.copytree("tests/core/_entity/data_sample", data_path)
+
+    # Restore backup when it does not exist should raise an error
+    with pytest.raises(SystemExit) as err:
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "sql", data_path, tmp_sqlite, "--restore"]):
+            _MigrateCLI.handle_command()
+    assert err.value.code == 1
+    assert f"The backup database '{backup_path}' does not exist." in caplog.text
+
+    # The database is only backed up if it exists
+    with pytest.raises(SystemExit):
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "sql", data_path, tmp_sqlite]):
+            _MigrateCLI.handle_command()
+    assert os.path.exists(tmp_sqlite)
+    assert not os.path.exists(backup_path)
+
+    Config.configure_core(repository_properties={"db_location": tmp_sqlite})
+    _CycleSQLRepository()._delete_all()
+    _SQLConnection._close()
+
+    with pytest.raises(SystemExit):
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "sql", data_path, tmp_sqlite]):
+            _MigrateCLI.handle_command()
+    assert f"Backed up entities from '{tmp_sqlite}' to '{backup_path}' database before migration." in caplog.text
+    assert len(_CycleSQLRepository()._load_all()) == 1
+    _SQLConnection._close()
+
+    # Restore the backup, which does not contain the cycles
+    with pytest.raises(SystemExit):
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "sql", data_path, tmp_sqlite, "--restore"]):
+            _MigrateCLI.handle_command()
+    assert f"Restored entities from the backup database '{backup_path}' to '{tmp_sqlite}'." in caplog.text
+    assert not os.path.exists(backup_path)
+    assert _CycleSQLRepository()._load_all() == []
+    connection, _ = _SQLConnection._get_connection()
+    assert connection.execute("SELECT COUNT(*) FROM scenario").fetchone()[0] == 1
+
+
 def test_not_provide_valid_repository_type(caplog):
     _MigrateCLI.create_parser()
 
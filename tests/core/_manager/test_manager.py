@@ -13,9 +13,13 @@ import dataclasses
 import pathlib
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Union
+from unittest import mock
+
+import pytest
 
 from taipy.common.config import Config
 from taipy.core._manager._manager import _Manager
+from taipy.core._manager._save_batch import _SaveBatch
 from taipy.core._repository._abstract_converter import _AbstractConverter
 from taipy.core._repository._abstract_repository import _AbstractRepository
 from taipy.core._repository._filesystem_repository import _FileSystemRepository
@@ -178,3 +182,36 @@ class TestManager:
         rc = MockManager._is_editable("some_entity")
         assert not rc
         assert "Entity some_entity does not exist in the repository." in rc.reasons
+
+    def test_save_batch(self):
+        MockManager._delete_all()
+
+        with mock.patch.object(MockManager._repository, "_save_many", wraps=MockManager._repository._save_many) as mck:
+            with _SaveBatch():
+                for i in range(3):
+                    MockManager._set(MockEntity(f"uuid-{i}", f"Foo{i}"))
+                MockManager._set(MockEntity("uuid-0", "Bar"))
+
+                # The entities are read from the batch until they are saved
+                assert MockManager._get("uuid-0").name == "Bar"
+                assert MockManager._exists("uuid-1")
+                assert not MockManager._repository._exists("uuid-1")
+                assert MockManager._repository._load_all() == []
+                assert sorted(e.name for e in MockManager._get_all()) == ["Bar", "Foo1", "Foo2"]
+                assert [e.id for e in MockManager._get_all_by([{"name": "Foo1"}])] == ["uuid-1"]
+            mck.assert_called_once()
+
+        assert len(MockManager._get_all()) == 3
+        assert MockManager._get("uuid-0").name == "Bar"
+
+    def test_save_batch_is_discarded_on_error(self):
+        MockManager._delete_all()
+
+        with pytest.raises(ValueError):
+            with _SaveBatch():
+                MockManager._set(MockEntity("uuid", "Foo"))
+                with _SaveBatch():
+                    MockManager._set(MockEntity("uuid-nested", "Foo"))
+                raise ValueError
+
+        assert MockManager._get_all() == []
@@ -39,6 +39,7 @@ class MockStandaloneDispatcher(_StandaloneJobDispatcher):
     def __init__(self, orchestrator: _AbstractOrchestrator):
         super(_StandaloneJobDispatcher, self).__init__(orchestrator)
         self._executor: Executor = MockProcessPoolExecutor()
+        self._executors = {_StandaloneJobDispatcher._DEFAULT_EXECUTOR: self._executor}
         self._nb_available_workers = 1
         self._nb_available_workers_lock = Lock()
 
@@ -0,0 +1,63 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import asyncio
+import threading
+from time import perf_counter
+
+import pytest
+
+from taipy.core._orchestrator._dispatcher._asyncio_executor import _AsyncioExecutor
+
+
+async def sleep_and_return(duration, value):
+    await asyncio.sleep(duration)
+    return value, threading.current_thread().name
+
+
+def test_submit_runs_the_coroutines_concurrently_on_one_thread():
+    with _AsyncioExecutor() as executor:
+        start = perf_counter()
+        futures = [executor.submit(sleep_and_return, 0.2, i) for i in range(100)]
+        results = [future.result(timeout=5) for future in futures]
+        duration = perf_counter() - start
+
+    assert [value for value, _ in results] == list(range(100))
+    assert {thread_name for _, thread_name in results} == {"Thread-Taipy-EventLoop"}
+    assert duration < 2
+
+
+def test_cancel_future_cancels_the_coroutine():
+    cancelled = threading.Event()
+
+    async def wait_forever():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with _AsyncioExecutor() as executor:
+        future = executor.submit(wait_forever)
+        assert future.cancel()
+        assert cancelled.wait(timeout=5)
+
+
+def test_shutdown():
+    executor = _AsyncioExecutor()
+    future = executor.submit(sleep_and_return, 0.1, "value")
+    executor.shutdown(wait=True)
+
+    assert future.result()[0] == "value"
+    assert not executor._thread.is_alive()
+    assert executor._loop.is_closed()
+    with pytest.raises(RuntimeError):
+        executor.submit(sleep_and_return, 0, "value")
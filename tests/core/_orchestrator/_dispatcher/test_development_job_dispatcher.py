@@ -35,14 +35,22 @@ def test_dispatch_executes_the_function_no_exception():
     job = Job(JobId("job"), task, "s_id", task.id)
     dispatcher = _OrchestratorFactory._build_dispatcher()
 
-    with patch("taipy.core._orchestrator._dispatcher._task_function_wrapper._TaskFunctionWrapper.execute") as mck:
-        mck.return_value = []
+    def execute(wrapper):
+        wrapper.read_durations = {"dn_id": 0.5}
+        return []
+
+    with patch(
+        "taipy.core._orchestrator._dispatcher._task_function_wrapper._TaskFunctionWrapper.execute",
+        autospec=True,
+        side_effect=execute,
+    ) as mck:
         dispatcher._dispatch(job)
 
         mck.assert_called_once()
 
     assert job.is_completed()
     assert job.stacktrace == []
+    assert job.read_durations == {"dn_id": 0.5}
 
 
 def test_dispatch_executes_the_function_with_exceptions():
@@ -9,10 +9,12 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 import traceback
+from unittest import mock
 
 from taipy import Job, JobId, Status, Task
 from taipy.core._orchestrator._dispatcher import _JobDispatcher
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.job._job_manager import _JobManager
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
@@ -33,6 +35,22 @@ def test_update_job_status_no_exception():
     assert job.stacktrace == []
 
 
+def test_update_job_status_records_read_durations():
+    task = Task("config_id", {}, nothing)
+    _TaskManagerFactory._build_manager()._set(task)
+    job = Job(JobId("id"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+
+    with mock.patch.object(_JobManager, "_set", wraps=_JobManager._set) as mck:
+        _JobDispatcher(_OrchestratorFactory._orchestrator)._update_job_status(job, None, {"dn_id": 0.5})
+        # The read durations are saved with the status of the job
+        mck.assert_called_once()
+
+    assert job.status == Status.COMPLETED
+    assert job.read_durations == {"dn_id": 0.5}
+    assert _JobManagerFactory._build_manager()._get(job.id).read_durations == {"dn_id": 0.5}
+
+
 def test_update_job_status_with_one_exception():
     task = Task("config_id", {}, nothing)
     _TaskManagerFactory._build_manager()._set(task)
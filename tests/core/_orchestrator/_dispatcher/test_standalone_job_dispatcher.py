@@ -9,7 +9,8 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from concurrent.futures import Future, ProcessPoolExecutor
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import mock
 from unittest.mock import call
 
@@ -17,6 +18,8 @@ from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 from taipy.core import JobId
 from taipy.core._orchestrator._dispatcher import _StandaloneJobDispatcher
+from taipy.core._orchestrator._dispatcher._asyncio_executor import _AsyncioExecutor
+from taipy.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.job.job import Job
@@ -46,6 +49,18 @@ def test_init_default():
     assert isinstance(job_dispatcher._executor, ProcessPoolExecutor)
 
 
+def test_init_sends_config_to_workers_once():
+    initializer = mock.Mock()
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    job_dispatcher = _StandaloneJobDispatcher(orchestrator, initializer)
+
+    assert job_dispatcher._executor._initializer == _TaskFunctionWrapper._initialize_worker
+    assert job_dispatcher._executor._initargs == (
+        _TomlSerializer()._serialize(Config._applied_config),
+        initializer,
+    )
+
+
 def test_init_with_nb_workers():
     Config.configure_job_executions(max_nb_of_workers=2)
     orchestrator = _OrchestratorFactory._build_orchestrator()
@@ -69,7 +84,7 @@ def test_dispatch_job():
     assert submit_first_call[0].job_id == job.id
     assert submit_first_call[0].task == task
     assert submit_first_call[1] == ()
-    assert submit_first_call[2]["config_as_string"] == _TomlSerializer()._serialize(Config._applied_config)
+    assert submit_first_call[2] == {}  # The configuration is not sent with the job
 
     # test that the job status is updated after execution on future
     assert len(dispatcher.update_job_status_from_future_calls) == 1
@@ -77,6 +92,80 @@ def test_dispatch_job():
     assert dispatcher.update_job_status_from_future_calls[0][1] == dispatcher._executor.f[0]
 
 
+def test_dispatch_job_with_thread_executor():
+    task = create_task()
+    task.properties["executor"] = "thread"
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    with mock.patch.object(dispatcher, "_update_job_status_from_future") as mck:
+        dispatcher._dispatch(job)
+        assert_true_after_time(lambda: mck.call_count == 1, time=5, msg="The job was not executed.")
+
+    assert isinstance(dispatcher._executors["thread"], ThreadPoolExecutor)
+    assert dispatcher._executors["process"] is dispatcher._executor
+    assert dispatcher._nb_available_workers == 1
+
+
+def test_dispatch_job_with_inline_executor():
+    task = create_task()
+    task.properties["executor"] = "inline"
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    dispatcher = MockStandaloneDispatcher(_OrchestratorFactory._build_orchestrator())
+    nb_submit_calls = len(dispatcher._executor.submit_called)
+
+    dispatcher._dispatch(job)
+
+    # The job is executed in the dispatcher thread, without using any worker
+    assert len(dispatcher._executor.submit_called) == nb_submit_calls
+    assert len(dispatcher.update_job_status_from_future_calls) == 0
+    assert dispatcher._nb_available_workers == 1
+    assert job.is_completed()
+
+
+async def async_nothing(*args):
+    return
+
+
+async def wait_forever(*args):
+    await asyncio.sleep(60)
+
+
+def test_dispatch_coroutine_function_job_on_the_asyncio_executor():
+    task = Task("config_id", {}, async_nothing, [], [])
+    _TaskManagerFactory._build_manager()._set(task)
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    dispatcher._dispatch(job)
+
+    assert_true_after_time(job.is_completed, time=5, msg="The job was not completed.")
+    assert isinstance(dispatcher._executors["asyncio"], _AsyncioExecutor)
+    assert dispatcher._nb_available_workers == 2  # No worker is used by the coroutines
+    assert dispatcher._coroutine_futures == {}
+
+
+def test_cancel_running_coroutine_job():
+    task = Task("config_id", {}, wait_forever, [], [])
+    _TaskManagerFactory._build_manager()._set(task)
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._build_orchestrator())
+    other_job = Job(JobId("other_job"), create_task(), "s_id", task.id)
+
+    dispatcher._dispatch(job)
+    future = dispatcher._coroutine_futures[job.id]
+
+    assert not dispatcher._cancel_running_job(other_job)
+    assert dispatcher._cancel_running_job(job)
+    assert future.cancelled()
+    assert dispatcher._coroutine_futures == {}
+    assert not job.is_completed()
+
+
 def test_can_execute():
     dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
     assert dispatcher._nb_available_workers == 2
@@ -95,7 +184,7 @@ def test_update_job_status_from_future():
     orchestrator = _OrchestratorFactory._build_orchestrator()
     dispatcher = _StandaloneJobDispatcher(orchestrator)
     ft = Future()
-    ft.set_result(None)
+    ft.set_result((None, {}))
     assert dispatcher._nb_available_workers == 2
     dispatcher._update_job_status_from_future(job, ft)
     assert dispatcher._nb_available_workers == 3
@@ -124,3 +213,34 @@ def test_run():
         assert_true_after_time(lambda: mck.call_count == 4, time=5, msg="The 4 jobs were not dequeued.")
         dispatcher.stop()
         mck.assert_has_calls([call(job_1), call(job_2), call(job_3), call(job_4)])
+
+
+def test_run_is_notified_when_jobs_are_queued():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+
+    with mock.patch("taipy.core._orchestrator._dispatcher._job_dispatcher._JobDispatcher._execute_job") as mck:
+        dispatcher = _StandaloneJobDispatcher(orchestrator)
+        dispatcher._MAX_WAITING_TIME = 60
+        dispatcher.start()
+        orchestrator._orchestrate_job_to_run_or_block([job])
+        # The dispatcher does not wait for the end of its waiting time to dequeue the job.
+        assert_true_after_time(lambda: mck.call_count == 1, time=5, msg="The job was not dequeued.")
+        dispatcher.stop(timeout=5)
+        assert not dispatcher.is_running()
+        mck.assert_called_once_with(job)
+
+
+def test_update_job_status_from_future_notifies_dispatcher():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._build_orchestrator())
+    ft = Future()
+    ft.set_result((None, {}))
+
+    with mock.patch.object(dispatcher.condition, "notify_all") as mck:
+        dispatcher._update_job_status_from_future(job, ft)
+        mck.assert_called()
@@ -9,8 +9,11 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
 import random
 import string
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
@@ -18,10 +21,11 @@ from taipy.common.config.common.scope import Scope
 from taipy.common.config.exceptions import ConfigurationUpdateBlocked
 from taipy.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
 from taipy.core.data._data_manager import _DataManager
+from taipy.core.exceptions import DataNodeWritingError, NoData
 from taipy.core.task.task import Task
 
 
-def _create_task(function, nb_outputs=1):
+def _create_task(function, nb_outputs=1, **properties):
     output_dn_config_id = "".join(random.choice(string.ascii_lowercase) for _ in range(10))
     dn_input_configs = [
         Config.configure_data_node("input1", "pickle", Scope.SCENARIO, default_data=21),
@@ -35,7 +39,7 @@ def _create_task(function, nb_outputs=1):
     output_dn = _DataManager._bulk_get_or_create(dn_output_configs).values()
     return Task(
         output_dn_config_id,
-        {},
+        properties,
         function=function,
         input=input_dn,
         output=output_dn,
@@ -98,6 +102,104 @@ def test_data_node_not_written_due_to_wrong_result_nb():
     assert isinstance(exceptions[0], Exception)
 
 
+def test_execute_records_read_durations():
+    task = _create_task(multiply)
+
+    wrapper = _TaskFunctionWrapper("job_id", task)
+    exceptions = wrapper.execute()
+
+    assert exceptions == []
+    assert set(wrapper.read_durations) == {dn.id for dn in task.input.values()}
+    assert all(duration >= 0 for duration in wrapper.read_durations.values())
+
+    exceptions, read_durations = wrapper()
+    assert exceptions == []
+    assert read_durations == wrapper.read_durations
+
+
+def test_execute_reads_and_writes_concurrently():
+    def return_2tuple(nb1, nb2):
+        return multiply(nb1, nb2), multiply(nb1, nb2) / 2
+
+    task = _create_task(return_2tuple, 2, max_nb_of_io_workers=4)
+    with mock.patch(
+        "taipy.core._orchestrator._dispatcher._task_function_wrapper.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    ) as mck:
+        wrapper = _TaskFunctionWrapper("job_id", task)
+        exceptions = wrapper.execute()
+
+    mck.assert_called_once_with(max_workers=2)
+    assert exceptions == []
+    assert set(wrapper.read_durations) == {dn.id for dn in task.input.values()}
+    assert task.output[f"{task.config_id}_output0"].read() == 42
+    assert task.output[f"{task.config_id}_output1"].read() == 21
+
+
+def test_concurrent_read_error_is_returned():
+    task = _create_task(multiply, max_nb_of_io_workers=2)
+    with mock.patch("taipy.core.data.pickle.PickleDataNode._read", side_effect=[21, NoData()]):
+        wrapper = _TaskFunctionWrapper("job_id", task)
+        exceptions = wrapper.execute()
+
+    assert len(exceptions) == 1
+    assert isinstance(exceptions[0], NoData)
+    assert len(wrapper.read_durations) == 2
+
+
+def test_concurrent_write_errors_are_collected():
+    def return_2tuple(nb1, nb2):
+        return multiply(nb1, nb2), multiply(nb1, nb2) / 2
+
+    task = _create_task(return_2tuple, 2, max_nb_of_io_workers=2)
+    with mock.patch("taipy.core.data.pickle.PickleDataNode._write", side_effect=ValueError("Cannot write")):
+        exceptions = _TaskFunctionWrapper("job_id", task).execute()
+
+    assert len(exceptions) == 2
+    assert all(isinstance(e, DataNodeWritingError) for e in exceptions)
+
+
+def test_execute_coroutine_function():
+    async def async_multiply(nb1, nb2):
+        await asyncio.sleep(0)
+        return multiply(nb1, nb2)
+
+    task = _create_task(async_multiply)
+    exceptions = _TaskFunctionWrapper("job_id", task).execute()
+
+    assert exceptions == []
+    assert task.output[f"{task.config_id}_output0"].read() == 42
+
+
+def test_execute_async():
+    async def async_multiply(nb1, nb2):
+        await asyncio.sleep(0)
+        return multiply(nb1, nb2)
+
+    async_task = _create_task(async_multiply)
+    sync_task = _create_task(multiply)
+
+    wrapper = _TaskFunctionWrapper("job_id", async_task)
+    exceptions = asyncio.run(wrapper.execute_async())
+    assert exceptions == []
+    assert set(wrapper.read_durations) == {dn.id for dn in async_task.input.values()}
+    assert async_task.output[f"{async_task.config_id}_output0"].read() == 42
+
+    exceptions = asyncio.run(_TaskFunctionWrapper("job_id", sync_task).execute_async())
+    assert exceptions == []
+    assert sync_task.output[f"{sync_task.config_id}_output0"].read() == 42
+
+
+def test_execute_async_returns_the_exceptions():
+    async def raise_error(nb1, nb2):
+        raise ValueError("Something bad has happened")
+
+    task = _create_task(raise_error)
+    exceptions = asyncio.run(_TaskFunctionWrapper("job_id", task).execute_async())
+
+    assert len(exceptions) == 1
+    assert isinstance(exceptions[0], ValueError)
+
+
 def test_cannot_exec_task_that_update_config():
     def update_config_fct(n, m):
         from taipy.common.config import Config
@@ -128,3 +230,21 @@ def test_can_execute_task_with_a_modified_config():
     res = _TaskFunctionWrapper("job_id", task_asserting_cfg_is_correct).execute(config_as_string=cfg_as_str)
 
     assert len(res) == 0  # no exception raised so the asserts in the fct passed
+
+
+def test_config_is_applied_only_when_it_changes():
+    initializer = mock.Mock()
+    cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
+    with (
+        mock.patch.object(_TaskFunctionWrapper, "_TaskFunctionWrapper__applied_config_hash", None),
+        mock.patch.object(_TomlSerializer, "_deserialize", wraps=_TomlSerializer._deserialize) as mck,
+    ):
+        _TaskFunctionWrapper._initialize_worker(cfg_as_str, initializer)
+        _TaskFunctionWrapper._apply_config(cfg_as_str)
+        Config.unblock_update()
+        Config.configure_core(custom_property="custom_property")
+        _TaskFunctionWrapper._apply_config(_TomlSerializer()._serialize(Config._applied_config))
+
+    initializer.assert_called_once()
+    assert mck.call_count == 2  # The configuration is not applied again when unchanged
+    assert Config.core.custom_property == "custom_property"
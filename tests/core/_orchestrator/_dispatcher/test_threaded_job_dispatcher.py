@@ -0,0 +1,95 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core import JobId
+from taipy.core._orchestrator._dispatcher import _ThreadedJobDispatcher
+from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.in_memory import InMemoryDataNode
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.job.job import Job
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+from taipy.core.task.task import Task
+from tests.core.utils import assert_true_after_time
+
+
+def current_thread_name():
+    return threading.current_thread().name
+
+
+def create_task(function=current_thread_name, **properties):
+    output = InMemoryDataNode("output", Scope.SCENARIO)
+    _DataManagerFactory._build_manager()._set(output)
+    task = Task("config_id", properties, function, [], [output])
+    _TaskManagerFactory._build_manager()._set(task)
+    return task
+
+
+def test_init_default():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    job_dispatcher = _ThreadedJobDispatcher(orchestrator)
+
+    assert job_dispatcher.orchestrator == orchestrator
+    assert job_dispatcher.lock == orchestrator.lock
+    assert job_dispatcher._nb_available_workers == 2
+    assert isinstance(job_dispatcher._executor, ThreadPoolExecutor)
+
+
+def test_init_with_nb_workers():
+    Config.configure_job_executions(max_nb_of_workers=5)
+    job_dispatcher = _ThreadedJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    assert job_dispatcher._nb_available_workers == 5
+    assert job_dispatcher._executor._max_workers == 5
+
+
+def test_dispatch_job_in_a_thread_sharing_the_managers():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    dispatcher = _ThreadedJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    dispatcher._dispatch(job)
+
+    assert_true_after_time(job.is_completed, time=5, msg="The job was not completed.")
+    # The in-memory output is written by the thread in the data of the current process
+    assert task.output["output"].read().startswith("taipy-job")
+    assert dispatcher._nb_available_workers == 2
+    assert list(dispatcher._executors) == ["thread"]
+
+
+def test_dispatch_job_with_inline_executor():
+    task = create_task(executor="inline")
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    dispatcher = _ThreadedJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    with mock.patch.object(dispatcher._executor, "submit") as mck:
+        dispatcher._dispatch(job)
+        mck.assert_not_called()
+
+    assert job.is_completed()
+    assert task.output["output"].read() == threading.current_thread().name
+
+
+def test_run_shuts_the_executors_down():
+    dispatcher = _ThreadedJobDispatcher(_OrchestratorFactory._build_orchestrator())
+    dispatcher.start()
+    dispatcher.stop(timeout=5)
+
+    assert not dispatcher.is_running()
+    assert dispatcher._executor._shutdown
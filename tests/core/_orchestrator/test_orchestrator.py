@@ -9,22 +9,24 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
 import multiprocessing
 import random
 import string
 from functools import partial
-from time import sleep
+from time import perf_counter, sleep
 from typing import cast
 
 import pytest
 
 from taipy.common.config import Config
 from taipy.common.config.common.scope import Scope
-from taipy.core._orchestrator._dispatcher import _StandaloneJobDispatcher
+from taipy.core._orchestrator._dispatcher import _StandaloneJobDispatcher, _ThreadedJobDispatcher
 from taipy.core._orchestrator._orchestrator import _Orchestrator
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.config.job_config import JobConfig
 from taipy.core.data._data_manager import _DataManager
+from taipy.core.scenario._scenario_manager import _ScenarioManager
 from taipy.core.scenario.scenario import Scenario
 from taipy.core.submission._submission_manager import _SubmissionManager
 from taipy.core.submission.submission_status import SubmissionStatus
@@ -48,6 +50,15 @@ def mult_by_2(n):
     return n * 2
 
 
+async def async_sleep_and_double(n):
+    await asyncio.sleep(0.5)
+    return n * 2
+
+
+def identity(n):
+    return n
+
+
 @pytest.mark.orchestrator_dispatcher
 def test_submit_task_multithreading_multiple_task():
     Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
@@ -294,6 +305,74 @@ def test_blocked_submittable():
     assert dispatcher._nb_available_workers == 2  # No more process used.
 
 
+@pytest.mark.orchestrator_dispatcher
+def test_submit_submittable_in_threaded_mode_with_in_memory_data_nodes():
+    Config.configure_job_executions(mode=JobConfig._THREADED_MODE, max_nb_of_workers=2)
+    foo_cfg = Config.configure_data_node("foo", "in_memory", default_data=1)
+    bar_cfg = Config.configure_data_node("bar", "in_memory")
+    baz_cfg = Config.configure_data_node("baz", "in_memory")
+    t_1_cfg = Config.configure_task("by_2", mult_by_2, foo_cfg, bar_cfg)
+    t_2_cfg = Config.configure_task("by_4", mult_by_2, bar_cfg, baz_cfg, executor="inline")
+    scenario = _ScenarioManager._create(Config.configure_scenario("scenario_config", [t_1_cfg, t_2_cfg]))
+    dispatcher = _OrchestratorFactory._build_dispatcher(force_restart=True)
+    assert isinstance(dispatcher, _ThreadedJobDispatcher)
+
+    submission = _Orchestrator.submit(scenario, wait=True, timeout=10)
+
+    assert_submission_status(submission, SubmissionStatus.COMPLETED)
+    assert scenario.bar.read() == 2
+    assert scenario.baz.read() == 4
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 2)
+
+
+@pytest.mark.orchestrator_dispatcher
+def test_submit_coroutine_function_tasks_concurrently():
+    nb_of_tasks = 8
+    Config.configure_job_executions(mode=JobConfig._THREADED_MODE, max_nb_of_workers=2)
+    input_cfg = Config.configure_data_node("input", default_data=21)
+    task_configs = [
+        Config.configure_task(f"t_{i}", async_sleep_and_double, input_cfg, Config.configure_data_node(f"output_{i}"))
+        for i in range(nb_of_tasks)
+    ]
+    scenario = _ScenarioManager._create(Config.configure_scenario("scenario_config", task_configs))
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+
+    start = perf_counter()
+    submission = _Orchestrator.submit(scenario, wait=True, timeout=30)
+    duration = perf_counter() - start
+
+    assert_submission_status(submission, SubmissionStatus.COMPLETED)
+    assert all(scenario.data_nodes[f"output_{i}"].read() == 42 for i in range(nb_of_tasks))
+    # The jobs do not wait for one of the 2 workers: they share the event loop.
+    assert duration < nb_of_tasks * 0.5 / 2
+
+
+@pytest.mark.standalone
+@pytest.mark.benchmark
+def test_latency_of_a_chain_of_no_op_tasks(record_property):
+    # Measures the end-to-end overhead of the orchestration: the tasks do nothing, but each task must wait for the
+    # completion of the previous one, so the dispatcher is idle between two jobs.
+    nb_of_tasks = 50
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_configs = [
+        Config.configure_data_node(f"dn_{i}", default_data=0 if i == 0 else None) for i in range(nb_of_tasks + 1)
+    ]
+    task_configs = [
+        Config.configure_task(f"t_{i}", identity, dn_configs[i], dn_configs[i + 1], skippable=False)
+        for i in range(nb_of_tasks)
+    ]
+    scenario = _ScenarioManager._create(Config.configure_scenario("chain", task_configs))
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+
+    start = perf_counter()
+    submission = _Orchestrator.submit(scenario, wait=True, timeout=300)
+    duration = perf_counter() - start
+
+    assert_submission_status(submission, SubmissionStatus.COMPLETED)
+    assert scenario.data_nodes[f"dn_{nb_of_tasks}"].read() == 0
+    record_property("chained_task_ms", duration / nb_of_tasks * 1000)
+
+
 # ################################  UTIL METHODS    ##################################
 def _create_task(function, nb_outputs=1):
     output_dn_config_id = "".join(random.choice(string.ascii_lowercase) for _ in range(10))
@@ -8,6 +8,7 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
+import asyncio
 from typing import cast
 
 from taipy import Job, JobId, Status
@@ -15,14 +16,20 @@ from taipy.common.config import Config
 from taipy.core import taipy
 from taipy.core._orchestrator._orchestrator import _Orchestrator
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.config.job_config import JobConfig
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
+from tests.core.utils import assert_true_after_time
 
 
 def nothing(*args, **kwargs):
     pass
 
 
+async def wait_forever(*args, **kwargs):
+    await asyncio.sleep(60)
+
+
 def create_job(status):
     t_cfg = Config.configure_task("no_output", nothing, [], [])
     t = _TaskManagerFactory._build_manager()._bulk_get_or_create([t_cfg])
@@ -57,6 +64,27 @@ def test_cancel_job_no_subsequent_jobs():
     assert job.is_canceled()
 
 
+def test_cancel_running_coroutine_job_with_subsequent_blocked_jobs():
+    Config.configure_job_executions(mode=JobConfig._THREADED_MODE)
+    dn_0 = Config.configure_data_node("dn_0", default_data=0)
+    dn_1 = Config.configure_data_node("dn_1")
+    t1 = Config.configure_task("t1", wait_forever, [dn_0], [dn_1])
+    t2 = Config.configure_task("t2", nothing, [dn_1], [])
+    scenario = taipy.create_scenario(Config.configure_scenario("scenario", [t1, t2]))
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+
+    jobs = {job.task.config_id: job for job in taipy.submit(scenario).jobs}
+    assert_true_after_time(jobs["t1"].is_running, msg="The job was not executed.")
+    assert jobs["t2"].is_blocked()
+
+    taipy.cancel_job(jobs["t1"])
+
+    assert jobs["t1"].is_canceled()
+    assert jobs["t2"].is_abandoned()
+    assert not scenario.dn_1.edit_in_progress
+    _OrchestratorFactory._dispatcher.stop()
+
+
 def test_cancel_job_with_subsequent_blocked_jobs():
     scenario = create_scenario()
     orchestrator = cast(_Orchestrator, _OrchestratorFactory._build_orchestrator())
@@ -64,11 +92,9 @@ def test_cancel_job_with_subsequent_blocked_jobs():
     job2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "s_id", "e_id")
     job3 = orchestrator._lock_dn_output_and_create_job(scenario.t3, "s_id", "e_id")
     job2bis = orchestrator._lock_dn_output_and_create_job(scenario.t2bis, "s_id", "e_id")
-    job1.pending()
-    job2.blocked()
-    job3.blocked()
-    job2bis.blocked()
-    orchestrator.blocked_jobs = [job2, job3, job2bis]
+    orchestrator._orchestrate_job_to_run_or_block([job1, job2, job3, job2bis])
+    assert job1.is_pending()
+    assert orchestrator.blocked_jobs == [job2, job3, job2bis]
 
     orchestrator.cancel_job(job1)
 
@@ -90,11 +116,12 @@ def test_cancel_job_with_subsequent_jobs_and_parallel_jobs():
     job2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "s_id", "e_id")
     job3 = orchestrator._lock_dn_output_and_create_job(scenario.t3, "s_id", "e_id")
     job2bis = orchestrator._lock_dn_output_and_create_job(scenario.t2bis, "s_id", "e_id")
+    scenario.dn_1.write(1)
     job1.completed()
-    job2.pending()
-    job3.blocked()
-    job2bis.pending()
-    cast(_Orchestrator, orchestrator).blocked_jobs = [job3]
+    orchestrator._orchestrate_job_to_run_or_block([job2, job3, job2bis])
+    assert job2.is_pending()
+    assert job2bis.is_pending()
+    assert cast(_Orchestrator, orchestrator).blocked_jobs == [job3]
 
     orchestrator.cancel_job(job2)
 
@@ -114,11 +141,10 @@ def test_cancel_blocked_job_with_subsequent_blocked_jobs():
     job2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "s_id", "e_id")
     job3 = orchestrator._lock_dn_output_and_create_job(scenario.t3, "s_id", "e_id")
     job2bis = orchestrator._lock_dn_output_and_create_job(scenario.t2bis, "s_id", "e_id")
-    job1.blocked()
-    job2.blocked()
-    job3.blocked()
-    job2bis.blocked()
-    orchestrator.blocked_jobs = [job2, job3, job2bis]
+    scenario.dn_0.lock_edit()
+    orchestrator._orchestrate_job_to_run_or_block([job1, job2, job3, job2bis])
+    scenario.dn_0.unlock_edit()
+    assert orchestrator.blocked_jobs == [job1, job2, job3, job2bis]
 
     orchestrator.cancel_job(job1)
 
@@ -14,6 +14,7 @@ import taipy
 from taipy import Job, JobId, Status
 from taipy.common.config import Config
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.data._data_manager import _DataManager
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
@@ -31,12 +32,6 @@ def create_job(id, status):
     return job
 
 
-def create_job_from_task(id, task):
-    job = Job(JobId(id), task, "s", task.id)
-    _JobManagerFactory._build_manager()._set(job)
-    return job
-
-
 def create_scenario():
     # dn_0 --> t1 --> dn_1 --> t2 --> dn_2
     #  \
@@ -51,106 +46,162 @@ def create_scenario():
     return taipy.create_scenario(sc_conf)
 
 
+def create_chained_scenario():
+    # dn_0 --> t1 --> dn_1 --> t2 --> dn_2
+    #                  \
+    #   dn_3 ----------+--> t4
+    dn_0_cfg = Config.configure_pickle_data_node("dn_0", default_data=0)
+    dn_1_cfg = Config.configure_pickle_data_node("dn_1")
+    dn_2_cfg = Config.configure_pickle_data_node("dn_2")
+    dn_3_cfg = Config.configure_pickle_data_node("dn_3")
+    t1_cfg = Config.configure_task("t1", nothing, [dn_0_cfg], [dn_1_cfg])
+    t2_cfg = Config.configure_task("t2", nothing, [dn_1_cfg], [dn_2_cfg])
+    t4_cfg = Config.configure_task("t4", nothing, [dn_1_cfg, dn_3_cfg], [])
+    sc_conf = Config.configure_scenario("chained_scenario_cfg", [t1_cfg, t2_cfg, t4_cfg])
+    return taipy.create_scenario(sc_conf)
+
+
+def orchestrate_chained_scenario_jobs(orchestrator, scenario):
+    jobs = [
+        orchestrator._lock_dn_output_and_create_job(task, "s_id", scenario.id)
+        for task in [scenario.t1, scenario.t2, scenario.t4]
+    ]
+    orchestrator._orchestrate_job_to_run_or_block(jobs)
+    assert orchestrator.jobs_to_run.get() == jobs[0]
+    return jobs
+
+
 def test_on_status_change_on_running_job_does_nothing():
     orchestrator = _OrchestratorFactory._build_orchestrator()
-    job_1_blocked = create_job("1_blocked", Status.BLOCKED)
-    job_2_to_be_unblocked = create_job("to_be_unblocked", Status.BLOCKED)
-    job_3_blocked = create_job("3_blocked", Status.BLOCKED)
-    job_4_running = create_job("running_job", Status.RUNNING)
-    orchestrator.blocked_jobs.append(job_1_blocked)
-    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
-    orchestrator.blocked_jobs.append(job_3_blocked)
+    scenario = create_chained_scenario()
+    job_1, job_2, job_4 = orchestrate_chained_scenario_jobs(orchestrator, scenario)
+    job_1.running()
 
     with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
-        orchestrator._on_status_change(job_4_running)
+        orchestrator._on_status_change(job_1)
 
         mck.assert_not_called()
-        assert job_1_blocked in orchestrator.blocked_jobs
-        assert job_1_blocked.is_blocked()
-        assert job_2_to_be_unblocked in orchestrator.blocked_jobs
-        assert job_2_to_be_unblocked.is_blocked()
-        assert job_3_blocked in orchestrator.blocked_jobs
-        assert job_3_blocked.is_blocked()
-        assert job_4_running.is_running()
-        assert len(orchestrator.blocked_jobs) == 3
+        assert job_2 in orchestrator.blocked_jobs
+        assert job_2.is_blocked()
+        assert job_4 in orchestrator.blocked_jobs
+        assert job_4.is_blocked()
+        assert job_1.is_running()
+        assert len(orchestrator.blocked_jobs) == 2
         assert orchestrator.jobs_to_run.qsize() == 0
 
 
 def test_on_status_change_on_completed_job():
     orchestrator = _OrchestratorFactory._build_orchestrator()
-    job_1_blocked = create_job("1_blocked", Status.BLOCKED)
-    job_2_to_be_unblocked = create_job("to_be_unblocked", Status.BLOCKED)
-    job_3_blocked = create_job("3_blocked", Status.BLOCKED)
-    job_4_completed = create_job("completed_job", Status.COMPLETED)
-    orchestrator.blocked_jobs.append(job_1_blocked)
-    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
-    orchestrator.blocked_jobs.append(job_3_blocked)
-
-    def mck_is_blocked(job):
-        if job.id == "to_be_unblocked":
-            return False
-        return True
+    scenario = create_chained_scenario()
+    job_1, job_2, job_4 = orchestrate_chained_scenario_jobs(orchestrator, scenario)
+    scenario.dn_1.write(1)  # The output of job 1 is written and unlocked when it completes.
 
-    with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
-        mck.side_effect = mck_is_blocked
-        orchestrator._on_status_change(job_4_completed)
-
-        assert job_1_blocked in orchestrator.blocked_jobs
-        assert job_1_blocked.is_blocked()
-        assert job_2_to_be_unblocked not in orchestrator.blocked_jobs
-        assert job_2_to_be_unblocked.is_pending()
-        assert job_3_blocked in orchestrator.blocked_jobs
-        assert job_3_blocked.is_blocked()
-        assert job_4_completed.is_completed()
-        assert len(orchestrator.blocked_jobs) == 2
-        assert orchestrator.jobs_to_run.qsize() == 1
-        assert orchestrator.jobs_to_run.get() == job_2_to_be_unblocked
+    job_1.completed()  # The orchestrator is notified of the status change.
+
+    assert job_2 not in orchestrator.blocked_jobs
+    assert job_2.is_pending()
+    assert job_4 in orchestrator.blocked_jobs  # job 4 is still waiting for dn_3
+    assert job_4.is_blocked()
+    assert len(orchestrator.blocked_jobs) == 1
+    assert orchestrator.jobs_to_run.qsize() == 1
+    assert orchestrator.jobs_to_run.get() == job_2
+    assert orchestrator._blocking_data_node_ids == {job_4.id: {scenario.dn_3.id}}
+    assert list(orchestrator._waiting_jobs) == [scenario.dn_3.id]
 
 
 def test_on_status_change_on_skipped_job():
     orchestrator = _OrchestratorFactory._build_orchestrator()
-    job_1_blocked = create_job("1_blocked", Status.BLOCKED)
-    job_2_to_be_unblocked = create_job("to_be_unblocked", Status.BLOCKED)
-    job_3_blocked = create_job("3_blocked", Status.BLOCKED)
-    job_4_skipped = create_job("skipped_job", Status.SKIPPED)
-    orchestrator.blocked_jobs.append(job_1_blocked)
-    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
-    orchestrator.blocked_jobs.append(job_3_blocked)
-
-    def mck_is_blocked(job):
-        if job.id == "to_be_unblocked":
-            return False
-        return True
+    scenario = create_chained_scenario()
+    job_1, job_2, job_4 = orchestrate_chained_scenario_jobs(orchestrator, scenario)
+    scenario.dn_1.write(1)
 
-    with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
-        mck.side_effect = mck_is_blocked
-
-        orchestrator._on_status_change(job_4_skipped)
-
-        # Assert that when the status is skipped, the unblock jobs mechanism is executed
-        assert job_1_blocked in orchestrator.blocked_jobs
-        assert job_1_blocked.is_blocked()
-        assert job_2_to_be_unblocked not in orchestrator.blocked_jobs
-        assert job_2_to_be_unblocked.is_pending()
-        assert job_3_blocked in orchestrator.blocked_jobs
-        assert job_3_blocked.is_blocked()
-        assert job_4_skipped.is_skipped()
-        assert len(orchestrator.blocked_jobs) == 2
-        assert orchestrator.jobs_to_run.qsize() == 1
-        assert orchestrator.jobs_to_run.get() == job_2_to_be_unblocked
+    job_1.skipped()
+
+    # Assert that when the status is skipped, the unblock jobs mechanism is executed
+    assert job_2 not in orchestrator.blocked_jobs
+    assert job_2.is_pending()
+    assert job_4 in orchestrator.blocked_jobs
+    assert job_4.is_blocked()
+    assert len(orchestrator.blocked_jobs) == 1
+    assert orchestrator.jobs_to_run.qsize() == 1
+    assert orchestrator.jobs_to_run.get() == job_2
+
+
+def test_on_status_change_only_checks_the_successors_of_the_job():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    other_job = create_job("other_job", Status.COMPLETED)
+    scenario = create_chained_scenario()
+    job_1, job_2, job_4 = orchestrate_chained_scenario_jobs(orchestrator, scenario)
+    scenario.dn_1.write(1)
+
+    with mock.patch("taipy.core.data._data_manager._DataManager._get", wraps=_DataManager._get) as mck:
+        orchestrator._on_status_change(other_job)
+        mck.assert_not_called()
+    assert len(orchestrator.blocked_jobs) == 2
+
+    job_1.completed()
+    assert job_2.is_pending()
+    assert job_4.is_blocked()
+
+
+def test_writing_a_data_node_outside_of_a_job_unblocks_the_jobs_waiting_for_it():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario = create_chained_scenario()
+    job_1, job_2, job_4 = orchestrate_chained_scenario_jobs(orchestrator, scenario)
+    scenario.dn_1.write(1)
+    job_1.completed()
+    assert job_4.is_blocked()
+
+    scenario.dn_3.write(3)
+
+    assert job_4.is_pending()
+    assert len(orchestrator.blocked_jobs) == 0
+    assert orchestrator._blocking_data_node_ids == {}
+    assert orchestrator._waiting_jobs == {}
+
+
+def test_on_status_change_does_not_unblock_jobs_waiting_for_an_unfinished_job():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    other_job = create_job("other_job", Status.COMPLETED)
+    scenario = create_chained_scenario()
+    job_1, job_2, job_4 = orchestrate_chained_scenario_jobs(orchestrator, scenario)
+    scenario.dn_1.write(1)  # dn_1 is unlocked while job 1 is still running
+
+    orchestrator._on_status_change(other_job)
+
+    assert job_2.is_blocked()
+    assert orchestrator._writing_jobs == {scenario.dn_1.id: {job_1.id}, scenario.dn_2.id: {job_2.id}}
+    job_1.completed()
+    assert job_2.is_pending()
+    assert orchestrator._writing_jobs == {scenario.dn_2.id: {job_2.id}}
+
+
+def test_cancel_job_unblocks_the_jobs_of_other_submissions():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario = create_scenario()
+    scenario.dn_1.write(1)
+    j1 = orchestrator._lock_dn_output_and_create_job(scenario.t1, "s", scenario.id)
+    orchestrator._orchestrate_job_to_run_or_block([j1])
+    other_j2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "other_s", scenario.id)
+    orchestrator._orchestrate_job_to_run_or_block([other_j2])  # dn_1 is locked by j1
+    assert other_j2.is_blocked()
+
+    orchestrator.cancel_job(j1)
+
+    assert j1.is_canceled()
+    assert other_j2.is_pending()
+    assert other_j2 not in orchestrator.blocked_jobs
+    assert orchestrator.jobs_to_run.get() == other_j2
 
 
 def test_on_status_change_on_failed_job():
     orchestrator = _OrchestratorFactory._build_orchestrator()
     scenario = create_scenario()
-    j1 = create_job_from_task("j1", scenario.t1)
+    j1 = orchestrator._lock_dn_output_and_create_job(scenario.t1, "s", scenario.id)
+    j2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "s", scenario.id)
+    j3 = orchestrator._lock_dn_output_and_create_job(scenario.t3, "s", scenario.id)
+    orchestrator._orchestrate_job_to_run_or_block([j2, j3])  # dn_1 is locked by j1 and dn_0 has no data
     j1.status = Status.FAILED
-    j2 = create_job_from_task("j2", scenario.t2)
-    j2.status = Status.BLOCKED
-    j3 = create_job_from_task("j3", scenario.t3)
-    j3.status = Status.BLOCKED
-    orchestrator.blocked_jobs.append(j2)
-    orchestrator.blocked_jobs.append(j3)
 
     orchestrator._on_status_change(j1)
 
@@ -14,7 +14,11 @@ from unittest import mock
 import pytest
 
 from taipy.common.config import Config
-from taipy.core._orchestrator._dispatcher import _DevelopmentJobDispatcher, _StandaloneJobDispatcher
+from taipy.core._orchestrator._dispatcher import (
+    _DevelopmentJobDispatcher,
+    _StandaloneJobDispatcher,
+    _ThreadedJobDispatcher,
+)
 from taipy.core._orchestrator._orchestrator import _Orchestrator
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.config.job_config import JobConfig
@@ -104,6 +108,29 @@ def test_rebuild_standalone_dispatcher_and_force_restart():
     _OrchestratorFactory._dispatcher.stop()
 
 
+def test_build_threaded_dispatcher():
+    Config.configure_job_executions(mode=JobConfig._THREADED_MODE)
+    _OrchestratorFactory._orchestrator = None
+    _OrchestratorFactory._dispatcher = None
+    _OrchestratorFactory._build_orchestrator()
+    _OrchestratorFactory._build_dispatcher()
+    assert isinstance(_OrchestratorFactory._dispatcher, _ThreadedJobDispatcher)
+    assert _OrchestratorFactory._dispatcher.is_running()
+    threaded_dispatcher = _OrchestratorFactory._dispatcher
+
+    _OrchestratorFactory._build_dispatcher()
+    assert _OrchestratorFactory._dispatcher is threaded_dispatcher
+
+    # Switching to the standalone mode replaces the threaded dispatcher
+    Config.unblock_update()
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE)
+    with mock.patch("taipy.core._orchestrator._dispatcher._job_dispatcher._JobDispatcher.start") as start_mock:
+        _OrchestratorFactory._build_dispatcher()
+        assert type(_OrchestratorFactory._dispatcher) is _StandaloneJobDispatcher
+        start_mock.assert_called_once()
+    assert not threaded_dispatcher.is_running()
+
+
 def test_build_unknown_dispatcher():
     Config.configure_job_executions(mode="UNKNOWN")
     _OrchestratorFactory._build_orchestrator()
@@ -130,7 +130,7 @@ class TestDataNodeConfigChecker:
         assert len(Config._collector.errors) == 1
         expected_error_message = (
             "`storage_type` field of DataNodeConfig `new` must be either csv, sql_table,"
-            " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, or in_memory."
+            " sql, mongo_collection, pickle, excel, generic, json, parquet, npy, s3_object, or in_memory."
             ' Current value of property `storage_type` is "bar".'
         )
         assert expected_error_message in caplog.text
@@ -665,7 +665,7 @@ class TestDataNodeConfigChecker:
         assert len(Config._collector.errors) == 1
         expected_error_message = (
             'The `exposed_type` of DataNodeConfig `default` must be either "pandas"'
-            ', "numpy", or a custom type. Current value of property `exposed_type` is "foo".'
+            ', "numpy", "arrow", or a custom type. Current value of property `exposed_type` is "foo".'
         )
         assert expected_error_message in caplog.text
 
@@ -685,6 +685,11 @@ class TestDataNodeConfigChecker:
         Config.check()
         assert len(Config._collector.errors) == 0
 
+        config._sections[DataNodeConfig.name]["default"].properties = {"exposed_type": "arrow"}
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
         config._sections[DataNodeConfig.name]["default"].properties = {"exposed_type": MyCustomClass}
         Config.check()
         assert len(Config._collector.errors) == 0
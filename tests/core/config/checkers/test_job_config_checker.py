@@ -37,7 +37,7 @@ class TestJobConfigChecker:
             Config._collector = IssueCollector()
             Config.check()
         assert len(Config._collector.errors) == 1
-        expected_error_message = "Job execution mode must be either development, standalone."
+        expected_error_message = "Job execution mode must be either development, standalone, threaded."
         assert expected_error_message in caplog.text
 
         Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
@@ -70,3 +70,23 @@ class TestJobConfigChecker:
             ' value of property `storage_type` is "in_memory".'
         )
         assert expected_error_message in caplog.text
+
+    def test_check_threaded_mode(self, caplog):
+        dn_config = Config.configure_data_node(id="foo", storage_type="in_memory")
+        task_config = Config.configure_task("bar", print, dn_config)
+
+        Config.configure_job_executions(mode=JobConfig._THREADED_MODE)
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        task_config._properties["executor"] = "process"
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        expected_error_message = (
+            "DataNode `foo`: In-memory storage type cannot be used by TaskConfig `bar` executed by the `process`"
+            " executor."
+        )
+        assert expected_error_message in caplog.text
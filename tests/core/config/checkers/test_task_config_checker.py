@@ -9,7 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
 from copy import copy
+from unittest import mock
 
 import pytest
 
@@ -311,3 +313,43 @@ class TestTaskConfigChecker:
         Config.check()
         assert len(Config._collector.errors) == 0
         assert len(Config._collector.warnings) == 2
+
+    def test_check_executor(self, caplog):
+        Config.configure_task("new", print, executor="thread")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_task("new", print, executor="foo")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        expected_error_message = (
+            "executor field of TaskConfig `new` must be either process, thread, inline, asyncio."
+            ' Current value of property `executor` is "foo".'
+        )
+        assert expected_error_message in caplog.text
+
+    def test_check_max_nb_of_io_workers(self, caplog):
+        Config.configure_task("new", print, max_nb_of_io_workers=4)
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_task("new", print, max_nb_of_io_workers="ENV[MAX_NB_OF_IO_WORKERS]")
+        with mock.patch.dict(os.environ, {"MAX_NB_OF_IO_WORKERS": "4"}):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_task("new", print, max_nb_of_io_workers=-1)
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        expected_error_message = (
+            "max_nb_of_io_workers field of TaskConfig `new` must be populated with a positive integer value."
+            " Current value of property `max_nb_of_io_workers` is -1."
+        )
+        assert expected_error_message in caplog.text
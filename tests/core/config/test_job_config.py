@@ -26,6 +26,17 @@ def test_job_config():
     assert Config.job_config.foo == "bar"
 
 
+def test_threaded_job_config():
+    job_c = Config.configure_job_executions(mode="threaded")
+    assert job_c.is_threaded
+    assert not job_c.is_standalone
+    assert not job_c.is_development
+
+    Config.configure_job_executions(mode="threaded", max_nb_of_workers=8)
+    assert Config.job_config.is_threaded
+    assert Config.job_config.max_nb_of_workers == 8
+
+
 def test_clean_config():
     job_config = Config.configure_job_executions(mode="standalone", max_nb_of_workers=3, prop="foo")
 
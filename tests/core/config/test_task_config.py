@@ -106,6 +106,21 @@ def test_task_config_creation():
     assert list(Config.tasks) == ["default", task_config.id, task2.id]
 
 
+def test_task_config_executor():
+    input_config = Config.configure_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("tasks1", print, input_config, output_config)
+    assert task_config.executor is None
+    assert "executor" not in task_config.properties
+
+    task_config = Config.configure_task("tasks2", print, input_config, output_config, executor="thread")
+    assert task_config.executor == "thread"
+    assert Config.tasks["tasks2"].properties["executor"] == "thread"
+
+    Config.set_default_task_configuration(print, executor="inline")
+    assert Config.tasks["default"].executor == "inline"
+
+
 def test_task_count():
     input_config = Config.configure_data_node("input")
     output_config = Config.configure_data_node("output")
@@ -26,6 +26,7 @@ from taipy.common.config.checker._checker import _Checker
 from taipy.common.config.common.frequency import Frequency
 from taipy.common.config.common.scope import Scope
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core._repository._sql_connection import _SQLConnection
 from taipy.core._version._version import _Version
 from taipy.core._version._version_manager_factory import _VersionManagerFactory
 from taipy.core.config import (
@@ -42,6 +43,7 @@ from taipy.core.cycle.cycle import Cycle
 from taipy.core.cycle.cycle_id import CycleId
 from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.data._data_model import _DataNodeModel
+from taipy.core.data._sql_engine_registry import _SQLEngineRegistry
 from taipy.core.data.in_memory import DataNodeId, InMemoryDataNode
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.job.job import Job
@@ -372,6 +374,13 @@ def init_managers():
         _VersionManagerFactory._build_manager()._delete_all()
         _SubmissionManagerFactory._build_manager()._delete_all()
 
+        _SQLConnection._close()
+        _SQLEngineRegistry._dispose()
+        db_location = _SQLConnection._get_db_location()
+        for path in [db_location, f"{db_location}-wal", f"{db_location}-shm"]:
+            if os.path.exists(path):
+                os.remove(path)
+
     return _init_managers
 
 
@@ -385,6 +394,9 @@ def init_orchestrator():
         _OrchestratorFactory._build_dispatcher(force_restart=True)
         _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
         _OrchestratorFactory._orchestrator.blocked_jobs = []
+        _OrchestratorFactory._orchestrator._blocking_data_node_ids = {}
+        _OrchestratorFactory._orchestrator._waiting_jobs = {}
+        _OrchestratorFactory._orchestrator._writing_jobs = {}
 
     return _init_orchestrator
 
@@ -12,10 +12,12 @@
 import os
 import pathlib
 
+import pandas as pd
 import pytest
 
 from taipy.common.config import Config
 from taipy.common.config.common.scope import Scope
+from taipy.core._manager._save_batch import _SaveBatch
 from taipy.core._version._version_manager import _VersionManager
 from taipy.core.config.data_node_config import DataNodeConfig
 from taipy.core.data._data_manager import _DataManager
@@ -472,6 +474,19 @@ class TestDataManager:
         assert cycle_dn_3.id == cycle_dn_4.id
         assert cycle_dn_4.id == cycle_dn_5.id
 
+    def test_get_or_create_within_a_save_batch(self):
+        global_dn_config = Config.configure_data_node(id="global_dn", storage_type="in_memory", scope=Scope.GLOBAL)
+        cycle_dn_config = Config.configure_data_node(id="cycle_dn", storage_type="in_memory", scope=Scope.CYCLE)
+
+        with _SaveBatch():
+            dns = _DataManager._bulk_get_or_create([global_dn_config, cycle_dn_config], "cycle_id", "scenario_id")
+            dns_bis = _DataManager._bulk_get_or_create([global_dn_config, cycle_dn_config], "cycle_id", "scenario_id_2")
+            assert dns[global_dn_config].id == dns_bis[global_dn_config].id
+            assert dns[cycle_dn_config].id == dns_bis[cycle_dn_config].id
+            assert len(_DataManager._get_all()) == 2
+
+        assert len(_DataManager._get_all()) == 2
+
     def test_ensure_persistence_of_data_node(self):
         dm = _DataManager()
         dm._delete_all()
@@ -530,6 +545,16 @@ class TestDataManager:
         assert not file_exists(generated_dn_1.path)
         assert not file_exists(generated_dn_2.path)
 
+    def test_clean_generated_parquet_dataset_directory(self):
+        dn_config = Config.configure_parquet_data_node(id="d1", default_data={"a": [1], "b": [2]})
+        dn = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+        dn.append(pd.DataFrame({"a": [3], "b": [4]}))
+        assert os.path.isdir(dn.path)
+
+        _DataManager._clean_generated_file(dn)
+
+        assert not os.path.exists(dn.path)
+
     @pytest.mark.parametrize(
         "storage_type,path",
         [
@@ -22,6 +22,7 @@ from taipy.common.config.common.scope import Scope
 from taipy.common.config.exceptions.exceptions import InvalidConfigurationId
 from taipy.core.data._data_manager import _DataManager
 from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data._edit_log import _EditLog
 from taipy.core.data.data_node import DataNode
 from taipy.core.data.data_node_id import DataNodeId
 from taipy.core.data.in_memory import InMemoryDataNode
@@ -692,6 +693,50 @@ class TestDataNode:
         assert last_edit["env"] == "staging"
         assert last_edit["timestamp"] == date
 
+    def test_track_edit_moves_old_edits_to_edit_log(self):
+        dn_config = Config.configure_data_node("A", max_edits=2)
+        data_node = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+
+        for i in range(5):
+            data_node.write(data=str(i), job_id=f"job_{i}")
+
+        assert len(data_node._edits) == 2
+        assert [edit["job_id"] for edit in data_node.edits] == [f"job_{i}" for i in range(5)]
+        assert isinstance(data_node.edits[0]["timestamp"], datetime)
+        assert data_node.get_last_edit()["job_id"] == "job_4"
+        assert data_node.job_ids == [f"job_{i}" for i in range(5)]
+        assert "max_edits" not in data_node._get_user_properties()
+
+        _DataManager._delete(data_node.id)
+        assert _EditLog._read(data_node.id) == []
+
+    def test_track_edit_bounded_by_core_property(self):
+        Config.configure_core(data_node_max_edits=1)
+        dn_config = Config.configure_data_node("A")
+        data_node = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+
+        data_node.write(data="1", job_id="job_1")
+        data_node.write(data="2", job_id="job_2")
+
+        assert [edit["job_id"] for edit in data_node._edits] == ["job_2"]
+        assert [edit["job_id"] for edit in data_node.edits] == ["job_1", "job_2"]
+
+    def test_read_chunks_splits_the_data(self):
+        dn = InMemoryDataNode("foo", Scope.SCENARIO, properties={"default_data": list(range(5))})
+        assert list(dn.read_chunks(chunk_size=2)) == [[0, 1], [2, 3], [4]]
+
+        dn = InMemoryDataNode("foo", Scope.SCENARIO, properties={"default_data": "not a sequence"})
+        assert list(dn.read_chunks(chunk_size=2)) == ["not a sequence"]
+
+        dn = InMemoryDataNode("foo", Scope.SCENARIO)
+        assert list(dn.read_chunks(chunk_size=2)) == []
+
+    def test_write_chunks_requires_append(self):
+        dn = InMemoryDataNode("foo", Scope.SCENARIO, properties={"default_data": [1]})
+        with pytest.raises(NotImplementedError):
+            dn.write_chunks([[2], [3]])
+        assert dn.read() == [1]
+
     def test_label(self):
         a_date = datetime.now()
         dn = DataNode(
@@ -0,0 +1,156 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pickle
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_read_cache import _DataReadCache
+from taipy.core.data.csv import CSVDataNode
+from taipy.core.data.pickle import PickleDataNode
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_cache():
+    _DataReadCache._clear()
+    yield
+    _DataReadCache._clear()
+
+
+@pytest.fixture
+def csv_dn(tmp_path):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "foo.csv")})
+    dn.write(pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}))
+    return dn
+
+
+def test_cache_is_disabled_by_default(csv_dn):
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck:
+        csv_dn.read()
+        csv_dn.read()
+        assert mck.call_count == 2
+
+
+def test_read_is_served_from_cache(csv_dn):
+    Config.configure_core(data_read_cache_size=10_000)
+
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck:
+        first = csv_dn.read()
+        second = csv_dn.read()
+        mck.assert_called_once()
+
+    assert_frame_equal(first, second)
+    assert first is not second
+
+
+def test_read_only_cache_hands_out_copies(csv_dn):
+    Config.configure_core(data_read_cache_size=10_000)
+
+    data = csv_dn.read()
+    data.loc[0, "a"] = 42
+
+    assert csv_dn.read().loc[0, "a"] == 1
+
+
+def test_read_only_cache_hands_out_read_only_numpy_arrays(tmp_path):
+    Config.configure_core(data_read_cache_size=10_000)
+    dn = PickleDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "foo.p")})
+    dn.write(np.arange(10))
+
+    array = dn.read()
+
+    assert not array.flags.writeable
+    with pytest.raises(ValueError):
+        array[0] = 42
+
+
+def test_writable_cache_hands_out_cached_data(csv_dn):
+    Config.configure_core(data_read_cache_size=10_000, data_read_cache_read_only=False)
+
+    assert csv_dn.read() is csv_dn.read()
+
+
+def test_write_append_and_track_edit_invalidate_entry(csv_dn):
+    Config.configure_core(data_read_cache_size=10_000)
+    csv_dn.read()
+
+    csv_dn.write(pd.DataFrame({"a": [7], "b": [8]}))
+    assert_frame_equal(csv_dn.read(), pd.DataFrame({"a": [7], "b": [8]}))
+
+    csv_dn.append(pd.DataFrame({"a": [9], "b": [10]}))
+    assert_frame_equal(csv_dn.read(), pd.DataFrame({"a": [7, 9], "b": [8, 10]}))
+
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck:
+        csv_dn.track_edit(comment="external edit")
+        csv_dn.read()
+        mck.assert_called_once()
+
+
+def test_change_from_another_process_invalidates_entry(csv_dn):
+    Config.configure_core(data_read_cache_size=10_000)
+    csv_dn.read()
+
+    pd.DataFrame({"a": [0], "b": [0]}).to_csv(csv_dn.path, index=False)
+    stat = os.stat(csv_dn.path)
+    os.utime(csv_dn.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert_frame_equal(csv_dn.read(), pd.DataFrame({"a": [0], "b": [0]}))
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    dns = []
+    for i in range(3):
+        dn = PickleDataNode(f"dn_{i}", Scope.SCENARIO, properties={"path": str(tmp_path / f"{i}.p")})
+        dn.write(np.zeros(100))
+        dns.append(dn)
+    Config.configure_core(data_read_cache_size=2_000)
+
+    with mock.patch("pickle.load", wraps=pickle.load) as mck:
+        dns[0].read()
+        dns[1].read()
+        dns[0].read()
+        dns[2].read()
+        assert mck.call_count == 3
+
+        dns[0].read()
+        assert mck.call_count == 3
+        dns[1].read()
+        assert mck.call_count == 4
+
+
+def test_data_larger_than_the_budget_is_not_cached(csv_dn):
+    Config.configure_core(data_read_cache_size=10)
+
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck:
+        csv_dn.read()
+        csv_dn.read()
+        assert mck.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [("has_header", False), ("encoding", "latin-1"), ("exposed_type", "numpy"), ("sheet_name", "Sheet2")],
+)
+def test_edited_read_property_invalidates_entry(csv_dn, name, value):
+    Config.configure_core(data_read_cache_size=10_000)
+    csv_dn.read()
+
+    csv_dn._properties[name] = value
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck:
+        csv_dn.read()
+        mck.assert_called_once()
@@ -375,6 +375,13 @@ class TestExcelDataNode:
                 },
             )
 
+        with pytest.raises(InvalidExposedType):
+            ExcelDataNode(
+                "foo",
+                Scope.SCENARIO,
+                properties={"default_path": path, "exposed_type": "arrow", "sheet_name": "Sheet1"},
+            )
+
     def test_get_system_modified_date_instead_of_last_edit_date(self, tmpdir_factory):
         temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.xlsx"))
         pd.DataFrame([]).to_excel(temp_file_path)
@@ -11,6 +11,7 @@
 
 import os
 import pathlib
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -117,3 +118,47 @@ def test_filter_numpy_exposed_type(csv_file):
         np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
     )
     assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+
+def test_filter_streams_the_file_by_chunks(csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "pandas"})
+    dn.write(pd.DataFrame({"foo": [1, 2, 1, 2, 1], "bar": [1, 2, 3, 4, 5]}))
+
+    with mock.patch.object(CSVDataNode, "_CSVDataNode__FILTER_CHUNK_SIZE", 2):
+        with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck:
+            filtered_data = dn.filter([("foo", 1, Operator.EQUAL), ("bar", 1, Operator.GREATER_THAN)])
+            assert mck.call_args.kwargs["chunksize"] == 2
+
+    expected_data = pd.DataFrame({"foo": [1, 1], "bar": [3, 5]})
+    assert_frame_equal(filtered_data.reset_index(drop=True), expected_data)
+
+    filtered_data = dn.filter(("foo", 3, Operator.EQUAL))
+    assert filtered_data.empty
+    assert list(filtered_data.columns) == ["foo", "bar"]
+
+
+def test_filter_keeps_the_dtypes_of_the_first_chunk(csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "pandas"})
+    dn.write(pd.DataFrame({"foo": [1, 2, 1, 2, 1], "bar": [1.0, 2.5, 3.0, 4.0, 5.0], "baz": [1, 2, "x", 4, 5]}))
+
+    with mock.patch.object(CSVDataNode, "_CSVDataNode__FILTER_CHUNK_SIZE", 2):
+        filtered_data = dn.filter(("foo", 1, Operator.EQUAL))
+
+    # The third row does not fit the integer dtype inferred for baz from the first chunk: the whole file is read.
+    expected_data = dn.read()[dn.read()["foo"] == 1]
+    assert_frame_equal(filtered_data, expected_data)
+    assert filtered_data["baz"].tolist() == ["1", "x", "5"]
+    assert filtered_data["bar"].dtype == np.float64
+
+
+def test_filter_reads_only_the_selected_columns(csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "pandas"})
+    dn.write(pd.DataFrame({"foo": [1, 2, 1], "bar": [1, 2, 3], "baz": ["a", "b", "c"]}))
+
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as mck:
+        filtered_data = dn.filter(("foo", 1, Operator.EQUAL), columns=["baz"])
+        assert mck.call_args.kwargs["usecols"] == ["baz", "foo"]
+    assert_frame_equal(filtered_data.reset_index(drop=True), pd.DataFrame({"baz": ["a", "c"]}))
+
+    filtered_data = dn.filter([("foo", 1, Operator.EQUAL), ("bar", 3, Operator.EQUAL)], columns=["bar", "foo"])
+    assert_frame_equal(filtered_data.reset_index(drop=True), pd.DataFrame({"bar": [3], "foo": [1]}))
@@ -13,8 +13,11 @@ from typing import Dict, List
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
+from taipy.common.config.common.scope import Scope
+from taipy.core.data.in_memory import InMemoryDataNode
 from taipy.core.data.operator import JoinOperator, Operator
 
 from .utils import (
@@ -203,6 +206,31 @@ def test_filter_numpy_exposed_type(default_data_frame):
     )
 
 
+def test_filter_arrow_table():
+    table = pa.table({"a": [1, 2, 3, None], "b": ["x", "y", "z", "t"]})
+    dn = InMemoryDataNode("foo", Scope.SCENARIO, properties={"default_data": table})
+
+    assert dn.filter(("a", 2, Operator.EQUAL)).to_pydict() == {"a": [2], "b": ["y"]}
+    assert dn.filter(("a", 2, Operator.NOT_EQUAL)).to_pydict() == {"a": [1, 3, None], "b": ["x", "z", "t"]}
+    assert dn.filter([("a", 1, Operator.GREATER_THAN), ("b", "z", Operator.LESS_THAN)]).to_pydict() == {
+        "a": [2],
+        "b": ["y"],
+    }
+    assert dn.filter(
+        [("a", 1, Operator.EQUAL), ("b", "z", Operator.GREATER_OR_EQUAL)], JoinOperator.OR
+    ).to_pydict() == {"a": [1, 3], "b": ["x", "z"]}
+
+    # Operators that cannot be expressed with pyarrow.compute are applied with pandas
+    filtered_table = dn.filter(("a", None, Operator.NOT_EQUAL))
+    assert isinstance(filtered_table, pa.Table)
+    assert filtered_table.num_rows == 4
+
+    assert dn["b"].to_pylist() == ["x", "y", "z", "t"]
+    assert dn[["b"]].column_names == ["b"]
+    assert dn[[True, False, True, False]].to_pydict() == {"a": [1, 3], "b": ["x", "z"]}
+    assert [chunk.num_rows for chunk in dn.read_chunks(chunk_size=3)] == [3, 1]
+
+
 def test_filter_by_get_item(default_data_frame):
     # get item for DataFrame data_type
     default_data_frame[1] = [100, 100]
@@ -12,9 +12,12 @@
 import os
 import pathlib
 from importlib import util
+from unittest import mock
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pandas.testing import assert_frame_equal
 
@@ -137,3 +140,60 @@ class TestFilterParquetDataNode:
             np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
         )
         assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+    def test_filter_is_pushed_down_to_pyarrow(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "pandas"})
+        dn.write(pd.DataFrame({"foo": [1, 2, 1, None], "bar": [1, 2, 3, 4]}))
+
+        with mock.patch("pandas.read_parquet", wraps=pd.read_parquet) as mck:
+            filtered_data = dn.filter([("foo", 1, Operator.NOT_EQUAL), ("bar", 1, Operator.GREATER_THAN)])
+            assert "filters" in mck.call_args.kwargs
+
+        expected_data = pd.DataFrame({"foo": [2.0, None], "bar": [2, 4]})
+        assert_frame_equal(filtered_data.reset_index(drop=True), expected_data)
+
+    @pytest.mark.parametrize("exposed_type", ["pandas", "arrow"])
+    def test_filter_reads_only_the_selected_columns(self, parquet_file_path, exposed_type):
+        dn = ParquetDataNode(
+            "foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": exposed_type}
+        )
+        dn.write(pd.DataFrame({"foo": [1, 2, 1], "bar": [1, 2, 3], "baz": ["a", "b", "c"]}))
+
+        with mock.patch("pyarrow.parquet.read_table", wraps=pq.read_table) as mck:
+            filtered_data = dn.filter(("foo", 1, Operator.EQUAL), columns=["baz"])
+            assert mck.call_args.kwargs["columns"] == ["baz", "foo"]
+        assert dict(filtered_data.to_pydict() if exposed_type == "arrow" else filtered_data.to_dict("list")) == {
+            "baz": ["a", "c"]
+        }
+
+        # The columns are selected even if the operators cannot be pushed down
+        filtered_data = dn.filter(("foo", None, Operator.NOT_EQUAL), columns=["bar"])
+        assert (filtered_data.column_names if exposed_type == "arrow" else list(filtered_data.columns)) == ["bar"]
+
+    def test_filter_arrow_exposed_type(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "arrow"})
+        dn.write(pa.table({"foo": [1, 2, 1, None], "bar": [1, 2, 3, 4]}))
+
+        with mock.patch("pyarrow.parquet.read_table", wraps=pq.read_table) as mck:
+            filtered_data = dn.filter([("foo", 1, Operator.NOT_EQUAL), ("bar", 1, Operator.GREATER_THAN)])
+            assert "filters" in mck.call_args.kwargs
+        assert filtered_data.equals(pa.table({"foo": [2, None], "bar": [2, 4]}))
+
+        filtered_data = dn.filter([("foo", 2, Operator.EQUAL), ("bar", 3, Operator.EQUAL)], JoinOperator.OR)
+        assert filtered_data.to_pydict() == {"foo": [2, 1], "bar": [2, 3]}
+
+        assert dn["bar"].to_pylist() == [1, 2, 3, 4]
+        assert dn[["bar"]].column_names == ["bar"]
+        assert dn[1:3].num_rows == 2
+
+    def test_filter_falls_back_to_in_memory_filtering(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "pandas"})
+        dn.write(pd.DataFrame({"foo": [1, 2, 1], "bar": ["a", "b", "c"]}))
+
+        with mock.patch("pandas.read_parquet", wraps=pd.read_parquet) as mck:
+            filtered_data = dn.filter(("foo", None, Operator.NOT_EQUAL))
+            assert "filters" not in mck.call_args.kwargs
+        assert len(filtered_data) == 3
+
+        with pytest.raises(TypeError):
+            dn.filter(("bar", 1, Operator.GREATER_THAN))
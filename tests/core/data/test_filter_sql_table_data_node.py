@@ -150,3 +150,28 @@ class TestFilterSQLTableDataNode:
             dn.filter([("bar", 1, Operator.EQUAL), ("bar", 2, Operator.EQUAL)], JoinOperator.OR)
 
             assert read_mock["_read"].call_count == 0
+
+    def test_filter_selects_columns_and_pages_in_query(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "exposed_type": "pandas",
+        }
+        dn = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"foo": [1, 1, 1, 2, 2, 2], "bar": [1, 2, 3, 1, 2, 3]}))
+
+        assert_frame_equal(
+            dn.filter(("bar", 2, Operator.GREATER_OR_EQUAL), columns=["foo"]), pd.DataFrame({"foo": [1, 1, 2, 2]})
+        )
+        assert_frame_equal(
+            dn.filter(("foo", 2, Operator.EQUAL), limit=2, offset=1), pd.DataFrame({"foo": [2, 2], "bar": [2, 3]})
+        )
+        assert_frame_equal(dn.filter(columns=["bar"], limit=2), pd.DataFrame({"bar": [1, 2]}))
+        assert_frame_equal(
+            dn.filter(("bar", "2", Operator.EQUAL)), pd.DataFrame({"foo": [1, 2], "bar": [2, 2]}), check_dtype=False
+        )
+        assert dn.filter(("bar", "1' OR '1'='1", Operator.EQUAL)).empty
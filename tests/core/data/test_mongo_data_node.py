@@ -172,6 +172,18 @@ class TestMongoCollectionDataNode:
         assert data[4].KWARGS_KEY == "KWARGS_VALUE"
         assert isinstance(data[5]._id, ObjectId)
 
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_read_chunks(self, properties):
+        mock_client = pymongo.MongoClient("localhost")
+        mock_client[properties["db_name"]][properties["collection_name"]].insert_many([{"foo": i} for i in range(5)])
+
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+        chunks = list(mongo_dn.read_chunks(chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [row.foo for chunk in chunks for row in chunk] == list(range(5))
+
     @mongomock.patch(servers=(("localhost", 27017),))
     @pytest.mark.parametrize("properties", __properties)
     def test_read_empty_as(self, properties):
@@ -359,6 +371,22 @@ class TestMongoCollectionDataNode:
             {},
         ]
 
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_filter_returns_only_the_selected_columns(self, properties):
+        mock_client = pymongo.MongoClient("localhost")
+        mock_client[properties["db_name"]][properties["collection_name"]].insert_many(
+            [{"foo": 1, "bar": 1, "baz": "a"}, {"foo": 2, "bar": 2, "baz": "b"}, {"foo": 1, "bar": 3, "baz": "c"}]
+        )
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+
+        filtered_data = mongo_dn.filter(("foo", 1, Operator.EQUAL), columns=["baz"])
+        assert [{k: v for k, v in m.__dict__.items() if k != "_id"} for m in filtered_data] == [
+            {"baz": "a"},
+            {"baz": "c"},
+        ]
+        assert len(mongo_dn.filter(columns=["bar"])) == 3
+
     @mongomock.patch(servers=(("localhost", 27017),))
     @pytest.mark.parametrize("properties", __properties)
     def test_filter_does_not_read_all_entities(self, properties):
@@ -0,0 +1,104 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import stat
+
+import numpy as np
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.npy import NpyDataNode
+from taipy.core.exceptions.exceptions import NoData
+
+
+@pytest.fixture
+def npy_file_path(tmp_path):
+    path = str(tmp_path / "matrix.npy")
+    np.save(path, np.arange(12, dtype=np.float64).reshape(3, 4))
+    return path
+
+
+class TestNpyDataNode:
+    def test_create_with_manager(self, npy_file_path):
+        npy_dn_config = Config.configure_npy_data_node(id="matrix", default_path=npy_file_path)
+        dn = _DataManagerFactory._build_manager()._create_and_set(npy_dn_config, None, None)
+
+        assert isinstance(dn, NpyDataNode)
+        assert dn.storage_type() == "npy"
+        assert dn.properties["mmap_mode"] == "r"
+        assert dn.is_ready_for_reading
+        assert dn._get_user_properties() == {}
+        np.testing.assert_array_equal(dn.read(), np.arange(12, dtype=np.float64).reshape(3, 4))
+
+    def test_read_is_memory_mapped_and_read_only(self, npy_file_path):
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_file_path})
+
+        data = dn.read()
+
+        assert isinstance(data, np.memmap)
+        assert not data.flags.writeable
+        with pytest.raises(ValueError):
+            data[0, 0] = 42
+
+    def test_read_without_memory_map(self, npy_file_path):
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_file_path, "mmap_mode": False})
+
+        data = dn.read()
+
+        assert not isinstance(data, np.memmap)
+        np.testing.assert_array_equal(data, np.arange(12, dtype=np.float64).reshape(3, 4))
+
+    def test_write_keeps_memory_mapped_arrays_valid(self, npy_file_path):
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_file_path})
+        previous = dn.read()
+
+        dn.write([[1, 2], [3, 4]])
+
+        np.testing.assert_array_equal(dn.read(), np.array([[1, 2], [3, 4]]))
+        np.testing.assert_array_equal(previous, np.arange(12, dtype=np.float64).reshape(3, 4))
+        assert os.listdir(os.path.dirname(npy_file_path)) == ["matrix.npy"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="The file mode bits are not supported on Windows")
+    def test_write_keeps_the_file_mode(self, tmp_path, npy_file_path):
+        os.chmod(npy_file_path, 0o640)
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_file_path})
+        dn.write([1, 2, 3])
+        assert stat.S_IMODE(os.stat(npy_file_path).st_mode) == 0o640
+
+        umask = os.umask(0o022)
+        try:
+            new_path = str(tmp_path / "new.npy")
+            NpyDataNode("foo", Scope.SCENARIO, properties={"path": new_path}).write([1, 2, 3])
+        finally:
+            os.umask(umask)
+        assert stat.S_IMODE(os.stat(new_path).st_mode) == 0o644
+
+    def test_read_and_write_generated_file(self):
+        no_data_dn = NpyDataNode("foo", Scope.SCENARIO)
+        with pytest.raises(NoData):
+            no_data_dn.read_or_raise()
+
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"default_data": [1, 2, 3]})
+        assert dn.is_generated
+        assert dn.path.endswith(".npy")
+        np.testing.assert_array_equal(dn.read(), np.array([1, 2, 3]))
+
+        os.remove(dn.path)
+
+    def test_read_chunks_slices_the_memory_mapped_array(self, npy_file_path):
+        dn = NpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_file_path})
+
+        chunks = list(dn.read_chunks(chunk_size=2))
+
+        assert [chunk.shape for chunk in chunks] == [(2, 4), (1, 4)]
@@ -235,6 +235,17 @@ class TestParquetDataNode:
         assert ".data" not in dn.path
         assert os.path.exists(dn.path)
 
+    def test_migrate_a_dataset_directory_to_new_path(self, tmp_path):
+        path = os.path.join(tmp_path, ".data", "test.parquet")
+        os.makedirs(path)
+        pd.DataFrame([{"a": 1}]).to_parquet(os.path.join(path, "part-0.parquet"))
+
+        dn = ParquetDataNode("foo_bar", Scope.SCENARIO, properties={"path": path})
+
+        assert ".data" not in dn.path
+        assert os.path.isdir(dn.path)
+        assert_frame_equal(dn.read(), pd.DataFrame([{"a": 1}]))
+
     def test_is_downloadable(self):
         path = os.path.join(pathlib.Path(__file__).parent.resolve(), "data_sample/example.parquet")
         dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path, "exposed_type": "pandas"})
@@ -272,6 +283,17 @@ class TestParquetDataNode:
         dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path})
         assert dn._get_downloadable_path() == ""
 
+    def test_get_downloadable_path_of_an_appended_dataset_directory(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path})
+        dn.append(pd.DataFrame([{"a": 7, "b": 8, "c": 9}]))
+        expected = dn.read()
+        assert os.path.isdir(parquet_file_path)
+
+        assert dn.is_downloadable()
+        assert dn._get_downloadable_path() == parquet_file_path
+        assert os.path.isfile(parquet_file_path)
+        assert_frame_equal(pd.read_parquet(parquet_file_path), expected)
+
     def test_upload(self, parquet_file_path, tmpdir_factory):
         old_parquet_path = tmpdir_factory.mktemp("data").join("df.parquet").strpath
         old_data = pd.DataFrame([{"a": 0, "b": 1, "c": 2}, {"a": 3, "b": 4, "c": 5}])
@@ -289,6 +311,18 @@ class TestParquetDataNode:
         assert dn.last_edit_date > old_last_edit_date
         assert dn.path == old_parquet_path  # The path of the dn should not change
 
+    def test_upload_replaces_the_appended_dataset_directory(self, parquet_file_path, tmpdir_factory):
+        old_parquet_path = tmpdir_factory.mktemp("data").join("df.parquet").strpath
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": old_parquet_path})
+        dn.write(pd.DataFrame([{"a": 0, "b": 1, "c": 2}]))
+        dn.append(pd.DataFrame([{"a": 3, "b": 4, "c": 5}]))
+        assert os.path.isdir(old_parquet_path)
+
+        dn._upload(parquet_file_path)
+
+        assert os.path.isfile(old_parquet_path)
+        assert_frame_equal(dn.read(), pd.read_parquet(parquet_file_path))
+
     def test_upload_with_upload_check_pandas(self, parquet_file_path, tmpdir_factory):
         old_parquet_path = tmpdir_factory.mktemp("data").join("df.parquet").strpath
         old_data = pd.DataFrame([{"a": 0, "b": 1, "c": 2}, {"a": 3, "b": 4, "c": 5}])
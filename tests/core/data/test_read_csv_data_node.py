@@ -15,6 +15,7 @@ import pathlib
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from taipy.common.config.common.scope import Scope
@@ -56,6 +57,16 @@ def test_read_with_header_numpy():
     assert np.array_equal(data_numpy, pd.read_csv(csv_file_path).to_numpy())
 
 
+def test_read_with_header_arrow():
+    csv_data_node_as_arrow = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": "arrow"}
+    )
+    data_arrow = csv_data_node_as_arrow.read()
+    assert isinstance(data_arrow, pa.Table)
+    assert data_arrow.num_rows == 10
+    assert pd.DataFrame.equals(data_arrow.to_pandas(), pd.read_csv(csv_file_path))
+
+
 def test_read_with_header_custom_exposed_type():
     data_pandas = pd.read_csv(csv_file_path)
 
@@ -100,6 +111,16 @@ def test_read_without_header_numpy():
     assert np.array_equal(data_numpy, pd.read_csv(csv_file_path, header=None).to_numpy())
 
 
+def test_read_without_header_arrow():
+    csv_data_node_as_arrow = CSVDataNode(
+        "qux", Scope.SCENARIO, properties={"path": csv_file_path, "has_header": False, "exposed_type": "arrow"}
+    )
+    data_arrow = csv_data_node_as_arrow.read()
+    assert isinstance(data_arrow, pa.Table)
+    assert data_arrow.num_rows == 11
+    assert data_arrow.column_names == ["f0", "f1", "f2"]
+
+
 def test_read_without_header_custom_exposed_type():
     csv_data_node_as_custom_object = CSVDataNode(
         "quux", Scope.SCENARIO, properties={"path": csv_file_path, "has_header": False, "exposed_type": MyCustomObject}
@@ -114,3 +135,45 @@ def test_read_without_header_custom_exposed_type():
         assert row_pandas[0] == row_custom.id
         assert str(row_pandas[1]) == row_custom.integer
         assert row_pandas[2] == row_custom.text
+
+
+def test_read_chunks_pandas():
+    csv_data_node_as_pandas = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path})
+    chunks = list(csv_data_node_as_pandas.read_chunks(chunk_size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert all(isinstance(chunk, pd.DataFrame) for chunk in chunks)
+    assert pd.DataFrame.equals(pd.concat(chunks), pd.read_csv(csv_file_path))
+
+
+def test_read_chunks_numpy():
+    csv_data_node_as_numpy = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": "numpy"}
+    )
+    chunks = list(csv_data_node_as_numpy.read_chunks(chunk_size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert np.array_equal(np.concatenate(chunks), pd.read_csv(csv_file_path).to_numpy())
+
+
+def test_read_chunks_arrow():
+    csv_data_node_as_arrow = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": "arrow"}
+    )
+    chunks = list(csv_data_node_as_arrow.read_chunks(chunk_size=4))
+    assert [chunk.num_rows for chunk in chunks] == [4, 4, 2]
+    assert pd.DataFrame.equals(pa.concat_tables(chunks).to_pandas(), pd.read_csv(csv_file_path))
+
+
+def test_read_chunks_custom_exposed_type():
+    csv_data_node_as_custom_object = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": MyCustomObject}
+    )
+    chunks = list(csv_data_node_as_custom_object.read_chunks(chunk_size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    data_custom = [row for chunk in chunks for row in chunk]
+    assert all(isinstance(row, MyCustomObject) for row in data_custom)
+    assert [row.id for row in data_custom] == [row.id for row in csv_data_node_as_custom_object.read()]
+
+
+def test_read_chunks_never_written():
+    not_existing_csv = CSVDataNode("foo", Scope.SCENARIO, properties={"path": "WRONG.csv", "has_header": True})
+    assert list(not_existing_csv.read_chunks()) == []
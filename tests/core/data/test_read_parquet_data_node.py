@@ -12,9 +12,11 @@
 import os
 import pathlib
 from importlib import util
+from unittest import mock
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from taipy.common.config.common.scope import Scope
@@ -93,6 +95,23 @@ class TestReadParquetDataNode:
         assert len(data_numpy) == 2
         assert np.array_equal(data_numpy, df.to_numpy())
 
+    def test_read_parquet_file_arrow(self, parquet_file_path):
+        df = pd.read_parquet(parquet_file_path)
+        dn = ParquetDataNode("bar", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "arrow"})
+        with mock.patch("pandas.read_parquet") as mck:
+            data_arrow = dn.read()
+            mck.assert_not_called()
+        assert isinstance(data_arrow, pa.Table)
+        assert data_arrow.num_rows == 2
+        assert data_arrow.to_pandas().equals(df)
+
+        dn = ParquetDataNode(
+            "bar",
+            Scope.SCENARIO,
+            properties={"path": parquet_file_path, "exposed_type": "arrow", "read_kwargs": {"columns": ["a"]}},
+        )
+        assert dn.read().column_names == ["a"]
+
     def test_read_custom_exposed_type(self):
         example_parquet_path = os.path.join(pathlib.Path(__file__).parent.resolve(), "data_sample/example.parquet")
 
@@ -186,3 +205,26 @@ class TestReadParquetDataNode:
         path = "data/node/path"
         dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path})
         assert dn.read_with_kwargs() is None
+
+    def test_read_chunks(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        df = pd.DataFrame({"a": range(10), "b": range(10, 20)})
+        df.to_parquet(temp_file_path, row_group_size=3)
+
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        chunks = list(dn.read_chunks(chunk_size=4))
+        assert all(len(chunk) <= 4 for chunk in chunks)
+        assert pd.concat(chunks).reset_index(drop=True).equals(df)
+
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path, "exposed_type": "numpy"})
+        assert np.array_equal(np.concatenate(list(dn.read_chunks(chunk_size=4))), df.to_numpy())
+
+        dn = ParquetDataNode(
+            "foo", Scope.SCENARIO, properties={"path": temp_file_path, "read_kwargs": {"columns": ["b"]}}
+        )
+        assert pd.concat(dn.read_chunks(chunk_size=4)).reset_index(drop=True).equals(df[["b"]])
+
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path, "exposed_type": "arrow"})
+        chunks = list(dn.read_chunks(chunk_size=4))
+        assert all(isinstance(chunk, pa.Table) and chunk.num_rows <= 4 for chunk in chunks)
+        assert pa.concat_tables(chunks).to_pandas().equals(df)
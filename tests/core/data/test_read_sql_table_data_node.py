@@ -14,6 +14,7 @@ from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from taipy.common.config.common.scope import Scope
@@ -170,38 +171,39 @@ class TestReadSQLTableDataNode:
             properties=custom_properties,
         )
 
-        assert sql_data_node._get_read_query(("key", 1, Operator.EQUAL)) == "SELECT * FROM example WHERE key = '1'"
-        assert sql_data_node._get_read_query(("key", 1, Operator.NOT_EQUAL)) == "SELECT * FROM example WHERE key <> '1'"
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.GREATER_THAN)) == "SELECT * FROM example WHERE key > '1'"
-        )
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.GREATER_OR_EQUAL))
-            == "SELECT * FROM example WHERE key >= '1'"
-        )
-        assert sql_data_node._get_read_query(("key", 1, Operator.LESS_THAN)) == "SELECT * FROM example WHERE key < '1'"
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.LESS_OR_EQUAL))
-            == "SELECT * FROM example WHERE key <= '1'"
-        )
+        assert str(sql_data_node._get_read_query()) == "SELECT * FROM example"
+
+        for operator, sql_operator in [
+            (Operator.EQUAL, "="),
+            (Operator.NOT_EQUAL, "!="),
+            (Operator.GREATER_THAN, ">"),
+            (Operator.GREATER_OR_EQUAL, ">="),
+            (Operator.LESS_THAN, "<"),
+            (Operator.LESS_OR_EQUAL, "<="),
+        ]:
+            query = sql_data_node._get_read_query(("key", 1, operator))
+            assert " ".join(str(query).split()) == f"SELECT * FROM example WHERE key {sql_operator} :key_1"
+            assert query.compile().params == {"key_1": 1}
 
         with pytest.raises(NotImplementedError):
             sql_data_node._get_read_query(
                 [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], "SOME JoinOperator"
             )
 
-        assert (
-            sql_data_node._get_read_query(
-                [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.AND
-            )
-            == "SELECT * FROM example WHERE key = '1' AND key2 > '2'"
+        query = sql_data_node._get_read_query(
+            [("key", 1, Operator.EQUAL), ("key2", "a'b", Operator.GREATER_THAN)], JoinOperator.AND
         )
-        assert (
-            sql_data_node._get_read_query(
-                [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.OR
-            )
-            == "SELECT * FROM example WHERE key = '1' OR key2 > '2'"
+        assert " ".join(str(query).split()) == "SELECT * FROM example WHERE key = :key_1 AND key2 > :key2_1"
+        assert query.compile().params == {"key_1": 1, "key2_1": "a'b"}
+
+        query = sql_data_node._get_read_query(
+            [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.OR
         )
+        assert " ".join(str(query).split()) == "SELECT * FROM example WHERE key = :key_1 OR key2 > :key2_1"
+
+        query = sql_data_node._get_read_query(columns=["key", "key2"], limit=10, offset=20)
+        assert " ".join(str(query).split()) == "SELECT key, key2 FROM example LIMIT :param_1 OFFSET :param_2"
+        assert query.compile().params == {"param_1": 10, "param_2": 20}
 
     @pytest.mark.parametrize("sql_properties", __sql_properties)
     def test_read_numpy(self, sql_properties):
@@ -272,3 +274,48 @@ class TestReadSQLTableDataNode:
         data = dn.read()
 
         assert data.equals(pd.DataFrame([{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}]))
+
+    def test_read_chunks(self, tmp_sqlite_db_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_db_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        chunks = list(dn.read_chunks(chunk_size=1))
+        assert len(chunks) == 2
+        assert chunks[0].equals(pd.DataFrame([{"foo": 1, "bar": 2}]))
+        assert chunks[1].equals(pd.DataFrame([{"foo": 3, "bar": 4}]))
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": "numpy"})
+        assert np.array_equal(np.concatenate(list(dn.read_chunks(chunk_size=1))), np.array([[1, 2], [3, 4]]))
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": "arrow"})
+        chunks = list(dn.read_chunks(chunk_size=1))
+        assert [chunk.to_pylist() for chunk in chunks] == [[{"foo": 1, "bar": 2}], [{"foo": 3, "bar": 4}]]
+
+    def test_read_arrow(self, tmp_sqlite_db_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_db_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "exposed_type": "arrow",
+        }
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        data = dn.read()
+        assert isinstance(data, pa.Table)
+        assert data.equals(pa.table({"foo": [1, 3], "bar": [2, 4]}))
+
+        filtered_data = dn.filter(("foo", 1, Operator.GREATER_THAN), columns=["bar"])
+        assert filtered_data.equals(pa.table({"bar": [4]}))
+
+        dn.write(pa.table({"foo": [5], "bar": [6]}))
+        assert dn.read().to_pylist() == [{"foo": 5, "bar": 6}]
@@ -404,3 +404,20 @@ class TestSQLDataNode:
             dn.filter([("bar", 1, Operator.EQUAL), ("bar", 2, Operator.EQUAL)], JoinOperator.OR)
 
             assert read_mock["_read"].call_count == 0
+
+    def test_filter_wraps_read_query(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "read_query": "SELECT foo, bar FROM example WHERE foo > 0;",
+            "write_query_builder": my_write_query_builder_with_pandas,
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "exposed_type": "pandas",
+        }
+        dn = SQLDataNode("foo", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"foo": [0, 1, 1, 2, 2], "bar": [9, 1, 2, 1, 2]}))
+
+        assert_frame_equal(dn.filter(("bar", 2, Operator.EQUAL), columns=["foo"]), pd.DataFrame({"foo": [1, 2]}))
+        assert_frame_equal(dn.filter(limit=1, offset=2), pd.DataFrame({"foo": [2], "bar": [1]}))
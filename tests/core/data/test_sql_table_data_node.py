@@ -17,6 +17,7 @@ import pytest
 from taipy.common.config import Config
 from taipy.common.config.common.scope import Scope
 from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data._sql_engine_registry import _SQLEngineRegistry
 from taipy.core.data.data_node_id import DataNodeId
 from taipy.core.data.sql_table import SQLTableDataNode
 from taipy.core.exceptions.exceptions import InvalidExposedType, MissingRequiredProperty
@@ -179,3 +180,37 @@ class TestSQLTableDataNode:
 
             dn.some_random_attribute_that_does_not_related_to_engine = "foo"
             assert dn._engine is not None
+
+    def test_engine_is_shared_across_data_node_instances(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        dn_config = Config.configure_sql_table_data_node(
+            "foo",
+            db_name=db_name,
+            db_engine="sqlite",
+            table_name="example",
+            sqlite_folder_path=folder_path,
+            sqlite_file_extension=file_extension,
+            db_pool_size=3,
+            db_pool_recycle=60,
+        )
+        dn = _DataManagerFactory._build_manager()._create_and_set(dn_config, None, None)
+        engine = dn._get_engine()
+
+        assert engine.pool.size() == 3
+        assert engine.pool._recycle == 60
+        assert _DataManagerFactory._build_manager()._get(dn.id)._get_engine() is engine
+
+        other_dn = SQLTableDataNode("bar", Scope.SCENARIO, properties={**dn.properties, "db_pool_size": 4})
+        assert other_dn._get_engine() is not engine
+
+        _SQLEngineRegistry._dispose()
+        assert _DataManagerFactory._build_manager()._get(dn.id)._get_engine() is not engine
+
+    def test_engines_are_reset_after_fork(self):
+        engine = _SQLEngineRegistry._get_engine("sqlite://")
+
+        with patch.object(engine, "dispose") as dispose_mock:
+            _SQLEngineRegistry._reset_after_fork()
+            dispose_mock.assert_called_once_with(close=False)
+
+        assert _SQLEngineRegistry._get_engine("sqlite://") is not engine
@@ -188,3 +188,24 @@ def test_write_with_column_names(tmp_csv_file):
     csv_dn.write_with_column_names(data, columns)
     df = pd.DataFrame(data, columns=columns)
     assert pd.DataFrame.equals(df, csv_dn.read())
+
+
+def test_write_chunks(tmp_csv_file):
+    csv_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file})
+    chunks = (pd.DataFrame({"a": [i, i + 1], "b": [i * 10, i * 10 + 10]}) for i in range(0, 6, 2))
+
+    csv_dn.write_chunks(chunks, job_id="a_job")
+
+    assert_frame_equal(csv_dn.read(), pd.DataFrame({"a": list(range(6)), "b": list(range(0, 60, 10))}))
+    assert len(csv_dn.edits) == 1
+    assert csv_dn.edits[0]["job_id"] == "a_job"
+
+
+def test_write_no_chunk_leaves_the_data_node_untouched(tmp_csv_file):
+    csv_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file})
+    csv_dn.write(pd.DataFrame({"a": [1], "b": [2]}))
+
+    csv_dn.write_chunks([])
+
+    assert_frame_equal(csv_dn.read(), pd.DataFrame({"a": [1], "b": [2]}))
+    assert len(csv_dn.edits) == 1
@@ -12,6 +12,7 @@
 import dataclasses
 import os
 import pathlib
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -425,3 +426,20 @@ def test_append_pandas_multisheet(excel_file_with_multi_sheet, default_multi_she
             [default_multi_sheet_data_frame["Sheet2"], pd.DataFrame(content["Sheet2"], columns=["a", "b", "c"])]
         ).reset_index(drop=True),
     )
+
+
+def test_append_streams_rows_to_each_sheet(excel_file_with_multi_sheet, default_multi_sheet_data_frame):
+    dn = ExcelDataNode(
+        "foo", Scope.SCENARIO, properties={"path": excel_file_with_multi_sheet, "sheet_name": ["Sheet1", "Sheet2"]}
+    )
+    content = {"Sheet2": pd.DataFrame([{"a": 77, "b": 88, "c": 99}])}
+
+    with mock.patch("pandas.ExcelWriter") as mck:
+        dn.append(content)
+        mck.assert_not_called()
+
+    assert_frame_equal(dn.read()["Sheet1"], default_multi_sheet_data_frame["Sheet1"])
+    assert_frame_equal(
+        dn.read()["Sheet2"],
+        pd.concat([default_multi_sheet_data_frame["Sheet2"], content["Sheet2"]]).reset_index(drop=True),
+    )
@@ -15,6 +15,8 @@ from importlib import util
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pandas.testing import assert_frame_equal
 
@@ -109,6 +111,25 @@ class TestWriteParquetDataNode:
         parquet_dn.write(None)
         assert parquet_dn.read().size == 0
 
+    def test_write_arrow(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        parquet_dn = ParquetDataNode(
+            "foo", Scope.SCENARIO, properties={"path": temp_file_path, "exposed_type": "arrow"}
+        )
+
+        table = pa.table({"a": [11, 44], "b": ["x", "y"]})
+        parquet_dn.write(table)
+
+        dn_data = parquet_dn.read()
+        assert isinstance(dn_data, pa.Table)
+        assert dn_data.equals(table)
+
+        parquet_dn.write(pd.DataFrame({"a": [1, 2, 3]}))
+        assert parquet_dn.read().equals(pa.table({"a": [1, 2, 3]}))
+
+        parquet_dn.append(pa.table({"a": [4]}))
+        assert parquet_dn.read().column("a").to_pylist() == [1, 2, 3, 4]
+
     def test_write_custom_exposed_type(self, tmpdir_factory):
         temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
         parquet_dn = ParquetDataNode(
@@ -234,3 +255,66 @@ class TestWriteParquetDataNode:
             dn.read(),
             pd.concat([default_data_frame, pd.DataFrame(content, columns=["a", "b", "c"])]).reset_index(drop=True),
         )
+
+    @pytest.mark.parametrize("exposed_type", ["pandas", "arrow"])
+    def test_append_adds_files_to_a_dataset_directory(self, parquet_file_path, default_data_frame, exposed_type):
+        dn = ParquetDataNode(
+            "foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": exposed_type}
+        )
+        first = pd.DataFrame([{"a": 11, "b": 22, "c": 33}])
+        second = pd.DataFrame([{"a": 44, "b": 55, "c": 66}])
+
+        dn.append(first if exposed_type == "pandas" else pa.Table.from_pandas(first))
+        dn.append(second if exposed_type == "pandas" else pa.Table.from_pandas(second))
+
+        assert os.path.isdir(parquet_file_path)
+        assert len(os.listdir(parquet_file_path)) == 3
+        expected = pd.concat([default_data_frame, first, second]).reset_index(drop=True)
+        data = dn.read()
+        if exposed_type == "arrow":
+            assert isinstance(data, pa.Table)
+            data = data.to_pandas()
+        assert_frame_equal(data, expected)
+
+    def test_compact(self, parquet_file_path, default_data_frame):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path})
+        dn.append(pd.DataFrame([{"a": 11, "b": 22, "c": 33}]))
+        dn.append(pd.DataFrame([{"a": 44, "b": 55, "c": 66}]))
+        expected = dn.read()
+
+        dn.compact()
+
+        assert os.path.isfile(parquet_file_path)
+        assert os.listdir(os.path.dirname(parquet_file_path)) == [os.path.basename(parquet_file_path)]
+        assert_frame_equal(dn.read(), expected)
+        assert pq.ParquetFile(parquet_file_path).metadata.num_rows == 4
+
+    def test_write_after_append_replaces_the_dataset_directory(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path})
+        dn.append(pd.DataFrame([{"a": 11, "b": 22, "c": 33}]))
+        assert os.path.isdir(parquet_file_path)
+
+        dn.write(pd.DataFrame([{"a": 7, "b": 8, "c": 9}]))
+
+        assert os.path.isfile(parquet_file_path)
+        assert_frame_equal(dn.read(), pd.DataFrame([{"a": 7, "b": 8, "c": 9}]))
+
+    def test_read_chunks_streams_the_dataset_directory(self, parquet_file_path, default_data_frame):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path})
+        dn.append(pd.DataFrame([{"a": 11, "b": 22, "c": 33}, {"a": 44, "b": 55, "c": 66}]))
+
+        chunks = list(dn.read_chunks(chunk_size=1))
+
+        assert os.path.isdir(parquet_file_path)
+        assert [len(chunk) for chunk in chunks] == [1, 1, 1, 1]
+        assert_frame_equal(pd.concat(chunks).reset_index(drop=True), dn.read())
+
+    def test_write_chunks(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        chunks = [pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}), pd.DataFrame({"a": [3], "b": ["z"]})]
+
+        dn.write_chunks(iter(chunks))
+
+        assert_frame_equal(dn.read(), pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}))
+        assert [len(chunk) for chunk in dn.read_chunks(chunk_size=2)] == [2, 1]
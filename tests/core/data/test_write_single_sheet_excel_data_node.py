@@ -11,6 +11,8 @@
 import dataclasses
 import os
 import pathlib
+import stat
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -432,3 +434,39 @@ def test_append_only_first_sheet_of_a_multisheet_file(
         ).reset_index(drop=True),
     )
     assert_frame_equal(dn.read()["Sheet2"], default_multi_sheet_data_frame["Sheet2"])
+
+
+def test_append_streams_rows_without_rewriting_the_workbook(excel_file, default_data_frame):
+    dn = ExcelDataNode("foo", Scope.SCENARIO, properties={"path": excel_file, "sheet_name": "Sheet1"})
+    content = pd.DataFrame({"a": [11, None], "b": [22.5, 55.5], "c": ["<x&y>", True]})
+
+    with mock.patch("pandas.ExcelWriter") as mck:
+        dn.append(content)
+        mck.assert_not_called()
+
+    expected = pd.concat([default_data_frame, content]).reset_index(drop=True)
+    assert_frame_equal(dn.read(), expected, check_dtype=False)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="The file mode bits are not supported on Windows")
+def test_append_keeps_the_file_mode(excel_file):
+    os.chmod(excel_file, 0o640)
+    dn = ExcelDataNode("foo", Scope.SCENARIO, properties={"path": excel_file, "sheet_name": "Sheet1"})
+
+    with mock.patch("pandas.ExcelWriter") as mck:
+        dn.append(pd.DataFrame({"a": [11], "b": [22], "c": [33]}))
+        mck.assert_not_called()
+
+    assert stat.S_IMODE(os.stat(excel_file).st_mode) == 0o640
+
+
+def test_append_values_with_a_style_falls_back_to_pandas(excel_file, default_data_frame):
+    dn = ExcelDataNode("foo", Scope.SCENARIO, properties={"path": excel_file, "sheet_name": "Sheet1"})
+    content = pd.DataFrame({"a": [pd.Timestamp("2024-01-01")], "b": [22], "c": [33]})
+
+    with mock.patch("taipy.core.data.excel.pd.ExcelWriter", wraps=pd.ExcelWriter) as mck:
+        dn.append(content)
+        mck.assert_called_once()
+
+    assert len(dn.read()) == len(default_data_frame) + 1
+    assert dn.read()["a"].iloc[-1] == pd.Timestamp("2024-01-01")
@@ -16,6 +16,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
+from sqlalchemy import Table
 
 from taipy.common.config.common.scope import Scope
 from taipy.core.data.sql_table import SQLTableDataNode
@@ -187,3 +188,108 @@ class TestWriteSQLTableDataNode:
         append_data_1 = pd.DataFrame([{"foo": 5, "bar": 6}, {"foo": 7, "bar": 8}])
         dn.append(append_data_1)
         assert_frame_equal(dn.read(), pd.concat([original_data, append_data_1]).reset_index(drop=True))
+
+    def test_sqlite_write_chunks(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        chunks = [pd.DataFrame([{"foo": 5, "bar": 6}]), pd.DataFrame([{"foo": 7, "bar": 8}])]
+        dn.write_chunks(chunks)
+        assert_frame_equal(dn.read(), pd.DataFrame([{"foo": 5, "bar": 6}, {"foo": 7, "bar": 8}]))
+
+        def failing_chunks():
+            yield pd.DataFrame([{"foo": 9, "bar": 10}])
+            raise ValueError("Chunk can not be built")
+
+        with pytest.raises(ValueError):
+            dn.write_chunks(failing_chunks())
+        assert_frame_equal(dn.read(), pd.DataFrame([{"foo": 5, "bar": 6}, {"foo": 7, "bar": 8}]))
+
+    def test_sqlite_write_reflects_the_table_once(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        with patch("taipy.core.data.sql_table.Table", wraps=Table) as mck:
+            dn.write(pd.DataFrame([{"foo": 1, "bar": 2}]))
+            dn.append(pd.DataFrame([{"foo": 3, "bar": 4}]))
+            assert mck.call_count == 1
+
+        assert_frame_equal(dn.read(), pd.DataFrame([{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}]))
+
+    @pytest.mark.parametrize("insert_method", [None, "multi"])
+    def test_sqlite_write_by_batches(self, tmp_sqlite_sqlite3_file_path, insert_method):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "insert_batch_size": 2,
+            "insert_method": insert_method,
+        }
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        data = pd.DataFrame({"foo": range(5), "bar": [1.5, None, 2.5, None, 3.5]})
+        dn.write(data)
+
+        assert_frame_equal(dn.read(), data, check_dtype=False)
+
+    def test_sqlite_write_nullable_integers(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"foo": pd.array([1, pd.NA, 3], dtype="Int64"), "bar": [np.int64(2), np.nan, 6]}))
+
+        with dn._get_engine().connect() as connection:
+            types = connection.exec_driver_sql("SELECT typeof(foo), typeof(bar) FROM example").fetchall()
+        assert types == [("integer", "integer"), ("null", "null"), ("integer", "integer")]
+        assert_frame_equal(dn.read(), pd.DataFrame({"foo": [1, None, 3], "bar": [2.0, None, 6.0]}), check_dtype=False)
+
+    def test_sqlite_write_reflects_an_altered_table_again(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame([{"foo": 1, "bar": 2}]))
+        with dn._get_engine().connect() as connection:
+            connection.exec_driver_sql("ALTER TABLE example ADD COLUMN baz int")
+            connection.commit()
+
+        data = pd.DataFrame([{"foo": 3, "bar": 4, "baz": 5}])
+        dn.write(data)
+        assert_frame_equal(dn.read(), data)
+
+        with patch.object(SQLTableDataNode, "_insert_dataframe", side_effect=ValueError):
+            with pytest.raises(ValueError):
+                dn.write(data)
+        with patch("taipy.core.data.sql_table.Table", wraps=Table) as mck:
+            dn.write(data)
+            assert mck.call_count == 1
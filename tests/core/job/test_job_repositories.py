@@ -34,6 +34,18 @@ class TestJobRepository:
         obj = repository._load(job.id)
         assert isinstance(obj, Job)
 
+    def test_save_and_load_read_durations(self, data_node, job):
+        _DataFSRepository()._save(data_node)
+        task = Task("task_config_id", {}, print, [data_node], [data_node])
+        _TaskFSRepository()._save(task)
+        job._task = task
+        job._read_durations = {data_node.id: 0.25}
+
+        repository = _JobFSRepository()
+        repository._save(job)
+
+        assert repository._load(job.id).read_durations == {data_node.id: 0.25}
+
     def test_exists(self, data_node, job):
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
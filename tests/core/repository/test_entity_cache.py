@@ -0,0 +1,102 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.core._repository._entity_cache import _EntityCache
+from taipy.core.exceptions.exceptions import ModelNotFound
+
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+
+
+@pytest.fixture
+def repository():
+    Config.configure_core(repository_properties={"entity_cache_size": 2})
+    return MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+
+
+def test_cache_is_disabled_by_default():
+    r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    r._save(MockObj("uuid", "foo"))
+
+    assert r._entity_cache is None
+    assert r._load("uuid").name == "foo"
+
+
+def test_load_is_served_from_cache(repository):
+    repository._save(MockObj("uuid", "foo"))
+
+    with mock.patch.object(MockConverter, "_model_to_entity", wraps=MockConverter._model_to_entity) as converter:
+        with mock.patch("pathlib.Path.open") as mck_open:
+            first = repository._load("uuid")
+            second = repository._load("uuid")
+            mck_open.assert_not_called()
+        converter.assert_called_once()
+
+    assert first.name == second.name == "foo"
+    assert first is not second
+
+
+def test_returned_entities_do_not_share_state(repository):
+    repository._save(MockObj("uuid", "foo"))
+
+    entity = repository._load("uuid")
+    entity.name = "bar"
+
+    assert repository._load("uuid").name == "foo"
+
+
+def test_change_from_another_process_invalidates_entry(repository):
+    repository._save(MockObj("uuid", "foo"))
+    assert repository._load("uuid").name == "foo"
+
+    path = repository.dir_path / "uuid.json"
+    content = json.loads(path.read_text())
+    content["name"] = "barbaz"
+    path.write_text(json.dumps(content))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert repository._load("uuid").name == "barbaz"
+
+
+def test_delete_invalidates_entry(repository):
+    repository._save(MockObj("uuid", "foo"))
+    repository._save(MockObj("uuid_2", "bar"))
+    repository._load("uuid")
+
+    repository._delete("uuid")
+    with pytest.raises(ModelNotFound):
+        repository._load("uuid")
+
+    repository._delete_all()
+    with pytest.raises(ModelNotFound):
+        repository._load("uuid_2")
+
+
+def test_cache_is_bounded():
+    cache = _EntityCache(2)
+    for i in range(3):
+        cache._put(f"key_{i}", 0, f"content_{i}")
+
+    assert cache._get("key_0", 0) is None
+    assert cache._get("key_1", 0) == "content_1"
+    assert cache._get("key_2", 0) == "content_2"
+
+    cache._resize(1)
+    assert cache._get("key_1", 0) is None
+    assert cache._get("key_2", 1) is None
+    assert cache._get("key_2", 0) is None
@@ -0,0 +1,111 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest import mock
+
+import pytest
+
+from taipy.core._repository._filesystem_index import _FileSystemIndex
+from taipy.core._repository._filesystem_repository import _FileSystemRepository
+
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+
+
+@pytest.fixture
+def repository():
+    r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    r._delete_all()
+    for i in range(10):
+        r._save(MockObj(f"uuid-{i}", f"foo-{i}", version="1.0" if i < 3 else "2.0"))
+    yield r
+    r._delete_all()
+
+
+def _read_file_spy(repository):
+    read_file = repository._FileSystemRepository__read_file
+    return mock.patch.object(repository, "_FileSystemRepository__read_file", side_effect=read_file)
+
+
+def test_filtered_queries_only_read_matching_files(repository):
+    with _read_file_spy(repository) as spy:
+        entities = repository._load_all([{"version": "1.0"}])
+    assert sorted(e.id for e in entities) == ["uuid-0", "uuid-1", "uuid-2"]
+    assert spy.call_count == 3
+
+    with _read_file_spy(repository) as spy:
+        entities = repository._load_all([{"version": "2.0", "id": "uuid-5"}, {"version": "1.0"}])
+    assert len(entities) == 4
+    assert spy.call_count == 10
+
+    with _read_file_spy(repository) as spy:
+        assert repository._load_all([{"version": "3.0"}]) == []
+    assert spy.call_count == 0
+
+
+def test_index_follows_saves_and_deletions(repository):
+    repository._save(MockObj("uuid-0", "foo-0", version="2.0"))
+    repository._delete("uuid-1")
+
+    assert [e.id for e in repository._load_all([{"version": "1.0"}])] == ["uuid-2"]
+    assert len(repository._load_all([{"version": "2.0"}])) == 8
+
+    repository._delete_by("version", "2.0")
+    assert repository._load_all([{"version": "2.0"}]) == []
+    assert len(repository._load_all()) == 1
+
+
+def test_index_is_shared_between_repository_instances(repository):
+    other = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    assert len(other._load_all([{"version": "1.0"}])) == 3
+
+    repository._save(MockObj("uuid-10", "foo-10", version="1.0"))
+    assert len(other._load_all([{"version": "1.0"}])) == 4
+
+
+def test_missing_index_is_rebuilt(repository):
+    index_path = repository._storage_folder / f"mock_model{_FileSystemRepository._INDEX_SUFFIX}"
+    assert index_path.exists()
+    index_path.unlink()
+
+    other = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    assert len(other._load_all([{"version": "1.0"}])) == 3
+    assert index_path.exists()
+
+    repository._delete_all()
+    assert not index_path.exists()
+    assert other._load_all([{"version": "1.0"}]) == []
+
+
+def test_index_is_compacted(repository):
+    index_path = repository._storage_folder / f"mock_model{_FileSystemRepository._INDEX_SUFFIX}"
+    other = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    assert len(other._load_all([{"version": "1.0"}])) == 3
+
+    with mock.patch.object(_FileSystemIndex, "_MIN_NB_OF_LINES_TO_COMPACT", 20):
+        nb_of_lines = len(index_path.read_text().splitlines())
+        for i in range(40):
+            repository._save(MockObj("uuid-0", f"foo-{i}", version="1.0"))
+        assert len(index_path.read_text().splitlines()) == nb_of_lines + 40
+
+        assert len(repository._load_all([{"version": "1.0"}])) == 3
+        assert len(index_path.read_text().splitlines()) == 11
+
+        # The other repositories follow the new journal
+        other._save(MockObj("uuid-10", "foo-10", version="1.0"))
+        assert len(other._load_all([{"version": "1.0"}])) == 4
+        assert len(repository._load_all([{"version": "1.0"}])) == 4
+
+
+def test_list_values_are_not_looked_up_in_the_index(repository):
+    index = repository._index
+    assert index._can_answer([{"version": "1.0"}])
+    assert not index._can_answer([{"version": "1.0"}, {"id": "uuid-0"}])
+    assert not index._can_answer([{"version": ["1.0", "2.0"]}])
@@ -18,7 +18,7 @@ import pytest
 
 from taipy.core.exceptions.exceptions import ModelNotFound
 
-from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj, MockSQLRepository
 
 
 class TestRepositoriesStorage:
@@ -42,6 +42,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_save_and_fetch_model(self, mock_repo, params):
@@ -56,6 +57,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_exists(self, mock_repo, params):
@@ -70,6 +72,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_get_all(self, mock_repo, params):
@@ -93,6 +96,26 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_save_many(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+
+        r._save_many([])
+        r._save_many([MockObj(f"uuid-{i}", f"Foo{i}", version="1.0") for i in range(5)])
+        r._save_many([MockObj("uuid-0", "Bar", version="2.0")])
+
+        assert len(r._load_all()) == 5
+        assert r._load("uuid-0").name == "Bar"
+        assert [m.id for m in r._load_all([{"version": "2.0"}])] == ["uuid-0"]
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_all(self, mock_repo, params):
@@ -114,6 +137,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_many(self, mock_repo, params):
@@ -134,6 +158,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_search(self, mock_repo, params):
@@ -153,6 +178,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     @pytest.mark.parametrize("export_path", ["tmp"])
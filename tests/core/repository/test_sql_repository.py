@@ -0,0 +1,138 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import threading
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core._repository._sql_connection import _SQLConnection
+from taipy.core._version._version_manager import _VersionManager
+from taipy.core._version._version_manager_factory import _VersionManagerFactory
+from taipy.core._version._version_sql_repository import _VersionSQLRepository
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data._data_sql_repository import _DataSQLRepository
+from taipy.core.exceptions.exceptions import ModelNotFound
+from taipy.core.job._job_sql_repository import _JobSQLRepository
+from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+from taipy.core.scenario._scenario_sql_repository import _ScenarioSQLRepository
+
+from .mocks import MockConverter, MockModel, MockObj, MockSQLRepository
+
+
+@pytest.fixture
+def repository():
+    r = MockSQLRepository(model_type=MockModel, converter=MockConverter, table_name="mock_model")
+    r._delete_all()
+    for i in range(10):
+        r._save(MockObj(f"uuid-{i}", f"foo-{i}", version="1.0" if i < 3 else "2.0"))
+    return r
+
+
+@pytest.fixture
+def sql_repository_type(tmp_sqlite):
+    Config.configure_core(repository_type="sql", repository_properties={"db_location": tmp_sqlite})
+    yield tmp_sqlite
+    Config.configure_core(repository_type="filesystem")
+
+
+def test_filters(repository):
+    assert sorted(e.id for e in repository._load_all([{"version": "1.0"}])) == ["uuid-0", "uuid-1", "uuid-2"]
+    assert len(repository._load_all([{"version": "2.0", "id": "uuid-5"}, {"version": "1.0"}])) == 4
+    assert [e.id for e in repository._load_all([{"version": "2.0", "name": "foo-9"}])] == ["uuid-9"]
+    assert repository._load_all([{"version": "3.0"}]) == []
+    assert repository._load_all([{"version": None}]) == []
+    assert len(repository._load_all([{}])) == 10
+
+
+def test_filtered_queries_use_indexes(repository):
+    connection, _ = _SQLConnection._get_connection()
+    plan = connection.execute("EXPLAIN QUERY PLAN SELECT data FROM mock_model WHERE version = ?", ("1.0",)).fetchall()
+    assert "ix_mock_model_version" in str(plan)
+
+
+def test_delete_by(repository):
+    repository._delete_by("version", "1.0")
+    assert len(repository._load_all()) == 7
+    assert repository._load_all([{"version": "1.0"}]) == []
+
+    with pytest.raises(ModelNotFound):
+        repository._delete("uuid-0")
+    with pytest.raises(ModelNotFound):
+        repository._export("uuid-0", "tmp")
+
+
+def test_entities_are_shared_between_threads_and_repositories(repository):
+    loaded = []
+    thread = threading.Thread(target=lambda: loaded.extend(repository._load_all([{"version": "1.0"}])))
+    thread.start()
+    thread.join()
+    assert len(loaded) == 3
+
+    other = MockSQLRepository(model_type=MockModel, converter=MockConverter, table_name="mock_model")
+    other._save(MockObj("uuid-10", "foo-10", version="1.0"))
+    assert len(repository._load_all([{"version": "1.0"}])) == 4
+
+
+def test_get_by_config_and_owner_id(sql_repository_type):
+    dn_config = Config.configure_data_node("dn", scope=Scope.SCENARIO)
+    dn_global_config = Config.configure_data_node("dn_global", scope=Scope.GLOBAL)
+    data_manager = _DataManagerFactory._build_manager()
+    data_nodes = [data_manager._create_and_set(dn_config, f"SCENARIO_{i}", None) for i in range(1000)]
+    global_data_node = data_manager._create_and_set(dn_global_config, None, None)
+
+    repository = data_manager._repository
+    assert isinstance(repository, _DataSQLRepository)
+    assert repository._get_by_config_and_owner_id(dn_config.id, "SCENARIO_500").id == data_nodes[500].id
+    assert repository._get_by_config_and_owner_id(dn_global_config.id, None).id == global_data_node.id
+    assert repository._get_by_config_and_owner_id(dn_config.id, "SCENARIO_1000") is None
+
+    # More pairs than the number of parameters allowed in a single query
+    pairs = [(dn_config, f"SCENARIO_{i}") for i in range(1000)] + [(dn_global_config, None)]
+    res = repository._get_by_configs_and_owner_ids(pairs)
+    assert len(res) == 1001
+    assert res[(dn_config, "SCENARIO_999")].id == data_nodes[999].id
+    assert res[(dn_global_config, None)].id == global_data_node.id
+    assert repository._get_by_configs_and_owner_ids(pairs, [{"version": "not_a_version"}]) == {}
+
+
+def test_sql_repository_type(sql_repository_type):
+    assert isinstance(_ScenarioManagerFactory._build_manager()._repository, _ScenarioSQLRepository)
+    assert isinstance(_VersionManagerFactory._build_manager()._repository, _VersionSQLRepository)
+
+    scenario_config = Config.configure_scenario("sc", [], [])
+    scenario = _ScenarioManagerFactory._build_manager()._create(scenario_config)
+
+    assert os.path.exists(sql_repository_type)
+    assert _ScenarioSQLRepository()._load(scenario.id).id == scenario.id
+    assert _JobSQLRepository()._load_all() == []
+
+
+def test_version_info(sql_repository_type):
+    repository = _VersionManagerFactory._build_manager()._repository
+
+    with pytest.raises(ModelNotFound):
+        repository._get_latest_version()
+
+    repository._set_latest_version("1.0")
+    assert repository._get_latest_version() == "1.0"
+    assert repository._get_development_version() == ""
+
+    repository._set_development_version("2.0")
+    assert repository._get_latest_version() == "2.0"
+    assert repository._get_development_version() == "2.0"
+    assert _VersionManager._get_development_version() == "2.0"
+
+    repository._delete_all()
+    with pytest.raises(ModelNotFound):
+        repository._get_development_version()
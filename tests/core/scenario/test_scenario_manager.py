@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from contextlib import ExitStack
 from datetime import datetime, timedelta
 from typing import Callable, Iterable, Optional
 from unittest.mock import ANY, patch
@@ -33,6 +34,7 @@ from taipy.core.exceptions.exceptions import (
     DeletingPrimaryScenario,
     DifferentScenarioConfigs,
     InsufficientScenarioToCompare,
+    InvalidScenario,
     NonExistingComparator,
     NonExistingScenario,
     NonExistingScenarioConfig,
@@ -41,6 +43,7 @@ from taipy.core.exceptions.exceptions import (
     UnauthorizedTagError,
 )
 from taipy.core.job._job_manager import _JobManager
+from taipy.core.notification import EventEntityType, EventOperation, Notifier
 from taipy.core.reason import WrongConfigType
 from taipy.core.scenario._scenario_manager import _ScenarioManager
 from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
@@ -607,6 +610,66 @@ def test_scenario_manager_only_creates_data_node_once():
     assert len(_ScenarioManager._get_all()) == 2
 
 
+def test_scenario_creation_saves_entities_in_one_batch():
+    dn_config_1 = Config.configure_data_node("foo", "in_memory", Scope.GLOBAL, default_data=1)
+    dn_config_2 = Config.configure_data_node("bar", "in_memory", Scope.SCENARIO, default_data=0)
+    dn_config_3 = Config.configure_data_node("baz", "in_memory", Scope.SCENARIO, default_data=0)
+    task_config_1 = Config.configure_task("mult_by_2", mult_by_2, [dn_config_1], dn_config_2)
+    task_config_2 = Config.configure_task("mult_by_3", mult_by_3, [dn_config_2], dn_config_3)
+    scenario_config = Config.configure_scenario("sc", [task_config_1, task_config_2], [], Frequency.DAILY)
+    scenario_config.add_sequences({"by_6": [task_config_1, task_config_2]})
+    registration_id, queue = Notifier.register(operation=EventOperation.CREATION)
+
+    repositories = [
+        _DataManager._repository,
+        _TaskManager._repository,
+        _ScenarioManager._repository,
+        _CycleManager._repository,
+    ]
+    with ExitStack() as stack:
+        save_mocks = [stack.enter_context(patch.object(r, "_save", wraps=r._save)) for r in repositories]
+        save_many_mocks = [stack.enter_context(patch.object(r, "_save_many", wraps=r._save_many)) for r in repositories]
+        scenario = _ScenarioManager._create(scenario_config)
+
+    for save_mock in save_mocks:
+        save_mock.assert_not_called()
+    for save_many_mock in save_many_mocks:
+        save_many_mock.assert_called_once()
+    assert len(list(save_many_mocks[0].call_args.args[0])) == 3
+    assert _DataManager._get(scenario.bar.id)._parent_ids == {scenario.mult_by_2.id, scenario.mult_by_3.id}
+
+    # The creation events are published once the entities are saved
+    events = []
+    while not queue.empty():
+        events.append(queue.get())
+    Notifier.unregister(registration_id)
+    assert {e.entity_type for e in events} == {
+        EventEntityType.CYCLE,
+        EventEntityType.DATA_NODE,
+        EventEntityType.TASK,
+        EventEntityType.SEQUENCE,
+        EventEntityType.SCENARIO,
+    }
+    assert events[-1].entity_id == scenario.id
+    assert len(_DataManager._get_all()) == 3
+    assert len(_TaskManager._get_all()) == 2
+    assert len(_SequenceManager._get_all()) == 1
+
+
+def test_scenario_creation_failure_saves_nothing():
+    dn_config = Config.configure_data_node("foo", "in_memory", Scope.SCENARIO, default_data=1)
+    task_config = Config.configure_task("mult_by_2", mult_by_2, [dn_config], [])
+    scenario_config = Config.configure_scenario("sc", [task_config])
+
+    with patch.object(Scenario, "_is_consistent", return_value=False):
+        with pytest.raises(InvalidScenario):
+            _ScenarioManager._create(scenario_config)
+
+    assert len(_DataManager._get_all()) == 0
+    assert len(_TaskManager._get_all()) == 0
+    assert len(_ScenarioManager._get_all()) == 0
+
+
 def test_notification_subscribe(mocker):
     mocker.patch("taipy.core._entity._reload._Reloader._reload", side_effect=lambda m, o: o)
 
@@ -94,7 +94,7 @@ def test_gui_service_arguments_hierarchy():
     assert service_config["time_zone"] is None
     assert service_config["title"] is None
     assert service_config["upload_folder"] is None
-    assert not service_config["use_arrow"]
+    assert service_config["use_arrow"]
     assert not service_config["use_reloader"]
     assert service_config["watermark"] == "Taipy inside"
     assert service_config["webapp_path"] is None
@@ -0,0 +1,116 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest import mock
+
+import numpy as np
+import pandas
+import pytest
+
+from taipy.gui import Gui
+from taipy.gui.data.data_accessor import _DataAccessors
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.pandas_data_accessor import _PandasDataAccessor
+from taipy.gui.utils import _TaipyData
+
+pa = pytest.importorskip("pyarrow")
+
+from taipy.gui.data.arrow_data_accessor import _ArrowDataAccessor  # noqa: E402
+
+
+def _read_stream(data: bytes):
+    return pa.ipc.open_stream(data).read_all()
+
+
+def test_page_is_sliced_without_pandas(gui: Gui, helpers, small_dataframe):
+    accessor = _ArrowDataAccessor(gui)
+    table = pa.table(small_dataframe)
+    with mock.patch.object(_ArrowDataAccessor, "to_pandas") as mck:
+        ret_data = accessor.get_data("x", table, {"start": 1, "end": 2}, _DataFormat.APACHE_ARROW)
+        mck.assert_not_called()
+    value = ret_data["value"]
+    assert value["rowcount"] == 3
+    assert value["start"] == 1
+    assert value["orient"] == "records"
+    page = _read_stream(value["data"])
+    assert page.to_pydict() == {"name": ["B", "C"], "value": [2, 3], "_tp_index": [1, 2]}
+
+
+def test_page_matches_pandas_accessor(gui: Gui, helpers, small_dataframe):
+    payload = {"start": 0, "end": 1, "columns": ["value"], "pagekey": "0-1"}
+    arrow_ret = _ArrowDataAccessor(gui).get_data("x", pa.table(small_dataframe), payload, _DataFormat.APACHE_ARROW)
+    pandas_ret = _PandasDataAccessor(gui).get_data(
+        "x", pandas.DataFrame(small_dataframe), {**payload, "columns": ["value"]}, _DataFormat.APACHE_ARROW
+    )
+    assert arrow_ret["pagekey"] == pandas_ret["pagekey"]
+    assert arrow_ret["value"]["rowcount"] == pandas_ret["value"]["rowcount"]
+    assert arrow_ret["value"]["start"] == pandas_ret["value"]["start"]
+    assert _read_stream(arrow_ret["value"]["data"]).to_pydict() == _read_stream(pandas_ret["value"]["data"]).to_pydict()
+
+
+def test_fall_back_to_pandas(gui: Gui, helpers, small_dataframe):
+    accessor = _ArrowDataAccessor(gui)
+    table = pa.table(small_dataframe)
+    ret_data = accessor.get_data(
+        "x", table, {"start": 0, "end": -1, "orderby": "value", "sort": "desc"}, _DataFormat.APACHE_ARROW
+    )
+    assert _read_stream(ret_data["value"]["data"]).column("value").to_pylist() == [3, 2, 1]
+
+    ret_data = accessor.get_data("x", table, {"start": 0, "end": -1}, _DataFormat.JSON)
+    assert len(ret_data["value"]["data"]) == 3
+
+
+def test_col_types_and_edit(gui: Gui, small_dataframe):
+    accessor = _ArrowDataAccessor(gui)
+    table = pa.table(small_dataframe)
+    assert accessor.get_col_types("x", table) == {"name": "object", "value": "int64"}
+
+    new_table = accessor.on_edit(table, {"index": 0, "col": "value", "value": 10})
+    assert isinstance(new_table, pa.Table)
+    assert new_table.column("value").to_pylist() == [10, 2, 3]
+
+
+def test_data_is_sent_in_batches(gui: Gui):
+    df = pandas.DataFrame({"x": range(5), "y": [1.0, np.nan, 3.0, None, 5.0]})
+    with mock.patch.object(_PandasDataAccessor, "_PandasDataAccessor__ARROW_BATCH_ROWS", 2):
+        ret_data = _PandasDataAccessor(gui).get_data("x", df, {"alldata": True}, _DataFormat.APACHE_ARROW)
+    value = ret_data["value"]
+    assert value["format"] == _DataFormat.APACHE_ARROW.value
+    assert isinstance(value["data"], list)
+    assert len(value["data"]) == 3
+    table = pa.concat_tables([_read_stream(chunk) for chunk in value["data"]])
+    assert table.to_pydict() == {"x": [0, 1, 2, 3, 4], "y": [1.0, None, 3.0, None, 5.0]}
+
+    ret_data = _PandasDataAccessor(gui).get_data("x", df.iloc[:0], {"alldata": True}, _DataFormat.APACHE_ARROW)
+    assert _read_stream(ret_data["value"]["data"]).num_rows == 0
+
+
+def test_unconvertible_data_is_sent_as_json(gui: Gui):
+    df = pandas.DataFrame({"x": [1, 2], "y": [1, "two"]})
+    ret_data = _PandasDataAccessor(gui).get_data("x", df, {"alldata": True}, _DataFormat.APACHE_ARROW)
+    assert ret_data["value"]["format"] == _DataFormat.JSON.value
+    assert ret_data["value"]["data"] == {"x": [1, 2], "y": [1, "two"]}
+
+    ret_data = _PandasDataAccessor(gui).get_data("x", [df[["x"]], df], {"alldata": True}, _DataFormat.APACHE_ARROW)
+    assert ret_data["value"]["format"] == _DataFormat.JSON.value
+    assert ret_data["value"]["data"] == [{"x": [1, 2]}, {"x": [1, 2], "y": [1, "two"]}]
+
+
+def test_arrow_is_used_with_the_clients_that_accept_it(gui: Gui, small_dataframe):
+    accessors = _DataAccessors(gui)
+    data = _TaipyData(pandas.DataFrame(small_dataframe), "x")
+    payload = {"start": 0, "end": -1}
+    arrow_payload = {**payload, "acceptformats": [_DataFormat.APACHE_ARROW.value]}
+
+    assert accessors.get_data("x", data, arrow_payload)["value"]["format"] == _DataFormat.JSON.value
+    accessors.set_data_format(_DataFormat.APACHE_ARROW)
+    assert accessors.get_data("x", data, payload)["value"]["format"] == _DataFormat.JSON.value
+    assert accessors.get_data("x", data, arrow_payload)["value"]["format"] == _DataFormat.APACHE_ARROW.value
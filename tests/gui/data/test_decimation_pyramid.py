@@ -0,0 +1,156 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.decimator import LTTB, MinMaxDecimator
+from taipy.gui.data.decimator._pyramid import _DecimationPyramid
+from taipy.gui.data.pandas_data_accessor import _PandasDataAccessor
+
+_N = 200_000
+
+
+@pytest.fixture
+def series_df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"x": np.arange(_N, dtype=np.float64), "y": rng.standard_normal(_N).cumsum()})
+
+
+def _instance_payload():
+    return {"decimator": "a_decimator", "xAxis": "x", "yAxis": "y", "chartMode": "lines"}
+
+
+def _zoom_payload(x0, x1):
+    return {"width": 100, "relayoutData": {"xaxis.range[0]": x0, "xaxis.range[1]": x1}}
+
+
+def test_levels(series_df):
+    y = series_df["y"].to_numpy()
+    pyramid = _DecimationPyramid._create(series_df["x"].to_numpy(), y)
+    assert pyramid is not None
+
+    assert pyramid.get_range(None, None) == (0, _N)
+    assert pyramid.get_range(10, 20.5) == (11, 21)
+    assert pyramid.get_range(20, 10) == (21, 21)
+
+    positions = pyramid.select(0, _N, 5_000)
+    assert len(positions) <= 5_000
+    assert np.all(np.diff(positions) > 0)
+    # The extreme values are kept at every level
+    assert {0, _N - 1, int(np.argmin(y)), int(np.argmax(y))} <= set(positions.tolist())
+
+    positions = pyramid.select(1_000, 101_000, 30_000)
+    assert len(positions) <= 30_000
+    assert positions[0] >= 1_000 and positions[-1] < 101_000
+    np.testing.assert_array_equal(pyramid.select(1_000, 1_200, 30_000), np.arange(1_000, 1_200))
+    np.testing.assert_array_equal(pyramid.get_points(np.array([3, 5]))[:, 1], y[[3, 5]])
+
+
+def test_unsupported_series():
+    assert _DecimationPyramid._create(np.array([2.0, 1.0, 3.0]), np.array([1.0, 2.0, 3.0])) is None
+    assert _DecimationPyramid._create(np.array([1.0, np.nan, 3.0]), np.array([1.0, 2.0, 3.0])) is None
+    assert _DecimationPyramid._create(np.array(["a", "b"], dtype=object), np.array([1.0, 2.0])) is None
+    assert _DecimationPyramid._create(np.array([1.0, 2.0]), np.array(["a", "b"], dtype=object)) is None
+
+
+def test_datetime_series():
+    x = pd.date_range("2024-01-01", periods=100, freq="h").to_numpy()
+    pyramid = _DecimationPyramid._create(x, np.arange(100))
+    assert pyramid is not None
+    assert pyramid.get_range("2024-01-01 10:00:00", "2024-01-02") == (11, 24)
+
+
+@pytest.mark.parametrize("decimator_class", [LTTB, MinMaxDecimator])
+def test_zoom_uses_the_pyramid(series_df, decimator_class):
+    decimator = decimator_class(100, pyramid=True)
+    create = _DecimationPyramid._create
+    with patch.object(_DecimationPyramid, "_create", side_effect=create) as mck:
+        df, is_applied, _ = decimator._on_decimate_df(series_df, _instance_payload(), {"width": 100})
+        assert is_applied
+        assert 0 < len(df) <= 100
+
+        df, is_applied, _ = decimator._on_decimate_df(series_df, _instance_payload(), _zoom_payload(5_000, 60_000))
+        assert is_applied
+        assert 0 < len(df) <= 100
+        assert df["x"].min() > 5_000 and df["x"].max() < 60_000
+
+        # Only a few points in the range: no decimation
+        df, is_applied, _ = decimator._on_decimate_df(series_df, _instance_payload(), _zoom_payload(99.5, 149.5))
+        assert not is_applied
+        pd.testing.assert_frame_equal(df, series_df.iloc[100:150])
+        assert mck.call_count == 1
+
+        # The pyramid is built again for new data, or on demand
+        decimator._on_decimate_df(series_df.copy(), _instance_payload(), {"width": 100})
+        assert mck.call_count == 2
+        decimator._invalidate_pyramids()
+        decimator._on_decimate_df(series_df, _instance_payload(), {"width": 100})
+        assert mck.call_count == 3
+
+
+def test_zoom_without_pyramid_is_unchanged(series_df):
+    payload = _zoom_payload(5_000, 60_000)
+    df, _, _ = LTTB(100)._on_decimate_df(series_df, _instance_payload(), payload)
+    expected_df, _ = LTTB(100)._apply_decimator(
+        series_df[(series_df["x"] > 5_000) & (series_df["x"] < 60_000)], "x", "y", "", payload, False
+    )
+    pd.testing.assert_frame_equal(df, expected_df[["x", "y"]])
+
+
+def test_unsorted_data_is_decimated_without_pyramid(series_df):
+    unsorted_df = series_df.iloc[::-1]
+    df, is_applied, _ = LTTB(100, pyramid=True)._on_decimate_df(unsorted_df, _instance_payload(), {"width": 100})
+    expected_df, _, _ = LTTB(100)._on_decimate_df(unsorted_df, _instance_payload(), {"width": 100})
+    assert is_applied
+    pd.testing.assert_frame_equal(df, expected_df)
+
+
+def test_variable_update_drops_the_pyramids(series_df):
+    decimator = LTTB(100, pyramid=True)
+    gui = Mock()
+    gui._get_user_instance.return_value = decimator
+    accessor = _PandasDataAccessor(gui)
+    payload = {"alldata": True, "decimatorPayload": {"decimators": [_instance_payload()], "width": 100}}
+
+    create = _DecimationPyramid._create
+    with patch.object(_DecimationPyramid, "_create", side_effect=create) as mck:
+        accessor.get_data("x", series_df, payload, _DataFormat.JSON)
+        accessor.get_data("x", series_df, payload, _DataFormat.JSON)
+        assert mck.call_count == 1
+
+        accessor.invalidate_cache("y")
+        accessor.get_data("x", series_df, payload, _DataFormat.JSON)
+        assert mck.call_count == 1
+
+        accessor.invalidate_cache("x")
+        accessor.get_data("x", series_df, payload, _DataFormat.JSON)
+        assert mck.call_count == 2
+
+
+def test_filtered_data_is_decimated_without_pyramid(series_df):
+    gui = Mock()
+    gui._get_user_instance.return_value = LTTB(100, pyramid=True)
+    accessor = _PandasDataAccessor(gui)
+    payload = {
+        "alldata": True,
+        "filters": [{"col": "x", "action": ">", "value": 1_000}],
+        "decimatorPayload": {"decimators": [_instance_payload()], "width": 100},
+    }
+
+    with patch.object(_DecimationPyramid, "_create") as mck:
+        accessor.get_data("x", series_df, payload, _DataFormat.JSON)
+        accessor.get_data("x", series_df, payload, _DataFormat.JSON)
+        mck.assert_not_called()
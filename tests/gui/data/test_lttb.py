@@ -0,0 +1,93 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from taipy.gui.data.decimator.lttb import LTTB
+
+
+def _reference_decimate(data: np.ndarray, n_out: int) -> np.ndarray:
+    # The bin by bin implementation of LTTB, which the vectorized one must match exactly
+    if n_out >= data.shape[0]:
+        return np.full(len(data), True)
+    n_bins = n_out - 2
+    data_bins = np.array_split(data[1:-1], n_bins)
+    prev_a = data[0]
+    start_pos = 0
+    out_mask = np.full(len(data), False)
+    out_mask[0] = True
+    out_mask[len(data) - 1] = True
+    for i in range(len(data_bins)):
+        this_bin = data_bins[i]
+        next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
+        c = next_bin.mean(axis=0)
+        areas = 0.5 * abs(
+            (prev_a[0] - c[0]) * (this_bin - prev_a)[:, 1] - (prev_a - this_bin)[:, 0] * (c[1] - prev_a[1])
+        )
+        bs_pos = np.argmax(areas)
+        prev_a = this_bin[bs_pos]
+        out_mask[start_pos + bs_pos] = True
+        start_pos += len(this_bin)
+    return out_mask
+
+
+def _random_walk(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.column_stack((np.arange(n, dtype=np.float64), rng.standard_normal(n).cumsum()))
+
+
+@pytest.mark.parametrize(
+    "data, n_out",
+    [
+        (_random_walk(1_000), 100),
+        (_random_walk(1_003), 3),
+        (_random_walk(10_007, seed=1), 997),
+        (_random_walk(500), 499),
+        # Integer values, with many ties between the triangles of a bin
+        (np.column_stack((np.arange(5_000), np.arange(5_000) % 7)), 300),
+        (np.column_stack((np.sort(np.random.default_rng(2).random(2_000)), np.zeros(2_000))), 50),
+    ],
+)
+def test_same_mask_as_reference(data, n_out):
+    mask = LTTB(n_out)._decimate(data, {})
+
+    np.testing.assert_array_equal(mask, _reference_decimate(data, n_out))
+    assert mask.sum() <= n_out
+
+
+def test_no_decimation():
+    data = _random_walk(10)
+    assert LTTB(10)._decimate(data, {}).all()
+    with pytest.raises(ValueError):
+        LTTB(2)._decimate(data, {})
+
+
+@pytest.mark.benchmark
+def test_benchmark(record_property):
+    data = _random_walk(1_000_000)
+    n_out = 2_000
+    decimator = LTTB(n_out)
+
+    def best_of(fct, n=3):
+        durations = []
+        for _ in range(n):
+            start = perf_counter()
+            fct()
+            durations.append(perf_counter() - start)
+        return min(durations)
+
+    np.testing.assert_array_equal(decimator._decimate(data, {}), _reference_decimate(data, n_out))
+    # The durations are reported, not compared: they depend on the load of the machine
+    record_property("lttb_ms", best_of(lambda: decimator._decimate(data, {})) * 1000)
+    record_property("lttb_bin_by_bin_ms", best_of(lambda: _reference_decimate(data, n_out)) * 1000)
@@ -13,7 +13,7 @@ import inspect
 import os
 from datetime import datetime
 from importlib import util
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pandas
 import pandas as pd
@@ -429,3 +429,114 @@ def test_csv(gui, small_dataframe):
     path = accessor.to_csv("", pd)
     assert path is not None
     assert os.path.getsize(path) > 0
+
+
+def test_paging_reuses_the_query_results(gui, small_dataframe):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(small_dataframe)
+    payload = {
+        "columns": ["name", "value"],
+        "filters": [{"col": "value", "action": ">", "value": 1}],
+        "orderby": "value",
+        "sort": "desc",
+    }
+
+    run_query = _PandasDataAccessor._PandasDataAccessor__run_query  # type: ignore[attr-defined]
+    with patch.object(
+        _PandasDataAccessor, "_PandasDataAccessor__run_query", autospec=True, side_effect=run_query
+    ) as mck:
+        first_page = accessor.get_data("x", pd, {**payload, "start": 0, "end": 0}, _DataFormat.JSON)
+        second_page = accessor.get_data("x", pd, {**payload, "start": 1, "end": 1}, _DataFormat.JSON)
+        assert mck.call_count == 1
+
+        # Another query runs again
+        accessor.get_data("x", pd, {**payload, "sort": "asc", "start": 0, "end": 0}, _DataFormat.JSON)
+        assert mck.call_count == 2
+        # So does the same query on a new value
+        accessor.get_data("x", pd.copy(), {**payload, "start": 0, "end": 0}, _DataFormat.JSON)
+        assert mck.call_count == 3
+
+    assert first_page["value"]["rowcount"] == 2
+    assert first_page["value"]["data"] == [{"name": "C", "value": 3, "_tp_index": 2}]
+    assert second_page["value"]["rowcount"] == 2
+    assert second_page["value"]["start"] == 1
+    assert second_page["value"]["data"] == [{"name": "B", "value": 2, "_tp_index": 1}]
+
+
+def test_query_results_only_hold_the_row_positions(gui, small_dataframe):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(small_dataframe)
+    query_cache = accessor._PandasDataAccessor__query_cache  # type: ignore[attr-defined]
+
+    with patch.object(query_cache, "set", wraps=query_cache.set) as mck:
+        # Paging through all the rows, unsorted, is not cached
+        accessor.get_data("x", pd, {"columns": ["name"], "start": 0, "end": 0}, _DataFormat.JSON)
+        mck.assert_not_called()
+
+        payload = {"columns": ["name"], "filters": [{"col": "value", "action": ">", "value": 1}], "orderby": "name"}
+        page = accessor.get_data("x", pd, {**payload, "start": 0, "end": 0}, _DataFormat.JSON)
+        mck.assert_called_once()
+        rows, sorted_indexes = mck.call_args.args[4]
+        assert rows.tolist() == [1, 2]
+        assert sorted_indexes.tolist() == [0, 1]
+
+    assert page["value"]["rowcount"] == 2
+    assert page["value"]["data"] == [{"name": "B", "_tp_index": 1}]
+
+
+def test_query_results_are_invalidated(gui, small_dataframe):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(small_dataframe)
+    payload = {"start": 0, "end": 0, "orderby": "value", "sort": "desc"}
+    assert accessor.get_data("x", pd, payload, _DataFormat.JSON)["value"]["data"][0]["value"] == 3
+
+    accessor.on_edit(pd, {"index": 0, "col": "value", "value": 10})
+    assert accessor.get_data("x", pd, payload, _DataFormat.JSON)["value"]["data"][0]["value"] == 10
+
+    pd.at[1, "value"] = 20
+    assert accessor.get_data("x", pd, payload, _DataFormat.JSON)["value"]["data"][0]["value"] == 10
+    accessor.invalidate_cache("x")
+    assert accessor.get_data("x", pd, payload, _DataFormat.JSON)["value"]["data"][0]["value"] == 20
+
+
+def test_append_rows(gui, small_dataframe):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(small_dataframe)
+    new_pd = accessor.append_rows(pd, [["D", 4], ["E", 5]])
+    assert len(pd) == 3
+    assert new_pd["name"].tolist() == ["A", "B", "C", "D", "E"]
+    assert new_pd.index.tolist() == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        accessor.append_rows([pd, pd], [["D", 4]])
+
+    windows = [
+        ({"columns": ["name"], "pagekey": "page", "start": 0, "end": 1}, _DataFormat.JSON),
+        ({"columns": ["name"], "pagekey": "inf", "start": 0, "end": 2, "infinite": True}, _DataFormat.JSON),
+    ]
+    updates = accessor.get_appended_rows_updates("x", new_pd, windows)
+    assert updates == [
+        {"pagekey": "page", "delta": True, "value": {"rowcount": 5}},
+        {
+            "pagekey": "inf",
+            "infinite": True,
+            "value": {
+                "format": "JSON",
+                "rowcount": 5,
+                "start": 3,
+                "data": [{"name": "D", "_tp_index": 3}, {"name": "E", "_tp_index": 4}],
+            },
+        },
+    ]
+    # The appended rows are only sent once
+    assert accessor.get_appended_rows_updates("x", new_pd, windows) is None
+
+    # Rows appended twice before the update are sent together
+    new_pd = accessor.append_rows(pd, {"name": ["D"], "value": [4]})
+    new_pd = accessor.append_rows(new_pd, {"name": ["E"], "value": [5]})
+    updates = accessor.get_appended_rows_updates("x", new_pd, windows[1:])
+    assert [row["name"] for row in updates[0]["value"]["data"]] == ["D", "E"]
+
+    # The rows of sorted tables must be requested again
+    new_pd = accessor.append_rows(pd, [["D", 4]])
+    sorted_window = ({"pagekey": "page", "start": 0, "end": 1, "orderby": "name", "sort": "asc"}, _DataFormat.JSON)
+    assert accessor.get_appended_rows_updates("x", new_pd, [sorted_window]) is None
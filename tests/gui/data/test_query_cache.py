@@ -0,0 +1,87 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import gc
+import weakref
+
+from taipy.gui.data.query_cache import _QueryCache
+
+
+def test_get_and_set():
+    cache = _QueryCache()
+    source = object()
+    assert cache.get("client", "x", "query", source) is None
+
+    cache.set("client", "x", "query", source, "result", 1)
+    assert cache.get("client", "x", "query", source) == "result"
+    assert cache.get("other_client", "x", "query", source) is None
+    assert cache.get("client", "y", "query", source) is None
+    assert cache.get("client", "x", "other_query", source) is None
+    # A result computed from another value is never returned
+    assert cache.get("client", "x", "query", object()) is None
+    assert cache.get("client", "x", "query", source) is None
+
+
+def test_least_recently_used_results_are_evicted_per_client():
+    cache = _QueryCache(max_bytes_per_client=20)
+    source = object()
+    cache.set("client", "x", "query_1", source, 1, 5)
+    cache.set("client", "x", "query_2", source, 2, 10)
+    cache.set("other_client", "x", "query_1", source, 1, 5)
+    assert cache.get("client", "x", "query_1", source) == 1
+
+    cache.set("client", "x", "query_3", source, 3, 10)
+
+    assert cache.get("client", "x", "query_2", source) is None
+    assert cache.get("client", "x", "query_1", source) == 1
+    assert cache.get("client", "x", "query_3", source) == 3
+    assert cache.get("other_client", "x", "query_1", source) == 1
+
+    # A result larger than the size of the results of a client is not stored
+    cache.set("client", "x", "query_4", source, 4, 21)
+    assert cache.get("client", "x", "query_4", source) is None
+    assert cache.get("client", "x", "query_1", source) == 1
+
+
+def test_the_source_is_not_kept_alive():
+    class Source:
+        pass
+
+    cache = _QueryCache()
+    source = Source()
+    source_ref = weakref.ref(source)
+    cache.set("client", "x", "query", source, "result", 1)
+
+    del source
+    gc.collect()
+
+    assert source_ref() is None
+
+
+def test_invalidate():
+    cache = _QueryCache()
+    source, other_source = object(), object()
+    for client_id in ("client", "other_client"):
+        cache.set(client_id, "x", "query", source, "x", 1)
+        cache.set(client_id, "y", "query", other_source, "y", 1)
+
+    cache.invalidate("x", "client")
+    assert cache.get("client", "x", "query", source) is None
+    assert cache.get("client", "y", "query", other_source) == "y"
+    assert cache.get("other_client", "x", "query", source) == "x"
+
+    cache.invalidate(source=other_source)
+    assert cache.get("client", "y", "query", other_source) is None
+    assert cache.get("other_client", "y", "query", other_source) is None
+    assert cache.get("other_client", "x", "query", source) == "x"
+
+    cache.invalidate(client_id="other_client")
+    assert cache.get("other_client", "x", "query", source) is None
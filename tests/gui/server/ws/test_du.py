@@ -11,6 +11,8 @@
 
 import inspect
 
+import pandas as pd
+
 from taipy.gui import Gui, Markdown
 
 
@@ -137,3 +139,46 @@ def test_du_table_data_fetched(gui: Gui, helpers, csvdata):
             "format": "JSON",
         },
     )
+
+
+def test_du_table_rows_appended(gui: Gui, helpers):
+    def append(state, id):
+        state.append_rows("data_rows", {"value": [100, 101]})
+
+    data_rows = pd.DataFrame({"value": range(15)})  # noqa: F841
+
+    gui._set_frame(inspect.currentframe())
+    gui.add_page(
+        "test",
+        Markdown("<|{data_rows}|table|page_size=10|> <|Append|button|on_action=append|id=my_button|>"),
+    )
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    var_name = "_TpD_tpec_TpExPr_data_rows_TPMDL_0"
+    payload = {"columns": ["value"], "pagekey": "0-9--asc", "start": 0, "end": 9, "orderby": "", "sort": "asc"}
+    ws_client.emit("message", {"client_id": sid, "type": "DU", "name": var_name, "payload": payload})
+    assert ws_client.get_received()
+
+    # The first page does not display the new rows: only the number of rows is sent
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "append"})
+    assert len(gui._bindings()._get_all_scopes()[sid].data_rows) == 17  # type: ignore
+    received_messages = ws_client.get_received()
+    helpers.assert_outward_ws_message(received_messages[0], "MU", var_name, {"rowcount": 17})
+    assert received_messages[0]["args"]["payload"][0]["payload"]["delta"]
+
+    # The last page displays the new rows
+    payload = {**payload, "pagekey": "10-19--asc", "start": 10, "end": 19}
+    ws_client.emit("message", {"client_id": sid, "type": "DU", "name": var_name, "payload": payload})
+    ws_client.get_received()
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "append"})
+    received_messages = ws_client.get_received()
+    updates = [pl for msg in received_messages for pl in msg["args"]["payload"]]
+    assert {"rowcount": 19} in [u["payload"]["value"] for u in updates]
+    page = next(u["payload"]["value"] for u in updates if u["payload"].get("pagekey") == "10-19--asc")
+    assert page["start"] == 10
+    assert page["rowcount"] == 19
+    assert [row["value"] for row in page["data"]] == [10, 11, 12, 13, 14, 100, 101, 100, 101]
+    assert [row["_tp_index"] for row in page["data"]] == list(range(10, 19))
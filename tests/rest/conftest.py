@@ -337,5 +337,8 @@ def init_orchestrator():
         _OrchestratorFactory._build_dispatcher(force_restart=True)
         _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
         _OrchestratorFactory._orchestrator.blocked_jobs = []
+        _OrchestratorFactory._orchestrator._blocking_data_node_ids = {}
+        _OrchestratorFactory._orchestrator._waiting_jobs = {}
+        _OrchestratorFactory._orchestrator._writing_jobs = {}
 
     return _init_orchestrator